@@ -0,0 +1,12 @@
+from application.behaviors.base import BaseBehavior
+from application.behaviors.timing import (
+    LatencyHistogram,
+    TimingBehavior,
+)
+
+
+__all__ = [
+    "BaseBehavior",
+    "LatencyHistogram",
+    "TimingBehavior",
+]
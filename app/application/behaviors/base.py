@@ -0,0 +1,43 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import dataclass
+from typing import Any
+
+from application.commands.base import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+
+
+RequestType = BaseQuery | BaseCommand
+HandlerType = BaseQueryHandler | BaseCommandHandler
+NextCallable = Callable[[RequestType], Awaitable[Any]]
+
+
+@dataclass
+class BaseBehavior(ABC):
+    """Звено pipeline медиатора вокруг вызова обработчика.
+
+    Behavior получает запрос, обработчик, которому он адресован, и
+    следующее звено цепочки. Чтобы продолжить обработку, нужно вызвать
+    ``await call_next(request)``.
+
+    """
+
+    @abstractmethod
+    async def handle(
+        self,
+        request: RequestType,
+        handler: HandlerType,
+        call_next: NextCallable,
+    ) -> Any: ...
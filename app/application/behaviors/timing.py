@@ -0,0 +1,106 @@
+import time
+from bisect import bisect_left
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Any
+
+from application.behaviors.base import (
+    BaseBehavior,
+    HandlerType,
+    NextCallable,
+    RequestType,
+)
+
+
+# Верхние границы бакетов в секундах (последний бакет — всё, что дольше)
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+@dataclass
+class LatencyHistogram:
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: list[int] = field(init=False)
+    count: int = field(default=0, init=False)
+    total: float = field(default=0.0, init=False)
+    max: float = field(default=0.0, init=False)
+
+    def __post_init__(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Оценка перцентиля по верхней границе бакета."""
+        if not self.count:
+            return 0.0
+
+        threshold = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= threshold:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.counts)),
+        }
+
+
+@dataclass
+class TimingBehavior(BaseBehavior):
+    """Собирает гистограммы латентности по каждому обработчику."""
+
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    histograms: dict[str, LatencyHistogram] = field(default_factory=dict, kw_only=True)
+
+    async def handle(
+        self,
+        request: RequestType,
+        handler: HandlerType,
+        call_next: NextCallable,
+    ) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return await call_next(request)
+        finally:
+            self.observe(handler.__class__.__name__, time.perf_counter() - started_at)
+
+    def observe(self, handler_name: str, seconds: float) -> None:
+        histogram = self.histograms.get(handler_name)
+        if histogram is None:
+            histogram = self.histograms[handler_name] = LatencyHistogram(buckets=self.buckets)
+
+        histogram.observe(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {name: histogram.as_dict() for name, histogram in self.histograms.items()}
@@ -0,0 +1,55 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+from application.commands.base import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from domain.organization.services import CatalogSnapshotService
+from domain.organization.snapshot import (
+    SNAPSHOT_BATCH_SIZE,
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+@dataclass(frozen=True)
+class ExportCatalogSnapshotCommand(BaseCommand):
+    """Снимок всех таблиц каталога в каталог ``directory``."""
+
+    directory: Path
+    snapshot_format: SnapshotFormat = SnapshotFormat.PARQUET
+    batch_size: int = SNAPSHOT_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class ExportCatalogSnapshotCommandHandler(
+    BaseCommandHandler[ExportCatalogSnapshotCommand, dict[SnapshotTable, Path]],
+):
+    catalog_snapshot_service: CatalogSnapshotService
+
+    async def handle(self, command: ExportCatalogSnapshotCommand) -> dict[SnapshotTable, Path]:
+        return await self.catalog_snapshot_service.write_snapshot(
+            directory=command.directory,
+            snapshot_format=command.snapshot_format,
+            batch_size=command.batch_size,
+        )
+
+
+@dataclass(frozen=True)
+class BuildCatalogFileCommand(BaseCommand):
+    """Файл снимка каталога для узлов без базы данных."""
+
+    path: Path
+    batch_size: int = SNAPSHOT_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class BuildCatalogFileCommandHandler(BaseCommandHandler[BuildCatalogFileCommand, dict[str, int]]):
+    catalog_snapshot_service: CatalogSnapshotService
+
+    async def handle(self, command: BuildCatalogFileCommand) -> dict[str, int]:
+        return await self.catalog_snapshot_service.write_catalog_file(
+            path=command.path,
+            batch_size=command.batch_size,
+        )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from application.commands.base import (
     BaseCommand,
@@ -30,3 +31,36 @@ class CreateOrganizationCommandHandler(
             activities=command.activities,
         )
         return result
+
+
+@dataclass(frozen=True)
+class RebuildOrganizationDocumentsCommand(BaseCommand):
+    """Пересборка read model ``organization_document`` (всех документов,
+    если ID не переданы)."""
+
+    organization_ids: tuple[UUID, ...] | None = None
+
+
+@dataclass(frozen=True)
+class RebuildOrganizationDocumentsCommandHandler(
+    BaseCommandHandler[RebuildOrganizationDocumentsCommand, int],
+):
+    organization_service: OrganizationService
+
+    async def handle(self, command: RebuildOrganizationDocumentsCommand) -> int:
+        return await self.organization_service.rebuild_organization_documents(
+            organization_ids=command.organization_ids,
+        )
+
+
+@dataclass(frozen=True)
+class DeleteOrganizationCommand(BaseCommand):
+    organization_id: UUID
+
+
+@dataclass(frozen=True)
+class DeleteOrganizationCommandHandler(BaseCommandHandler[DeleteOrganizationCommand, None]):
+    organization_service: OrganizationService
+
+    async def handle(self, command: DeleteOrganizationCommand) -> None:
+        await self.organization_service.delete_organization(organization_id=command.organization_id)
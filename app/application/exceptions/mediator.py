@@ -19,3 +19,14 @@ class QueryHandlerNotRegisteredException(LogicException):
     @property
     def message(self) -> str:
         return f"Query handler not registered for query type: {self.query_type.__name__}"
+
+
+@dataclass(eq=False)
+class CommandHandlersFailedException(LogicException):
+    command_type: type
+    errors: list[Exception]
+
+    @property
+    def message(self) -> str:
+        messages = "; ".join(getattr(error, "message", str(error)) for error in self.errors)
+        return f"{len(self.errors)} command handlers failed for command type {self.command_type.__name__}: {messages}"
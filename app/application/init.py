@@ -5,14 +5,25 @@ from infrastructure.database.repositories import (
     SQLAlchemyActivityRepository,
     SQLAlchemyAPIKeyRepository,
     SQLAlchemyBuildingRepository,
+    SQLAlchemyCatalogSnapshotRepository,
+    SQLAlchemyMapTileRepository,
+    SQLAlchemyOrganizationDocumentRepository,
     SQLAlchemyOrganizationRepository,
     SQLAlchemyUserRepository,
 )
+from infrastructure.snapshot.catalog import CatalogSnapshot
+from infrastructure.snapshot.repositories import (
+    SnapshotActivityRepository,
+    SnapshotBuildingRepository,
+    SnapshotOrganizationDocumentRepository,
+    SnapshotOrganizationRepository,
+)
 from punq import (
     Container,
     Scope,
 )
 
+from application.behaviors import TimingBehavior
 from application.commands.activity import (
     CreateActivityCommand,
     CreateActivityCommandHandler,
@@ -25,9 +36,19 @@ from application.commands.building import (
     CreateBuildingCommand,
     CreateBuildingCommandHandler,
 )
+from application.commands.catalog_snapshot import (
+    BuildCatalogFileCommand,
+    BuildCatalogFileCommandHandler,
+    ExportCatalogSnapshotCommand,
+    ExportCatalogSnapshotCommandHandler,
+)
 from application.commands.organization import (
     CreateOrganizationCommand,
     CreateOrganizationCommandHandler,
+    DeleteOrganizationCommand,
+    DeleteOrganizationCommandHandler,
+    RebuildOrganizationDocumentsCommand,
+    RebuildOrganizationDocumentsCommandHandler,
 )
 from application.commands.user import (
     CreateUserCommand,
@@ -39,6 +60,8 @@ from application.queries.activity import (
     GetActivitiesQueryHandler,
     GetActivityByIdQuery,
     GetActivityByIdQueryHandler,
+    GetActivityVersionQuery,
+    GetActivityVersionQueryHandler,
 )
 from application.queries.api_key import (
     GetAPIKeyByKeyQuery,
@@ -49,20 +72,50 @@ from application.queries.building import (
     GetBuildingByAddressQueryHandler,
     GetBuildingByIdQuery,
     GetBuildingByIdQueryHandler,
+    GetBuildingVersionQuery,
+    GetBuildingVersionQueryHandler,
+)
+from application.queries.catalog_snapshot import (
+    GetCatalogSnapshotQuery,
+    GetCatalogSnapshotQueryHandler,
+)
+from application.queries.map_tile import (
+    GetMapTileQuery,
+    GetMapTileQueryHandler,
 )
 from application.queries.organization import (
+    FindInconsistentOrganizationDocumentsQuery,
+    FindInconsistentOrganizationDocumentsQueryHandler,
+    GetActivityFacetsQuery,
+    GetActivityFacetsQueryHandler,
+    GetNearestOrganizationsQuery,
+    GetNearestOrganizationsQueryHandler,
     GetOrganizationByIdQuery,
     GetOrganizationByIdQueryHandler,
+    GetOrganizationChangesQuery,
+    GetOrganizationChangesQueryHandler,
+    GetOrganizationClustersByRectangleQuery,
+    GetOrganizationClustersByRectangleQueryHandler,
+    GetOrganizationDocumentsByIdsQuery,
+    GetOrganizationDocumentsByIdsQueryHandler,
     GetOrganizationsByActivityQuery,
     GetOrganizationsByActivityQueryHandler,
     GetOrganizationsByAddressQuery,
     GetOrganizationsByAddressQueryHandler,
+    GetOrganizationsByIdsQuery,
+    GetOrganizationsByIdsQueryHandler,
     GetOrganizationsByNameQuery,
     GetOrganizationsByNameQueryHandler,
     GetOrganizationsByRadiusQuery,
     GetOrganizationsByRadiusQueryHandler,
     GetOrganizationsByRectangleQuery,
     GetOrganizationsByRectangleQueryHandler,
+    GetOrganizationsNearPointsQuery,
+    GetOrganizationsNearPointsQueryHandler,
+    GetOrganizationVersionQuery,
+    GetOrganizationVersionQueryHandler,
+    SearchOrganizationsQuery,
+    SearchOrganizationsQueryHandler,
 )
 from application.queries.user import (
     AuthenticateUserQuery,
@@ -70,19 +123,30 @@ from application.queries.user import (
 )
 from domain.organization.interfaces.repositories.activity import BaseActivityRepository
 from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.interfaces.repositories.catalog_snapshot import BaseCatalogSnapshotRepository
+from domain.organization.interfaces.repositories.map_tile import BaseMapTileRepository
 from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
 from domain.organization.services import (
+    ActivityFacetService,
     ActivityService,
     BuildingService,
+    CatalogSnapshotService,
+    MapTileService,
     OrganizationService,
 )
+from domain.organization.services.facets import FacetCache
+from domain.organization.services.map_tile import TileCache
 from domain.user.interfaces.repositories.api_key import BaseAPIKeyRepository
 from domain.user.interfaces.repositories.user import BaseUserRepository
 from domain.user.services import (
     APIKeyService,
     UserService,
 )
-from settings.config import Config
+from settings.config import (
+    CatalogBackend,
+    Config,
+)
 
 
 @lru_cache(1)
@@ -109,13 +173,45 @@ def _init_container() -> Container:
     container.register(BaseBuildingRepository, SQLAlchemyBuildingRepository)
     container.register(BaseActivityRepository, SQLAlchemyActivityRepository)
     container.register(BaseOrganizationRepository, SQLAlchemyOrganizationRepository)
+    container.register(BaseOrganizationDocumentRepository, SQLAlchemyOrganizationDocumentRepository)
+    container.register(BaseMapTileRepository, SQLAlchemyMapTileRepository)
+    container.register(BaseCatalogSnapshotRepository, SQLAlchemyCatalogSnapshotRepository)
     container.register(BaseUserRepository, SQLAlchemyUserRepository)
     container.register(BaseAPIKeyRepository, SQLAlchemyAPIKeyRepository)
 
+    # Read-only узел: каталог читается из файла снимка, база нужна только
+    # для пользователей, API ключей и тайлов
+    if container.resolve(Config).catalog_backend is CatalogBackend.SNAPSHOT:
+
+        def init_catalog_snapshot() -> CatalogSnapshot:
+            config: Config = container.resolve(Config)
+            return CatalogSnapshot.open(config.catalog_snapshot_path)
+
+        container.register(CatalogSnapshot, factory=init_catalog_snapshot, scope=Scope.singleton)
+        container.register(BaseBuildingRepository, SnapshotBuildingRepository)
+        container.register(BaseActivityRepository, SnapshotActivityRepository)
+        container.register(BaseOrganizationRepository, SnapshotOrganizationRepository)
+        container.register(BaseOrganizationDocumentRepository, SnapshotOrganizationDocumentRepository)
+
     # Регистрируем доменные сервисы
     container.register(BuildingService)
     container.register(ActivityService)
     container.register(OrganizationService)
+    container.register(MapTileService)
+    container.register(ActivityFacetService)
+    container.register(CatalogSnapshotService)
+
+    def init_tile_cache() -> TileCache:
+        config: Config = container.resolve(Config)
+        return TileCache(max_entries=config.tile_cache_size)
+
+    container.register(TileCache, factory=init_tile_cache, scope=Scope.singleton)
+
+    def init_facet_cache() -> FacetCache:
+        config: Config = container.resolve(Config)
+        return FacetCache(max_entries=config.facet_cache_size)
+
+    container.register(FacetCache, factory=init_facet_cache, scope=Scope.singleton)
     container.register(UserService)
     container.register(APIKeyService)
 
@@ -123,27 +219,53 @@ def _init_container() -> Container:
     container.register(CreateBuildingCommandHandler)
     container.register(CreateActivityCommandHandler)
     container.register(CreateOrganizationCommandHandler)
+    container.register(DeleteOrganizationCommandHandler)
+    container.register(RebuildOrganizationDocumentsCommandHandler)
+    container.register(ExportCatalogSnapshotCommandHandler)
+    container.register(BuildCatalogFileCommandHandler)
     container.register(CreateUserCommandHandler)
     container.register(CreateAPIKeyCommandHandler)
 
     # Регистрируем query handlers
     container.register(GetActivityByIdQueryHandler)
+    container.register(GetActivityVersionQueryHandler)
     container.register(GetActivitiesQueryHandler)
     container.register(GetBuildingByIdQueryHandler)
+    container.register(GetBuildingVersionQueryHandler)
     container.register(GetBuildingByAddressQueryHandler)
     container.register(GetOrganizationByIdQueryHandler)
+    container.register(GetOrganizationVersionQueryHandler)
+    container.register(GetOrganizationsByIdsQueryHandler)
+    container.register(GetOrganizationDocumentsByIdsQueryHandler)
+    container.register(FindInconsistentOrganizationDocumentsQueryHandler)
     container.register(GetOrganizationsByAddressQueryHandler)
     container.register(GetOrganizationsByActivityQueryHandler)
     container.register(GetOrganizationsByNameQueryHandler)
     container.register(GetOrganizationsByRadiusQueryHandler)
     container.register(GetOrganizationsByRectangleQueryHandler)
+    container.register(SearchOrganizationsQueryHandler)
+    container.register(GetOrganizationClustersByRectangleQueryHandler)
+    container.register(GetNearestOrganizationsQueryHandler)
+    container.register(GetOrganizationsNearPointsQueryHandler)
+    container.register(GetActivityFacetsQueryHandler)
+    container.register(GetOrganizationChangesQueryHandler)
+    container.register(GetMapTileQueryHandler)
+    container.register(GetCatalogSnapshotQueryHandler)
     container.register(GetAPIKeyByKeyQueryHandler)
     container.register(AuthenticateUserQueryHandler)
 
+    # Регистрируем behaviors медиатора
+    container.register(TimingBehavior, instance=TimingBehavior(), scope=Scope.singleton)
+
     # Инициализируем медиатор
     def init_mediator() -> Mediator:
         mediator = Mediator()
 
+        # Регистрируем behaviors (порядок регистрации = порядок вложенности)
+        timing_behavior = container.resolve(TimingBehavior)
+        mediator.register_command_behavior(timing_behavior)
+        mediator.register_query_behavior(timing_behavior)
+
         # Регистрируем commands
         mediator.register_command(
             CreateBuildingCommand,
@@ -157,6 +279,22 @@ def _init_container() -> Container:
             CreateOrganizationCommand,
             [container.resolve(CreateOrganizationCommandHandler)],
         )
+        mediator.register_command(
+            DeleteOrganizationCommand,
+            [container.resolve(DeleteOrganizationCommandHandler)],
+        )
+        mediator.register_command(
+            RebuildOrganizationDocumentsCommand,
+            [container.resolve(RebuildOrganizationDocumentsCommandHandler)],
+        )
+        mediator.register_command(
+            ExportCatalogSnapshotCommand,
+            [container.resolve(ExportCatalogSnapshotCommandHandler)],
+        )
+        mediator.register_command(
+            BuildCatalogFileCommand,
+            [container.resolve(BuildCatalogFileCommandHandler)],
+        )
         mediator.register_command(
             CreateUserCommand,
             [container.resolve(CreateUserCommandHandler)],
@@ -171,6 +309,10 @@ def _init_container() -> Container:
             GetActivityByIdQuery,
             container.resolve(GetActivityByIdQueryHandler),
         )
+        mediator.register_query(
+            GetActivityVersionQuery,
+            container.resolve(GetActivityVersionQueryHandler),
+        )
         mediator.register_query(
             GetActivitiesQuery,
             container.resolve(GetActivitiesQueryHandler),
@@ -179,6 +321,10 @@ def _init_container() -> Container:
             GetBuildingByIdQuery,
             container.resolve(GetBuildingByIdQueryHandler),
         )
+        mediator.register_query(
+            GetBuildingVersionQuery,
+            container.resolve(GetBuildingVersionQueryHandler),
+        )
         mediator.register_query(
             GetBuildingByAddressQuery,
             container.resolve(GetBuildingByAddressQueryHandler),
@@ -187,6 +333,22 @@ def _init_container() -> Container:
             GetOrganizationByIdQuery,
             container.resolve(GetOrganizationByIdQueryHandler),
         )
+        mediator.register_query(
+            GetOrganizationVersionQuery,
+            container.resolve(GetOrganizationVersionQueryHandler),
+        )
+        mediator.register_query(
+            GetOrganizationsByIdsQuery,
+            container.resolve(GetOrganizationsByIdsQueryHandler),
+        )
+        mediator.register_query(
+            GetOrganizationDocumentsByIdsQuery,
+            container.resolve(GetOrganizationDocumentsByIdsQueryHandler),
+        )
+        mediator.register_query(
+            FindInconsistentOrganizationDocumentsQuery,
+            container.resolve(FindInconsistentOrganizationDocumentsQueryHandler),
+        )
         mediator.register_query(
             GetOrganizationsByAddressQuery,
             container.resolve(GetOrganizationsByAddressQueryHandler),
@@ -207,6 +369,38 @@ def _init_container() -> Container:
             GetOrganizationsByRectangleQuery,
             container.resolve(GetOrganizationsByRectangleQueryHandler),
         )
+        mediator.register_query(
+            SearchOrganizationsQuery,
+            container.resolve(SearchOrganizationsQueryHandler),
+        )
+        mediator.register_query(
+            GetOrganizationClustersByRectangleQuery,
+            container.resolve(GetOrganizationClustersByRectangleQueryHandler),
+        )
+        mediator.register_query(
+            GetNearestOrganizationsQuery,
+            container.resolve(GetNearestOrganizationsQueryHandler),
+        )
+        mediator.register_query(
+            GetOrganizationsNearPointsQuery,
+            container.resolve(GetOrganizationsNearPointsQueryHandler),
+        )
+        mediator.register_query(
+            GetActivityFacetsQuery,
+            container.resolve(GetActivityFacetsQueryHandler),
+        )
+        mediator.register_query(
+            GetOrganizationChangesQuery,
+            container.resolve(GetOrganizationChangesQueryHandler),
+        )
+        mediator.register_query(
+            GetMapTileQuery,
+            container.resolve(GetMapTileQueryHandler),
+        )
+        mediator.register_query(
+            GetCatalogSnapshotQuery,
+            container.resolve(GetCatalogSnapshotQueryHandler),
+        )
         mediator.register_query(
             GetAPIKeyByKeyQuery,
             container.resolve(GetAPIKeyByKeyQueryHandler),
@@ -1,10 +1,20 @@
+import asyncio
+import logging
 from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import (
     dataclass,
     field,
 )
+from enum import StrEnum
+from functools import partial
+from typing import Any
 
+from application.behaviors.base import (
+    BaseBehavior,
+    HandlerType,
+    RequestType,
+)
 from application.commands.base import (
     BaseCommand,
     BaseCommandHandler,
@@ -12,6 +22,7 @@ from application.commands.base import (
     CommandType,
 )
 from application.exceptions.mediator import (
+    CommandHandlersFailedException,
     CommandHandlersNotRegisteredException,
     QueryHandlerNotRegisteredException,
 )
@@ -23,6 +34,20 @@ from application.queries.base import (
 )
 
 
+# Логгер приложения по имени: слой application не зависит от infrastructure,
+# а handlers на него навешивает setup_logging
+logger = logging.getLogger("app_logger")
+
+
+class CommandExecutionPolicy(StrEnum):
+    # Обработчики выполняются по очереди, первая ошибка прерывает выполнение
+    SEQUENTIAL = "sequential"
+    # Все обработчики выполняются конкурентно, ошибки собираются вместе
+    CONCURRENT = "concurrent"
+    # Ответ возвращается после первого обработчика, остальные — в фоне
+    PRIMARY_THEN_BACKGROUND = "primary_then_background"
+
+
 @dataclass(eq=False)
 class Mediator:
     commands_map: dict[CommandType, BaseCommandHandler] = field(
@@ -35,13 +60,26 @@ class Mediator:
         kw_only=True,
     )
 
+    command_behaviors: list[BaseBehavior] = field(default_factory=list, kw_only=True)
+    query_behaviors: list[BaseBehavior] = field(default_factory=list, kw_only=True)
+
+    command_policies: dict[CommandType, CommandExecutionPolicy] = field(
+        default_factory=dict,
+        kw_only=True,
+    )
+    _background_tasks: set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+
     def register_command(
         self,
         command: CommandType,
         command_handlers: Iterable[BaseCommandHandler[CommandType, CommandResultType]],
+        policy: CommandExecutionPolicy | None = None,
     ):
         self.commands_map[command].extend(command_handlers)
 
+        if policy is not None:
+            self.command_policies[command] = policy
+
     def register_query(
         self,
         query: QueryType,
@@ -49,6 +87,14 @@ class Mediator:
     ):
         self.queries_map[query] = query_handler
 
+    def register_command_behavior(self, behavior: BaseBehavior):
+        """Behaviors выполняются в порядке регистрации: первый — внешний."""
+        self.command_behaviors.append(behavior)
+
+    def register_query_behavior(self, behavior: BaseBehavior):
+        """Behaviors выполняются в порядке регистрации: первый — внешний."""
+        self.query_behaviors.append(behavior)
+
     async def handle_command(self, command: BaseCommand) -> Iterable[CommandResultType]:
         command_type = command.__class__
 
@@ -57,7 +103,23 @@ class Mediator:
         if not handlers:
             raise CommandHandlersNotRegisteredException(command_type)
 
-        return [await handler.handle(command) for handler in handlers]
+        policy = self.command_policies.get(command_type, CommandExecutionPolicy.SEQUENTIAL)
+
+        if len(handlers) == 1 or policy == CommandExecutionPolicy.SEQUENTIAL:
+            return [await self._call_command_handler(command, handler) for handler in handlers]
+
+        if policy == CommandExecutionPolicy.CONCURRENT:
+            return await self._handle_command_concurrently(command, handlers)
+
+        primary, *secondary = handlers
+        result = await self._call_command_handler(command, primary)
+
+        for handler in secondary:
+            task = asyncio.create_task(self._call_command_handler(command, handler))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._on_background_task_done)
+
+        return [result]
 
     async def handle_query(self, query: BaseQuery) -> QueryResultType:
         query_type = query.__class__
@@ -66,4 +128,72 @@ class Mediator:
         if not handler:
             raise QueryHandlerNotRegisteredException(query_type)
 
-        return await handler.handle(query=query)
+        if not self.query_behaviors:
+            return await handler.handle(query=query)
+
+        return await self._run_pipeline(self.query_behaviors, query, handler)
+
+    async def wait_background_tasks(self) -> None:
+        """Дожидается фоновых обработчиков команд (для shutdown и тестов)."""
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def _call_command_handler(
+        self,
+        command: BaseCommand,
+        handler: BaseCommandHandler,
+    ) -> CommandResultType:
+        if not self.command_behaviors:
+            return await handler.handle(command)
+
+        return await self._run_pipeline(self.command_behaviors, command, handler)
+
+    async def _handle_command_concurrently(
+        self,
+        command: BaseCommand,
+        handlers: list[BaseCommandHandler],
+    ) -> list[CommandResultType]:
+        results: list[Any] = [None] * len(handlers)
+        errors: list[Exception] = []
+
+        async def run(index: int, handler: BaseCommandHandler) -> None:
+            # Ошибку ловим внутри задачи, чтобы TaskGroup не отменял соседние обработчики
+            try:
+                results[index] = await self._call_command_handler(command, handler)
+            except Exception as error:
+                errors.append(error)
+
+        async with asyncio.TaskGroup() as task_group:
+            for index, handler in enumerate(handlers):
+                task_group.create_task(run(index, handler))
+
+        if len(errors) == 1:
+            raise errors[0]
+
+        if errors:
+            raise CommandHandlersFailedException(command_type=command.__class__, errors=errors)
+
+        return results
+
+    def _on_background_task_done(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+
+        if task.cancelled() or task.exception() is None:
+            return
+
+        logger.error(
+            "Background command handler failed",
+            exc_info=task.exception(),
+        )
+
+    @staticmethod
+    async def _run_pipeline(
+        behaviors: list[BaseBehavior],
+        request: RequestType,
+        handler: HandlerType,
+    ) -> Any:
+        call_next = handler.handle
+        for behavior in reversed(behaviors):
+            call_next = partial(behavior.handle, handler=handler, call_next=call_next)
+
+        return await call_next(request)
@@ -6,6 +6,8 @@ from application.queries.base import (
     BaseQuery,
     BaseQueryHandler,
 )
+from domain.base.entity import EntityVersion
+from domain.base.pagination import TotalMode
 from domain.organization.entities import ActivityEntity
 from domain.organization.services.activity import ActivityService
 
@@ -15,12 +17,19 @@ class GetActivityByIdQuery(BaseQuery):
     activity_id: UUID
 
 
+@dataclass(frozen=True)
+class GetActivityVersionQuery(BaseQuery):
+    activity_id: UUID
+
+
 @dataclass(frozen=True)
 class GetActivitiesQuery(BaseQuery):
     name: str | None = None
     parent_id: UUID | None = None
     limit: int = 10
     offset: int = 0
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
 
 
 @dataclass(frozen=True)
@@ -36,11 +45,24 @@ class GetActivityByIdQueryHandler(
         return await self.activity_service.get_activity_by_id(query.activity_id)
 
 
+@dataclass(frozen=True)
+class GetActivityVersionQueryHandler(
+    BaseQueryHandler[GetActivityVersionQuery, EntityVersion | None],
+):
+    activity_service: ActivityService
+
+    async def handle(
+        self,
+        query: GetActivityVersionQuery,
+    ) -> EntityVersion | None:
+        return await self.activity_service.get_activity_version(query.activity_id)
+
+
 @dataclass(frozen=True)
 class GetActivitiesQueryHandler(
     BaseQueryHandler[
         GetActivitiesQuery,
-        tuple[Iterable[ActivityEntity], int],
+        tuple[Iterable[ActivityEntity], int | None],
     ],
 ):
     activity_service: ActivityService
@@ -48,10 +70,12 @@ class GetActivitiesQueryHandler(
     async def handle(
         self,
         query: GetActivitiesQuery,
-    ) -> tuple[Iterable[ActivityEntity], int]:
+    ) -> tuple[Iterable[ActivityEntity], int | None]:
         return await self.activity_service.get_activities(
             name=query.name,
             parent_id=query.parent_id,
             limit=query.limit,
             offset=query.offset,
+            cursor=query.cursor,
+            total_mode=query.total_mode,
         )
@@ -5,6 +5,7 @@ from application.queries.base import (
     BaseQuery,
     BaseQueryHandler,
 )
+from domain.base.entity import EntityVersion
 from domain.organization.entities import BuildingEntity
 from domain.organization.services.building import BuildingService
 
@@ -14,6 +15,11 @@ class GetBuildingByIdQuery(BaseQuery):
     building_id: UUID
 
 
+@dataclass(frozen=True)
+class GetBuildingVersionQuery(BaseQuery):
+    building_id: UUID
+
+
 @dataclass(frozen=True)
 class GetBuildingByAddressQuery(BaseQuery):
     address: str
@@ -32,6 +38,19 @@ class GetBuildingByIdQueryHandler(
         return await self.building_service.get_building_by_id(query.building_id)
 
 
+@dataclass(frozen=True)
+class GetBuildingVersionQueryHandler(
+    BaseQueryHandler[GetBuildingVersionQuery, EntityVersion | None],
+):
+    building_service: BuildingService
+
+    async def handle(
+        self,
+        query: GetBuildingVersionQuery,
+    ) -> EntityVersion | None:
+        return await self.building_service.get_building_version(query.building_id)
+
+
 @dataclass(frozen=True)
 class GetBuildingByAddressQueryHandler(
     BaseQueryHandler[GetBuildingByAddressQuery, BuildingEntity | None],
@@ -0,0 +1,28 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.organization.services import CatalogSnapshotService
+from domain.organization.snapshot import (
+    SNAPSHOT_BATCH_SIZE,
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+@dataclass(frozen=True)
+class GetCatalogSnapshotQuery(BaseQuery):
+    table: SnapshotTable
+    snapshot_format: SnapshotFormat
+    batch_size: int = SNAPSHOT_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class GetCatalogSnapshotQueryHandler(BaseQueryHandler[GetCatalogSnapshotQuery, AsyncIterator[bytes]]):
+    catalog_snapshot_service: CatalogSnapshotService
+
+    async def handle(self, query: GetCatalogSnapshotQuery) -> AsyncIterator[bytes]:
+        return self.catalog_snapshot_service.export_table(query.table, query.snapshot_format, query.batch_size)
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+from domain.organization.services import MapTileService
+
+
+@dataclass(frozen=True)
+class GetMapTileQuery(BaseQuery):
+    z: int
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class GetMapTileQueryHandler(BaseQueryHandler[GetMapTileQuery, bytes]):
+    map_tile_service: MapTileService
+
+    async def handle(self, query: GetMapTileQuery) -> bytes:
+        return await self.map_tile_service.get_tile(query.z, query.x, query.y)
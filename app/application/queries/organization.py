@@ -1,12 +1,32 @@
 from collections.abc import Iterable
 from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
 
 from application.queries.base import (
     BaseQuery,
     BaseQueryHandler,
 )
+from domain.base.entity import EntityVersion
+from domain.base.pagination import TotalMode
 from domain.organization.entities import OrganizationEntity
-from domain.organization.services import OrganizationService
+from domain.organization.read_models import (
+    ActivityFacet,
+    NearbyOrganization,
+    OrganizationChangesPage,
+    OrganizationCluster,
+    OrganizationDocument,
+)
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+    SearchPolygon,
+)
+from domain.organization.services import (
+    ActivityFacetService,
+    OrganizationService,
+)
+from domain.organization.services.organization import OrganizationListItem
 
 
 @dataclass(frozen=True)
@@ -14,11 +34,34 @@ class GetOrganizationByIdQuery(BaseQuery):
     organization_id: str
 
 
+@dataclass(frozen=True)
+class GetOrganizationVersionQuery(BaseQuery):
+    organization_id: UUID
+
+
+@dataclass(frozen=True)
+class GetOrganizationsByIdsQuery(BaseQuery):
+    organization_ids: tuple[UUID, ...]
+
+
+@dataclass(frozen=True)
+class GetOrganizationDocumentsByIdsQuery(BaseQuery):
+    organization_ids: tuple[UUID, ...]
+
+
+@dataclass(frozen=True)
+class FindInconsistentOrganizationDocumentsQuery(BaseQuery): ...
+
+
 @dataclass(frozen=True)
 class GetOrganizationsByAddressQuery(BaseQuery):
     address: str
     limit: int
     offset: int
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    as_documents: bool = False
+    fields: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -26,6 +69,10 @@ class GetOrganizationsByActivityQuery(BaseQuery):
     activity_name: str
     limit: int
     offset: int
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    as_documents: bool = False
+    fields: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -33,6 +80,10 @@ class GetOrganizationsByNameQuery(BaseQuery):
     name: str
     limit: int
     offset: int
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    as_documents: bool = False
+    fields: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -42,6 +93,10 @@ class GetOrganizationsByRadiusQuery(BaseQuery):
     radius: float
     limit: int
     offset: int
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    as_documents: bool = False
+    fields: tuple[str, ...] | None = None
 
 
 @dataclass(frozen=True)
@@ -52,6 +107,66 @@ class GetOrganizationsByRectangleQuery(BaseQuery):
     lon_max: float
     limit: int
     offset: int
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    as_documents: bool = False
+    fields: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class SearchOrganizationsQuery(BaseQuery):
+    limit: int
+    offset: int
+    name: str | None = None
+    activity_name: str | None = None
+    address: str | None = None
+    circle: SearchCircle | None = None
+    bounding_box: SearchBoundingBox | None = None
+    polygon: SearchPolygon | None = None
+    cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    as_documents: bool = False
+    fields: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class GetOrganizationClustersByRectangleQuery(BaseQuery):
+    lat_min: float
+    lat_max: float
+    lon_min: float
+    lon_max: float
+    zoom: int
+
+
+@dataclass(frozen=True)
+class GetNearestOrganizationsQuery(BaseQuery):
+    latitude: float
+    longitude: float
+    limit: int
+    activity_name: str | None = None
+
+
+@dataclass(frozen=True)
+class GetOrganizationsNearPointsQuery(BaseQuery):
+    points: tuple[SearchCircle, ...]
+    limit: int
+    activity_name: str | None = None
+
+
+@dataclass(frozen=True)
+class GetActivityFacetsQuery(BaseQuery):
+    name: str | None = None
+    address: str | None = None
+    building_id: UUID | None = None
+    circle: SearchCircle | None = None
+    bounding_box: SearchBoundingBox | None = None
+
+
+@dataclass(frozen=True)
+class GetOrganizationChangesQuery(BaseQuery):
+    limit: int
+    since: datetime | None = None
+    cursor: str | None = None
 
 
 @dataclass(frozen=True)
@@ -69,11 +184,67 @@ class GetOrganizationByIdQueryHandler(
         )
 
 
+@dataclass(frozen=True)
+class GetOrganizationVersionQueryHandler(
+    BaseQueryHandler[GetOrganizationVersionQuery, EntityVersion | None],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: GetOrganizationVersionQuery,
+    ) -> EntityVersion | None:
+        return await self.organization_service.get_organization_version(query.organization_id)
+
+
+@dataclass(frozen=True)
+class GetOrganizationsByIdsQueryHandler(
+    BaseQueryHandler[GetOrganizationsByIdsQuery, list[OrganizationEntity]],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: GetOrganizationsByIdsQuery,
+    ) -> list[OrganizationEntity]:
+        return await self.organization_service.get_organizations_by_ids(
+            query.organization_ids,
+        )
+
+
+@dataclass(frozen=True)
+class GetOrganizationDocumentsByIdsQueryHandler(
+    BaseQueryHandler[GetOrganizationDocumentsByIdsQuery, list[OrganizationDocument]],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: GetOrganizationDocumentsByIdsQuery,
+    ) -> list[OrganizationDocument]:
+        return await self.organization_service.get_organization_documents_by_ids(
+            query.organization_ids,
+        )
+
+
+@dataclass(frozen=True)
+class FindInconsistentOrganizationDocumentsQueryHandler(
+    BaseQueryHandler[FindInconsistentOrganizationDocumentsQuery, list[UUID]],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: FindInconsistentOrganizationDocumentsQuery,
+    ) -> list[UUID]:
+        return await self.organization_service.find_inconsistent_organization_documents()
+
+
 @dataclass(frozen=True)
 class GetOrganizationsByAddressQueryHandler(
     BaseQueryHandler[
         GetOrganizationsByAddressQuery,
-        tuple[Iterable[OrganizationEntity], int],
+        tuple[Iterable[OrganizationListItem], int | None],
     ],
 ):
     organization_service: OrganizationService
@@ -81,11 +252,15 @@ class GetOrganizationsByAddressQueryHandler(
     async def handle(
         self,
         query: GetOrganizationsByAddressQuery,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         return await self.organization_service.get_organizations_by_address(
             address=query.address,
             limit=query.limit,
             offset=query.offset,
+            cursor=query.cursor,
+            total_mode=query.total_mode,
+            as_documents=query.as_documents,
+            fields=query.fields,
         )
 
 
@@ -93,7 +268,7 @@ class GetOrganizationsByAddressQueryHandler(
 class GetOrganizationsByActivityQueryHandler(
     BaseQueryHandler[
         GetOrganizationsByActivityQuery,
-        tuple[Iterable[OrganizationEntity], int],
+        tuple[Iterable[OrganizationListItem], int | None],
     ],
 ):
     organization_service: OrganizationService
@@ -101,11 +276,15 @@ class GetOrganizationsByActivityQueryHandler(
     async def handle(
         self,
         query: GetOrganizationsByActivityQuery,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         return await self.organization_service.get_organizations_by_activity(
             activity_name=query.activity_name,
             limit=query.limit,
             offset=query.offset,
+            cursor=query.cursor,
+            total_mode=query.total_mode,
+            as_documents=query.as_documents,
+            fields=query.fields,
         )
 
 
@@ -113,7 +292,7 @@ class GetOrganizationsByActivityQueryHandler(
 class GetOrganizationsByNameQueryHandler(
     BaseQueryHandler[
         GetOrganizationsByNameQuery,
-        tuple[Iterable[OrganizationEntity], int],
+        tuple[Iterable[OrganizationListItem], int | None],
     ],
 ):
     organization_service: OrganizationService
@@ -121,11 +300,15 @@ class GetOrganizationsByNameQueryHandler(
     async def handle(
         self,
         query: GetOrganizationsByNameQuery,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         return await self.organization_service.get_organizations_by_name(
             name=query.name,
             limit=query.limit,
             offset=query.offset,
+            cursor=query.cursor,
+            total_mode=query.total_mode,
+            as_documents=query.as_documents,
+            fields=query.fields,
         )
 
 
@@ -133,7 +316,7 @@ class GetOrganizationsByNameQueryHandler(
 class GetOrganizationsByRadiusQueryHandler(
     BaseQueryHandler[
         GetOrganizationsByRadiusQuery,
-        tuple[Iterable[OrganizationEntity], int],
+        tuple[Iterable[OrganizationListItem], int | None],
     ],
 ):
     organization_service: OrganizationService
@@ -141,13 +324,17 @@ class GetOrganizationsByRadiusQueryHandler(
     async def handle(
         self,
         query: GetOrganizationsByRadiusQuery,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         return await self.organization_service.get_organizations_by_radius(
             latitude=query.latitude,
             longitude=query.longitude,
             radius=query.radius,
             limit=query.limit,
             offset=query.offset,
+            cursor=query.cursor,
+            total_mode=query.total_mode,
+            as_documents=query.as_documents,
+            fields=query.fields,
         )
 
 
@@ -155,7 +342,7 @@ class GetOrganizationsByRadiusQueryHandler(
 class GetOrganizationsByRectangleQueryHandler(
     BaseQueryHandler[
         GetOrganizationsByRectangleQuery,
-        tuple[Iterable[OrganizationEntity], int],
+        tuple[Iterable[OrganizationListItem], int | None],
     ],
 ):
     organization_service: OrganizationService
@@ -163,7 +350,7 @@ class GetOrganizationsByRectangleQueryHandler(
     async def handle(
         self,
         query: GetOrganizationsByRectangleQuery,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         return await self.organization_service.get_organizations_by_rectangle(
             lat_min=query.lat_min,
             lat_max=query.lat_max,
@@ -171,4 +358,117 @@ class GetOrganizationsByRectangleQueryHandler(
             lon_max=query.lon_max,
             limit=query.limit,
             offset=query.offset,
+            cursor=query.cursor,
+            total_mode=query.total_mode,
+            as_documents=query.as_documents,
+            fields=query.fields,
+        )
+
+
+@dataclass(frozen=True)
+class SearchOrganizationsQueryHandler(
+    BaseQueryHandler[
+        SearchOrganizationsQuery,
+        tuple[Iterable[OrganizationListItem], int | None],
+    ],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: SearchOrganizationsQuery,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
+        return await self.organization_service.search_organizations(
+            limit=query.limit,
+            offset=query.offset,
+            name=query.name,
+            activity_name=query.activity_name,
+            address=query.address,
+            circle=query.circle,
+            bounding_box=query.bounding_box,
+            polygon=query.polygon,
+            cursor=query.cursor,
+            total_mode=query.total_mode,
+            as_documents=query.as_documents,
+            fields=query.fields,
+        )
+
+
+@dataclass(frozen=True)
+class GetOrganizationClustersByRectangleQueryHandler(
+    BaseQueryHandler[GetOrganizationClustersByRectangleQuery, list[OrganizationCluster]],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: GetOrganizationClustersByRectangleQuery,
+    ) -> list[OrganizationCluster]:
+        return await self.organization_service.get_organization_clusters_by_rectangle(
+            lat_min=query.lat_min,
+            lat_max=query.lat_max,
+            lon_min=query.lon_min,
+            lon_max=query.lon_max,
+            zoom=query.zoom,
+        )
+
+
+@dataclass(frozen=True)
+class GetNearestOrganizationsQueryHandler(
+    BaseQueryHandler[GetNearestOrganizationsQuery, list[NearbyOrganization]],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: GetNearestOrganizationsQuery,
+    ) -> list[NearbyOrganization]:
+        return await self.organization_service.get_nearest_organizations(
+            latitude=query.latitude,
+            longitude=query.longitude,
+            limit=query.limit,
+            activity_name=query.activity_name,
+        )
+
+
+@dataclass(frozen=True)
+class GetOrganizationsNearPointsQueryHandler(
+    BaseQueryHandler[GetOrganizationsNearPointsQuery, list[list[NearbyOrganization]]],
+):
+    organization_service: OrganizationService
+
+    async def handle(
+        self,
+        query: GetOrganizationsNearPointsQuery,
+    ) -> list[list[NearbyOrganization]]:
+        return await self.organization_service.get_organizations_near_points(
+            points=query.points,
+            limit=query.limit,
+            activity_name=query.activity_name,
+        )
+
+
+@dataclass(frozen=True)
+class GetActivityFacetsQueryHandler(BaseQueryHandler[GetActivityFacetsQuery, list[ActivityFacet]]):
+    activity_facet_service: ActivityFacetService
+
+    async def handle(self, query: GetActivityFacetsQuery) -> list[ActivityFacet]:
+        return await self.activity_facet_service.get_activity_facets(
+            name=query.name,
+            address=query.address,
+            building_id=query.building_id,
+            circle=query.circle,
+            bounding_box=query.bounding_box,
+        )
+
+
+@dataclass(frozen=True)
+class GetOrganizationChangesQueryHandler(BaseQueryHandler[GetOrganizationChangesQuery, OrganizationChangesPage]):
+    organization_service: OrganizationService
+
+    async def handle(self, query: GetOrganizationChangesQuery) -> OrganizationChangesPage:
+        return await self.organization_service.get_organization_changes(
+            limit=query.limit,
+            since=query.since,
+            cursor=query.cursor,
         )
@@ -0,0 +1,42 @@
+"""Бенчмарк сжатия страницы из 100 организаций: CPU на ответ против
+сэкономленных байт для zstd, brotli и gzip.
+
+Запуск из каталога ``app``::
+
+    python -m benchmarks.compression
+
+"""
+
+import time
+
+import orjson
+from benchmarks.serialization import build_organizations_page
+from presentation.api.middleware.compression import available_encoders
+from presentation.api.v1.organization.serializers import organization_detail_to_dict
+
+
+ITERATIONS = 200
+
+
+def main() -> None:
+    body = orjson.dumps(
+        {"data": {"items": [organization_detail_to_dict(org) for org in build_organizations_page()]}},
+    )
+    print(f"identity: {len(body):>8} bytes")
+
+    for encoding, encoder_factory in available_encoders().items():
+        started_at = time.process_time()
+        for _ in range(ITERATIONS):
+            encoder = encoder_factory()
+            compressed = encoder.compress(body) + encoder.finish()
+        cpu_ms = (time.process_time() - started_at) * 1000 / ITERATIONS
+
+        saved = len(body) - len(compressed)
+        print(
+            f"{encoding:>8}: {len(compressed):>8} bytes ({saved / len(body):6.1%} saved), "
+            f"{cpu_ms:6.3f} ms CPU/response, {saved / 1024 / cpu_ms:8.1f} KiB saved per CPU ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
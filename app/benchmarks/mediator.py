@@ -0,0 +1,63 @@
+"""Бенчмарк накладных расходов pipeline медиатора.
+
+Запуск из каталога ``app``::
+
+    python -m benchmarks.mediator
+
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from application.behaviors import TimingBehavior
+from application.mediator import Mediator
+from application.queries.base import (
+    BaseQuery,
+    BaseQueryHandler,
+)
+
+
+ITERATIONS = 200_000
+
+
+@dataclass(frozen=True)
+class NoopQuery(BaseQuery): ...
+
+
+@dataclass(frozen=True)
+class NoopQueryHandler(BaseQueryHandler[NoopQuery, None]):
+    async def handle(self, query: NoopQuery) -> None:
+        return None
+
+
+async def _measure(call, query: NoopQuery) -> float:
+    """Возвращает среднее время одного вызова в наносекундах."""
+    started_at = time.perf_counter_ns()
+    for _ in range(ITERATIONS):
+        await call(query)
+    return (time.perf_counter_ns() - started_at) / ITERATIONS
+
+
+async def main() -> None:
+    query = NoopQuery()
+    handler = NoopQueryHandler()
+
+    bare_mediator = Mediator()
+    bare_mediator.register_query(NoopQuery, handler)
+
+    timed_mediator = Mediator()
+    timed_mediator.register_query(NoopQuery, handler)
+    timed_mediator.register_query_behavior(TimingBehavior())
+
+    direct = await _measure(handler.handle, query)
+    bare = await _measure(bare_mediator.handle_query, query)
+    timed = await _measure(timed_mediator.handle_query, query)
+
+    print(f"direct handler call:        {direct:8.1f} ns/op")
+    print(f"mediator, no behaviors:     {bare:8.1f} ns/op (overhead {bare - direct:+.1f} ns)")
+    print(f"mediator, TimingBehavior:   {timed:8.1f} ns/op (overhead {timed - direct:+.1f} ns)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,120 @@
+"""Бенчмарк поиска организаций рядом с точками маршрута: запрос на
+каждую точку против одного VALUES + LATERAL запроса.
+
+Нужен запущенный PostgreSQL с применёнными миграциями (настройки берутся
+из ``Config``). Данные вставляются в транзакции, которая в конце
+откатывается.
+
+Запуск из каталога ``app``::
+
+    python -m benchmarks.near_points
+
+"""
+
+import asyncio
+import random
+import time
+
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.organization import OrganizationModel
+from infrastructure.database.pagination import paginate_select
+from infrastructure.database.repositories.organization import (
+    apply_organization_filters,
+    near_points_select,
+    organization_sort_key,
+)
+from sqlalchemy import (
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.init import init_container
+from domain.base.pagination import PageRequest
+from domain.organization.search import SearchCircle
+
+
+BUILDINGS = 50_000
+POINTS = (10, 50, 100)
+RADIUS = 1000
+LIMIT = 10
+ITERATIONS = 20
+
+# Окрестности Москвы
+LATITUDE = (55.55, 55.95)
+LONGITUDE = (37.35, 37.85)
+
+
+async def _per_point(session: AsyncSession, points: list[SearchCircle]) -> None:
+    for point in points:
+        filters = {"within": point}
+        stmt = paginate_select(
+            apply_organization_filters(select(OrganizationModel.oid), filters),
+            OrganizationModel,
+            PageRequest(limit=LIMIT),
+            sort_key=organization_sort_key(filters),
+        )
+        (await session.scalars(stmt)).all()
+
+
+async def _batched(session: AsyncSession, points: list[SearchCircle]) -> None:
+    (await session.execute(near_points_select(points, LIMIT, {}))).all()
+
+
+async def _measure(session: AsyncSession, run, points: list[SearchCircle]) -> float:
+    """Возвращает среднее время обработки всех точек в миллисекундах."""
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await run(session, points)
+    return (time.perf_counter() - started_at) * 1000 / ITERATIONS
+
+
+async def main() -> None:
+    database: Database = init_container().resolve(Database)
+    rng = random.Random(42)
+
+    async with database.get_session() as session:
+        await session.execute(
+            text(
+                "INSERT INTO building (oid, address, location, geohash, created_at, updated_at) "
+                "SELECT gen_random_uuid(), 'bench_' || n, point::geography, ST_GeoHash(point, 9), now(), now() "
+                "FROM generate_series(1, :rows) AS n, "
+                "LATERAL (SELECT ST_SetSRID(ST_MakePoint(:lon_min + random() * (:lon_max - :lon_min), "
+                ":lat_min + random() * (:lat_max - :lat_min)), 4326) AS point) AS p",
+            ),
+            {
+                "rows": BUILDINGS,
+                "lon_min": LONGITUDE[0],
+                "lon_max": LONGITUDE[1],
+                "lat_min": LATITUDE[0],
+                "lat_max": LATITUDE[1],
+            },
+        )
+        await session.execute(
+            text(
+                "INSERT INTO organization (oid, name, building_id, created_at, updated_at) "
+                "SELECT gen_random_uuid(), 'bench_' || address, oid, now(), now() "
+                "FROM building WHERE address LIKE 'bench\\_%'",
+            ),
+        )
+        await session.execute(text("ANALYZE building"))
+        await session.execute(text("ANALYZE organization"))
+
+        for count in POINTS:
+            points = [
+                SearchCircle(
+                    latitude=rng.uniform(*LATITUDE),
+                    longitude=rng.uniform(*LONGITUDE),
+                    radius=RADIUS,
+                )
+                for _ in range(count)
+            ]
+            per_point = await _measure(session, _per_point, points)
+            batched = await _measure(session, _batched, points)
+            print(f"{count:>4} points  per-point {per_point:9.3f} ms  batched {batched:9.3f} ms")
+
+        await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
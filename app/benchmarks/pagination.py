@@ -0,0 +1,86 @@
+"""Бенчмарк offset и keyset пагинации: первая страница против 10 000-й.
+
+Нужен запущенный PostgreSQL с применёнными миграциями (настройки берутся
+из ``Config``). Данные вставляются в транзакции, которая в конце
+откатывается.
+
+Запуск из каталога ``app``::
+
+    python -m benchmarks.pagination
+
+"""
+
+import asyncio
+import time
+
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.activity import ActivityModel
+from infrastructure.database.pagination import paginate_select
+from sqlalchemy import (
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.init import init_container
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
+
+
+PAGE_SIZE = 10
+FAR_PAGE = 10_000
+ROWS = PAGE_SIZE * (FAR_PAGE + 1)
+ITERATIONS = 50
+
+
+async def _measure(session: AsyncSession, page: PageRequest) -> float:
+    """Возвращает среднее время выборки страницы в миллисекундах."""
+    stmt = paginate_select(select(ActivityModel), ActivityModel, page)
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        (await session.scalars(stmt)).all()
+    return (time.perf_counter() - started_at) * 1000 / ITERATIONS
+
+
+async def main() -> None:
+    database: Database = init_container().resolve(Database)
+
+    async with database.get_session() as session:
+        await session.execute(
+            text(
+                "INSERT INTO activity (oid, name, created_at, updated_at) "
+                "SELECT gen_random_uuid(), 'bench_' || n, "
+                "now() + n * interval '1 microsecond', now() "
+                "FROM generate_series(1, :rows) AS n",
+            ),
+            {"rows": ROWS},
+        )
+        await session.execute(text("ANALYZE activity"))
+
+        # Курсор на последнюю запись страницы, предшествующей FAR_PAGE
+        last = await session.scalar(
+            paginate_select(
+                select(ActivityModel),
+                ActivityModel,
+                PageRequest(limit=1, offset=PAGE_SIZE * (FAR_PAGE - 1) - 1),
+            ),
+        )
+        cursor = PageCursor.from_entity(last)
+
+        results = {
+            "offset, page 1": PageRequest(limit=PAGE_SIZE),
+            f"offset, page {FAR_PAGE}": PageRequest(limit=PAGE_SIZE, offset=PAGE_SIZE * (FAR_PAGE - 1)),
+            "keyset, page 1": PageRequest(limit=PAGE_SIZE),
+            f"keyset, page {FAR_PAGE}": PageRequest(limit=PAGE_SIZE, after=cursor),
+        }
+        for name, page in results.items():
+            print(f"{name:<22} {await _measure(session, page):8.3f} ms/page")
+
+        await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
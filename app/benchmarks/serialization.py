@@ -0,0 +1,109 @@
+"""Бенчмарк сериализации страницы из 100 организаций: pydantic схемы
+против быстрого пути entity -> dict -> orjson.
+
+Запуск из каталога ``app``::
+
+    python -m benchmarks.serialization
+
+"""
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+import httpx
+from presentation.api.filters import PaginationOut
+from presentation.api.responses import list_paginated_response
+from presentation.api.schemas import (
+    ApiResponse,
+    ListPaginatedResponse,
+)
+from presentation.api.v1.organization.schemas import OrganizationDetailSchema
+from presentation.api.v1.organization.serializers import organization_detail_to_dict
+
+from domain.organization.entities import (
+    ActivityEntity,
+    BuildingEntity,
+    OrganizationEntity,
+)
+from domain.organization.value_objects import (
+    ActivityNameValueObject,
+    BuildingAddressValueObject,
+    BuildingCoordinatesValueObject,
+    OrganizationNameValueObject,
+    OrganizationPhoneValueObject,
+)
+
+
+PAGE_SIZE = 100
+REQUESTS = 500
+
+
+def build_organizations_page() -> list[OrganizationEntity]:
+    food = ActivityEntity(name=ActivityNameValueObject("Еда"))
+    meat = ActivityEntity(name=ActivityNameValueObject("Мясная продукция"), parent=food)
+    building = BuildingEntity(
+        address=BuildingAddressValueObject("г. Москва, ул. Ленина 1"),
+        coordinates=BuildingCoordinatesValueObject(latitude=55.7558, longitude=37.6173),
+    )
+    return [
+        OrganizationEntity(
+            name=OrganizationNameValueObject(f"ООО Рога и Копыта {index}"),
+            building=building,
+            phones=[
+                OrganizationPhoneValueObject("+7-495-123-4567"),
+                OrganizationPhoneValueObject("+7-923-666-1313"),
+            ],
+            activities=[food, meat],
+        )
+        for index in range(PAGE_SIZE)
+    ]
+
+
+def _create_app(organizations: list[OrganizationEntity]) -> FastAPI:
+    app = FastAPI()
+    pagination = PaginationOut(limit=PAGE_SIZE, offset=0, total=PAGE_SIZE)
+
+    @app.get("/pydantic", response_model=ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]])
+    async def pydantic_page():
+        return ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]](
+            data=ListPaginatedResponse[OrganizationDetailSchema](
+                items=[OrganizationDetailSchema.from_entity(org) for org in organizations],
+                pagination=pagination,
+            ),
+        )
+
+    @app.get("/fast", response_model=ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]])
+    async def fast_page():
+        return list_paginated_response(
+            items=[organization_detail_to_dict(org) for org in organizations],
+            pagination=pagination,
+        )
+
+    return app
+
+
+async def _measure(client: httpx.AsyncClient, url: str) -> float:
+    """Возвращает пропускную способность в запросах в секунду."""
+    started_at = time.perf_counter()
+    for _ in range(REQUESTS):
+        response = await client.get(url)
+        response.raise_for_status()
+    return REQUESTS / (time.perf_counter() - started_at)
+
+
+async def main() -> None:
+    app = _create_app(build_organizations_page())
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        pydantic_rps = await _measure(client, "/pydantic")
+        fast_rps = await _measure(client, "/fast")
+
+    print(f"pydantic schemas + response_model: {pydantic_rps:8.1f} req/s")
+    print(f"entity -> dict -> orjson:          {fast_rps:8.1f} req/s (x{fast_rps / pydantic_rps:.1f})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
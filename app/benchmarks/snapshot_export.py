@@ -0,0 +1,142 @@
+"""Бенчмарк выгрузки каталога: постраничный JSON против колоночного
+снимка (Arrow IPC и Parquet) из курсора на стороне сервера.
+
+JSON путь повторяет то, что делает клиент API: keyset страницы по
+``PAGE_SIZE`` организаций с адресом, координатами, телефонами и видами
+деятельности, каждая страница сериализуется orjson. Снимок выгружает
+таблицы организаций, зданий, телефонов и связей с видами деятельности.
+Скорость в обоих случаях — организаций в секунду.
+
+Нужен запущенный PostgreSQL с применёнными миграциями (настройки берутся
+из ``Config``) и pyarrow. Данные вставляются в транзакции, которая в
+конце откатывается.
+
+Запуск из каталога ``app``::
+
+    python -m benchmarks.snapshot_export
+
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import orjson
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.organization import OrganizationModel
+from infrastructure.database.pagination import paginate_select
+from infrastructure.database.repositories.catalog_snapshot import snapshot_select
+from infrastructure.database.repositories.organization import ORGANIZATION_PROJECTION_COLUMNS
+from infrastructure.snapshot import encode_snapshot
+from sqlalchemy import (
+    select,
+    text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.init import init_container
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
+from domain.organization.snapshot import (
+    rows_to_batch,
+    SNAPSHOT_BATCH_SIZE,
+    SnapshotBatch,
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+ORGANIZATIONS = 200_000
+PAGE_SIZE = 100
+
+# Таблицы, из которых аналитики восстанавливают организации
+TABLES = (
+    SnapshotTable.ORGANIZATIONS,
+    SnapshotTable.BUILDINGS,
+    SnapshotTable.PHONES,
+    SnapshotTable.ORGANIZATION_ACTIVITIES,
+)
+
+
+async def _json_pages(session: AsyncSession) -> int:
+    """Возвращает размер всех страниц в байтах."""
+    stmt = select(
+        OrganizationModel.oid,
+        OrganizationModel.created_at,
+        *(column.label(name) for name, column in ORGANIZATION_PROJECTION_COLUMNS.items() if name != "oid"),
+    ).join_from(OrganizationModel, OrganizationModel.building)
+
+    size = 0
+    page = PageRequest(limit=PAGE_SIZE)
+    while True:
+        rows = (await session.execute(paginate_select(stmt, OrganizationModel, page))).all()
+        if not rows:
+            return size
+
+        items = [{name: value for name, value in row._mapping.items() if name != "created_at"} for row in rows]
+        size += len(orjson.dumps({"items": items}))
+        page = PageRequest(limit=PAGE_SIZE, after=PageCursor(created_at=rows[-1].created_at, oid=rows[-1].oid))
+
+
+async def _batches(session: AsyncSession, table: SnapshotTable) -> AsyncIterator[SnapshotBatch]:
+    result = await session.stream(snapshot_select(table).execution_options(yield_per=SNAPSHOT_BATCH_SIZE))
+    async for rows in result.partitions():
+        yield rows_to_batch(table, [tuple(row) for row in rows])
+
+
+async def _snapshot(session: AsyncSession, snapshot_format: SnapshotFormat) -> int:
+    size = 0
+    for table in TABLES:
+        async for chunk in encode_snapshot(table, snapshot_format, _batches(session, table)):
+            size += len(chunk)
+    return size
+
+
+async def _measure(name: str, run) -> None:
+    started_at = time.perf_counter()
+    size = await run()
+    elapsed = time.perf_counter() - started_at
+    print(f"{name:<8} {ORGANIZATIONS / elapsed:>12,.0f} organizations/s  {size / 2**20:8.1f} MiB")
+
+
+async def main() -> None:
+    database: Database = init_container().resolve(Database)
+
+    async with database.get_session() as session:
+        await session.execute(
+            text(
+                "INSERT INTO building (oid, address, location, geohash, created_at, updated_at) "
+                "SELECT gen_random_uuid(), 'bench_' || n, point::geography, ST_GeoHash(point, 9), now(), now() "
+                "FROM generate_series(1, :rows) AS n, "
+                "LATERAL (SELECT ST_SetSRID(ST_MakePoint(37.35 + random() * 0.5, 55.55 + random() * 0.4), 4326) "
+                "AS point) AS p",
+            ),
+            {"rows": ORGANIZATIONS},
+        )
+        await session.execute(
+            text(
+                "INSERT INTO organization (oid, name, building_id, created_at, updated_at) "
+                "SELECT gen_random_uuid(), 'bench_' || address, oid, now() + random() * interval '1 day', now() "
+                "FROM building WHERE address LIKE 'bench\\_%'",
+            ),
+        )
+        await session.execute(
+            text(
+                "INSERT INTO organization_phone (oid, organization_id, phone, created_at, updated_at) "
+                "SELECT gen_random_uuid(), oid, '+7-495-' || lpad((random() * 9999999)::int::text, 7, '0'), "
+                "now(), now() FROM organization WHERE name LIKE 'bench\\_%'",
+            ),
+        )
+        await session.execute(text("ANALYZE organization"))
+
+        await _measure("json", lambda: _json_pages(session))
+        await _measure("arrow", lambda: _snapshot(session, SnapshotFormat.ARROW))
+        await _measure("parquet", lambda: _snapshot(session, SnapshotFormat.PARQUET))
+
+        await session.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""Бенчмарк in-memory поиска зданий по области: перебор всех зданий
+(как раньше в ``DummyInMemoryBuildingRepository``) против
+``SpatialIndex`` — сетки ячеек и векторного haversine на NumPy.
+
+База не нужна; нужен NumPy. Запуск из каталога ``app``::
+
+    python -m benchmarks.spatial_index
+
+"""
+
+import random
+import time
+
+from infrastructure.database.repositories.dummy.spatial import SpatialIndex
+
+from domain.organization.geo import distance_meters
+
+
+BUILDINGS = 1_000_000
+QUERIES = 200
+SCAN_QUERIES = 3
+RADIUS = 1000
+
+# Окрестности Москвы
+LATITUDE = (55.55, 55.95)
+LONGITUDE = (37.35, 37.85)
+
+
+def _scan(points: list[tuple[float, float]], latitude: float, longitude: float) -> list[int]:
+    return [
+        item
+        for item, (point_latitude, point_longitude) in enumerate(points)
+        if distance_meters(latitude, longitude, point_latitude, point_longitude) <= RADIUS
+    ]
+
+
+def _measure(name: str, run, queries: list[tuple[float, float]]) -> None:
+    started_at = time.perf_counter()
+    found = sum(len(run(latitude, longitude)) for latitude, longitude in queries)
+    elapsed = (time.perf_counter() - started_at) * 1000 / len(queries)
+    print(f"{name:<16} {elapsed:10.3f} ms/query  {found / len(queries):8.1f} buildings/query")
+
+
+def main() -> None:
+    rng = random.Random(42)
+    points = [(rng.uniform(*LATITUDE), rng.uniform(*LONGITUDE)) for _ in range(BUILDINGS)]
+    queries = [(rng.uniform(*LATITUDE), rng.uniform(*LONGITUDE)) for _ in range(QUERIES)]
+
+    index = SpatialIndex()
+    for item, (latitude, longitude) in enumerate(points):
+        index.add(item, latitude, longitude)
+
+    started_at = time.perf_counter()
+    index.within(*queries[0], RADIUS)
+    print(f"{'grid build':<16} {(time.perf_counter() - started_at) * 1000:10.1f} ms")
+
+    _measure("scan radius", lambda latitude, longitude: _scan(points, latitude, longitude), queries[:SCAN_QUERIES])
+    _measure("grid radius", lambda latitude, longitude: index.within(latitude, longitude, RADIUS), queries)
+    _measure(
+        "grid bbox",
+        lambda latitude, longitude: index.in_bounding_box(latitude, latitude + 0.01, longitude, longitude + 0.02),
+        queries,
+    )
+
+
+if __name__ == "__main__":
+    main()
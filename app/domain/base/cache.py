@@ -0,0 +1,38 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Generic,
+    TypeVar,
+)
+
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+@dataclass
+class LRUCache(Generic[KeyType, ValueType]):
+    """LRU в памяти процесса: при переполнении вытесняется запись, к
+    которой дольше всего не обращались."""
+
+    max_entries: int = 1024
+    _entries: OrderedDict[KeyType, ValueType] = field(default_factory=OrderedDict, init=False)
+
+    def get(self, key: KeyType) -> ValueType | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: KeyType, value: ValueType) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -21,3 +21,15 @@ class BaseEntity(ABC):
 
     def __eq__(self, other: "BaseEntity") -> bool:
         return self.oid == other.oid
+
+
+@dataclass(frozen=True)
+class EntityVersion:
+    """Версия сущности без её загрузки: по ней строится ETag."""
+
+    oid: UUID
+    updated_at: datetime
+
+    @classmethod
+    def from_entity(cls, entity: BaseEntity) -> "EntityVersion":
+        return cls(oid=entity.oid, updated_at=entity.updated_at)
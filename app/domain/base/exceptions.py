@@ -13,3 +13,12 @@ class DomainException(ApplicationException):
     @property
     def message(self) -> str:
         return "Domain exception occurred"
+
+
+@dataclass(eq=False)
+class InvalidPageCursorException(DomainException):
+    cursor: str
+
+    @property
+    def message(self) -> str:
+        return "Invalid pagination cursor"
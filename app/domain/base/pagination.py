@@ -0,0 +1,67 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+from uuid import UUID
+
+import orjson
+
+from domain.base.entity import BaseEntity
+from domain.base.exceptions import InvalidPageCursorException
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """Позиция keyset пагинации: последний отданный ключ (created_at,
+    oid)."""
+
+    created_at: datetime
+    oid: UUID
+
+    @classmethod
+    def from_entity(cls, entity: BaseEntity) -> "PageCursor":
+        return cls(created_at=entity.created_at, oid=entity.oid)
+
+    def encode(self) -> str:
+        payload = orjson.dumps([self.created_at.isoformat(), str(self.oid)])
+        return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            created_at, oid = orjson.loads(payload)
+            return cls(created_at=datetime.fromisoformat(created_at), oid=UUID(oid))
+        except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+            raise InvalidPageCursorException(cursor=token)
+
+    def key(self) -> tuple[datetime, UUID]:
+        return (self.created_at, self.oid)
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """Страница выборки: offset пагинация или keyset после ``after``."""
+
+    limit: int
+    offset: int = 0
+    after: PageCursor | None = None
+
+    @classmethod
+    def build(cls, limit: int, offset: int = 0, cursor: str | None = None) -> "PageRequest":
+        if cursor:
+            return cls(limit=limit, after=PageCursor.decode(cursor))
+
+        return cls(limit=limit, offset=offset)
+
+
+class TotalMode(StrEnum):
+    """Как считать ``total`` для страницы."""
+
+    # Точный COUNT(*) по всем подходящим записям
+    EXACT = "exact"
+    # Оценка: точный подсчёт до порога, выше — оценка планировщика
+    ESTIMATE = "estimate"
+    # Не считать вовсе (клиенту достаточно next_cursor)
+    NONE = "none"
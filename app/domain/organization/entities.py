@@ -4,7 +4,10 @@ from dataclasses import (
 )
 from typing import Optional
 
-from domain.base.entity import BaseEntity
+from domain.base.entity import (
+    BaseEntity,
+    EntityVersion,
+)
 from domain.organization.exceptions import ActivityNestingLevelExceededException
 from domain.organization.value_objects import (
     ActivityNameValueObject,
@@ -57,3 +60,16 @@ class OrganizationEntity(BaseEntity):
         kw_only=True,
     )
     activities: list[ActivityEntity] = field(default_factory=list, kw_only=True)
+
+    def version(self) -> EntityVersion:
+        """Версия ответа с организацией (для ETag): в документ входят
+        здание и виды деятельности, поэтому берётся самое позднее
+        ``updated_at`` из них и самой организации."""
+        return EntityVersion(
+            oid=self.oid,
+            updated_at=max(
+                self.updated_at,
+                self.building.updated_at,
+                *(activity.updated_at for activity in self.activities),
+            ),
+        )
@@ -131,3 +131,59 @@ class BuildingNotFoundException(OrganizationException):
     @property
     def message(self) -> str:
         return f"Building with address {self.address} not found"
+
+
+@dataclass(eq=False)
+class UnknownOrganizationFieldsException(OrganizationException):
+    fields: tuple[str, ...]
+
+    @property
+    def message(self) -> str:
+        return f"Unknown organization fields: {', '.join(self.fields)}"
+
+
+@dataclass(eq=False)
+class InvalidTileCoordinatesException(OrganizationException):
+    z: int
+    x: int
+    y: int
+
+    @property
+    def message(self) -> str:
+        return f"Invalid tile coordinates: {self.z}/{self.x}/{self.y}"
+
+
+@dataclass(eq=False)
+class InvalidSearchPolygonException(OrganizationException):
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return f"Invalid search polygon: {self.reason}"
+
+
+@dataclass(eq=False)
+class SearchPolygonTooLargeException(OrganizationException):
+    vertices: int
+    max_vertices: int
+
+    @property
+    def message(self) -> str:
+        return f"Search polygon has {self.vertices} vertices, at most {self.max_vertices} allowed"
+
+
+@dataclass(eq=False)
+class SnapshotFormatUnavailableException(OrganizationException):
+    snapshot_format: str
+    dependency: str
+
+    @property
+    def message(self) -> str:
+        return f"Snapshot format {self.snapshot_format} requires {self.dependency} to be installed"
+
+
+@dataclass(eq=False)
+class ReadOnlyCatalogException(OrganizationException):
+    @property
+    def message(self) -> str:
+        return "Catalog is read-only on this node"
@@ -0,0 +1,27 @@
+import math
+
+from domain.organization.entities import OrganizationEntity
+from domain.organization.search import SearchCircle
+
+
+EARTH_RADIUS_METERS = 6371000
+
+
+def distance_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Расстояние по сфере (haversine) — приближение ST_Distance по
+    geography для репозиториев без PostgreSQL (in-memory и снимок
+    каталога)."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+
+    a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return EARTH_RADIUS_METERS * c
+
+
+def organization_distance(circle: SearchCircle, organization: OrganizationEntity) -> float:
+    coordinates = organization.building.coordinates
+    return distance_meters(circle.latitude, circle.longitude, coordinates.latitude, coordinates.longitude)
@@ -0,0 +1,87 @@
+import math
+
+from domain.organization.search import SearchBoundingBox
+
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Точность колонки ``building.geohash``: ячейка ~4.8 x 4.8 м
+GEOHASH_PRECISION = 9
+# Сколько ячеек допускается в покрытии области: каждая — отдельный
+# диапазон btree индекса
+MAX_COVER_CELLS = 32
+
+
+def encode(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Geohash точки — как ``ST_GeoHash`` в PostGIS.
+
+    Биты чередуются начиная с долготы; точка на границе половин
+    относится к верхней (восточной/северной).
+
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    value = bits = 0
+    is_longitude = True
+    while len(chars) < precision:
+        interval, coordinate = (lon_range, longitude) if is_longitude else (lat_range, latitude)
+        middle = (interval[0] + interval[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            interval[0] = middle
+        else:
+            interval[1] = middle
+        is_longitude = not is_longitude
+
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            value = bits = 0
+
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """(высота, ширина) ячейки в градусах."""
+    lon_bits = math.ceil(5 * precision / 2)
+    lat_bits = 5 * precision // 2
+    return 180 / 2**lat_bits, 360 / 2**lon_bits
+
+
+def cover(bbox: SearchBoundingBox, max_cells: int = MAX_COVER_CELLS) -> tuple[str, ...]:
+    """Ячейки максимальной точности, покрывающие прямоугольник, — не
+    больше ``max_cells``.
+
+    Здание внутри ``bbox`` имеет geohash с одним из этих префиксов, так
+    что покрытие годится как грубый фильтр по btree индексу и как ключ
+    кеша данных, агрегированных по ячейкам покрытия: близкие
+    прямоугольники дают одно покрытие. Точные ответы по самому ``bbox``
+    (счётчики фасетов) по покрытию кешировать нельзя. Пустой префикс — вся
+    карта, пустое покрытие — перевёрнутый прямоугольник.
+
+    """
+    best: tuple[str, ...] = ("",)
+    for precision in range(1, GEOHASH_PRECISION + 1):
+        height, width = cell_size(precision)
+        rows = _cell_range(bbox.lat_min + 90, bbox.lat_max + 90, height, 2 ** (5 * precision // 2))
+        columns = _cell_range(bbox.lon_min + 180, bbox.lon_max + 180, width, 2 ** math.ceil(5 * precision / 2))
+        if len(rows) * len(columns) > max_cells:
+            break
+
+        best = tuple(
+            sorted(
+                encode(-90 + (row + 0.5) * height, -180 + (column + 0.5) * width, precision)
+                for row in rows
+                for column in columns
+            ),
+        )
+
+    return best
+
+
+def _cell_range(low: float, high: float, size: float, count: int) -> range:
+    first = min(int(low // size), count - 1)
+    last = min(int(high // size), count - 1)
+    return range(first, last + 1)
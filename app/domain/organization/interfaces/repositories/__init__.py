@@ -1,10 +1,16 @@
 from .activity import BaseActivityRepository
 from .building import BaseBuildingRepository
+from .catalog_snapshot import BaseCatalogSnapshotRepository
+from .map_tile import BaseMapTileRepository
 from .organization import BaseOrganizationRepository
+from .organization_document import BaseOrganizationDocumentRepository
 
 
 __all__ = (
     "BaseActivityRepository",
     "BaseBuildingRepository",
+    "BaseCatalogSnapshotRepository",
+    "BaseMapTileRepository",
+    "BaseOrganizationDocumentRepository",
     "BaseOrganizationRepository",
 )
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
+from domain.base.entity import EntityVersion
+from domain.base.pagination import PageRequest
 from domain.organization.entities import ActivityEntity
 
 
@@ -18,8 +20,27 @@ class BaseActivityRepository(ABC):
     @abstractmethod
     async def get_by_id(self, activity_id: UUID) -> ActivityEntity | None: ...
 
+    @abstractmethod
+    async def get_version(self, activity_id: UUID) -> EntityVersion | None:
+        """Версия записи без загрузки связей (для ETag)."""
+
+    @abstractmethod
+    async def get_by_ids(self, activity_ids: Iterable[UUID]) -> Iterable[ActivityEntity]: ...
+
     @abstractmethod
     async def get_by_name(self, name: str) -> ActivityEntity | None: ...
 
     @abstractmethod
-    async def filter(self, **filters: Any) -> Iterable[ActivityEntity]: ...
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[ActivityEntity]: ...
+
+    @abstractmethod
+    async def count(self, **filters: Any) -> int: ...
+
+    @abstractmethod
+    async def estimate_count(self, **filters: Any) -> int:
+        """Приблизительное количество: дешевле ``count`` на больших
+        выборках."""
@@ -6,6 +6,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from uuid import UUID
 
+from domain.base.entity import EntityVersion
 from domain.organization.entities import BuildingEntity
 
 
@@ -17,6 +18,13 @@ class BaseBuildingRepository(ABC):
     @abstractmethod
     async def get_by_id(self, building_id: UUID) -> BuildingEntity | None: ...
 
+    @abstractmethod
+    async def get_version(self, building_id: UUID) -> EntityVersion | None:
+        """Версия записи без загрузки связей (для ETag)."""
+
+    @abstractmethod
+    async def get_by_ids(self, building_ids: Iterable[UUID]) -> Iterable[BuildingEntity]: ...
+
     @abstractmethod
     async def get_by_address(self, address: str) -> BuildingEntity | None: ...
 
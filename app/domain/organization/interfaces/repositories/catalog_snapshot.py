@@ -0,0 +1,45 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from domain.organization.snapshot import (
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+@dataclass
+class BaseCatalogSnapshotRepository(ABC):
+    @abstractmethod
+    def export(
+        self,
+        table: SnapshotTable,
+        snapshot_format: SnapshotFormat,
+        batch_size: int,
+    ) -> AsyncIterator[bytes]:
+        """Таблица каталога в колоночном формате — кусками байтов по мере
+        записи record batch'ей по ``batch_size`` строк; в памяти держится
+        не больше одной пачки."""
+
+    @abstractmethod
+    def export_all(
+        self,
+        snapshot_format: SnapshotFormat,
+        batch_size: int,
+    ) -> AsyncIterator[tuple[SnapshotTable, AsyncIterator[bytes]]]:
+        """Все таблицы каталога, прочитанные из одного состояния базы: пары
+        (таблица, куски байтов как у ``export``).
+
+        Куски таблицы нужно дочитать до перехода к следующей.
+
+        """
+
+    @abstractmethod
+    async def write_catalog_file(self, path: Path, batch_size: int) -> dict[str, int]:
+        """Собирает файл снимка для read-only узлов (см.
+        ``infrastructure.snapshot.catalog_file``) из одного состояния базы
+        и возвращает число строк по таблицам."""
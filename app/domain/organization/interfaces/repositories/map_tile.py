@@ -0,0 +1,23 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+
+from domain.organization.tiles import (
+    TileAttributes,
+    TileCoordinates,
+)
+
+
+@dataclass
+class BaseMapTileRepository(ABC):
+    @abstractmethod
+    async def render(self, tile: TileCoordinates, attributes: TileAttributes) -> bytes:
+        """Mapbox Vector Tile со слоями ``buildings`` и ``organizations``
+        (пустые байты, если в тайле ничего нет)."""
+
+    @abstractmethod
+    async def get_data_version(self) -> str:
+        """Версия данных карты: меняется при любом изменении зданий или
+        организаций и входит в ключ кеша тайлов."""
@@ -2,21 +2,54 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from collections.abc import Iterable
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+from domain.base.entity import EntityVersion
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
 from domain.organization.entities import OrganizationEntity
+from domain.organization.read_models import (
+    ActivityFacet,
+    NearbyOrganization,
+    OrganizationChangesPage,
+    OrganizationCluster,
+    OrganizationProjection,
+)
+from domain.organization.search import SearchCircle
 
 
 @dataclass
 class BaseOrganizationRepository(ABC):
     @abstractmethod
-    async def add(self, organization: OrganizationEntity) -> None: ...
+    async def add(self, organization: OrganizationEntity) -> None:
+        """Сохраняет организацию вместе с её документом
+        ``organization_document`` в одной транзакции."""
+
+    @abstractmethod
+    async def delete(self, organization_id: UUID) -> bool:
+        """Удаляет организацию вместе с документом и оставляет запись об
+        удалении для ``get_changes``; ``False``, если организации нет."""
 
     @abstractmethod
     async def get_by_id(self, organization_id: UUID) -> OrganizationEntity | None: ...
 
+    @abstractmethod
+    async def get_version(self, organization_id: UUID) -> EntityVersion | None:
+        """Версия ответа с организацией (для ETag, как
+        ``OrganizationEntity.version``) без загрузки связей."""
+
+    @abstractmethod
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationEntity]: ...
+
     @abstractmethod
     async def get_by_name(self, name: str) -> Iterable[OrganizationEntity]: ...
 
@@ -31,3 +64,113 @@ class BaseOrganizationRepository(ABC):
         self,
         activity_name: str,
     ) -> Iterable[OrganizationEntity]: ...
+
+    @abstractmethod
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationEntity]:
+        """Фильтры:
+
+        - ``name`` — подстрока названия без учета регистра;
+        - ``text`` — как ``name``, но с ранжированием по сходству названия;
+        - ``building_id``, ``building_ids``;
+        - ``address`` — подстрока адреса здания без учета регистра;
+        - ``activity_names`` — организации с любым из видов деятельности;
+        - ``activity_subtree`` — название вида деятельности: он сам и его
+          дети, как в ``OrganizationService.get_organizations_by_activity``;
+        - ``within`` (``SearchCircle``), ``bounding_box``
+          (``SearchBoundingBox``), ``polygon`` (``SearchPolygon``).
+
+        С ``page`` результат упорядочен по (created_at, oid), с ``text`` —
+        по (сходство по убыванию, oid), а с ``within`` — по (расстояние до
+        центра круга, oid).
+
+        """
+
+    @abstractmethod
+    async def project(
+        self,
+        fields: tuple[str, ...],
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationProjection]:
+        """Как ``filter``, но выбирает только колонки ``fields`` — без
+        гидратации сущностей и лишних JOIN.
+
+        С ``within`` в значения добавляется ``distance`` в метрах.
+
+        """
+
+    @abstractmethod
+    async def count(self, **filters: Any) -> int: ...
+
+    @abstractmethod
+    async def estimate_count(self, **filters: Any) -> int:
+        """Приблизительное количество: дешевле ``count`` на больших
+        выборках."""
+
+    @abstractmethod
+    async def count_by_activity(self, **filters: Any) -> Iterable[ActivityFacet]:
+        """Число организаций по видам деятельности среди отобранных
+        ``filters`` (как в ``filter``); виды без организаций не
+        возвращаются."""
+
+    @abstractmethod
+    async def get_data_version(self) -> str:
+        """Меняется при любом изменении организаций, зданий или видов
+        деятельности — ключ для кешей агрегатов."""
+
+    @abstractmethod
+    async def get_changes(
+        self,
+        limit: int,
+        since: datetime | None = None,
+        after: PageCursor | None = None,
+    ) -> OrganizationChangesPage:
+        """Изменённые (по ``updated_at``) и удалённые организации по
+        возрастанию (время изменения, oid).
+
+        ``after`` — позиция последней полученной записи (``created_at``
+        курсора — время изменения), иначе с ``since`` включительно, иначе
+        с начала. Записи, которые ещё могут быть обогнаны незавершёнными
+        транзакциями, не отдаются: ``until`` страницы — граница, до
+        которой поток уже не изменится.
+
+        """
+
+    @abstractmethod
+    async def cluster_by_bounding_box(
+        self,
+        lat_min: float,
+        lat_max: float,
+        lon_min: float,
+        lon_max: float,
+        grid_size: float | None,
+    ) -> Iterable[OrganizationCluster]:
+        """Организации в области, сгруппированные по ячейкам сетки шагом
+        ``grid_size`` метров EPSG:3857; без ``grid_size`` — по зданиям."""
+
+    @abstractmethod
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        activity_names: Iterable[str] | None = None,
+    ) -> Iterable[NearbyOrganization]:
+        """``limit`` ближайших к точке организаций по возрастанию
+        расстояния; с ``activity_names`` — только с этими видами
+        деятельности."""
+
+    @abstractmethod
+    async def get_near_points(
+        self,
+        points: Sequence[SearchCircle],
+        limit: int,
+        activity_name: str | None = None,
+    ) -> list[list[NearbyOrganization]]:
+        """Для каждой точки — до ``limit`` организаций в её радиусе по
+        возрастанию расстояния (порядок списков — как у ``points``); с
+        ``activity_name`` — только этот вид деятельности и вложенные."""
@@ -0,0 +1,43 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from domain.base.pagination import PageRequest
+from domain.organization.read_models import OrganizationDocument
+
+
+@dataclass
+class BaseOrganizationDocumentRepository(ABC):
+    """Read model ``organization_document``: готовые JSON документы
+    организаций."""
+
+    @abstractmethod
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationDocument]: ...
+
+    @abstractmethod
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationDocument]:
+        """Те же фильтры и порядок, что у
+        ``BaseOrganizationRepository.filter``.
+
+        С ``within`` в документ добавляется ``distance`` в метрах.
+
+        """
+
+    @abstractmethod
+    async def rebuild(self, organization_ids: Iterable[UUID] | None = None) -> int:
+        """Пересобирает документы из исходных таблиц (все, если ID не
+        переданы) и возвращает число пересобранных документов."""
+
+    @abstractmethod
+    async def find_inconsistent(self) -> list[UUID]:
+        """ID организаций, документ которых отсутствует или не совпадает с
+        собранным заново."""
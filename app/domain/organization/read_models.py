@@ -0,0 +1,145 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from domain.base.pagination import PageCursor
+from domain.organization.entities import OrganizationEntity
+from domain.organization.exceptions import UnknownOrganizationFieldsException
+
+
+# Поля, доступные в sparse fieldset (fields=...)
+ORGANIZATION_PROJECTION_FIELDS = (
+    "oid",
+    "name",
+    "building_id",
+    "address",
+    "latitude",
+    "longitude",
+    "phones",
+    "activity_ids",
+)
+# Компактное представление для карт
+ORGANIZATION_COMPACT_FIELDS = ("oid", "name", "latitude", "longitude")
+
+
+@dataclass(frozen=True)
+class OrganizationDocument:
+    """Денормализованный JSON документ организации (форма
+    ``OrganizationDetailSchema``): здание, телефоны и виды деятельности уже
+    собраны и сериализованы.
+
+    ``created_at`` нужен для keyset пагинации списков документов,
+    ``updated_at`` — для ETag: самое позднее изменение организации, её
+    здания или видов деятельности (``OrganizationEntity.version``).
+
+    """
+
+    oid: UUID
+    created_at: datetime
+    updated_at: datetime
+    content: bytes
+
+
+@dataclass(frozen=True)
+class OrganizationProjection:
+    """Организация с подмножеством полей из
+    ``ORGANIZATION_PROJECTION_FIELDS``."""
+
+    oid: UUID
+    created_at: datetime
+    values: dict[str, Any]
+
+    @staticmethod
+    def validate_fields(fields: Iterable[str]) -> tuple[str, ...]:
+        """Убирает дубликаты с сохранением порядка; неизвестные поля —
+        ошибка."""
+        fields = tuple(dict.fromkeys(fields))
+        unknown = tuple(name for name in fields if name not in ORGANIZATION_PROJECTION_FIELDS)
+        if unknown:
+            raise UnknownOrganizationFieldsException(fields=unknown)
+
+        return fields
+
+
+@dataclass(frozen=True)
+class OrganizationCluster:
+    """Точка карты: центр группы зданий и число организаций в ней.
+
+    ``building_id`` заполнен, если все организации кластера в одном
+    здании — тогда точку можно раскрыть запросом по зданию.
+
+    """
+
+    latitude: float
+    longitude: float
+    organizations: int
+    building_id: UUID | None = None
+
+
+@dataclass(frozen=True)
+class NearbyOrganization:
+    """Организация и расстояние от точки поиска до её здания в метрах
+    (геодезическое, по эллипсоиду WGS 84)."""
+
+    organization: OrganizationEntity
+    distance: float
+
+
+@dataclass(frozen=True)
+class ActivityFacet:
+    """Число организаций выборки с видом деятельности.
+
+    ``organizations`` — с самим видом деятельности, ``subtree_organizations``
+    — с ним или его детьми (столько же вернёт ``/by-activity`` с тем же
+    фильтром). Организация считается один раз, даже если у неё несколько
+    видов деятельности поддерева.
+
+    """
+
+    activity_id: UUID
+    name: str
+    parent_id: UUID | None
+    organizations: int
+    subtree_organizations: int
+
+
+@dataclass(frozen=True)
+class OrganizationChange:
+    """Запись потока изменений: организация создана или изменена в
+    ``changed_at`` либо удалена (``organization is None``)."""
+
+    oid: UUID
+    changed_at: datetime
+    organization: OrganizationEntity | None
+
+    @property
+    def deleted(self) -> bool:
+        return self.organization is None
+
+
+@dataclass(frozen=True)
+class OrganizationChangesPage:
+    """Страница потока изменений; все изменения раньше ``until`` уже
+    учтены — либо вошли в страницу, либо остались до неё."""
+
+    changes: list[OrganizationChange]
+    until: datetime
+
+    def next_cursor(self, after: PageCursor | None = None, since: datetime | None = None) -> PageCursor:
+        """Позиция, с которой продолжать поток.
+
+        Пустая первая страница тоже даёт позицию — границу ``until``
+        (или ``since``, если он позже), иначе клиенту пришлось бы
+        перечитывать поток с начала.
+
+        """
+        if self.changes:
+            return PageCursor(created_at=self.changes[-1].changed_at, oid=self.changes[-1].oid)
+        if after is not None:
+            return after
+
+        # Нулевой oid меньше любого: продолжение включает изменения ровно в
+        # момент границы
+        return PageCursor(created_at=max(self.until, since) if since else self.until, oid=UUID(int=0))
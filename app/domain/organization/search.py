@@ -0,0 +1,232 @@
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Any
+
+from domain.organization.exceptions import (
+    InvalidSearchPolygonException,
+    SearchPolygonTooLargeException,
+)
+
+
+# Больше вершин в запросе — ошибка
+MAX_POLYGON_VERTICES = 10_000
+# Больше вершин — многоугольник упрощается перед запросом, чтобы время
+# планирования и проверки ST_Intersects не росло с детализацией границы
+MAX_QUERY_POLYGON_VERTICES = 500
+
+# Точка (lon, lat) — порядок GeoJSON
+Position = tuple[float, float]
+Ring = tuple[Position, ...]
+
+
+@dataclass(frozen=True)
+class SearchCircle:
+    """Круг поиска на карте: центр и радиус в метрах.
+
+    Значение фильтра ``within`` репозиториев организаций: выборка
+    ограничена кругом и упорядочена по расстоянию от центра.
+
+    """
+
+    latitude: float
+    longitude: float
+    radius: float
+
+
+@dataclass(frozen=True)
+class SearchBoundingBox:
+    """Прямоугольная область поиска (фильтр ``bounding_box``)."""
+
+    lat_min: float
+    lat_max: float
+    lon_min: float
+    lon_max: float
+
+
+@dataclass(frozen=True)
+class SearchPolygon:
+    """Область поиска произвольной формы (фильтр ``polygon``).
+
+    ``polygons`` — части MultiPolygon: внешнее кольцо и дыры, кольца
+    замкнуты, точки в порядке GeoJSON (lon, lat).
+
+    """
+
+    polygons: tuple[tuple[Ring, ...], ...]
+
+    @classmethod
+    def from_geojson(cls, geometry: dict[str, Any]) -> "SearchPolygon":
+        """Разбирает GeoJSON геометрию ``Polygon`` или ``MultiPolygon``."""
+        geometry_type = geometry.get("type")
+        coordinates = geometry.get("coordinates")
+        if geometry_type == "Polygon":
+            polygons = [coordinates]
+        elif geometry_type == "MultiPolygon":
+            polygons = coordinates
+        else:
+            raise InvalidSearchPolygonException(reason=f"unsupported geometry type {geometry_type!r}")
+
+        if not isinstance(polygons, list) or not polygons:
+            raise InvalidSearchPolygonException(reason="coordinates must be a non-empty array")
+
+        polygon = cls(polygons=tuple(_parse_polygon(rings) for rings in polygons))
+        if polygon.vertex_count > MAX_POLYGON_VERTICES:
+            raise SearchPolygonTooLargeException(vertices=polygon.vertex_count, max_vertices=MAX_POLYGON_VERTICES)
+
+        return polygon
+
+    @property
+    def vertex_count(self) -> int:
+        return sum(len(ring) for rings in self.polygons for ring in rings)
+
+    def to_geojson(self) -> dict[str, Any]:
+        return {
+            "type": "MultiPolygon",
+            "coordinates": [[[list(position) for position in ring] for ring in rings] for rings in self.polygons],
+        }
+
+    def simplified(self, max_vertices: int = MAX_QUERY_POLYGON_VERTICES) -> "SearchPolygon":
+        """Многоугольник не больше чем из ``max_vertices`` вершин.
+
+        Кольца упрощаются алгоритмом Дугласа-Пекера с допуском,
+        удваиваемым от 1/100000 размера области, пока вершин не станет
+        достаточно. Внешнее кольцо сохраняет минимум треугольник, дыры
+        меньше допуска отбрасываются.
+
+        """
+        if self.vertex_count <= max_vertices:
+            return self
+
+        lon_min, lat_min, lon_max, lat_max = self.bounds()
+        extent = max(lon_max - lon_min, lat_max - lat_min)
+        tolerance = extent / 100_000
+        while True:
+            simplified = SearchPolygon(
+                polygons=tuple(
+                    (_simplify_ring(outer, tolerance, keep=True), *_simplify_holes(holes, tolerance))
+                    for outer, *holes in self.polygons
+                ),
+            )
+            if simplified.vertex_count <= max_vertices:
+                return simplified
+            if tolerance >= extent:
+                # Даже по треугольнику на часть не помещается
+                raise SearchPolygonTooLargeException(vertices=self.vertex_count, max_vertices=max_vertices)
+            tolerance *= 2
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """(lon_min, lat_min, lon_max, lat_max)."""
+        positions = [position for rings in self.polygons for position in rings[0]]
+        longitudes = [lon for lon, _ in positions]
+        latitudes = [lat for _, lat in positions]
+        return min(longitudes), min(latitudes), max(longitudes), max(latitudes)
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """Точка внутри одной из частей и вне её дыр (на плоскости lon/lat)."""
+        return any(
+            _ring_contains(outer, longitude, latitude)
+            and not any(_ring_contains(hole, longitude, latitude) for hole in holes)
+            for outer, *holes in self.polygons
+        )
+
+
+def _parse_polygon(rings: Any) -> tuple[Ring, ...]:
+    if not isinstance(rings, list) or not rings:
+        raise InvalidSearchPolygonException(reason="polygon must have at least one ring")
+
+    return tuple(_parse_ring(ring) for ring in rings)
+
+
+def _parse_ring(ring: Any) -> Ring:
+    if not isinstance(ring, list) or len(ring) < 4:
+        raise InvalidSearchPolygonException(reason="ring must have at least 4 positions")
+
+    positions = []
+    for position in ring:
+        if (
+            not isinstance(position, list | tuple)
+            or len(position) < 2
+            or not all(isinstance(value, int | float) for value in position[:2])
+        ):
+            raise InvalidSearchPolygonException(reason=f"invalid position {position!r}")
+
+        lon, lat = float(position[0]), float(position[1])
+        if not (-180 <= lon <= 180 and -90 <= lat <= 90):
+            raise InvalidSearchPolygonException(reason=f"position {position!r} is out of range")
+        positions.append((lon, lat))
+
+    if positions[0] != positions[-1]:
+        raise InvalidSearchPolygonException(reason="ring must be closed")
+    if _ring_area(positions) == 0:
+        # Все точки совпадают или лежат на одной прямой
+        raise InvalidSearchPolygonException(reason="ring must have a non-zero area")
+
+    return tuple(positions)
+
+
+def _ring_area(ring: Sequence[Position]) -> float:
+    """Удвоенная ориентированная площадь (формула шнурков)."""
+    return sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in pairwise(ring))
+
+
+def _ring_contains(ring: Ring, x: float, y: float) -> bool:
+    """Ray casting: число пересечений луча вправо с рёбрами нечётно."""
+    inside = False
+    for (x1, y1), (x2, y2) in pairwise(ring):
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def _simplify_holes(holes: Sequence[Ring], tolerance: float) -> list[Ring]:
+    simplified = (_simplify_ring(hole, tolerance, keep=False) for hole in holes)
+    return [hole for hole in simplified if hole]
+
+
+def _simplify_ring(ring: Ring, tolerance: float, keep: bool) -> Ring:
+    """Дуглас-Пекер для замкнутого кольца: делится на две ломаные по самой
+    дальней от первой точке. ``keep`` — не давать кольцу выродиться."""
+    start = ring[0]
+    split = max(range(1, len(ring) - 1), key=lambda index: math.dist(start, ring[index]))
+    simplified = (
+        *_douglas_peucker(ring[: split + 1], tolerance)[:-1],
+        *_douglas_peucker(ring[split:], tolerance),
+    )
+    if len(simplified) >= 4:
+        return simplified
+    if not keep:
+        return ()
+
+    # Треугольник: концы хорды и самая удалённая от неё точка
+    far = max(
+        (position for position in ring[1:-1] if position != ring[split]),
+        key=lambda position: _segment_distance(position, start, ring[split]),
+    )
+    return (start, ring[split], far, start)
+
+
+def _douglas_peucker(line: Sequence[Position], tolerance: float) -> list[Position]:
+    if len(line) < 3:
+        return list(line)
+
+    first, last = line[0], line[-1]
+    index, distance = max(
+        ((index, _segment_distance(line[index], first, last)) for index in range(1, len(line) - 1)),
+        key=lambda item: item[1],
+    )
+    if distance <= tolerance:
+        return [first, last]
+
+    return _douglas_peucker(line[: index + 1], tolerance)[:-1] + _douglas_peucker(line[index:], tolerance)
+
+
+def _segment_distance(point: Position, start: Position, end: Position) -> float:
+    (px, py), (x1, y1), (x2, y2) = point, start, end
+    dx, dy = x2 - x1, y2 - y1
+    if dx == dy == 0:
+        return math.dist(point, start)
+
+    t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
+    return math.dist(point, (x1 + t * dx, y1 + t * dy))
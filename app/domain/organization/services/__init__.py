@@ -1,10 +1,16 @@
 from domain.organization.services.activity import ActivityService
 from domain.organization.services.building import BuildingService
+from domain.organization.services.catalog_snapshot import CatalogSnapshotService
+from domain.organization.services.facets import ActivityFacetService
+from domain.organization.services.map_tile import MapTileService
 from domain.organization.services.organization import OrganizationService
 
 
 __all__ = [
+    "ActivityFacetService",
     "ActivityService",
     "BuildingService",
+    "CatalogSnapshotService",
+    "MapTileService",
     "OrganizationService",
 ]
@@ -3,6 +3,11 @@ from dataclasses import dataclass
 from uuid import UUID
 
 from application.exceptions.activity import ActivityWithThatNameAlreadyExistsException
+from domain.base.entity import EntityVersion
+from domain.base.pagination import (
+    PageRequest,
+    TotalMode,
+)
 from domain.organization.entities import ActivityEntity
 from domain.organization.exceptions import ActivityNotFoundException
 from domain.organization.interfaces.repositories import BaseActivityRepository
@@ -45,13 +50,22 @@ class ActivityService:
         """Получить активность по ID."""
         return await self.activity_repository.get_by_id(activity_id)
 
+    async def get_activity_version(
+        self,
+        activity_id: UUID,
+    ) -> EntityVersion | None:
+        """Версия активности (для ETag) без загрузки родителя."""
+        return await self.activity_repository.get_version(activity_id)
+
     async def get_activities(
         self,
         name: str | None = None,
         parent_id: UUID | None = None,
         limit: int = 10,
         offset: int = 0,
-    ) -> tuple[Iterable[ActivityEntity], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[Iterable[ActivityEntity], int | None]:
         """Получить список активностей с фильтрацией и пагинацией."""
         filters_dict = {}
         if name is not None:
@@ -59,9 +73,13 @@ class ActivityService:
         if parent_id is not None:
             filters_dict["parent_id"] = parent_id
 
-        activities = list(await self.activity_repository.filter(**filters_dict))
-        total = len(activities)
+        page = PageRequest.build(limit=limit, offset=offset, cursor=cursor)
+        activities = await self.activity_repository.filter(page=page, **filters_dict)
+
+        if total_mode == TotalMode.NONE:
+            return activities, None
 
-        paginated_activities = activities[offset : offset + limit]
+        if total_mode == TotalMode.ESTIMATE:
+            return activities, await self.activity_repository.estimate_count(**filters_dict)
 
-        return paginated_activities, total
+        return activities, await self.activity_repository.count(**filters_dict)
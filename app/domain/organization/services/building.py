@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from domain.base.entity import EntityVersion
 from domain.organization.entities import BuildingEntity
 from domain.organization.interfaces.repositories import BaseBuildingRepository
 from domain.organization.value_objects import (
@@ -35,6 +36,12 @@ class BuildingService:
     ) -> BuildingEntity:
         return await self.building_repository.get_by_id(building_id)
 
+    async def get_building_version(
+        self,
+        building_id: UUID,
+    ) -> EntityVersion | None:
+        return await self.building_repository.get_version(building_id)
+
     async def get_building_by_address(
         self,
         address: str,
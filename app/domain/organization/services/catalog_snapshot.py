@@ -0,0 +1,57 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from domain.organization.interfaces.repositories.catalog_snapshot import BaseCatalogSnapshotRepository
+from domain.organization.snapshot import (
+    SNAPSHOT_BATCH_SIZE,
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+@dataclass
+class CatalogSnapshotService:
+    catalog_snapshot_repository: BaseCatalogSnapshotRepository
+
+    def export_table(
+        self,
+        table: SnapshotTable,
+        snapshot_format: SnapshotFormat,
+        batch_size: int = SNAPSHOT_BATCH_SIZE,
+    ) -> AsyncIterator[bytes]:
+        return self.catalog_snapshot_repository.export(table, snapshot_format, batch_size)
+
+    async def write_snapshot(
+        self,
+        directory: Path,
+        snapshot_format: SnapshotFormat,
+        batch_size: int = SNAPSHOT_BATCH_SIZE,
+    ) -> dict[SnapshotTable, Path]:
+        """Пишет все таблицы в ``directory/<таблица>.<расширение>``.
+
+        Таблицы читаются из одного состояния базы. Файл пишется под
+        временным именем и переименовывается после записи, так что читатели
+        не видят недописанных таблиц.
+
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+
+        paths = {}
+        async for table, chunks in self.catalog_snapshot_repository.export_all(snapshot_format, batch_size):
+            path = directory / f"{table}.{snapshot_format.extension}"
+            partial = path.with_name(f"{path.name}.partial")
+            with partial.open("wb") as file:
+                async for chunk in chunks:
+                    file.write(chunk)
+
+            partial.replace(path)
+            paths[table] = path
+
+        return paths
+
+    async def write_catalog_file(self, path: Path, batch_size: int = SNAPSHOT_BATCH_SIZE) -> dict[str, int]:
+        """Пишет файл снимка для read-only узлов; файл заменяется
+        атомарно, так что узел не откроет недописанный снимок."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return await self.catalog_snapshot_repository.write_catalog_file(path, batch_size)
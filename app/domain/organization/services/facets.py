@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from domain.base.cache import LRUCache
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.read_models import ActivityFacet
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+)
+
+
+FacetCacheKey = tuple[tuple[tuple[str, Any], ...], str]
+
+
+class FacetCache(LRUCache[FacetCacheKey, list[ActivityFacet]]):
+    """LRU счётчиков по видам деятельности в памяти процесса.
+
+    Ключ — фильтры выборки и версия данных, как у ``TileCache``: после
+    изменений старые записи не отдаются, а вытесняются.
+
+    """
+
+
+@dataclass
+class ActivityFacetService:
+    organization_repository: BaseOrganizationRepository
+    facet_cache: FacetCache
+
+    async def get_activity_facets(
+        self,
+        name: str | None = None,
+        address: str | None = None,
+        building_id: UUID | None = None,
+        circle: SearchCircle | None = None,
+        bounding_box: SearchBoundingBox | None = None,
+    ) -> list[ActivityFacet]:
+        """Число организаций по видам деятельности (и их поддеревьям)
+        среди отобранных критериями, через AND."""
+        filters = {
+            "name": name,
+            "address": address,
+            "building_id": building_id,
+            "within": circle,
+            "bounding_box": bounding_box,
+        }
+        filters = {key: value for key, value in filters.items() if value is not None}
+        key = (tuple(sorted(filters.items())), await self.organization_repository.get_data_version())
+
+        facets = self.facet_cache.get(key)
+        if facets is None:
+            facets = list(await self.organization_repository.count_by_activity(**filters))
+            self.facet_cache.put(key, facets)
+
+        return facets
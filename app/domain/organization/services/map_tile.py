@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+from domain.base.cache import LRUCache
+from domain.organization.interfaces.repositories import BaseMapTileRepository
+from domain.organization.tiles import (
+    TileAttributes,
+    TileCoordinates,
+)
+
+
+TileCacheKey = tuple[TileCoordinates, str]
+
+
+class TileCache(LRUCache[TileCacheKey, bytes]):
+    """LRU готовых тайлов в памяти процесса.
+
+    Версия данных входит в ключ, поэтому после изменения зданий или
+    организаций старые тайлы не отдаются, а просто вытесняются.
+
+    """
+
+
+@dataclass
+class MapTileService:
+    map_tile_repository: BaseMapTileRepository
+    tile_cache: TileCache
+
+    async def get_tile(self, z: int, x: int, y: int) -> bytes:
+        """Тайл ``z/x/y`` с атрибутами, прореженными по масштабу."""
+        tile = TileCoordinates(z=z, x=x, y=y)
+        key = (tile, await self.map_tile_repository.get_data_version())
+
+        content = self.tile_cache.get(key)
+        if content is None:
+            content = await self.map_tile_repository.render(tile, TileAttributes.for_zoom(z))
+            self.tile_cache.put(key, content)
+
+        return content
@@ -1,7 +1,21 @@
-from collections.abc import Iterable
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
 from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
 
-from application.exceptions.organization import OrganizationWithThatNameAlreadyExistsException
+from application.exceptions.organization import (
+    OrganizationNotFoundException,
+    OrganizationWithThatNameAlreadyExistsException,
+)
+from domain.base.entity import EntityVersion
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+    TotalMode,
+)
 from domain.organization.entities import OrganizationEntity
 from domain.organization.exceptions import (
     ActivityNotFoundException,
@@ -10,19 +24,43 @@ from domain.organization.exceptions import (
 from domain.organization.interfaces.repositories import (
     BaseActivityRepository,
     BaseBuildingRepository,
+    BaseOrganizationDocumentRepository,
     BaseOrganizationRepository,
 )
+from domain.organization.read_models import (
+    NearbyOrganization,
+    OrganizationChangesPage,
+    OrganizationCluster,
+    OrganizationDocument,
+    OrganizationProjection,
+)
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+    SearchPolygon,
+)
+from domain.organization.tiles import cluster_grid_size
 from domain.organization.value_objects import (
     OrganizationNameValueObject,
     OrganizationPhoneValueObject,
 )
 
 
+OrganizationListItem = OrganizationEntity | OrganizationDocument | OrganizationProjection
+
+
+def _empty_page(total_mode: TotalMode) -> tuple[list[OrganizationListItem], int | None]:
+    """Пустая страница, когда искать нечего (нет такого адреса или вида
+    деятельности); ``total`` — как у ``_paginate`` в том же режиме."""
+    return [], None if total_mode is TotalMode.NONE else 0
+
+
 @dataclass
 class OrganizationService:
     organization_repository: BaseOrganizationRepository
     building_repository: BaseBuildingRepository
     activity_repository: BaseActivityRepository
+    organization_document_repository: BaseOrganizationDocumentRepository
 
     async def create_organization(
         self,
@@ -61,52 +99,118 @@ class OrganizationService:
             activities=activity_entities,
         )
 
+        # Документ read model репозиторий пишет в той же транзакции
         await self.organization_repository.add(organization)
 
         return organization
 
+    async def delete_organization(self, organization_id: UUID) -> None:
+        if not await self.organization_repository.delete(organization_id):
+            raise OrganizationNotFoundException(organization_oid=str(organization_id))
+
+    async def get_organization_changes(
+        self,
+        limit: int,
+        since: datetime | None = None,
+        cursor: str | None = None,
+    ) -> OrganizationChangesPage:
+        """Поток изменений для синхронизации реплик: созданные, изменённые
+        и удалённые организации по возрастанию времени изменения.
+
+        Курсор — позиция последней полученной записи; без курсора поток
+        начинается с ``since`` (или с начала каталога).
+
+        """
+        after = PageCursor.decode(cursor) if cursor else None
+        return await self.organization_repository.get_changes(limit=limit, since=since, after=after)
+
     async def get_organization_by_id(
         self,
         organization_id: str,
     ) -> OrganizationEntity | None:
         return await self.organization_repository.get_by_id(organization_id)
 
+    async def get_organization_version(
+        self,
+        organization_id: UUID,
+    ) -> EntityVersion | None:
+        """Версия организации с её зданием и видами деятельности (для ETag)
+        без их загрузки."""
+        return await self.organization_repository.get_version(organization_id)
+
+    async def get_organizations_by_ids(
+        self,
+        organization_ids: Iterable[UUID],
+    ) -> list[OrganizationEntity]:
+        """Пакетное получение организаций в порядке запрошенных ID.
+
+        Несуществующие ID пропускаются, дубликаты схлопываются.
+
+        """
+        requested_ids = list(dict.fromkeys(organization_ids))
+        organizations = {
+            organization.oid: organization
+            for organization in await self.organization_repository.get_by_ids(requested_ids)
+        }
+        return [organizations[oid] for oid in requested_ids if oid in organizations]
+
+    async def get_organization_documents_by_ids(
+        self,
+        organization_ids: Iterable[UUID],
+    ) -> list[OrganizationDocument]:
+        """Готовые JSON документы в порядке запрошенных ID, без гидратации
+        сущностей."""
+        requested_ids = list(dict.fromkeys(organization_ids))
+        return list(await self.organization_document_repository.get_by_ids(requested_ids))
+
+    async def rebuild_organization_documents(
+        self,
+        organization_ids: Iterable[UUID] | None = None,
+    ) -> int:
+        return await self.organization_document_repository.rebuild(organization_ids)
+
+    async def find_inconsistent_organization_documents(self) -> list[UUID]:
+        return await self.organization_document_repository.find_inconsistent()
+
     async def get_organizations_by_name(
         self,
         name: str,
         limit: int,
         offset: int,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
-        organizations = list(await self.organization_repository.get_by_name(name))
-        total = len(organizations)
-        return organizations[offset : offset + limit], total
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        as_documents: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
+        return await self._paginate(limit, offset, cursor, total_mode, as_documents, fields, name=name)
 
     async def get_organizations_by_address(
         self,
         address: str,
         limit: int,
         offset: int,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        as_documents: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         building = await self.building_repository.get_by_address(address)
 
         if not building:
-            return [], 0
-
-        organizations = await self.organization_repository.get_by_building_id(
-            building.oid,
-        )
-        all_organizations = list(organizations)
+            return _empty_page(total_mode)
 
-        organizations_list = list(all_organizations)
-        total = len(organizations_list)
-        return organizations_list[offset : offset + limit], total
+        return await self._paginate(limit, offset, cursor, total_mode, as_documents, fields, building_id=building.oid)
 
     async def get_organizations_by_activity(
         self,
         activity_name: str,
         limit: int,
         offset: int,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        as_documents: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         """Поиск организаций по виду деятельности (включая вложенные)
 
         Например, поиск по "Еда" найдет организации с видами деятельности:
@@ -115,35 +219,20 @@ class OrganizationService:
         - Молочная продукция
 
         """
-        root_activity = await self.activity_repository.get_by_name(name=activity_name)
-        if not root_activity:
-            return [], 0
-
-        # Получаем всех детей из дерева деятельности
-        child_activities = await self.activity_repository.filter(
-            parent_id=root_activity.oid,
+        activity_names = await self._activity_subtree_names(activity_name)
+        if activity_names is None:
+            return _empty_page(total_mode)
+
+        return await self._paginate(
+            limit,
+            offset,
+            cursor,
+            total_mode,
+            as_documents,
+            fields,
+            activity_names=activity_names,
         )
 
-        # Собираем все названия деятельностей (корень + дети)
-        activity_names = [root_activity.name.as_generic_type()]
-        activity_names.extend(
-            [child.name.as_generic_type() for child in child_activities],
-        )
-
-        # Ищем организации по каждой деятельности
-        all_organizations = []
-        for activity_name in activity_names:
-            organizations = await self.organization_repository.get_by_activity_name(
-                activity_name,
-            )
-            all_organizations.extend(organizations)
-
-        # Убираем дубликаты через set (используется __hash__ по oid)
-        unique_organizations = list(set(all_organizations))
-        total = len(unique_organizations)
-
-        return unique_organizations[offset : offset + limit], total
-
     async def get_organizations_by_radius(
         self,
         latitude: float,
@@ -151,28 +240,21 @@ class OrganizationService:
         radius: float,
         limit: int,
         offset: int,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        as_documents: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
         """Список организаций в заданном радиусе относительно точки на
-        карте."""
-        buildings = await self.building_repository.filter_by_radius(
-            latitude=latitude,
-            longitude=longitude,
-            radius_meters=radius,
-        )
+        карте.
 
-        # Ищем организации в найденных зданиях
-        all_organizations = []
-        for building in buildings:
-            organizations = await self.organization_repository.get_by_building_id(
-                building.oid,
-            )
-            all_organizations.extend(organizations)
-
-        # Убираем дубликаты через set (используется __hash__ по oid)
-        unique_organizations = list(set(all_organizations))
-        total = len(unique_organizations)
+        Организации упорядочены по расстоянию от точки (при равенстве — по
+        oid), страница выбирается в том же SQL запросе, документы и
+        проекции содержат ``distance``.
 
-        return unique_organizations[offset : offset + limit], total
+        """
+        circle = SearchCircle(latitude=latitude, longitude=longitude, radius=radius)
+        return await self._paginate(limit, offset, cursor, total_mode, as_documents, fields, within=circle)
 
     async def get_organizations_by_rectangle(
         self,
@@ -182,26 +264,171 @@ class OrganizationService:
         lon_max: float,
         limit: int,
         offset: int,
-    ) -> tuple[Iterable[OrganizationEntity], int]:
-        """Список организаций в прямоугольной области."""
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        as_documents: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
+        """Список организаций в прямоугольной области.
 
-        buildings = await self.building_repository.filter_by_bounding_box(
+        Область — фильтр того же SQL запроса, что выбирает страницу, поэтому
+        стоимость зависит от размера страницы, а не от числа зданий в
+        области.
+
+        """
+        bounding_box = SearchBoundingBox(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max)
+        return await self._paginate(limit, offset, cursor, total_mode, as_documents, fields, bounding_box=bounding_box)
+
+    async def search_organizations(
+        self,
+        limit: int,
+        offset: int,
+        name: str | None = None,
+        activity_name: str | None = None,
+        address: str | None = None,
+        circle: SearchCircle | None = None,
+        bounding_box: SearchBoundingBox | None = None,
+        polygon: SearchPolygon | None = None,
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        as_documents: bool = False,
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
+        """Поиск по любому сочетанию критериев одним SQL запросом.
+
+        Критерии объединяются через AND. Порядок: по расстоянию, если
+        задан круг, иначе по сходству названия, если задано ``name``,
+        иначе по (created_at, oid). Многоугольник с большим числом вершин
+        упрощается до ``MAX_QUERY_POLYGON_VERTICES``.
+
+        """
+        filters = {
+            "text": name,
+            "activity_subtree": activity_name,
+            "address": address,
+            "within": circle,
+            "bounding_box": bounding_box,
+            "polygon": polygon.simplified() if polygon is not None else None,
+        }
+        filters = {key: value for key, value in filters.items() if value is not None}
+
+        return await self._paginate(limit, offset, cursor, total_mode, as_documents, fields, **filters)
+
+    async def get_organization_clusters_by_rectangle(
+        self,
+        lat_min: float,
+        lat_max: float,
+        lon_min: float,
+        lon_max: float,
+        zoom: int,
+    ) -> list[OrganizationCluster]:
+        """Кластеры организаций в прямоугольной области для масштаба карты.
+
+        Ниже ``CLUSTER_MAX_ZOOM`` организации группируются в SQL по сетке
+        с шагом в долю тайла, начиная с него — по зданиям (отдельные точки).
+
+        """
+        clusters = await self.organization_repository.cluster_by_bounding_box(
             lat_min=lat_min,
             lat_max=lat_max,
             lon_min=lon_min,
             lon_max=lon_max,
+            grid_size=cluster_grid_size(zoom),
         )
+        return list(clusters)
 
-        # Ищем организации в найденных зданиях
-        all_organizations = []
-        for building in buildings:
-            organizations = await self.organization_repository.get_by_building_id(
-                building.oid,
-            )
-            all_organizations.extend(organizations)
+    async def get_nearest_organizations(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        activity_name: str | None = None,
+    ) -> list[NearbyOrganization]:
+        """``limit`` ближайших к точке организаций с расстоянием в метрах.
+
+        С ``activity_name`` учитываются только организации с этим видом
+        деятельности или вложенными в него (как в
+        ``get_organizations_by_activity``).
+
+        """
+        activity_names = None
+        if activity_name is not None:
+            activity_names = await self._activity_subtree_names(activity_name)
+            if activity_names is None:
+                return []
+
+        organizations = await self.organization_repository.get_nearest(
+            latitude=latitude,
+            longitude=longitude,
+            limit=limit,
+            activity_names=activity_names,
+        )
+        return list(organizations)
 
-        # Убираем дубликаты через set (используется __hash__ по oid)
-        unique_organizations = list(set(all_organizations))
-        total = len(unique_organizations)
+    async def get_organizations_near_points(
+        self,
+        points: Sequence[SearchCircle],
+        limit: int,
+        activity_name: str | None = None,
+    ) -> list[list[NearbyOrganization]]:
+        """Организации в радиусе каждой из точек (например, точек маршрута)
+        одним запросом к репозиторию; результаты — в порядке точек."""
+        return await self.organization_repository.get_near_points(
+            points=points,
+            limit=limit,
+            activity_name=activity_name,
+        )
 
-        return unique_organizations[offset : offset + limit], total
+    async def _activity_subtree_names(self, activity_name: str) -> list[str] | None:
+        """Названия вида деятельности и его детей; ``None``, если вида
+        деятельности нет."""
+        root_activity = await self.activity_repository.get_by_name(name=activity_name)
+        if not root_activity:
+            return None
+
+        # Получаем всех детей из дерева деятельности
+        child_activities = await self.activity_repository.filter(
+            parent_id=root_activity.oid,
+        )
+
+        # Собираем все названия деятельностей (корень + дети)
+        activity_names = [root_activity.name.as_generic_type()]
+        activity_names.extend(
+            [child.name.as_generic_type() for child in child_activities],
+        )
+        return activity_names
+
+    async def _paginate(
+        self,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        total_mode: TotalMode,
+        as_documents: bool,
+        fields: tuple[str, ...] | None,
+        **filters,
+    ) -> tuple[Iterable[OrganizationListItem], int | None]:
+        """Страница организаций (offset или keyset по cursor) и общее
+        количество в режиме ``total_mode``.
+
+        С ``fields`` возвращаются проекции только с этими полями, с
+        ``as_documents`` — готовые JSON документы из read model, иначе —
+        сущности.
+
+        """
+        page = PageRequest.build(limit=limit, offset=offset, cursor=cursor)
+        if fields:
+            fields = OrganizationProjection.validate_fields(fields)
+            organizations = await self.organization_repository.project(fields, page=page, **filters)
+        elif as_documents:
+            organizations = await self.organization_document_repository.filter(page=page, **filters)
+        else:
+            organizations = await self.organization_repository.filter(page=page, **filters)
+
+        if total_mode == TotalMode.NONE:
+            return organizations, None
+
+        if total_mode == TotalMode.ESTIMATE:
+            return organizations, await self.organization_repository.estimate_count(**filters)
+
+        return organizations, await self.organization_repository.count(**filters)
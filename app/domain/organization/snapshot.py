@@ -0,0 +1,90 @@
+from enum import StrEnum
+from typing import Any
+
+
+# Сколько строк в одном record batch по умолчанию
+SNAPSHOT_BATCH_SIZE = 10_000
+
+# Пачка строк таблицы снимка по колонкам: имя колонки -> значения
+SnapshotBatch = dict[str, list[Any]]
+
+
+class SnapshotTable(StrEnum):
+    """Таблицы снимка каталога."""
+
+    ORGANIZATIONS = "organizations"
+    BUILDINGS = "buildings"
+    PHONES = "phones"
+    ACTIVITIES = "activities"
+    # Связь организаций с видами деятельности
+    ORGANIZATION_ACTIVITIES = "organization_activities"
+
+
+class SnapshotFormat(StrEnum):
+    """Колоночный формат снимка."""
+
+    # Arrow IPC streaming format
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+    @property
+    def extension(self) -> str:
+        return "arrows" if self is SnapshotFormat.ARROW else "parquet"
+
+    @property
+    def media_type(self) -> str:
+        if self is SnapshotFormat.ARROW:
+            return "application/vnd.apache.arrow.stream"
+        return "application/vnd.apache.parquet"
+
+
+class SnapshotColumnType(StrEnum):
+    UUID = "uuid"
+    STRING = "string"
+    FLOAT64 = "float64"
+    TIMESTAMP = "timestamp"
+
+
+# Колонки таблиц в порядке записи. uuid отдаются строками, координаты —
+# float64 без округления (в JSON они проходят через десятичную запись)
+SNAPSHOT_COLUMNS: dict[SnapshotTable, tuple[tuple[str, SnapshotColumnType], ...]] = {
+    SnapshotTable.ORGANIZATIONS: (
+        ("oid", SnapshotColumnType.UUID),
+        ("name", SnapshotColumnType.STRING),
+        ("building_id", SnapshotColumnType.UUID),
+        ("created_at", SnapshotColumnType.TIMESTAMP),
+        ("updated_at", SnapshotColumnType.TIMESTAMP),
+    ),
+    SnapshotTable.BUILDINGS: (
+        ("oid", SnapshotColumnType.UUID),
+        ("address", SnapshotColumnType.STRING),
+        ("latitude", SnapshotColumnType.FLOAT64),
+        ("longitude", SnapshotColumnType.FLOAT64),
+        ("created_at", SnapshotColumnType.TIMESTAMP),
+        ("updated_at", SnapshotColumnType.TIMESTAMP),
+    ),
+    SnapshotTable.PHONES: (
+        ("organization_id", SnapshotColumnType.UUID),
+        ("phone", SnapshotColumnType.STRING),
+    ),
+    SnapshotTable.ACTIVITIES: (
+        ("oid", SnapshotColumnType.UUID),
+        ("name", SnapshotColumnType.STRING),
+        ("parent_id", SnapshotColumnType.UUID),
+        ("created_at", SnapshotColumnType.TIMESTAMP),
+        ("updated_at", SnapshotColumnType.TIMESTAMP),
+    ),
+    SnapshotTable.ORGANIZATION_ACTIVITIES: (
+        ("organization_id", SnapshotColumnType.UUID),
+        ("activity_id", SnapshotColumnType.UUID),
+    ),
+}
+
+
+def rows_to_batch(table: SnapshotTable, rows: list[tuple[Any, ...]]) -> SnapshotBatch:
+    """Транспонирует строки (в порядке ``SNAPSHOT_COLUMNS``) в колонки."""
+    names = [name for name, _ in SNAPSHOT_COLUMNS[table]]
+    if not rows:
+        return {name: [] for name in names}
+
+    return {name: list(values) for name, values in zip(names, zip(*rows, strict=True), strict=True)}
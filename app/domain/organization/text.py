@@ -0,0 +1,21 @@
+import re
+
+
+def trigrams(text: str) -> set[str]:
+    """Триграммы как в pg_trgm: слова в нижнем регистре, дополненные двумя
+    пробелами слева и одним справа."""
+    result = set()
+    for word in re.findall(r"\w+", text.lower()):
+        padded = f"  {word} "
+        result.update(padded[index : index + 3] for index in range(len(padded) - 2))
+    return result
+
+
+def similarity(left: str, right: str) -> float:
+    """Аналог ``similarity()`` pg_trgm: доля общих триграмм."""
+    left_trigrams, right_trigrams = trigrams(left), trigrams(right)
+    union = left_trigrams | right_trigrams
+    if not union:
+        return 0.0
+
+    return len(left_trigrams & right_trigrams) / len(union)
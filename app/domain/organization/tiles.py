@@ -0,0 +1,100 @@
+import math
+from dataclasses import dataclass
+
+from domain.organization.exceptions import InvalidTileCoordinatesException
+
+
+MAX_TILE_ZOOM = 22
+# Длина экватора в метрах EPSG:3857 и предельная широта проекции
+WEB_MERCATOR_WORLD_SIZE = 2 * math.pi * 6378137
+MAX_MERCATOR_LATITUDE = 85.05112878
+# Размер тайла в координатах MVT и запас за краем для иконок на границе
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+
+# Слой организаций появляется только на крупных масштабах: на мелких
+# точек зданий с количеством организаций достаточно
+ORGANIZATION_LAYER_MIN_ZOOM = 15
+BUILDING_ADDRESS_MIN_ZOOM = 14
+
+# Кластеризация: с этого масштаба точки отдаются без объединения, ниже —
+# сетка из CLUSTER_CELLS_PER_TILE ячеек на сторону тайла
+CLUSTER_MAX_ZOOM = 16
+CLUSTER_CELLS_PER_TILE = 4
+
+
+def mercator_meters(latitude: float, longitude: float) -> tuple[float, float]:
+    """Координаты точки в EPSG:3857 (как ``ST_Transform(..., 3857)``)."""
+    latitude = max(-MAX_MERCATOR_LATITUDE, min(MAX_MERCATOR_LATITUDE, latitude))
+    sin_lat = math.sin(math.radians(latitude))
+    x = longitude / 360 * WEB_MERCATOR_WORLD_SIZE
+    y = math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi) * WEB_MERCATOR_WORLD_SIZE
+    return x, y
+
+
+def cluster_grid_size(zoom: int) -> float | None:
+    """Шаг сетки кластеризации в метрах EPSG:3857 для масштаба ``zoom``;
+    ``None`` — кластеризация не нужна, отдаются отдельные здания."""
+    if zoom >= CLUSTER_MAX_ZOOM:
+        return None
+
+    return WEB_MERCATOR_WORLD_SIZE / (1 << zoom) / CLUSTER_CELLS_PER_TILE
+
+
+def _world_position(latitude: float, longitude: float, size: int) -> tuple[float, float]:
+    """Web Mercator координаты точки в единицах тайлов масштаба ``size``."""
+    x, y = mercator_meters(latitude, longitude)
+    return (x / WEB_MERCATOR_WORLD_SIZE + 0.5) * size, (0.5 - y / WEB_MERCATOR_WORLD_SIZE) * size
+
+
+@dataclass(frozen=True)
+class TileCoordinates:
+    """Тайл ``z/x/y`` в схеме XYZ (Web Mercator, y растёт вниз)."""
+
+    z: int
+    x: int
+    y: int
+
+    def __post_init__(self) -> None:
+        size = 1 << self.z if 0 <= self.z <= MAX_TILE_ZOOM else 0
+        if not (0 <= self.x < size and 0 <= self.y < size):
+            raise InvalidTileCoordinatesException(z=self.z, x=self.x, y=self.y)
+
+    @classmethod
+    def containing(cls, latitude: float, longitude: float, z: int) -> "TileCoordinates":
+        """Тайл масштаба ``z``, в который попадает точка."""
+        size = 1 << z
+        world_x, world_y = _world_position(latitude, longitude, size)
+        return cls(z=z, x=min(int(world_x), size - 1), y=min(int(world_y), size - 1))
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """``(lon_min, lat_min, lon_max, lat_max)`` тайла в WGS 84."""
+        size = 1 << self.z
+        lon_min = self.x / size * 360 - 180
+        lon_max = (self.x + 1) / size * 360 - 180
+        lat_max = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * self.y / size))))
+        lat_min = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (self.y + 1) / size))))
+        return lon_min, lat_min, lon_max, lat_max
+
+    def project(self, latitude: float, longitude: float) -> tuple[int, int]:
+        """Координаты точки внутри тайла (``0..TILE_EXTENT``), как
+        ``ST_AsMVTGeom``."""
+        world_x, world_y = _world_position(latitude, longitude, 1 << self.z)
+        return round((world_x - self.x) * TILE_EXTENT), round((world_y - self.y) * TILE_EXTENT)
+
+
+@dataclass(frozen=True)
+class TileAttributes:
+    """Атрибуты слоёв тайла для масштаба; пустой набор — слоя нет."""
+
+    building_fields: tuple[str, ...]
+    organization_fields: tuple[str, ...]
+
+    @classmethod
+    def for_zoom(cls, z: int) -> "TileAttributes":
+        building_fields = ("oid", "organizations")
+        if z >= BUILDING_ADDRESS_MIN_ZOOM:
+            building_fields += ("address",)
+
+        organization_fields = ("oid", "name", "building_id") if z >= ORGANIZATION_LAYER_MIN_ZOOM else ()
+        return cls(building_fields=building_fields, organization_fields=organization_fields)
@@ -2,6 +2,7 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import Iterable
 from uuid import UUID
 
 from domain.user.entities import UserEntity
@@ -14,6 +15,9 @@ class BaseUserRepository(ABC):
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> UserEntity | None: ...
 
+    @abstractmethod
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Iterable[UserEntity]: ...
+
     @abstractmethod
     async def get_by_username(self, username: str) -> UserEntity | None: ...
 
@@ -2,6 +2,7 @@ from geoalchemy2.shape import to_shape
 from infrastructure.database.models.building import BuildingModel
 
 from domain.organization.entities import BuildingEntity
+from domain.organization.geohash import encode
 from domain.organization.value_objects import (
     BuildingAddressValueObject,
     BuildingCoordinatesValueObject,
@@ -15,6 +16,7 @@ def building_entity_to_model(entity: BuildingEntity) -> BuildingModel:
         oid=entity.oid,
         address=entity.address.as_generic_type(),
         location=location,
+        geohash=encode(entity.coordinates.latitude, entity.coordinates.longitude),
         created_at=entity.created_at,
         updated_at=entity.updated_at,
     )
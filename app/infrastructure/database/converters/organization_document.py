@@ -0,0 +1,50 @@
+import orjson
+
+from domain.organization.entities import (
+    ActivityEntity,
+    BuildingEntity,
+    OrganizationEntity,
+)
+from domain.organization.read_models import OrganizationDocument
+
+
+def _activity_to_dict(entity: ActivityEntity) -> dict:
+    return {
+        "oid": entity.oid,
+        "name": entity.name.as_generic_type(),
+        "parent_id": entity.parent.oid if entity.parent else None,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
+
+
+def _building_to_dict(entity: BuildingEntity) -> dict:
+    return {
+        "oid": entity.oid,
+        "address": entity.address.as_generic_type(),
+        "latitude": entity.coordinates.latitude,
+        "longitude": entity.coordinates.longitude,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
+
+
+def organization_entity_to_document(entity: OrganizationEntity) -> OrganizationDocument:
+    content = orjson.dumps(
+        {
+            "oid": entity.oid,
+            "name": entity.name.as_generic_type(),
+            "building": _building_to_dict(entity.building),
+            "phones": [phone.as_generic_type() for phone in entity.phones],
+            "activities": [_activity_to_dict(activity) for activity in entity.activities],
+            "created_at": entity.created_at,
+            "updated_at": entity.updated_at,
+        },
+        option=orjson.OPT_UTC_Z,
+    )
+    return OrganizationDocument(
+        oid=entity.oid,
+        created_at=entity.created_at,
+        updated_at=entity.version().updated_at,
+        content=content,
+    )
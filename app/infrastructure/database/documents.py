@@ -0,0 +1,149 @@
+"""Сборка read model ``organization_document`` в Postgres.
+
+Отдельно от репозиториев: документ пишет и
+``SQLAlchemyOrganizationRepository.add`` в транзакции создания
+организации, и ``SQLAlchemyOrganizationDocumentRepository.rebuild``.
+
+"""
+
+from collections.abc import Iterable
+from uuid import UUID
+
+from infrastructure.database.models.activity import ActivityModel
+from infrastructure.database.models.building import BuildingModel
+from infrastructure.database.models.organization import (
+    organization_activity,
+    OrganizationDocumentModel,
+    OrganizationModel,
+    OrganizationPhoneModel,
+)
+from sqlalchemy import (
+    cast,
+    ColumnElement,
+    func,
+    literal_column,
+    Select,
+    select,
+)
+from sqlalchemy.dialects.postgresql import (
+    Insert,
+    insert,
+    JSONB,
+)
+
+
+def organization_document_expression() -> ColumnElement:
+    """JSONB документ организации, собранный в Postgres через
+    ``json_build_object``.
+
+    Ожидает ``organization JOIN building`` во FROM. Форма совпадает с
+    ``OrganizationDetailSchema``.
+
+    """
+    empty_array = literal_column("'[]'::json")
+
+    phones = (
+        select(func.coalesce(func.json_agg(OrganizationPhoneModel.phone), empty_array))
+        .where(OrganizationPhoneModel.organization_id == OrganizationModel.oid)
+        .scalar_subquery()
+    )
+    activities = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    func.json_build_object(
+                        "oid",
+                        ActivityModel.oid,
+                        "name",
+                        ActivityModel.name,
+                        "parent_id",
+                        ActivityModel.parent_id,
+                        "created_at",
+                        ActivityModel.created_at,
+                        "updated_at",
+                        ActivityModel.updated_at,
+                    ),
+                ),
+                empty_array,
+            ),
+        )
+        .select_from(organization_activity)
+        .join(ActivityModel, ActivityModel.oid == organization_activity.c.activity_id)
+        .where(organization_activity.c.organization_id == OrganizationModel.oid)
+        .scalar_subquery()
+    )
+    location = func.geometry(BuildingModel.location)
+    building = func.json_build_object(
+        "oid",
+        BuildingModel.oid,
+        "address",
+        BuildingModel.address,
+        "latitude",
+        func.ST_Y(location),
+        "longitude",
+        func.ST_X(location),
+        "created_at",
+        BuildingModel.created_at,
+        "updated_at",
+        BuildingModel.updated_at,
+    )
+
+    return cast(
+        func.json_build_object(
+            "oid",
+            OrganizationModel.oid,
+            "name",
+            OrganizationModel.name,
+            "building",
+            building,
+            "phones",
+            phones,
+            "activities",
+            activities,
+            "created_at",
+            OrganizationModel.created_at,
+            "updated_at",
+            OrganizationModel.updated_at,
+        ),
+        JSONB,
+    )
+
+
+def organization_version_expression() -> ColumnElement:
+    """Версия документа для ETag, как ``OrganizationEntity.version``:
+    самое позднее ``updated_at`` организации, её здания и видов
+    деятельности. Ожидает ``organization`` во FROM."""
+    building = (
+        select(BuildingModel.updated_at).where(BuildingModel.oid == OrganizationModel.building_id).scalar_subquery()
+    )
+    activities = (
+        select(func.max(ActivityModel.updated_at))
+        .select_from(organization_activity)
+        .join(ActivityModel, ActivityModel.oid == organization_activity.c.activity_id)
+        .where(organization_activity.c.organization_id == OrganizationModel.oid)
+        .scalar_subquery()
+    )
+    # GREATEST пропускает NULL — организация без видов деятельности
+    return func.greatest(OrganizationModel.updated_at, building, activities)
+
+
+def built_organization_documents() -> Select:
+    """``(oid, document)`` документов, собранных из исходных таблиц."""
+    return select(
+        OrganizationModel.oid.label("oid"),
+        organization_document_expression().label("document"),
+    ).join(BuildingModel, BuildingModel.oid == OrganizationModel.building_id)
+
+
+def upsert_organization_documents(organization_ids: Iterable[UUID] | None = None) -> Insert:
+    """INSERT ... ON CONFLICT пересборки документов (всех, если ID не
+    переданы)."""
+    source = built_organization_documents()
+    if organization_ids is not None:
+        source = source.where(OrganizationModel.oid_any(organization_ids))
+
+    stmt = insert(OrganizationDocumentModel).from_select(["oid", "document"], source)
+    return stmt.on_conflict_do_update(
+        index_elements=[OrganizationDocumentModel.oid],
+        set_={"document": stmt.excluded.document, "built_at": func.now()},
+    )
@@ -0,0 +1,153 @@
+import asyncio
+from collections.abc import (
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Generic,
+    TypeVar,
+)
+
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+BatchLoadFunction = Callable[[list[KeyType]], Awaitable[Mapping[KeyType, ValueType]]]
+
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+
+class BatchLoader(Generic[KeyType, ValueType]):
+    """DataLoader: собирает ``load()`` одного тика event loop в один batch.
+
+    Все ключи, запрошенные до того как event loop дойдет до следующей
+    итерации, передаются в ``batch_load_fn`` одним списком. Функция
+    возвращает словарь ``ключ -> значение``; отсутствующие ключи
+    резолвятся в ``None``.
+
+    """
+
+    def __init__(
+        self,
+        batch_load_fn: BatchLoadFunction[KeyType, ValueType],
+        *,
+        cache: bool = True,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        self._batch_load_fn = batch_load_fn
+        self._cache_enabled = cache
+        self._max_batch_size = max_batch_size
+        self._cache: dict[KeyType, asyncio.Future] = {}
+        self._queue: dict[KeyType, asyncio.Future] = {}
+        self._dispatch_scheduled = False
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: KeyType) -> ValueType | None:
+        return await self._enqueue(key)
+
+    async def load_many(self, keys: Iterable[KeyType]) -> list[ValueType | None]:
+        futures = [self._enqueue(key) for key in keys]
+        if not futures:
+            return []
+
+        return list(await asyncio.gather(*futures))
+
+    def prime(self, key: KeyType, value: ValueType) -> None:
+        if not self._cache_enabled:
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: KeyType) -> None:
+        self._cache.pop(key, None)
+
+    def clear_all(self) -> None:
+        self._cache.clear()
+
+    def _enqueue(self, key: KeyType) -> asyncio.Future:
+        future = self._cache.get(key) or self._queue.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue[key] = future
+        if self._cache_enabled:
+            self._cache[key] = future
+
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+
+        return future
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, {}
+        self._dispatch_scheduled = False
+
+        keys = list(queue)
+        for start in range(0, len(keys), self._max_batch_size):
+            batch = {key: queue[key] for key in keys[start : start + self._max_batch_size]}
+            task = asyncio.ensure_future(self._load_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, batch: dict[KeyType, asyncio.Future]) -> None:
+        try:
+            values = await self._batch_load_fn(list(batch))
+        except Exception as error:
+            for key, future in batch.items():
+                # Ошибки не кешируем: следующий load() повторит запрос
+                self._cache.pop(key, None)
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+_batch_loaders: ContextVar[dict[Hashable, BatchLoader] | None] = ContextVar(
+    "batch_loaders",
+    default=None,
+)
+
+
+@contextmanager
+def batch_loader_scope() -> Iterator[None]:
+    """Область жизни batch loaders (обычно — один HTTP запрос)."""
+    token = _batch_loaders.set({})
+    try:
+        yield
+    finally:
+        _batch_loaders.reset(token)
+
+
+def get_batch_loader(
+    key: Hashable,
+    batch_load_fn: BatchLoadFunction[KeyType, ValueType],
+) -> BatchLoader[KeyType, ValueType]:
+    """Возвращает loader текущей области для ``key``.
+
+    Вне ``batch_loader_scope`` каждый вызов получает новый loader без
+    кеша, т.е. батчатся только ключи одного ``load_many``.
+
+    """
+    loaders = _batch_loaders.get()
+    if loaders is None:
+        return BatchLoader(batch_load_fn, cache=False)
+
+    loader = loaders.get(key)
+    if loader is None:
+        loader = loaders[key] = BatchLoader(batch_load_fn)
+
+    return loader
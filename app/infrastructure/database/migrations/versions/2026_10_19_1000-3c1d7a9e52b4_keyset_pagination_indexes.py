@@ -0,0 +1,32 @@
+"""keyset pagination indexes
+
+Revision ID: 3c1d7a9e52b4
+Revises: 05b05195247d
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1d7a9e52b4"
+down_revision: Union[str, Sequence[str], None] = "05b05195247d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_organization_created_at_oid", "organization", ["created_at", "oid"], unique=False)
+    op.create_index("ix_activity_created_at_oid", "activity", ["created_at", "oid"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_activity_created_at_oid", table_name="activity")
+    op.drop_index("ix_organization_created_at_oid", table_name="organization")
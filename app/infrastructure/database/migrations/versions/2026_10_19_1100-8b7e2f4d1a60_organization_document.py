@@ -0,0 +1,80 @@
+"""organization document read model
+
+Revision ID: 8b7e2f4d1a60
+Revises: 3c1d7a9e52b4
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b7e2f4d1a60"
+down_revision: Union[str, Sequence[str], None] = "3c1d7a9e52b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "organization_document",
+        sa.Column("oid", sa.UUID(), nullable=False),
+        sa.Column("document", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("built_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["oid"], ["organization.oid"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("oid"),
+    )
+
+    # Заполняем документы для уже существующих организаций
+    op.execute(
+        """
+        INSERT INTO organization_document (oid, document)
+        SELECT
+            organization.oid,
+            json_build_object(
+                'oid', organization.oid,
+                'name', organization.name,
+                'building', json_build_object(
+                    'oid', building.oid,
+                    'address', building.address,
+                    'latitude', ST_Y(geometry(building.location)),
+                    'longitude', ST_X(geometry(building.location)),
+                    'created_at', building.created_at,
+                    'updated_at', building.updated_at
+                ),
+                'phones', (
+                    SELECT coalesce(json_agg(organization_phone.phone), '[]'::json)
+                    FROM organization_phone
+                    WHERE organization_phone.organization_id = organization.oid
+                ),
+                'activities', (
+                    SELECT coalesce(json_agg(json_build_object(
+                        'oid', activity.oid,
+                        'name', activity.name,
+                        'parent_id', activity.parent_id,
+                        'created_at', activity.created_at,
+                        'updated_at', activity.updated_at
+                    )), '[]'::json)
+                    FROM organization_activity
+                    JOIN activity ON activity.oid = organization_activity.activity_id
+                    WHERE organization_activity.organization_id = organization.oid
+                ),
+                'created_at', organization.created_at,
+                'updated_at', organization.updated_at
+            )::jsonb
+        FROM organization
+        JOIN building ON building.oid = organization.building_id
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("organization_document")
@@ -0,0 +1,40 @@
+"""map tile indexes
+
+Revision ID: d4a9c3e17f05
+Revises: 8b7e2f4d1a60
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4a9c3e17f05"
+down_revision: Union[str, Sequence[str], None] = "8b7e2f4d1a60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_building_updated_at", "building", ["updated_at"], unique=False)
+    op.create_index("ix_organization_updated_at", "organization", ["updated_at"], unique=False)
+    op.create_index(
+        "ix_building_location_mercator",
+        "building",
+        [sa.text("ST_Transform(geometry(location), 3857)")],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_building_location_mercator", table_name="building", postgresql_using="gist")
+    op.drop_index("ix_organization_updated_at", table_name="organization")
+    op.drop_index("ix_building_updated_at", table_name="building")
@@ -0,0 +1,47 @@
+"""search trigram indexes
+
+Revision ID: 6f2a8c1d9b34
+Revises: d4a9c3e17f05
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6f2a8c1d9b34"
+down_revision: Union[str, Sequence[str], None] = "d4a9c3e17f05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    op.create_index(
+        "ix_organization_name_trgm",
+        "organization",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_building_address_trgm",
+        "building",
+        ["address"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"address": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_building_address_trgm", table_name="building", postgresql_using="gin")
+    op.drop_index("ix_organization_name_trgm", table_name="organization", postgresql_using="gin")
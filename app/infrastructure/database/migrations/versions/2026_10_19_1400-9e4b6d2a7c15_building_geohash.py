@@ -0,0 +1,38 @@
+"""building geohash
+
+Revision ID: 9e4b6d2a7c15
+Revises: 6f2a8c1d9b34
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e4b6d2a7c15"
+down_revision: Union[str, Sequence[str], None] = "6f2a8c1d9b34"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("building", sa.Column("geohash", sa.String(length=12, collation="C"), nullable=True))
+
+    # Заполняем geohash для уже существующих зданий; точность совпадает с
+    # domain.organization.geohash.GEOHASH_PRECISION
+    op.execute("UPDATE building SET geohash = ST_GeoHash(geometry(location), 9)")
+
+    op.alter_column("building", "geohash", nullable=False)
+    op.create_index("ix_building_geohash", "building", ["geohash"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_building_geohash", table_name="building")
+    op.drop_column("building", "geohash")
@@ -0,0 +1,73 @@
+"""organization changes stream
+
+Revision ID: 1f7c3e9a5d28
+Revises: 9e4b6d2a7c15
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import geoalchemy2
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1f7c3e9a5d28"
+down_revision: Union[str, Sequence[str], None] = "9e4b6d2a7c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset по (updated_at, oid) покрывает и max(updated_at)
+    op.create_index("ix_organization_updated_at_oid", "organization", ["updated_at", "oid"], unique=False)
+    op.drop_index("ix_organization_updated_at", table_name="organization")
+
+    op.create_table(
+        "organization_tombstone",
+        sa.Column("oid", sa.UUID(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), server_default=sa.text("localtimestamp"), nullable=False),
+        sa.PrimaryKeyConstraint("oid"),
+    )
+    op.create_index(
+        "ix_organization_tombstone_deleted_at_oid",
+        "organization_tombstone",
+        ["deleted_at", "oid"],
+        unique=False,
+    )
+
+    # Триггер, а не запись из репозитория: каскадное удаление вместе со
+    # зданием тоже должно попасть в поток изменений
+    op.execute(
+        """
+        CREATE FUNCTION organization_tombstone() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO organization_tombstone (oid, deleted_at)
+            VALUES (OLD.oid, localtimestamp)
+            ON CONFLICT (oid) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+            RETURN OLD;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER organization_tombstone
+        AFTER DELETE ON organization
+        FOR EACH ROW EXECUTE FUNCTION organization_tombstone()
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER organization_tombstone ON organization")
+    op.execute("DROP FUNCTION organization_tombstone()")
+    op.drop_index("ix_organization_tombstone_deleted_at_oid", table_name="organization_tombstone")
+    op.drop_table("organization_tombstone")
+
+    op.create_index("ix_organization_updated_at", "organization", ["updated_at"], unique=False)
+    op.drop_index("ix_organization_updated_at_oid", table_name="organization")
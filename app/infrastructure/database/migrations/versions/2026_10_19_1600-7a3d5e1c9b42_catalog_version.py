@@ -0,0 +1,64 @@
+"""catalog version counter
+
+Revision ID: 7a3d5e1c9b42
+Revises: 1f7c3e9a5d28
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3d5e1c9b42"
+down_revision: Union[str, Sequence[str], None] = "1f7c3e9a5d28"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Таблицы, изменения которых видны в тайлах и агрегатах
+TABLES = ("building", "organization", "organization_phone", "organization_activity", "activity")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "catalog_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("INSERT INTO catalog_version (id, version) VALUES (1, 0)")
+
+    # FOR EACH STATEMENT: одно увеличение на запрос, а не на строку.
+    # Блокировка строки счётчика держится до конца транзакции, поэтому
+    # значение растёт в порядке фиксации записей
+    op.execute(
+        """
+        CREATE FUNCTION catalog_version_bump() RETURNS trigger AS $$
+        BEGIN
+            UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+    )
+    for table in TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER catalog_version_bump
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION catalog_version_bump()
+            """,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER catalog_version_bump ON {table}")
+    op.execute("DROP FUNCTION catalog_version_bump()")
+    op.drop_table("catalog_version")
@@ -0,0 +1,48 @@
+"""organization updated_at from the database clock
+
+Revision ID: b8e1f4a6c3d7
+Revises: 7a3d5e1c9b42
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e1f4a6c3d7"
+down_revision: Union[str, Sequence[str], None] = "7a3d5e1c9b42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Поток изменений сравнивает updated_at, deleted_at надгробий и границу
+    # задержки — все три берутся из localtimestamp сервера БД, а не из
+    # часов экземпляров приложения
+    op.execute(
+        """
+        CREATE FUNCTION organization_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at := localtimestamp;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER organization_updated_at
+        BEFORE INSERT OR UPDATE ON organization
+        FOR EACH ROW EXECUTE FUNCTION organization_updated_at()
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER organization_updated_at ON organization")
+    op.execute("DROP FUNCTION organization_updated_at()")
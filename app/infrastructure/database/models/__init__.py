@@ -1,9 +1,12 @@
 from .activity import ActivityModel
 from .building import BuildingModel
+from .catalog_version import CatalogVersionModel
 from .organization import (
     organization_activity,
+    OrganizationDocumentModel,
     OrganizationModel,
     OrganizationPhoneModel,
+    OrganizationTombstoneModel,
 )
 from .user import (
     APIKeyModel,
@@ -15,8 +18,11 @@ __all__ = [
     "ActivityModel",
     "APIKeyModel",
     "BuildingModel",
+    "CatalogVersionModel",
+    "OrganizationDocumentModel",
     "OrganizationModel",
     "OrganizationPhoneModel",
+    "OrganizationTombstoneModel",
     "UserModel",
     "organization_activity",
 ]
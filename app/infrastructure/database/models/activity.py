@@ -7,6 +7,7 @@ from uuid import UUID
 from infrastructure.database.models.base import TimedBaseModel
 from sqlalchemy import (
     ForeignKey,
+    Index,
     String,
 )
 from sqlalchemy.dialects.postgresql import UUID as UUIDType
@@ -19,6 +20,7 @@ from sqlalchemy.orm import (
 
 class ActivityModel(TimedBaseModel):
     __tablename__ = "activity"
+    __table_args__ = (Index("ix_activity_created_at_oid", "created_at", "oid"),)
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     parent_id: Mapped[UUID | None] = mapped_column(
@@ -1,8 +1,19 @@
 import datetime
+from collections.abc import Iterable
 from uuid import UUID
 
-from sqlalchemy import sql
-from sqlalchemy.dialects.postgresql import UUID as UUIDType
+from sqlalchemy import (
+    any_,
+    ColumnElement,
+    literal,
+    Select,
+    select,
+    sql,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    UUID as UUIDType,
+)
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -41,3 +52,18 @@ class TimedBaseModel(BaseModel):
         server_default=sql.func.now(),
         onupdate=sql.func.now(),
     )
+
+    @classmethod
+    def oid_any(cls, oids: Iterable[UUID]) -> ColumnElement[bool]:
+        return uuid_any(cls.oid, oids)
+
+    @classmethod
+    def select_version(cls, oid: UUID) -> Select:
+        """``(oid, updated_at)`` одной записи — поиск по первичному ключу
+        без загрузки связей."""
+        return select(cls.oid, cls.updated_at).where(cls.oid == oid)
+
+
+def uuid_any(column: ColumnElement[UUID], values: Iterable[UUID]) -> ColumnElement[bool]:
+    """``column = ANY(:values)`` — один параметр-массив вместо списка IN."""
+    return column == any_(literal(list(values), ARRAY(UUIDType(as_uuid=True))))
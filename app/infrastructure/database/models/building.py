@@ -1,8 +1,20 @@
+from collections.abc import Sequence
 from typing import Any
 
 from geoalchemy2 import Geography
 from infrastructure.database.models.base import TimedBaseModel
-from sqlalchemy import String
+from sqlalchemy import (
+    and_,
+    ColumnElement,
+    false,
+    func,
+    Index,
+    literal_column,
+    or_,
+    String,
+    text,
+    true,
+)
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -11,6 +23,24 @@ from sqlalchemy.orm import (
 
 class BuildingModel(TimedBaseModel):
     __tablename__ = "building"
+    __table_args__ = (
+        Index("ix_building_updated_at", "updated_at"),
+        Index("ix_building_geohash", "geohash"),
+        # Тайлы режутся в Web Mercator: индекс по тому же выражению, что и
+        # в запросе ST_AsMVT
+        Index(
+            "ix_building_location_mercator",
+            text("ST_Transform(geometry(location), 3857)"),
+            postgresql_using="gist",
+        ),
+        # Поиск по подстроке адреса (ILIKE)
+        Index(
+            "ix_building_address_trgm",
+            "address",
+            postgresql_using="gin",
+            postgresql_ops={"address": "gin_trgm_ops"},
+        ),
+    )
 
     address: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
 
@@ -18,3 +48,34 @@ class BuildingModel(TimedBaseModel):
         Geography(geometry_type="POINT", srid=4326),
         nullable=False,
     )
+
+    # Geohash точки (``domain.organization.geohash``). Collation "C":
+    # сравнение побайтное, диапазон префикса идёт по btree индексу и с
+    # bind параметрами
+    geohash: Mapped[str] = mapped_column(String(12, collation="C"), nullable=False)
+
+    @classmethod
+    def location_mercator(cls) -> ColumnElement:
+        """Точка здания в EPSG:3857 — выражение индекса
+        ``ix_building_location_mercator``.
+
+        SRID подставляется литералом: с bind параметром выражение не
+        совпадёт с индексным в generic плане prepared statement.
+
+        """
+        return func.ST_Transform(func.geometry(cls.location), literal_column("3857"))
+
+    @classmethod
+    def geohash_prefix_in(cls, cells: Sequence[str]) -> ColumnElement:
+        """Geohash начинается с одного из ``cells`` (покрытие
+        ``geohash.cover``) — по диапазону на ячейку, а не LIKE, чтобы
+        индекс использовался и в generic плане."""
+        if not cells:
+            # Покрытие перевёрнутого прямоугольника пусто: зданий в нём нет
+            return false()
+
+        if "" in cells:
+            # Пустой префикс — вся карта
+            return true()
+
+        return or_(*(and_(cls.geohash >= cell, cls.geohash < cell + "~") for cell in cells))
@@ -0,0 +1,32 @@
+from infrastructure.database.models.base import BaseModel
+from sqlalchemy import (
+    BigInteger,
+    Select,
+    select,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+
+
+class CatalogVersionModel(BaseModel):
+    """Счётчик изменений каталога — версия данных для ключей кешей.
+
+    Единственная строка увеличивается триггерами ``catalog_version_bump``
+    на изменение зданий, организаций, их телефонов и видов деятельности
+    (миграция 7a3d5e1c9b42) в той же транзакции, что и изменение. Новое
+    значение видно только после фиксации, и каждая зафиксированная запись
+    меняет его — в отличие от ``max(updated_at)``, который ставится до
+    фиксации и может оказаться меньше уже прочитанного.
+
+    """
+
+    __tablename__ = "catalog_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+    @classmethod
+    def select_version(cls) -> Select:
+        return select(cls.version).where(cls.id == 1)
@@ -1,15 +1,24 @@
+import datetime
 from typing import List
 from uuid import UUID
 
-from infrastructure.database.models.base import TimedBaseModel
+from infrastructure.database.models.base import (
+    BaseModel,
+    TimedBaseModel,
+)
 from infrastructure.database.models.building import BuildingModel
 from sqlalchemy import (
     Column,
     ForeignKey,
+    Index,
+    sql,
     String,
     Table,
 )
-from sqlalchemy.dialects.postgresql import UUID as UUIDType
+from sqlalchemy.dialects.postgresql import (
+    JSONB,
+    UUID as UUIDType,
+)
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -50,6 +59,19 @@ class OrganizationPhoneModel(TimedBaseModel):
 
 class OrganizationModel(TimedBaseModel):
     __tablename__ = "organization"
+    __table_args__ = (
+        Index("ix_organization_created_at_oid", "created_at", "oid"),
+        # Поток изменений: keyset по (updated_at, oid); updated_at ставит
+        # триггер organization_updated_at (миграция b8e1f4a6c3d7)
+        Index("ix_organization_updated_at_oid", "updated_at", "oid"),
+        # Поиск по подстроке названия (ILIKE) и ранжирование similarity()
+        Index(
+            "ix_organization_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
 
@@ -75,3 +97,45 @@ class OrganizationModel(TimedBaseModel):
         lazy="selectin",
         passive_deletes=True,
     )
+
+
+class OrganizationDocumentModel(BaseModel):
+    """Read model: собранный JSON документ организации.
+
+    Пересобирается из ``organization``, ``building``,
+    ``organization_phone`` и ``activity`` при создании организации и
+    командой ``RebuildOrganizationDocumentsCommand``.
+
+    """
+
+    __tablename__ = "organization_document"
+
+    oid: Mapped[UUID] = mapped_column(
+        UUIDType(as_uuid=True),
+        ForeignKey("organization.oid", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    document: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    built_at: Mapped[datetime.datetime] = mapped_column(
+        nullable=False,
+        server_default=sql.func.now(),
+    )
+
+
+class OrganizationTombstoneModel(BaseModel):
+    """Удалённая организация: запись для потока изменений.
+
+    Заполняется триггером ``organization_tombstone`` на DELETE из
+    ``organization`` (миграция 1f7c3e9a5d28), поэтому учитывает и
+    каскадное удаление вместе со зданием.
+
+    """
+
+    __tablename__ = "organization_tombstone"
+    __table_args__ = (Index("ix_organization_tombstone_deleted_at_oid", "deleted_at", "oid"),)
+
+    oid: Mapped[UUID] = mapped_column(UUIDType(as_uuid=True), primary_key=True)
+    deleted_at: Mapped[datetime.datetime] = mapped_column(
+        nullable=False,
+        server_default=sql.func.localtimestamp(),
+    )
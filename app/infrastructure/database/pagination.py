@@ -0,0 +1,102 @@
+from typing import Any
+
+import orjson
+from infrastructure.database.models.base import TimedBaseModel
+from sqlalchemy import (
+    ColumnElement,
+    func,
+    Select,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from domain.base.pagination import PageRequest
+
+
+ESTIMATE_COUNT_CAP = 1000
+
+
+def paginate_select(
+    stmt: Select,
+    model: type[TimedBaseModel],
+    page: PageRequest | None,
+    sort_key: ColumnElement | None = None,
+) -> Select:
+    """Применяет страницу к запросу: ORDER BY (created_at, oid) + keyset или
+    offset.
+
+    Keyset условие ``(created_at, oid) > (:created_at, :oid)``
+    использует индекс ``(created_at, oid)``, поэтому стоимость страницы
+    не зависит от её номера.
+
+    С ``sort_key`` (выражение по строке ``model``) порядок — (sort_key,
+    oid). Значение ключа для курсора не хранится: оно вычисляется тем же
+    выражением для строки ``page.after.oid``, поэтому совпадает с
+    отсортированным до бита.
+
+    """
+    if page is None:
+        return stmt
+
+    if sort_key is None:
+        stmt = stmt.order_by(model.created_at, model.oid).limit(page.limit)
+    else:
+        stmt = stmt.order_by(sort_key, model.oid).limit(page.limit)
+
+    if page.after is not None:
+        if sort_key is None:
+            return stmt.where(
+                tuple_(model.created_at, model.oid) > tuple_(page.after.created_at, page.after.oid),
+            )
+
+        anchor = select(sort_key).where(model.oid == page.after.oid).correlate_except(model).scalar_subquery()
+        return stmt.where(tuple_(sort_key, model.oid) > tuple_(anchor, page.after.oid))
+
+    if page.offset:
+        return stmt.offset(page.offset)
+
+    return stmt
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <stmt>`` — план запроса без его выполнения."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_count(
+    session: AsyncSession,
+    stmt: Select,
+    cap: int = ESTIMATE_COUNT_CAP,
+) -> int:
+    """Приблизительное количество строк ``stmt``.
+
+    Сначала строки считаются точно, но не больше ``cap + 1`` (LIMIT
+    внутри подзапроса обрывает сканирование). Если порог превышен,
+    возвращается оценка планировщика ``Plan Rows``, но не меньше
+    ``cap``.
+
+    """
+    capped = await session.scalar(
+        select(func.count()).select_from(stmt.limit(cap + 1).subquery()),
+    )
+    if capped <= cap:
+        return capped
+
+    plan = await session.scalar(Explain(stmt))
+    if isinstance(plan, (str, bytes)):
+        plan = orjson.loads(plan)
+
+    return max(cap, int(plan[0]["Plan"]["Plan Rows"]))
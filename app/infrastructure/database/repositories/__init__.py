@@ -1,7 +1,10 @@
 from .activity import SQLAlchemyActivityRepository
 from .api_key import SQLAlchemyAPIKeyRepository
 from .building import SQLAlchemyBuildingRepository
+from .catalog_snapshot import SQLAlchemyCatalogSnapshotRepository
+from .map_tile import SQLAlchemyMapTileRepository
 from .organization import SQLAlchemyOrganizationRepository
+from .organization_document import SQLAlchemyOrganizationDocumentRepository
 from .user import SQLAlchemyUserRepository
 
 
@@ -9,6 +12,9 @@ __all__ = [
     "SQLAlchemyActivityRepository",
     "SQLAlchemyAPIKeyRepository",
     "SQLAlchemyBuildingRepository",
+    "SQLAlchemyCatalogSnapshotRepository",
+    "SQLAlchemyMapTileRepository",
+    "SQLAlchemyOrganizationDocumentRepository",
     "SQLAlchemyOrganizationRepository",
     "SQLAlchemyUserRepository",
 ]
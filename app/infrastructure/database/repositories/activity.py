@@ -8,10 +8,24 @@ from infrastructure.database.converters.activity import (
     activity_model_to_entity,
 )
 from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.loaders import (
+    BatchLoader,
+    get_batch_loader,
+)
 from infrastructure.database.models.activity import ActivityModel
-from sqlalchemy import select
+from infrastructure.database.pagination import (
+    estimate_count,
+    paginate_select,
+)
+from sqlalchemy import (
+    func,
+    Select,
+    select,
+)
 from sqlalchemy.orm import selectinload
 
+from domain.base.entity import EntityVersion
+from domain.base.pagination import PageRequest
 from domain.organization.entities import ActivityEntity
 from domain.organization.interfaces.repositories.activity import BaseActivityRepository
 
@@ -26,17 +40,34 @@ class SQLAlchemyActivityRepository(BaseActivityRepository):
             session.add(model)
             await session.commit()
 
+        self._by_id_loader().clear(activity.oid)
+
     async def get_by_id(self, activity_id: UUID) -> ActivityEntity | None:
+        return await self._by_id_loader().load(activity_id)
+
+    async def get_version(self, activity_id: UUID) -> EntityVersion | None:
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(ActivityModel.select_version(activity_id))
+            row = res.one_or_none()
+
+            return EntityVersion(oid=row.oid, updated_at=row.updated_at) if row else None
+
+    async def get_by_ids(self, activity_ids: Iterable[UUID]) -> Iterable[ActivityEntity]:
+        activities = await self._by_id_loader().load_many(activity_ids)
+        return [activity for activity in activities if activity is not None]
+
+    def _by_id_loader(self) -> BatchLoader[UUID, ActivityEntity]:
+        return get_batch_loader((id(self), "oid"), self._load_by_ids)
+
+    async def _load_by_ids(self, activity_ids: list[UUID]) -> dict[UUID, ActivityEntity]:
         async with self.database.get_read_only_session() as session:
             stmt = (
                 select(ActivityModel)
-                .where(ActivityModel.oid == activity_id)
+                .where(ActivityModel.oid_any(activity_ids))
                 .options(selectinload(ActivityModel.parent))
             )
             res = await session.execute(stmt)
-            result = res.scalar_one_or_none()
-
-            return activity_model_to_entity(result) if result else None
+            return {model.oid: activity_model_to_entity(model) for model in res.scalars().all()}
 
     async def get_by_name(self, name: str) -> ActivityEntity | None:
         async with self.database.get_read_only_session() as session:
@@ -46,15 +77,34 @@ class SQLAlchemyActivityRepository(BaseActivityRepository):
 
             return activity_model_to_entity(result) if result else None
 
-    async def filter(self, **filters: Any) -> Iterable[ActivityEntity]:
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[ActivityEntity]:
         async with self.database.get_read_only_session() as session:
-            stmt = select(ActivityModel).options(selectinload(ActivityModel.parent))
-
-            for field, value in filters.items():
-                field_obj = getattr(ActivityModel, field)
-                stmt = stmt.where(field_obj == value)
+            stmt = self._apply_filters(select(ActivityModel), filters).options(selectinload(ActivityModel.parent))
+            stmt = paginate_select(stmt, ActivityModel, page)
 
             res = await session.execute(stmt)
             results = [activity_model_to_entity(row[0]) for row in res.all()]
 
             return results
+
+    async def count(self, **filters: Any) -> int:
+        async with self.database.get_read_only_session() as session:
+            stmt = self._apply_filters(select(func.count()).select_from(ActivityModel), filters)
+            res = await session.execute(stmt)
+            return res.scalar_one()
+
+    async def estimate_count(self, **filters: Any) -> int:
+        async with self.database.get_read_only_session() as session:
+            return await estimate_count(session, self._apply_filters(select(ActivityModel.oid), filters))
+
+    @staticmethod
+    def _apply_filters(stmt: Select, filters: dict[str, Any]) -> Select:
+        for field, value in filters.items():
+            field_obj = getattr(ActivityModel, field)
+            stmt = stmt.where(field_obj == value)
+
+        return stmt
@@ -7,14 +7,21 @@ from infrastructure.database.converters.building import (
     building_model_to_entity,
 )
 from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.loaders import (
+    BatchLoader,
+    get_batch_loader,
+)
 from infrastructure.database.models.building import BuildingModel
 from sqlalchemy import (
     func,
     select,
 )
 
+from domain.base.entity import EntityVersion
 from domain.organization.entities import BuildingEntity
+from domain.organization.geohash import cover
 from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.search import SearchBoundingBox
 
 
 @dataclass
@@ -27,13 +34,30 @@ class SQLAlchemyBuildingRepository(BaseBuildingRepository):
             session.add(model)
             await session.commit()
 
+        self._by_id_loader().clear(building.oid)
+
     async def get_by_id(self, building_id: UUID) -> BuildingEntity | None:
+        return await self._by_id_loader().load(building_id)
+
+    async def get_version(self, building_id: UUID) -> EntityVersion | None:
         async with self.database.get_read_only_session() as session:
-            stmt = select(BuildingModel).where(BuildingModel.oid == building_id)
-            res = await session.execute(stmt)
-            result = res.scalar_one_or_none()
+            res = await session.execute(BuildingModel.select_version(building_id))
+            row = res.one_or_none()
 
-            return building_model_to_entity(result) if result else None
+            return EntityVersion(oid=row.oid, updated_at=row.updated_at) if row else None
+
+    async def get_by_ids(self, building_ids: Iterable[UUID]) -> Iterable[BuildingEntity]:
+        buildings = await self._by_id_loader().load_many(building_ids)
+        return [building for building in buildings if building is not None]
+
+    def _by_id_loader(self) -> BatchLoader[UUID, BuildingEntity]:
+        return get_batch_loader((id(self), "oid"), self._load_by_ids)
+
+    async def _load_by_ids(self, building_ids: list[UUID]) -> dict[UUID, BuildingEntity]:
+        async with self.database.get_read_only_session() as session:
+            stmt = select(BuildingModel).where(BuildingModel.oid_any(building_ids))
+            res = await session.execute(stmt)
+            return {model.oid: building_model_to_entity(model) for model in res.scalars().all()}
 
     async def get_by_address(self, address: str) -> BuildingEntity | None:
         async with self.database.get_read_only_session() as session:
@@ -70,14 +94,12 @@ class SQLAlchemyBuildingRepository(BaseBuildingRepository):
         lon_max: float,
     ) -> Iterable[BuildingEntity]:
         async with self.database.get_read_only_session() as session:
-            # 5 точек потому что полигон должен быть замкнутым (последняя точка должна быть такой же как первая)
-            bbox_wkt = (
-                f"POLYGON(({lon_min} {lat_min}, {lon_max} {lat_min}, "
-                f"{lon_max} {lat_max}, {lon_min} {lat_max}, {lon_min} {lat_min}))"
-            )
-            bbox_geography = func.ST_GeogFromText(bbox_wkt)
+            bbox_geography = func.geography(func.ST_MakeEnvelope(lon_min, lat_min, lon_max, lat_max, 4326))
+
+            cells = cover(SearchBoundingBox(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max))
 
             stmt = select(BuildingModel).where(
+                BuildingModel.geohash_prefix_in(cells),
                 BuildingModel.location.ST_Intersects(bbox_geography),
             )
 
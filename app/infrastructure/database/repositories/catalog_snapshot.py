@@ -0,0 +1,129 @@
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+)
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.activity import ActivityModel
+from infrastructure.database.models.building import BuildingModel
+from infrastructure.database.models.organization import (
+    organization_activity,
+    OrganizationModel,
+    OrganizationPhoneModel,
+)
+from infrastructure.snapshot import encode_snapshot
+from infrastructure.snapshot.catalog_file import write_catalog_file
+from sqlalchemy import (
+    cast,
+    func,
+    Select,
+    select,
+    Text,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.organization.interfaces.repositories.catalog_snapshot import BaseCatalogSnapshotRepository
+from domain.organization.snapshot import (
+    rows_to_batch,
+    SnapshotBatch,
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+# Выборки таблиц снимка; колонки — в порядке SNAPSHOT_COLUMNS. uuid
+# приводятся к тексту в PostgreSQL, чтобы не создавать объекты UUID в
+# Python. Сортировки нет: курсор читает таблицу последовательно
+_SNAPSHOT_SELECTS: dict[SnapshotTable, Callable[[], Select]] = {
+    SnapshotTable.ORGANIZATIONS: lambda: select(
+        cast(OrganizationModel.oid, Text),
+        OrganizationModel.name,
+        cast(OrganizationModel.building_id, Text),
+        OrganizationModel.created_at,
+        OrganizationModel.updated_at,
+    ),
+    SnapshotTable.BUILDINGS: lambda: select(
+        cast(BuildingModel.oid, Text),
+        BuildingModel.address,
+        func.ST_Y(func.geometry(BuildingModel.location)),
+        func.ST_X(func.geometry(BuildingModel.location)),
+        BuildingModel.created_at,
+        BuildingModel.updated_at,
+    ),
+    SnapshotTable.PHONES: lambda: select(
+        cast(OrganizationPhoneModel.organization_id, Text),
+        OrganizationPhoneModel.phone,
+    ),
+    SnapshotTable.ACTIVITIES: lambda: select(
+        cast(ActivityModel.oid, Text),
+        ActivityModel.name,
+        cast(ActivityModel.parent_id, Text),
+        ActivityModel.created_at,
+        ActivityModel.updated_at,
+    ),
+    SnapshotTable.ORGANIZATION_ACTIVITIES: lambda: select(
+        cast(organization_activity.c.organization_id, Text),
+        cast(organization_activity.c.activity_id, Text),
+    ),
+}
+
+
+def snapshot_select(table: SnapshotTable) -> Select:
+    return _SNAPSHOT_SELECTS[table]()
+
+
+@dataclass
+class SQLAlchemyCatalogSnapshotRepository(BaseCatalogSnapshotRepository):
+    """Таблицы читаются курсором на стороне сервера пачками по
+    ``batch_size`` строк, каждая пачка сразу кодируется и отдаётся."""
+
+    database: Database
+
+    def export(
+        self,
+        table: SnapshotTable,
+        snapshot_format: SnapshotFormat,
+        batch_size: int,
+    ) -> AsyncIterator[bytes]:
+        return encode_snapshot(table, snapshot_format, self._table_batches(table, batch_size))
+
+    async def export_all(
+        self,
+        snapshot_format: SnapshotFormat,
+        batch_size: int,
+    ) -> AsyncIterator[tuple[SnapshotTable, AsyncIterator[bytes]]]:
+        async with self._snapshot_session() as session:
+            for table in SnapshotTable:
+                yield table, encode_snapshot(table, snapshot_format, self._batches(session, table, batch_size))
+
+    async def write_catalog_file(self, path: Path, batch_size: int) -> dict[str, int]:
+        async with self._snapshot_session() as session:
+            return await write_catalog_file(path, lambda table: self._batches(session, table, batch_size))
+
+    @asynccontextmanager
+    async def _snapshot_session(self) -> AsyncIterator[AsyncSession]:
+        # Серверный курсор asyncpg живёт только внутри транзакции, а
+        # read-only движок работает в autocommit. REPEATABLE READ: все
+        # таблицы снимка видят одно состояние базы, и связи не ссылаются на
+        # организации, созданные после выгрузки их таблицы
+        async with self.database.get_session() as session:
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            yield session
+
+    async def _table_batches(self, table: SnapshotTable, batch_size: int) -> AsyncIterator[SnapshotBatch]:
+        async with self._snapshot_session() as session:
+            async for batch in self._batches(session, table, batch_size):
+                yield batch
+
+    async def _batches(
+        self,
+        session: AsyncSession,
+        table: SnapshotTable,
+        batch_size: int,
+    ) -> AsyncIterator[SnapshotBatch]:
+        result = await session.stream(snapshot_select(table).execution_options(yield_per=batch_size))
+        async for rows in result.partitions():
+            yield rows_to_batch(table, [tuple(row) for row in rows])
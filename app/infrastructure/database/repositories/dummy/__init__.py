@@ -1,7 +1,10 @@
 from infrastructure.database.repositories.dummy.activity import DummyInMemoryActivityRepository
 from infrastructure.database.repositories.dummy.api_key import DummyInMemoryAPIKeyRepository
 from infrastructure.database.repositories.dummy.building import DummyInMemoryBuildingRepository
+from infrastructure.database.repositories.dummy.catalog_snapshot import DummyInMemoryCatalogSnapshotRepository
+from infrastructure.database.repositories.dummy.map_tile import DummyInMemoryMapTileRepository
 from infrastructure.database.repositories.dummy.organization import DummyInMemoryOrganizationRepository
+from infrastructure.database.repositories.dummy.organization_document import DummyInMemoryOrganizationDocumentRepository
 from infrastructure.database.repositories.dummy.user import DummyInMemoryUserRepository
 
 
@@ -9,6 +12,9 @@ __all__ = [
     "DummyInMemoryActivityRepository",
     "DummyInMemoryAPIKeyRepository",
     "DummyInMemoryBuildingRepository",
+    "DummyInMemoryCatalogSnapshotRepository",
+    "DummyInMemoryMapTileRepository",
+    "DummyInMemoryOrganizationDocumentRepository",
     "DummyInMemoryOrganizationRepository",
     "DummyInMemoryUserRepository",
 ]
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import (
     dataclass,
@@ -6,44 +7,81 @@ from dataclasses import (
 from typing import Any
 from uuid import UUID
 
+from infrastructure.database.repositories.dummy.pagination import paginate_entities
+
+from domain.base.entity import EntityVersion
+from domain.base.pagination import PageRequest
 from domain.organization.entities import ActivityEntity
 from domain.organization.interfaces.repositories.activity import BaseActivityRepository
 
 
 @dataclass
 class DummyInMemoryActivityRepository(BaseActivityRepository):
-    _saved_activities: list[ActivityEntity] = field(default_factory=list, kw_only=True)
+    """Индексы по oid, названию и родителю обновляются в ``add``.
+
+    Как в SQL репозитории, ``get_by_name`` и фильтры ``name``/``parent_id``
+    сравнивают значения точно.
+
+    """
+
+    _saved_activities: dict[UUID, ActivityEntity] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _by_name: dict[str, ActivityEntity] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _by_parent: dict[UUID | None, dict[UUID, ActivityEntity]] = field(
+        default_factory=lambda: defaultdict(dict),
+        init=False,
+    )
 
     async def add(self, activity: ActivityEntity) -> None:
-        self._saved_activities.append(activity)
+        self._saved_activities[activity.oid] = activity
+        self._by_name.setdefault(activity.name.as_generic_type(), activity)
+        self._by_parent[activity.parent.oid if activity.parent else None][activity.oid] = activity
 
     async def get_by_id(self, activity_id: UUID) -> ActivityEntity | None:
-        try:
-            return next(activity for activity in self._saved_activities if activity.oid == activity_id)
-        except StopIteration:
-            return None
+        return self._saved_activities.get(activity_id)
+
+    async def get_version(self, activity_id: UUID) -> EntityVersion | None:
+        activity = await self.get_by_id(activity_id)
+        return EntityVersion.from_entity(activity) if activity else None
+
+    async def get_by_ids(self, activity_ids: Iterable[UUID]) -> Iterable[ActivityEntity]:
+        activities = (self._saved_activities.get(oid) for oid in set(activity_ids))
+        return [activity for activity in activities if activity is not None]
 
     async def get_by_name(self, name: str) -> ActivityEntity | None:
-        try:
-            search_term = name.lower()
-            return next(
-                activity
-                for activity in self._saved_activities
-                if activity.name.as_generic_type().lower() == search_term
-            )
-        except StopIteration:
-            return None
-
-    async def filter(self, **filters: Any) -> Iterable[ActivityEntity]:
-        results = self._saved_activities.copy()
-
-        if filters.get("name"):
-            search_term = filters["name"].lower()
-            results = [activity for activity in results if search_term in activity.name.as_generic_type().lower()]
-
-        if filters.get("parent_id"):
-            results = [
-                activity for activity in results if activity.parent and activity.parent.oid == filters["parent_id"]
-            ]
-
-        return results
+        return self._by_name.get(name)
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[ActivityEntity]:
+        return paginate_entities(self._filter(filters), page)
+
+    async def count(self, **filters: Any) -> int:
+        return len(self._filter(filters))
+
+    async def estimate_count(self, **filters: Any) -> int:
+        # В памяти точный подсчёт и так дешёвый
+        return await self.count(**filters)
+
+    def _filter(self, filters: dict[str, Any]) -> list[ActivityEntity]:
+        unknown = filters.keys() - {"name", "parent_id"}
+        if unknown:
+            raise ValueError(f"Unsupported activity filter: {', '.join(sorted(unknown))}")
+
+        results = self._saved_activities
+
+        if "parent_id" in filters:
+            results = self._by_parent.get(filters["parent_id"], {})
+
+        if "name" in filters:
+            activity = self._by_name.get(filters["name"])
+            results = {activity.oid: activity} if activity is not None and activity.oid in results else {}
+
+        return list(results.values())
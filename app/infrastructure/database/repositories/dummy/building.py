@@ -1,56 +1,54 @@
-import math
 from collections.abc import Iterable
 from dataclasses import (
     dataclass,
     field,
 )
+from uuid import UUID
 
+from infrastructure.database.repositories.dummy.spatial import SpatialIndex
+
+from domain.base.entity import EntityVersion
 from domain.organization.entities import BuildingEntity
 from domain.organization.interfaces.repositories.building import BaseBuildingRepository
 
 
 @dataclass
 class DummyInMemoryBuildingRepository(BaseBuildingRepository):
-    _saved_buildings: list[BuildingEntity] = field(default_factory=list, kw_only=True)
-
-    async def add(self, building: BuildingEntity) -> None:
-        self._saved_buildings.append(building)
+    """Индексы по oid, адресу и координатам обновляются в ``add``; адрес
+    сравнивается точно, как в SQL репозитории, а поиск по области идёт
+    через ``SpatialIndex``."""
 
-    @staticmethod
-    def _calculate_distance(
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float,
-    ) -> float:
-        R = 6371000
+    _saved_buildings: dict[UUID, BuildingEntity] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _by_address: dict[str, BuildingEntity] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _spatial: SpatialIndex[BuildingEntity] = field(
+        default_factory=SpatialIndex,
+        init=False,
+    )
 
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+    async def add(self, building: BuildingEntity) -> None:
+        self._saved_buildings[building.oid] = building
+        self._by_address.setdefault(building.address.as_generic_type(), building)
+        self._spatial.add(building, building.coordinates.latitude, building.coordinates.longitude)
 
-        a = math.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    async def get_by_id(self, building_id: UUID) -> BuildingEntity | None:
+        return self._saved_buildings.get(building_id)
 
-        return R * c
+    async def get_version(self, building_id: UUID) -> EntityVersion | None:
+        building = await self.get_by_id(building_id)
+        return EntityVersion.from_entity(building) if building else None
 
-    async def get_by_id(self, building_id: str) -> BuildingEntity | None:
-        try:
-            return next(building for building in self._saved_buildings if building.oid == building_id)
-        except StopIteration:
-            return None
+    async def get_by_ids(self, building_ids: Iterable[UUID]) -> Iterable[BuildingEntity]:
+        buildings = (self._saved_buildings.get(oid) for oid in set(building_ids))
+        return [building for building in buildings if building is not None]
 
     async def get_by_address(self, address: str) -> BuildingEntity | None:
-        try:
-            search_term = address.lower()
-            return next(
-                building
-                for building in self._saved_buildings
-                if building.address.as_generic_type().lower() == search_term
-            )
-        except StopIteration:
-            return None
+        return self._by_address.get(address)
 
     async def filter_by_radius(
         self,
@@ -58,17 +56,7 @@ class DummyInMemoryBuildingRepository(BaseBuildingRepository):
         longitude: float,
         radius_meters: float,
     ) -> Iterable[BuildingEntity]:
-        results = []
-        for building in self._saved_buildings:
-            distance = self._calculate_distance(
-                latitude,
-                longitude,
-                building.coordinates.latitude,
-                building.coordinates.longitude,
-            )
-            if distance <= radius_meters:
-                results.append(building)
-        return results
+        return self._spatial.within(latitude, longitude, radius_meters)
 
     async def filter_by_bounding_box(
         self,
@@ -77,11 +65,4 @@ class DummyInMemoryBuildingRepository(BaseBuildingRepository):
         lon_min: float,
         lon_max: float,
     ) -> Iterable[BuildingEntity]:
-        return [
-            building
-            for building in self._saved_buildings
-            if (
-                lat_min <= building.coordinates.latitude <= lat_max
-                and lon_min <= building.coordinates.longitude <= lon_max
-            )
-        ]
+        return self._spatial.in_bounding_box(lat_min, lat_max, lon_min, lon_max)
@@ -0,0 +1,118 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from infrastructure.snapshot import encode_snapshot
+from infrastructure.snapshot.catalog_file import write_catalog_file
+
+from domain.organization.interfaces.repositories.activity import BaseActivityRepository
+from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.interfaces.repositories.catalog_snapshot import BaseCatalogSnapshotRepository
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.snapshot import (
+    rows_to_batch,
+    SnapshotBatch,
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+@dataclass
+class DummyInMemoryCatalogSnapshotRepository(BaseCatalogSnapshotRepository):
+    """Строки снимка собираются из сущностей in-memory репозиториев."""
+
+    organization_repository: BaseOrganizationRepository
+    building_repository: BaseBuildingRepository
+    activity_repository: BaseActivityRepository
+
+    def export(
+        self,
+        table: SnapshotTable,
+        snapshot_format: SnapshotFormat,
+        batch_size: int,
+    ) -> AsyncIterator[bytes]:
+        return encode_snapshot(table, snapshot_format, self._batches(table, batch_size))
+
+    async def export_all(
+        self,
+        snapshot_format: SnapshotFormat,
+        batch_size: int,
+    ) -> AsyncIterator[tuple[SnapshotTable, AsyncIterator[bytes]]]:
+        rows = await self._snapshot_rows()
+        for table in SnapshotTable:
+            yield table, encode_snapshot(table, snapshot_format, self._split(table, rows[table], batch_size))
+
+    async def write_catalog_file(self, path: Path, batch_size: int) -> dict[str, int]:
+        rows = await self._snapshot_rows()
+        return await write_catalog_file(path, lambda table: self._split(table, rows[table], batch_size))
+
+    async def _batches(self, table: SnapshotTable, batch_size: int) -> AsyncIterator[SnapshotBatch]:
+        async for batch in self._split(table, await self._rows(table), batch_size):
+            yield batch
+
+    @staticmethod
+    async def _split(
+        table: SnapshotTable,
+        rows: list[tuple[Any, ...]],
+        batch_size: int,
+    ) -> AsyncIterator[SnapshotBatch]:
+        for start in range(0, len(rows), batch_size):
+            yield rows_to_batch(table, rows[start : start + batch_size])
+
+    async def _snapshot_rows(self) -> dict[SnapshotTable, list[tuple[Any, ...]]]:
+        # Строки всех таблиц собираются до записи первой, чтобы изменения
+        # во время выгрузки не попали только в часть таблиц
+        return {table: await self._rows(table) for table in SnapshotTable}
+
+    async def _rows(self, table: SnapshotTable) -> list[tuple[Any, ...]]:
+        if table is SnapshotTable.BUILDINGS:
+            return [
+                (
+                    str(building.oid),
+                    building.address.as_generic_type(),
+                    building.coordinates.latitude,
+                    building.coordinates.longitude,
+                    building.created_at,
+                    building.updated_at,
+                )
+                for building in await self.building_repository.filter_by_bounding_box(-90, 90, -180, 180)
+            ]
+
+        if table is SnapshotTable.ACTIVITIES:
+            return [
+                (
+                    str(activity.oid),
+                    activity.name.as_generic_type(),
+                    str(activity.parent.oid) if activity.parent else None,
+                    activity.created_at,
+                    activity.updated_at,
+                )
+                for activity in await self.activity_repository.filter()
+            ]
+
+        organizations = await self.organization_repository.filter()
+        if table is SnapshotTable.PHONES:
+            return [
+                (str(organization.oid), phone.as_generic_type())
+                for organization in organizations
+                for phone in organization.phones
+            ]
+
+        if table is SnapshotTable.ORGANIZATION_ACTIVITIES:
+            return [
+                (str(organization.oid), str(activity.oid))
+                for organization in organizations
+                for activity in organization.activities
+            ]
+
+        return [
+            (
+                str(organization.oid),
+                organization.name.as_generic_type(),
+                str(organization.building.oid),
+                organization.created_at,
+                organization.updated_at,
+            )
+            for organization in organizations
+        ]
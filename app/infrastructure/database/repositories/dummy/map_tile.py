@@ -0,0 +1,74 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from infrastructure.database.repositories.dummy.mvt import encode_point_layer
+
+from domain.organization.entities import (
+    BuildingEntity,
+    OrganizationEntity,
+)
+from domain.organization.interfaces.repositories.map_tile import BaseMapTileRepository
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.tiles import (
+    TileAttributes,
+    TileCoordinates,
+)
+
+
+def _point(tile: TileCoordinates, building: BuildingEntity) -> tuple[int, int]:
+    return tile.project(building.coordinates.latitude, building.coordinates.longitude)
+
+
+def _pick(values: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    return {name: values[name] for name in fields}
+
+
+@dataclass
+class DummyInMemoryMapTileRepository(BaseMapTileRepository):
+    """Тайлы собираются из сущностей репозитория организаций."""
+
+    organization_repository: BaseOrganizationRepository
+
+    async def render(self, tile: TileCoordinates, attributes: TileAttributes) -> bytes:
+        lon_min, lat_min, lon_max, lat_max = tile.bounds()
+        organizations = [
+            organization
+            for organization in await self.organization_repository.filter()
+            if lat_min <= organization.building.coordinates.latitude <= lat_max
+            and lon_min <= organization.building.coordinates.longitude <= lon_max
+        ]
+
+        by_building: dict[UUID, list[OrganizationEntity]] = defaultdict(list)
+        for organization in organizations:
+            by_building[organization.building.oid].append(organization)
+
+        buildings = []
+        for building_organizations in by_building.values():
+            building = building_organizations[0].building
+            values = {
+                "oid": str(building.oid),
+                "organizations": len(building_organizations),
+                "address": building.address.as_generic_type(),
+            }
+            buildings.append((_point(tile, building), _pick(values, attributes.building_fields)))
+
+        content = encode_point_layer("buildings", buildings)
+        if not attributes.organization_fields:
+            return content
+
+        features = []
+        for organization in organizations:
+            values = {
+                "oid": str(organization.oid),
+                "name": organization.name.as_generic_type(),
+                "building_id": str(organization.building.oid),
+            }
+            features.append((_point(tile, organization.building), _pick(values, attributes.organization_fields)))
+
+        return content + encode_point_layer("organizations", features)
+
+    async def get_data_version(self) -> str:
+        # Тайл собирается только из организаций и их зданий
+        return await self.organization_repository.get_data_version()
@@ -1,47 +1,393 @@
-from collections.abc import Iterable
+from collections import defaultdict
+from collections.abc import (
+    Callable,
+    Iterable,
+    Sequence,
+)
 from dataclasses import (
     dataclass,
     field,
 )
+from datetime import datetime
+from statistics import fmean
+from typing import Any
 from uuid import UUID
 
-from domain.organization.entities import OrganizationEntity
+from infrastructure.database.repositories.dummy.pagination import paginate_entities
+
+from domain.base.entity import EntityVersion
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
+from domain.organization.entities import (
+    ActivityEntity,
+    OrganizationEntity,
+)
+from domain.organization.geo import (
+    distance_meters,
+    organization_distance,
+)
 from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.read_models import (
+    ActivityFacet,
+    NearbyOrganization,
+    OrganizationChange,
+    OrganizationChangesPage,
+    OrganizationCluster,
+    OrganizationProjection,
+)
+from domain.organization.search import SearchCircle
+from domain.organization.text import similarity
+from domain.organization.tiles import mercator_meters
+
+
+_PROJECTIONS: dict[str, Callable[[OrganizationEntity], Any]] = {
+    "oid": lambda org: org.oid,
+    "name": lambda org: org.name.as_generic_type(),
+    "building_id": lambda org: org.building.oid,
+    "address": lambda org: org.building.address.as_generic_type(),
+    "latitude": lambda org: org.building.coordinates.latitude,
+    "longitude": lambda org: org.building.coordinates.longitude,
+    "phones": lambda org: [phone.as_generic_type() for phone in org.phones],
+    "activity_ids": lambda org: [activity.oid for activity in org.activities],
+}
+
+
+def organization_sort_key(filters: dict[str, Any]) -> Callable[[OrganizationEntity], tuple[float, UUID]] | None:
+    """Как ``organization_sort_key`` SQL репозитория: расстояние при
+    ``within``, сходство названия при ``text``, иначе (created_at, oid)."""
+    circle = filters.get("within")
+    if circle is not None:
+        return lambda org: (organization_distance(circle, org), org.oid)
+
+    text = filters.get("text")
+    if text is not None:
+        return lambda org: (-similarity(org.name.as_generic_type(), text), org.oid)
+
+    return None
 
 
 @dataclass
 class DummyInMemoryOrganizationRepository(BaseOrganizationRepository):
-    _saved_organizations: list[OrganizationEntity] = field(
-        default_factory=list,
-        kw_only=True,
+    """Индексы по oid, зданию, названию вида деятельности (и его родителя)
+    и названию в нижнем регистре обновляются в ``add`` и ``delete``.
+
+    Семантика — как у SQL репозитория: ``get_by_name`` ищет подстроку без
+    учёта регистра (``ILIKE``), ``get_by_activity_name`` — точное название.
+
+    """
+
+    _saved_organizations: dict[UUID, OrganizationEntity] = field(
+        default_factory=dict,
+        init=False,
     )
+    _tombstones: dict[UUID, datetime] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _names: dict[UUID, str] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _by_building: dict[UUID, dict[UUID, OrganizationEntity]] = field(
+        default_factory=lambda: defaultdict(dict),
+        init=False,
+    )
+    _by_activity_name: dict[str, dict[UUID, OrganizationEntity]] = field(
+        default_factory=lambda: defaultdict(dict),
+        init=False,
+    )
+    _by_parent_activity_name: dict[str, dict[UUID, OrganizationEntity]] = field(
+        default_factory=lambda: defaultdict(dict),
+        init=False,
+    )
+    # Счётчик записей, как catalog_version в Postgres
+    _data_version: int = field(default=0, init=False)
 
     async def add(self, organization: OrganizationEntity) -> None:
-        self._saved_organizations.append(organization)
+        self._saved_organizations[organization.oid] = organization
+        self._names[organization.oid] = organization.name.as_generic_type().lower()
+        for index, key in self._index_keys(organization):
+            index[key][organization.oid] = organization
+        self._data_version += 1
+
+    async def delete(self, organization_id: UUID) -> bool:
+        organization = self._saved_organizations.pop(organization_id, None)
+        if organization is None:
+            return False
+
+        del self._names[organization_id]
+        for index, key in self._index_keys(organization):
+            index[key].pop(organization_id, None)
+        self._tombstones[organization_id] = datetime.now()
+        self._data_version += 1
+        return True
+
+    async def get_by_id(self, organization_id: UUID) -> OrganizationEntity | None:
+        return self._saved_organizations.get(organization_id)
 
-    async def get_by_id(self, organization_id: str) -> OrganizationEntity | None:
-        try:
-            return next(org for org in self._saved_organizations if org.oid == organization_id)
-        except StopIteration:
-            return None
+    async def get_version(self, organization_id: UUID) -> EntityVersion | None:
+        organization = await self.get_by_id(organization_id)
+        return organization.version() if organization else None
+
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationEntity]:
+        organizations = (self._saved_organizations.get(oid) for oid in set(organization_ids))
+        return [org for org in organizations if org is not None]
 
     async def get_by_name(self, name: str) -> Iterable[OrganizationEntity]:
-        search_term = name.lower()
-        return [org for org in self._saved_organizations if search_term in org.name.as_generic_type().lower()]
+        return self._filter({"name": name})
 
     async def get_by_building_id(
         self,
         building_id: UUID,
     ) -> Iterable[OrganizationEntity]:
-        return [org for org in self._saved_organizations if org.building.oid == building_id]
+        return list(self._by_building.get(building_id, {}).values())
 
     async def get_by_activity_name(
         self,
         activity_name: str,
     ) -> Iterable[OrganizationEntity]:
-        search_term = activity_name.lower()
-        return [
-            org
-            for org in self._saved_organizations
-            if any(search_term in activity.name.as_generic_type().lower() for activity in org.activities)
+        return list(self._by_activity_name.get(activity_name, {}).values())
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationEntity]:
+        return self._paginate(filters, page)
+
+    async def project(
+        self,
+        fields: tuple[str, ...],
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationProjection]:
+        circle = filters.get("within")
+        projections = []
+        for org in self._paginate(filters, page):
+            values = {name: _PROJECTIONS[name](org) for name in fields}
+            if circle is not None:
+                values["distance"] = organization_distance(circle, org)
+            projections.append(OrganizationProjection(oid=org.oid, created_at=org.created_at, values=values))
+
+        return projections
+
+    async def count(self, **filters: Any) -> int:
+        return len(self._filter(filters))
+
+    async def estimate_count(self, **filters: Any) -> int:
+        # В памяти точный подсчёт и так дешёвый
+        return await self.count(**filters)
+
+    async def count_by_activity(self, **filters: Any) -> Iterable[ActivityFacet]:
+        activities: dict[UUID, ActivityEntity] = {}
+        direct: dict[UUID, set[UUID]] = defaultdict(set)
+        subtree: dict[UUID, set[UUID]] = defaultdict(set)
+        for organization in self._filter(filters):
+            for activity in organization.activities:
+                activities[activity.oid] = activity
+                direct[activity.oid].add(organization.oid)
+                subtree[activity.oid].add(organization.oid)
+                if activity.parent is not None:
+                    activities.setdefault(activity.parent.oid, activity.parent)
+                    subtree[activity.parent.oid].add(organization.oid)
+
+        facets = [
+            ActivityFacet(
+                activity_id=activity.oid,
+                name=activity.name.as_generic_type(),
+                parent_id=activity.parent.oid if activity.parent is not None else None,
+                organizations=len(direct[activity.oid]),
+                subtree_organizations=len(subtree[activity.oid]),
+            )
+            for activity in activities.values()
+        ]
+        return sorted(facets, key=lambda facet: (-facet.subtree_organizations, facet.name))
+
+    async def get_data_version(self) -> str:
+        return str(self._data_version)
+
+    async def get_changes(
+        self,
+        limit: int,
+        since: datetime | None = None,
+        after: PageCursor | None = None,
+    ) -> OrganizationChangesPage:
+        # Незавершённых транзакций здесь нет — задержка не нужна
+        until = datetime.now()
+        changes = [
+            OrganizationChange(oid=org.oid, changed_at=org.updated_at, organization=org)
+            for org in self._saved_organizations.values()
+        ]
+        changes.extend(
+            OrganizationChange(oid=oid, changed_at=deleted_at, organization=None)
+            for oid, deleted_at in self._tombstones.items()
+        )
+        if after is not None:
+            changes = [change for change in changes if (change.changed_at, change.oid) > after.key()]
+        elif since is not None:
+            changes = [change for change in changes if change.changed_at >= since]
+
+        changes = sorted(changes, key=lambda change: (change.changed_at, change.oid))[:limit]
+        return OrganizationChangesPage(changes=changes, until=until)
+
+    async def cluster_by_bounding_box(
+        self,
+        lat_min: float,
+        lat_max: float,
+        lon_min: float,
+        lon_max: float,
+        grid_size: float | None,
+    ) -> Iterable[OrganizationCluster]:
+        cells: dict[Any, list[OrganizationEntity]] = defaultdict(list)
+        for org in self._saved_organizations.values():
+            coordinates = org.building.coordinates
+            if not (lat_min <= coordinates.latitude <= lat_max and lon_min <= coordinates.longitude <= lon_max):
+                continue
+
+            if grid_size is None:
+                cell = org.building.oid
+            else:
+                # Как ST_SnapToGrid: ближайший узел сетки в метрах EPSG:3857
+                x, y = mercator_meters(coordinates.latitude, coordinates.longitude)
+                cell = (round(x / grid_size), round(y / grid_size))
+            cells[cell].append(org)
+
+        clusters = []
+        for organizations in cells.values():
+            # Центр — среднее координат (в SQL — центроид в EPSG:3857)
+            building_ids = {org.building.oid for org in organizations}
+            clusters.append(
+                OrganizationCluster(
+                    latitude=fmean(org.building.coordinates.latitude for org in organizations),
+                    longitude=fmean(org.building.coordinates.longitude for org in organizations),
+                    organizations=len(organizations),
+                    building_id=building_ids.pop() if len(building_ids) == 1 else None,
+                ),
+            )
+        return clusters
+
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        activity_names: Iterable[str] | None = None,
+    ) -> Iterable[NearbyOrganization]:
+        filters = {} if activity_names is None else {"activity_names": activity_names}
+        nearby = [
+            NearbyOrganization(
+                organization=org,
+                distance=distance_meters(
+                    latitude,
+                    longitude,
+                    org.building.coordinates.latitude,
+                    org.building.coordinates.longitude,
+                ),
+            )
+            for org in self._filter(filters)
         ]
+        nearby.sort(key=lambda item: (item.distance, item.organization.oid))
+        return nearby[:limit]
+
+    async def get_near_points(
+        self,
+        points: Sequence[SearchCircle],
+        limit: int,
+        activity_name: str | None = None,
+    ) -> list[list[NearbyOrganization]]:
+        results = []
+        for point in points:
+            filters = {"within": point}
+            if activity_name is not None:
+                filters["activity_subtree"] = activity_name
+
+            organizations = sorted(self._filter(filters), key=organization_sort_key(filters))[:limit]
+            results.append(
+                [
+                    NearbyOrganization(organization=org, distance=organization_distance(point, org))
+                    for org in organizations
+                ],
+            )
+        return results
+
+    def _paginate(self, filters: dict[str, Any], page: PageRequest | None) -> list[OrganizationEntity]:
+        key = organization_sort_key(filters)
+        if key is None:
+            return paginate_entities(self._filter(filters), page)
+
+        after_key = None
+        if page is not None and page.after is not None:
+            anchor = self._saved_organizations.get(page.after.oid)
+            if anchor is None:
+                # В SQL ключ удалённого якоря — NULL, сравнение ложно
+                return []
+            after_key = key(anchor)
+
+        return paginate_entities(self._filter(filters), page, key=key, after_key=after_key)
+
+    def _index_keys(
+        self,
+        organization: OrganizationEntity,
+    ) -> Iterable[tuple[dict[Any, dict[UUID, OrganizationEntity]], Any]]:
+        yield self._by_building, organization.building.oid
+        for activity in organization.activities:
+            yield self._by_activity_name, activity.name.as_generic_type()
+            if activity.parent is not None:
+                yield self._by_parent_activity_name, activity.parent.name.as_generic_type()
+
+    def _indexed(self, key: str, value: Any) -> dict[UUID, OrganizationEntity] | None:
+        """Организации фильтра по индексу; ``None`` — у фильтра нет
+        индекса."""
+        if key == "building_id":
+            return self._by_building.get(value, {})
+        if key == "building_ids":
+            return _union(self._by_building.get(building_id, {}) for building_id in value)
+        if key == "activity_names":
+            return _union(self._by_activity_name.get(name, {}) for name in value)
+        if key == "activity_subtree":
+            # Вид деятельности и его прямые потомки
+            return _union((self._by_activity_name.get(value, {}), self._by_parent_activity_name.get(value, {})))
+        return None
+
+    def _predicate(self, key: str, value: Any) -> Callable[[OrganizationEntity], bool]:
+        if key in ("name", "text"):
+            search_term = value.lower()
+            return lambda org: search_term in self._names[org.oid]
+        if key == "address":
+            search_term = value.lower()
+            return lambda org: search_term in org.building.address.as_generic_type().lower()
+        if key == "within":
+            return lambda org: organization_distance(value, org) <= value.radius
+        if key == "bounding_box":
+            return lambda org: (
+                value.lat_min <= org.building.coordinates.latitude <= value.lat_max
+                and value.lon_min <= org.building.coordinates.longitude <= value.lon_max
+            )
+        if key == "polygon":
+            return lambda org: value.contains(org.building.coordinates.latitude, org.building.coordinates.longitude)
+        raise ValueError(f"Unsupported organization filter: {key}")
+
+    def _filter(self, filters: dict[str, Any]) -> list[OrganizationEntity]:
+        # Индексные фильтры сужают выборку, остальные проверяются по ней
+        candidates: dict[UUID, OrganizationEntity] | None = None
+        predicates = []
+        for key, value in filters.items():
+            matched = self._indexed(key, value)
+            if matched is None:
+                predicates.append(self._predicate(key, value))
+            elif candidates is None:
+                candidates = matched
+            else:
+                candidates = {oid: org for oid, org in candidates.items() if oid in matched}
+
+        results = self._saved_organizations if candidates is None else candidates
+        return [org for org in results.values() if all(predicate(org) for predicate in predicates)]
+
+
+def _union(indexes: Iterable[dict[UUID, OrganizationEntity]]) -> dict[UUID, OrganizationEntity]:
+    result: dict[UUID, OrganizationEntity] = {}
+    for index in indexes:
+        result.update(index)
+    return result
@@ -0,0 +1,96 @@
+from collections.abc import Iterable
+from dataclasses import (
+    dataclass,
+    field,
+    replace,
+)
+from typing import Any
+from uuid import UUID
+
+import orjson
+from infrastructure.database.converters.organization_document import organization_entity_to_document
+
+from domain.base.pagination import PageRequest
+from domain.organization.geo import organization_distance
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
+from domain.organization.read_models import OrganizationDocument
+
+
+@dataclass
+class DummyInMemoryOrganizationDocumentRepository(BaseOrganizationDocumentRepository):
+    """Документы собираются из сущностей репозитория организаций.
+
+    В Postgres документ пишется в транзакции создания организации и
+    удаляется каскадом вместе с ней. Здесь документ новой организации
+    собирается при первом чтении, а документ удалённой — выбрасывается.
+
+    """
+
+    organization_repository: BaseOrganizationRepository
+    _documents: dict[UUID, OrganizationDocument] = field(
+        default_factory=dict,
+        init=False,
+    )
+
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationDocument]:
+        organization_ids = list(organization_ids)
+        await self._sync(organization_ids)
+        return [self._documents[oid] for oid in organization_ids if oid in self._documents]
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationDocument]:
+        organizations = list(await self.organization_repository.filter(page=page, **filters))
+        documents = await self.get_by_ids(organization.oid for organization in organizations)
+
+        circle = filters.get("within")
+        if circle is None:
+            return documents
+
+        distances = {organization.oid: organization_distance(circle, organization) for organization in organizations}
+        return [
+            replace(
+                document,
+                content=orjson.dumps({**orjson.loads(document.content), "distance": distances[document.oid]}),
+            )
+            for document in documents
+        ]
+
+    async def rebuild(self, organization_ids: Iterable[UUID] | None = None) -> int:
+        if organization_ids is None:
+            self._documents.clear()
+            organizations = await self.organization_repository.filter()
+        else:
+            organization_ids = list(organization_ids)
+            for oid in organization_ids:
+                self._documents.pop(oid, None)
+            organizations = await self.organization_repository.get_by_ids(organization_ids)
+
+        documents = [organization_entity_to_document(organization) for organization in organizations]
+        self._documents.update((document.oid, document) for document in documents)
+        return len(documents)
+
+    async def find_inconsistent(self) -> list[UUID]:
+        organizations = list(await self.organization_repository.filter())
+        await self._sync({organization.oid for organization in organizations} | self._documents.keys())
+
+        expected = {organization.oid: organization_entity_to_document(organization) for organization in organizations}
+        return [
+            oid for oid in expected.keys() | self._documents.keys() if expected.get(oid) != self._documents.get(oid)
+        ]
+
+    async def _sync(self, organization_ids: Iterable[UUID]) -> None:
+        organization_ids = list(organization_ids)
+        organizations = {
+            organization.oid: organization
+            for organization in await self.organization_repository.get_by_ids(organization_ids)
+        }
+
+        for oid in organization_ids:
+            if oid not in organizations:
+                self._documents.pop(oid, None)
+            elif oid not in self._documents:
+                self._documents[oid] = organization_entity_to_document(organizations[oid])
@@ -0,0 +1,42 @@
+from collections.abc import (
+    Callable,
+    Iterable,
+)
+from datetime import datetime
+from typing import (
+    Any,
+    TypeVar,
+)
+from uuid import UUID
+
+from domain.base.entity import BaseEntity
+from domain.base.pagination import PageRequest
+
+
+EntityType = TypeVar("EntityType", bound=BaseEntity)
+
+
+def page_key(entity: BaseEntity) -> tuple[datetime, UUID]:
+    """Ключ сортировки, совпадающий с ORDER BY created_at, oid в SQL."""
+    return (entity.created_at, entity.oid)
+
+
+def paginate_entities(
+    entities: Iterable[EntityType],
+    page: PageRequest | None,
+    key: Callable[[EntityType], Any] = page_key,
+    after_key: Any = None,
+) -> list[EntityType]:
+    """С ``key`` отличным от ``page_key`` ключ keyset якоря передаётся в
+    ``after_key`` (как в SQL, где он вычисляется по oid курсора)."""
+    if page is None:
+        return list(entities)
+
+    ordered = sorted(entities, key=key)
+
+    if page.after is not None:
+        after = page.after.key() if after_key is None else after_key
+        ordered = [entity for entity in ordered if key(entity) > after]
+        return ordered[: page.limit]
+
+    return ordered[page.offset : page.offset + page.limit]
@@ -0,0 +1,204 @@
+"""Пространственный индекс точек для in-memory репозиториев и снимка
+каталога.
+
+Координаты хранятся массивами NumPy и раскладываются по сетке ячеек
+``cell_size`` градусов: точки отсортированы по номеру ячейки
+(``строка * колонок + колонка``), поэтому ячейки одной строки сетки
+внутри прямоугольника — один непрерывный срез, который находится
+``searchsorted``. Кандидаты из этих срезов проверяются векторно: точным
+сравнением координат для прямоугольника и haversine для круга.
+
+Расстояние — по сфере радиусом ``EARTH_RADIUS_METERS``, а ``ST_DWithin``
+по geography считает по эллипсоиду WGS84: на границе круга результаты
+могут расходиться на доли процента радиуса (до ~0,6%).
+
+Без NumPy индекс проверяет все точки по одной.
+
+"""
+
+import math
+from collections.abc import (
+    Iterable,
+    Iterator,
+)
+from typing import (
+    Generic,
+    TypeVar,
+)
+
+from domain.organization.geo import (
+    distance_meters,
+    EARTH_RADIUS_METERS,
+)
+
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - опциональная зависимость
+    numpy = None
+
+
+ItemType = TypeVar("ItemType")
+
+# ~1,1 км по широте: в круг радиусом в километр попадает несколько ячеек
+DEFAULT_CELL_SIZE = 0.01
+
+
+class SpatialIndex(Generic[ItemType]):
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._columns = math.ceil(360 / cell_size) + 1
+        self._items: list[ItemType] = []
+        self._latitudes: list[float] = []
+        self._longitudes: list[float] = []
+        # Массивы сетки пересобираются при первом запросе после вставки
+        self._grid = None
+
+    @classmethod
+    def from_points(
+        cls,
+        items: Iterable[ItemType],
+        latitudes: Iterable[float],
+        longitudes: Iterable[float],
+        cell_size: float = DEFAULT_CELL_SIZE,
+    ) -> "SpatialIndex[ItemType]":
+        """Индекс сразу по колонкам координат, без ``add`` на каждую точку."""
+        index = cls(cell_size)
+        index._items = list(items)
+        index._latitudes = list(latitudes)
+        index._longitudes = list(longitudes)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: ItemType, latitude: float, longitude: float) -> None:
+        self._items.append(item)
+        self._latitudes.append(latitude)
+        self._longitudes.append(longitude)
+        self._grid = None
+
+    def in_bounding_box(self, lat_min: float, lat_max: float, lon_min: float, lon_max: float) -> list[ItemType]:
+        """Точки прямоугольника (границы включаются) в порядке вставки."""
+        if numpy is None:
+            return [
+                self._items[index]
+                for index in range(len(self._items))
+                if lat_min <= self._latitudes[index] <= lat_max and lon_min <= self._longitudes[index] <= lon_max
+            ]
+
+        latitudes, longitudes, _, _ = self._grid_arrays()
+        candidates = self._candidates(lat_min, lat_max, [(lon_min, lon_max)])
+        mask = (
+            (latitudes[candidates] >= lat_min)
+            & (latitudes[candidates] <= lat_max)
+            & (longitudes[candidates] >= lon_min)
+            & (longitudes[candidates] <= lon_max)
+        )
+        return self._select(candidates[mask])
+
+    def within(self, latitude: float, longitude: float, radius_meters: float) -> list[ItemType]:
+        """Точки не дальше ``radius_meters`` от центра в порядке вставки."""
+        if numpy is None:
+            return [
+                self._items[index]
+                for index in range(len(self._items))
+                if distance_meters(latitude, longitude, self._latitudes[index], self._longitudes[index])
+                <= radius_meters
+            ]
+
+        latitudes, longitudes, _, _ = self._grid_arrays()
+        lat_min, lat_max, lon_ranges = _circle_bounds(latitude, longitude, radius_meters)
+        candidates = self._candidates(lat_min, lat_max, lon_ranges)
+        distances = haversine_meters(latitude, longitude, latitudes[candidates], longitudes[candidates])
+        return self._select(candidates[distances <= radius_meters])
+
+    def _grid_arrays(self):
+        """(широты, долготы, перестановка по ячейкам, номера ячеек в её
+        порядке)."""
+        if self._grid is None:
+            latitudes = numpy.asarray(self._latitudes, dtype=numpy.float64)
+            longitudes = numpy.asarray(self._longitudes, dtype=numpy.float64)
+            cells = self._cell(self._row(latitudes), self._column(longitudes))
+            order = numpy.argsort(cells, kind="stable")
+            self._grid = (latitudes, longitudes, order, cells[order])
+
+        return self._grid
+
+    def _candidates(self, lat_min: float, lat_max: float, lon_ranges: list[tuple[float, float]]):
+        """Индексы точек из ячеек, пересекающих прямоугольник."""
+        _, _, order, sorted_cells = self._grid_arrays()
+        if lat_min > lat_max or not len(order):
+            return numpy.empty(0, dtype=numpy.intp)
+
+        rows = numpy.arange(self._row(max(lat_min, -90)), self._row(min(lat_max, 90)) + 1)
+        slices = []
+        for lon_min, lon_max in lon_ranges:
+            if lon_min > lon_max:
+                continue
+            starts = numpy.searchsorted(sorted_cells, self._cell(rows, self._column(lon_min)), side="left")
+            ends = numpy.searchsorted(sorted_cells, self._cell(rows, self._column(lon_max)), side="right")
+            slices.extend(order[start:end] for start, end in zip(starts, ends, strict=True) if start < end)
+
+        if not slices:
+            return numpy.empty(0, dtype=numpy.intp)
+
+        return numpy.concatenate(slices)
+
+    def _select(self, indices) -> list[ItemType]:
+        return [self._items[index] for index in numpy.sort(indices).tolist()]
+
+    def _row(self, latitude):
+        return numpy.floor((numpy.clip(latitude, -90, 90) + 90) / self.cell_size).astype(numpy.int64)
+
+    def _column(self, longitude):
+        return numpy.floor((numpy.clip(longitude, -180, 180) + 180) / self.cell_size).astype(numpy.int64)
+
+    def _cell(self, row, column):
+        return row * self._columns + column
+
+
+def haversine_meters(latitude: float, longitude: float, latitudes, longitudes):
+    """``distance_meters`` для массивов точек."""
+    lat1_rad = math.radians(latitude)
+    lat2_rad = numpy.radians(latitudes)
+    delta_lat = lat2_rad - lat1_rad
+    delta_lon = numpy.radians(longitudes - longitude)
+
+    a = numpy.sin(delta_lat / 2) ** 2 + math.cos(lat1_rad) * numpy.cos(lat2_rad) * numpy.sin(delta_lon / 2) ** 2
+    c = 2 * numpy.arctan2(numpy.sqrt(a), numpy.sqrt(1 - a))
+
+    return EARTH_RADIUS_METERS * c
+
+
+def _circle_bounds(
+    latitude: float,
+    longitude: float,
+    radius_meters: float,
+) -> tuple[float, float, list[tuple[float, float]]]:
+    """Описанный прямоугольник круга: границы широты и диапазоны долготы
+    (два, если круг пересекает антимеридиан)."""
+    delta_lat = math.degrees(radius_meters / EARTH_RADIUS_METERS)
+    lat_min, lat_max = latitude - delta_lat, latitude + delta_lat
+
+    # Круг шире всего по долготе на дальней от экватора широте
+    cos_lat = math.cos(math.radians(min(max(abs(lat_min), abs(lat_max)), 90)))
+    if lat_min <= -90 or lat_max >= 90 or cos_lat < 1e-9:
+        return lat_min, lat_max, [(-180, 180)]
+
+    delta_lon = math.degrees(radius_meters / (EARTH_RADIUS_METERS * cos_lat))
+    if delta_lon >= 180:
+        return lat_min, lat_max, [(-180, 180)]
+
+    return lat_min, lat_max, list(_longitude_ranges(longitude - delta_lon, longitude + delta_lon))
+
+
+def _longitude_ranges(lon_min: float, lon_max: float) -> Iterator[tuple[float, float]]:
+    if lon_min < -180:
+        yield lon_min + 360, 180
+        yield -180, lon_max
+    elif lon_max > 180:
+        yield lon_min, 180
+        yield -180, lon_max - 360
+    else:
+        yield lon_min, lon_max
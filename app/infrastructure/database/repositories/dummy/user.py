@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import (
     dataclass,
     field,
@@ -21,6 +22,10 @@ class DummyInMemoryUserRepository(BaseUserRepository):
         except StopIteration:
             return None
 
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Iterable[UserEntity]:
+        ids = set(user_ids)
+        return [user for user in self._saved_users if user.oid in ids]
+
     async def get_by_username(self, username: str) -> UserEntity | None:
         search_term = username.lower()
         try:
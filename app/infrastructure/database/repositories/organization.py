@@ -1,27 +1,124 @@
-from collections.abc import Iterable
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
 from dataclasses import dataclass
+from datetime import (
+    datetime,
+    timedelta,
+)
+from typing import Any
 from uuid import UUID
 
+import orjson
 from infrastructure.database.converters.organization import (
     organization_activities_ids,
     organization_entity_to_model,
     organization_model_to_entity,
     organization_phones_to_models,
 )
+from infrastructure.database.documents import (
+    organization_version_expression,
+    upsert_organization_documents,
+)
 from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.loaders import (
+    BatchLoader,
+    get_batch_loader,
+)
 from infrastructure.database.models.activity import ActivityModel
+from infrastructure.database.models.base import uuid_any
+from infrastructure.database.models.building import BuildingModel
+from infrastructure.database.models.catalog_version import CatalogVersionModel
 from infrastructure.database.models.organization import (
     organization_activity,
     OrganizationModel,
+    OrganizationPhoneModel,
+    OrganizationTombstoneModel,
+)
+from infrastructure.database.pagination import (
+    estimate_count,
+    paginate_select,
 )
 from sqlalchemy import (
+    case,
+    cast,
+    column,
+    ColumnElement,
+    delete,
+    distinct,
+    false,
+    Float,
+    func,
     insert,
+    Integer,
+    literal_column,
+    or_,
+    Select,
     select,
+    Text,
+    true,
+    tuple_,
+    union_all,
+    values,
+)
+from sqlalchemy.orm import (
+    aliased,
+    selectinload,
 )
-from sqlalchemy.orm import selectinload
 
+from domain.base.entity import EntityVersion
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
 from domain.organization.entities import OrganizationEntity
+from domain.organization.geohash import cover
 from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.read_models import (
+    ActivityFacet,
+    NearbyOrganization,
+    OrganizationChange,
+    OrganizationChangesPage,
+    OrganizationCluster,
+    OrganizationProjection,
+)
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+)
+from domain.organization.tiles import MAX_MERCATOR_LATITUDE
+
+
+# updated_at и deleted_at ставят триггеры по localtimestamp — времени
+# начала транзакции на сервере БД. Транзакция, начатая раньше, может
+# зафиксироваться уже после того, как клиент прочитал поток дальше, поэтому
+# изменения моложе задержки (по тем же часам БД) не отдаются.
+CHANGES_SETTLE_DELAY = timedelta(seconds=5)
+
+_location = func.geometry(BuildingModel.location)
+
+# Колонки sparse fieldset; телефоны и виды деятельности — коррелированные
+# подзапросы, которые попадают в SQL только если поле запрошено
+ORGANIZATION_PROJECTION_COLUMNS: dict[str, ColumnElement] = {
+    "oid": OrganizationModel.oid,
+    "name": OrganizationModel.name,
+    "building_id": OrganizationModel.building_id,
+    "address": BuildingModel.address,
+    "latitude": func.ST_Y(_location),
+    "longitude": func.ST_X(_location),
+    "phones": select(
+        func.coalesce(func.array_agg(OrganizationPhoneModel.phone), literal_column("'{}'::varchar[]")),
+    )
+    .where(OrganizationPhoneModel.organization_id == OrganizationModel.oid)
+    .scalar_subquery(),
+    "activity_ids": select(
+        func.coalesce(func.array_agg(organization_activity.c.activity_id), literal_column("'{}'::uuid[]")),
+    )
+    .where(organization_activity.c.organization_id == OrganizationModel.oid)
+    .scalar_subquery(),
+}
+_BUILDING_FIELDS = frozenset(("address", "latitude", "longitude"))
 
 
 @dataclass
@@ -46,13 +143,49 @@ class SQLAlchemyOrganizationRepository(BaseOrganizationRepository):
                 ]
                 await session.execute(insert(organization_activity).values(values))
 
+            # Документ read model — в той же транзакции: организация не
+            # появится в ``total`` без документа в списках
+            await session.execute(upsert_organization_documents([org_model.oid]))
+
             await session.commit()
 
+        self._by_id_loader().clear(organization.oid)
+
+    async def delete(self, organization_id: UUID) -> bool:
+        # Запись в organization_tombstone делает триггер на DELETE, документ
+        # удаляется каскадом
+        async with self.database.get_session() as session:
+            res = await session.execute(delete(OrganizationModel).where(OrganizationModel.oid == organization_id))
+            await session.commit()
+
+        self._by_id_loader().clear(organization_id)
+        return res.rowcount > 0
+
     async def get_by_id(self, organization_id: UUID) -> OrganizationEntity | None:
+        return await self._by_id_loader().load(organization_id)
+
+    async def get_version(self, organization_id: UUID) -> EntityVersion | None:
+        async with self.database.get_read_only_session() as session:
+            stmt = select(OrganizationModel.oid, organization_version_expression().label("updated_at")).where(
+                OrganizationModel.oid == organization_id,
+            )
+            res = await session.execute(stmt)
+            row = res.one_or_none()
+
+            return EntityVersion(oid=row.oid, updated_at=row.updated_at) if row else None
+
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationEntity]:
+        organizations = await self._by_id_loader().load_many(organization_ids)
+        return [organization for organization in organizations if organization is not None]
+
+    def _by_id_loader(self) -> BatchLoader[UUID, OrganizationEntity]:
+        return get_batch_loader((id(self), "oid"), self._load_by_ids)
+
+    async def _load_by_ids(self, organization_ids: list[UUID]) -> dict[UUID, OrganizationEntity]:
         async with self.database.get_read_only_session() as session:
             stmt = (
                 select(OrganizationModel)
-                .where(OrganizationModel.oid == organization_id)
+                .where(OrganizationModel.oid_any(organization_ids))
                 .options(
                     selectinload(OrganizationModel.building),
                     selectinload(OrganizationModel.phones),
@@ -60,8 +193,7 @@ class SQLAlchemyOrganizationRepository(BaseOrganizationRepository):
                 )
             )
             res = await session.execute(stmt)
-            result = res.scalar_one_or_none()
-            return organization_model_to_entity(result) if result else None
+            return {model.oid: organization_model_to_entity(model) for model in res.scalars().all()}
 
     async def get_by_name(self, name: str) -> Iterable[OrganizationEntity]:
         async with self.database.get_read_only_session() as session:
@@ -115,3 +247,433 @@ class SQLAlchemyOrganizationRepository(BaseOrganizationRepository):
             res = await session.execute(stmt)
             results = [organization_model_to_entity(row) for row in res.scalars().all()]
             return results
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationEntity]:
+        async with self.database.get_read_only_session() as session:
+            stmt = apply_organization_filters(select(OrganizationModel), filters).options(
+                selectinload(OrganizationModel.building),
+                selectinload(OrganizationModel.phones),
+                selectinload(OrganizationModel.activities),
+            )
+            stmt = paginate_select(stmt, OrganizationModel, page, sort_key=organization_sort_key(filters))
+
+            res = await session.execute(stmt)
+            return [organization_model_to_entity(row) for row in res.scalars().all()]
+
+    async def project(
+        self,
+        fields: tuple[str, ...],
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationProjection]:
+        sort_key = organization_sort_key(filters)
+        if sort_key is not None:
+            fields = (*fields, "distance")
+
+        columns = {**ORGANIZATION_PROJECTION_COLUMNS, "distance": sort_key}
+        stmt = select(
+            OrganizationModel.oid.label("_oid"),
+            OrganizationModel.created_at.label("_created_at"),
+            *(columns[name].label(name) for name in fields),
+        )
+        if _BUILDING_FIELDS.intersection(fields):
+            stmt = stmt.join(BuildingModel, BuildingModel.oid == OrganizationModel.building_id)
+
+        stmt = paginate_select(apply_organization_filters(stmt, filters), OrganizationModel, page, sort_key=sort_key)
+
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(stmt)
+            return [
+                OrganizationProjection(
+                    oid=row._oid,
+                    created_at=row._created_at,
+                    values={name: row._mapping[name] for name in fields},
+                )
+                for row in res
+            ]
+
+    async def count(self, **filters: Any) -> int:
+        async with self.database.get_read_only_session() as session:
+            stmt = apply_organization_filters(select(func.count()).select_from(OrganizationModel), filters)
+            res = await session.execute(stmt)
+            return res.scalar_one()
+
+    async def estimate_count(self, **filters: Any) -> int:
+        async with self.database.get_read_only_session() as session:
+            return await estimate_count(session, apply_organization_filters(select(OrganizationModel.oid), filters))
+
+    async def count_by_activity(self, **filters: Any) -> Iterable[ActivityFacet]:
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(activity_facets_select(filters))
+            return [
+                ActivityFacet(
+                    activity_id=row.oid,
+                    name=row.name,
+                    parent_id=row.parent_id,
+                    organizations=row.organizations,
+                    subtree_organizations=row.subtree_organizations,
+                )
+                for row in res
+            ]
+
+    async def get_data_version(self) -> str:
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(CatalogVersionModel.select_version())
+            return str(res.scalar_one())
+
+    async def get_changes(
+        self,
+        limit: int,
+        since: datetime | None = None,
+        after: PageCursor | None = None,
+    ) -> OrganizationChangesPage:
+        async with self.database.get_read_only_session() as session:
+            # Граница — по часам БД, одно значение и для выборки, и для
+            # курсора пустой страницы
+            res = await session.execute(select(func.localtimestamp() - CHANGES_SETTLE_DELAY))
+            until = res.scalar_one()
+            res = await session.execute(organization_changes_select(limit, until, since, after))
+            rows = res.all()
+
+        organizations = {org.oid: org for org in await self.get_by_ids(row.oid for row in rows if not row.deleted)}
+        changes = [
+            OrganizationChange(
+                oid=row.oid,
+                changed_at=row.changed_at,
+                organization=None if row.deleted else organizations.get(row.oid),
+            )
+            for row in rows
+            # Удалена между запросами — попадёт в поток записью об удалении
+            if row.deleted or row.oid in organizations
+        ]
+        return OrganizationChangesPage(changes=changes, until=until)
+
+    async def cluster_by_bounding_box(
+        self,
+        lat_min: float,
+        lat_max: float,
+        lon_min: float,
+        lon_max: float,
+        grid_size: float | None,
+    ) -> Iterable[OrganizationCluster]:
+        location = BuildingModel.location_mercator()
+        # Проекция не определена у полюсов — область обрезается по её пределу
+        bbox = func.ST_Transform(
+            func.ST_MakeEnvelope(
+                lon_min,
+                max(lat_min, -MAX_MERCATOR_LATITUDE),
+                lon_max,
+                min(lat_max, MAX_MERCATOR_LATITUDE),
+                4326,
+            ),
+            literal_column("3857"),
+        )
+        cell = BuildingModel.oid if grid_size is None else func.ST_SnapToGrid(location, grid_size)
+        # Центр взвешен по организациям: точка здания входит в ST_Collect по разу на организацию
+        center = func.ST_Transform(func.ST_Centroid(func.ST_Collect(location)), literal_column("4326"))
+
+        stmt = (
+            select(
+                func.ST_Y(center).label("latitude"),
+                func.ST_X(center).label("longitude"),
+                func.count(OrganizationModel.oid).label("organizations"),
+                case(
+                    (func.count(distinct(BuildingModel.oid)) == 1, func.min(cast(BuildingModel.oid, Text))),
+                ).label("building_id"),
+            )
+            .select_from(OrganizationModel)
+            .join(BuildingModel, BuildingModel.oid == OrganizationModel.building_id)
+            .where(
+                BuildingModel.geohash_prefix_in(
+                    cover(SearchBoundingBox(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max)),
+                ),
+                func.ST_Intersects(location, bbox),
+            )
+            .group_by(cell)
+        )
+
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(stmt)
+            return [
+                OrganizationCluster(
+                    latitude=row.latitude,
+                    longitude=row.longitude,
+                    organizations=row.organizations,
+                    building_id=UUID(row.building_id) if row.building_id else None,
+                )
+                for row in res
+            ]
+
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        activity_names: Iterable[str] | None = None,
+    ) -> Iterable[NearbyOrganization]:
+        point = func.ST_GeogFromText(f"POINT({longitude} {latitude})")
+        # ``<->`` по geography обходит GiST индекс idx_building_location в
+        # порядке сферического расстояния; точное расстояние по эллипсоиду
+        # считается только для отобранных ``limit`` строк
+        stmt = (
+            select(OrganizationModel.oid, func.ST_Distance(BuildingModel.location, point).label("distance"))
+            .join(BuildingModel, BuildingModel.oid == OrganizationModel.building_id)
+            .order_by(BuildingModel.location.distance_centroid(point), OrganizationModel.oid)
+            .limit(limit)
+        )
+        if activity_names is not None:
+            stmt = apply_organization_filters(stmt, {"activity_names": activity_names})
+
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(stmt)
+            distances = {row.oid: row.distance for row in res}
+
+        organizations = await self.get_by_ids(distances)
+        # Сфера и эллипсоид могут расходиться в порядке близких точек
+        return sorted(
+            (NearbyOrganization(organization=org, distance=distances[org.oid]) for org in organizations),
+            key=lambda nearby: nearby.distance,
+        )
+
+    async def get_near_points(
+        self,
+        points: Sequence[SearchCircle],
+        limit: int,
+        activity_name: str | None = None,
+    ) -> list[list[NearbyOrganization]]:
+        filters = {"activity_subtree": activity_name} if activity_name is not None else {}
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(near_points_select(points, limit, filters))
+            rows = res.all()
+
+        organizations = {org.oid: org for org in await self.get_by_ids({row.oid for row in rows})}
+        results: list[list[NearbyOrganization]] = [[] for _ in points]
+        for row in rows:
+            # Строки одной точки приходят уже по расстоянию
+            if row.oid in organizations:
+                nearby = NearbyOrganization(organization=organizations[row.oid], distance=row.distance)
+                results[row.point].append(nearby)
+
+        return results
+
+
+def near_points_select(points: Sequence[SearchCircle], limit: int, filters: dict[str, Any]) -> Select:
+    """(point, oid, distance): до ``limit`` ближайших организаций в радиусе
+    каждой точки одним запросом.
+
+    Точки передаются через VALUES, для каждой LATERAL подзапрос делает
+    ST_DWithin по GiST индексу idx_building_location и сортировку по
+    расстоянию с LIMIT — как ``/by-radius``, но без запроса на точку.
+
+    """
+    values_points = values(
+        column("point", Integer),
+        column("longitude", Float),
+        column("latitude", Float),
+        column("radius", Float),
+        name="points",
+    ).data([(index, point.longitude, point.latitude, point.radius) for index, point in enumerate(points)])
+
+    center = func.geography(
+        func.ST_SetSRID(func.ST_MakePoint(values_points.c.longitude, values_points.c.latitude), 4326),
+    )
+    distance = func.ST_Distance(BuildingModel.location, center).label("distance")
+    nearby = (
+        apply_organization_filters(
+            select(OrganizationModel.oid, distance)
+            .join(BuildingModel, BuildingModel.oid == OrganizationModel.building_id)
+            .where(func.ST_DWithin(BuildingModel.location, center, values_points.c.radius)),
+            filters,
+        )
+        .order_by(distance, OrganizationModel.oid)
+        .limit(limit)
+        .lateral("nearby")
+    )
+
+    return (
+        select(values_points.c.point, nearby.c.oid, nearby.c.distance)
+        .select_from(values_points)
+        .join(nearby, true())
+        .order_by(values_points.c.point, nearby.c.distance, nearby.c.oid)
+    )
+
+
+def organization_changes_select(
+    limit: int,
+    until: datetime,
+    since: datetime | None = None,
+    after: PageCursor | None = None,
+) -> Select:
+    """(oid, changed_at, deleted): изменения и удаления раньше ``until`` по
+    возрастанию (changed_at, oid).
+
+    Условия keyset переносятся планировщиком в обе ветви UNION ALL, и
+    каждая читает свой индекс ``ix_*_oid`` по порядку (Merge Append) —
+    стоимость не зависит от размера каталога.
+
+    """
+    changes = union_all(
+        select(
+            OrganizationModel.oid,
+            OrganizationModel.updated_at.label("changed_at"),
+            false().label("deleted"),
+        ),
+        select(OrganizationTombstoneModel.oid, OrganizationTombstoneModel.deleted_at, true()),
+    ).subquery("changes")
+
+    stmt = select(changes).where(changes.c.changed_at < until)
+    if after is not None:
+        stmt = stmt.where(tuple_(changes.c.changed_at, changes.c.oid) > tuple_(after.created_at, after.oid))
+    elif since is not None:
+        stmt = stmt.where(changes.c.changed_at >= since)
+
+    return stmt.order_by(changes.c.changed_at, changes.c.oid).limit(limit)
+
+
+def activity_facets_select(filters: dict[str, Any]) -> Select:
+    """(oid, name, parent_id, organizations, subtree_organizations) для
+    видов деятельности организаций, отобранных ``filters``.
+
+    Каждая связь организации с видом деятельности засчитывается ему
+    самому и его родителю, затем один GROUP BY по виду деятельности
+    считает и прямые, и поддеревом — вместо запроса ``/by-activity`` на
+    каждый вид деятельности.
+
+    """
+    scope = apply_organization_filters(select(OrganizationModel.oid), filters).cte("scope")
+    in_scope = organization_activity.c.organization_id.in_(select(scope.c.oid))
+    links = union_all(
+        select(
+            organization_activity.c.organization_id,
+            organization_activity.c.activity_id,
+            true().label("direct"),
+        ).where(in_scope),
+        select(
+            organization_activity.c.organization_id,
+            ActivityModel.parent_id,
+            false(),
+        )
+        .join(ActivityModel, ActivityModel.oid == organization_activity.c.activity_id)
+        .where(in_scope, ActivityModel.parent_id.is_not(None)),
+    ).subquery("links")
+
+    counts = (
+        select(
+            links.c.activity_id,
+            func.count(distinct(links.c.organization_id)).filter(links.c.direct).label("organizations"),
+            func.count(distinct(links.c.organization_id)).label("subtree_organizations"),
+        )
+        .group_by(links.c.activity_id)
+        .subquery("counts")
+    )
+
+    return (
+        select(
+            ActivityModel.oid,
+            ActivityModel.name,
+            ActivityModel.parent_id,
+            counts.c.organizations,
+            counts.c.subtree_organizations,
+        )
+        .join(counts, counts.c.activity_id == ActivityModel.oid)
+        .order_by(counts.c.subtree_organizations.desc(), ActivityModel.name)
+    )
+
+
+def organization_distance(circle: SearchCircle) -> ColumnElement:
+    """Расстояние в метрах от центра круга до здания организации.
+
+    Коррелированный подзапрос по своему alias здания: выражение не
+    зависит от JOIN внешнего запроса и подходит для ORDER BY, SELECT и
+    keyset условия.
+
+    """
+    building = aliased(BuildingModel)
+    center = func.ST_GeogFromText(f"POINT({circle.longitude} {circle.latitude})")
+    return (
+        select(func.ST_Distance(building.location, center))
+        .where(building.oid == OrganizationModel.building_id)
+        .scalar_subquery()
+    )
+
+
+def organization_sort_key(filters: dict[str, Any]) -> ColumnElement | None:
+    """Ключ сортировки страницы для фильтров: расстояние при ``within``,
+    сходство названия (по убыванию) при ``text``, иначе порядок по
+    умолчанию (created_at, oid)."""
+    circle = filters.get("within")
+    if circle is not None:
+        return organization_distance(circle)
+
+    text = filters.get("text")
+    if text is not None:
+        # pg_trgm: similarity() в [0, 1], минус — чтобы ORDER BY шёл по возрастанию
+        return -func.similarity(OrganizationModel.name, text)
+
+    return None
+
+
+def apply_organization_filters(stmt: Select, filters: dict[str, Any]) -> Select:
+    """Фильтры ``BaseOrganizationRepository.filter`` поверх запроса к
+    ``organization``."""
+    for field, value in filters.items():
+        if field in ("name", "text"):
+            # ILIKE по подстроке использует GIN индекс ix_organization_name_trgm
+            stmt = stmt.where(OrganizationModel.name.ilike(f"%{value}%"))
+        elif field == "building_id":
+            stmt = stmt.where(OrganizationModel.building_id == value)
+        elif field == "building_ids":
+            stmt = stmt.where(uuid_any(OrganizationModel.building_id, value))
+        elif field == "address":
+            buildings_with_address = select(BuildingModel.oid).where(BuildingModel.address.ilike(f"%{value}%"))
+            stmt = stmt.where(OrganizationModel.building_id.in_(buildings_with_address))
+        elif field == "activity_names":
+            # Подзапрос вместо JOIN: не нужен DISTINCT, сортировка и keyset остаются индексными
+            organizations_with_activity = (
+                select(organization_activity.c.organization_id)
+                .join(ActivityModel, ActivityModel.oid == organization_activity.c.activity_id)
+                .where(ActivityModel.name.in_(list(value)))
+            )
+            stmt = stmt.where(OrganizationModel.oid.in_(organizations_with_activity))
+        elif field == "activity_subtree":
+            root = aliased(ActivityModel)
+            subtree = select(ActivityModel.oid).where(
+                or_(
+                    ActivityModel.name == value,
+                    ActivityModel.parent_id.in_(select(root.oid).where(root.name == value)),
+                ),
+            )
+            organizations_with_activity = select(organization_activity.c.organization_id).where(
+                organization_activity.c.activity_id.in_(subtree),
+            )
+            stmt = stmt.where(OrganizationModel.oid.in_(organizations_with_activity))
+        elif field == "within":
+            # ST_DWithin по geography использует GiST индекс idx_building_location
+            center = func.ST_GeogFromText(f"POINT({value.longitude} {value.latitude})")
+            buildings_within = select(BuildingModel.oid).where(BuildingModel.location.ST_DWithin(center, value.radius))
+            stmt = stmt.where(OrganizationModel.building_id.in_(buildings_within))
+        elif field == "bounding_box":
+            envelope = func.geography(
+                func.ST_MakeEnvelope(value.lon_min, value.lat_min, value.lon_max, value.lat_max, 4326),
+            )
+            # Покрытие geohash ячейками — грубый фильтр по btree индексу
+            buildings_inside = select(BuildingModel.oid).where(
+                BuildingModel.geohash_prefix_in(cover(value)),
+                BuildingModel.location.ST_Intersects(envelope),
+            )
+            stmt = stmt.where(OrganizationModel.building_id.in_(buildings_inside))
+        elif field == "polygon":
+            # Многоугольник уходит одним bind параметром GeoJSON, а не WKT строкой
+            area = func.geography(
+                func.ST_SetSRID(func.ST_GeomFromGeoJSON(orjson.dumps(value.to_geojson()).decode()), 4326),
+            )
+            buildings_inside = select(BuildingModel.oid).where(BuildingModel.location.ST_Intersects(area))
+            stmt = stmt.where(OrganizationModel.building_id.in_(buildings_inside))
+        else:
+            raise ValueError(f"Unsupported organization filter: {field}")
+
+    return stmt
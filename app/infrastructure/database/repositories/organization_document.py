@@ -0,0 +1,108 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from infrastructure.database.documents import (
+    built_organization_documents,
+    organization_version_expression,
+    upsert_organization_documents,
+)
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.models.base import uuid_any
+from infrastructure.database.models.organization import (
+    OrganizationDocumentModel,
+    OrganizationModel,
+)
+from infrastructure.database.pagination import paginate_select
+from infrastructure.database.repositories.organization import (
+    apply_organization_filters,
+    organization_sort_key,
+)
+from sqlalchemy import (
+    cast,
+    ColumnElement,
+    func,
+    Select,
+    select,
+    Text,
+)
+
+from domain.base.pagination import PageRequest
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
+from domain.organization.read_models import OrganizationDocument
+
+
+@dataclass
+class SQLAlchemyOrganizationDocumentRepository(BaseOrganizationDocumentRepository):
+    database: Database
+
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationDocument]:
+        organization_ids = list(organization_ids)
+        stmt = self._select_documents().where(uuid_any(OrganizationDocumentModel.oid, organization_ids))
+
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(stmt)
+            documents = {row.oid: self._row_to_document(row) for row in res}
+
+        return [documents[oid] for oid in organization_ids if oid in documents]
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationDocument]:
+        sort_key = organization_sort_key(filters)
+        stmt = apply_organization_filters(self._select_documents(distance=sort_key), filters)
+        stmt = paginate_select(stmt, OrganizationModel, page, sort_key=sort_key)
+
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(stmt)
+            return [self._row_to_document(row) for row in res]
+
+    async def rebuild(self, organization_ids: Iterable[UUID] | None = None) -> int:
+        async with self.database.get_session() as session:
+            res = await session.execute(upsert_organization_documents(organization_ids))
+            await session.commit()
+            return res.rowcount
+
+    async def find_inconsistent(self) -> list[UUID]:
+        built = built_organization_documents().subquery()
+        stmt = (
+            select(func.coalesce(built.c.oid, OrganizationDocumentModel.oid))
+            .select_from(
+                built.join(
+                    OrganizationDocumentModel,
+                    OrganizationDocumentModel.oid == built.c.oid,
+                    full=True,
+                ),
+            )
+            .where(OrganizationDocumentModel.document.is_distinct_from(built.c.document))
+        )
+
+        async with self.database.get_read_only_session() as session:
+            res = await session.execute(stmt)
+            return list(res.scalars().all())
+
+    @staticmethod
+    def _select_documents(distance: ColumnElement | None = None) -> Select:
+        document = OrganizationDocumentModel.document
+        if distance is not None:
+            document = document.op("||")(func.jsonb_build_object("distance", distance))
+
+        # document::text — байты уходят в ответ без json декодирования
+        return select(
+            OrganizationDocumentModel.oid,
+            OrganizationModel.created_at,
+            organization_version_expression().label("updated_at"),
+            cast(document, Text).label("content"),
+        ).join(OrganizationModel, OrganizationModel.oid == OrganizationDocumentModel.oid)
+
+    @staticmethod
+    def _row_to_document(row: Any) -> OrganizationDocument:
+        return OrganizationDocument(
+            oid=row.oid,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            content=row.content.encode(),
+        )
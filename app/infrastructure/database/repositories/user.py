@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -6,6 +7,10 @@ from infrastructure.database.converters.user import (
     user_model_to_entity,
 )
 from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.loaders import (
+    BatchLoader,
+    get_batch_loader,
+)
 from infrastructure.database.models.user import UserModel
 from sqlalchemy import select
 
@@ -23,13 +28,23 @@ class SQLAlchemyUserRepository(BaseUserRepository):
             session.add(model)
             await session.commit()
 
+        self._by_id_loader().clear(user.oid)
+
     async def get_by_id(self, user_id: UUID) -> UserEntity | None:
+        return await self._by_id_loader().load(user_id)
+
+    async def get_by_ids(self, user_ids: Iterable[UUID]) -> Iterable[UserEntity]:
+        users = await self._by_id_loader().load_many(user_ids)
+        return [user for user in users if user is not None]
+
+    def _by_id_loader(self) -> BatchLoader[UUID, UserEntity]:
+        return get_batch_loader((id(self), "oid"), self._load_by_ids)
+
+    async def _load_by_ids(self, user_ids: list[UUID]) -> dict[UUID, UserEntity]:
         async with self.database.get_read_only_session() as session:
-            stmt = select(UserModel).where(UserModel.oid == user_id)
+            stmt = select(UserModel).where(UserModel.oid_any(user_ids))
             res = await session.execute(stmt)
-            result = res.scalar_one_or_none()
-
-            return user_model_to_entity(result) if result else None
+            return {model.oid: user_model_to_entity(model) for model in res.scalars().all()}
 
     async def get_by_username(self, username: str) -> UserEntity | None:
         async with self.database.get_read_only_session() as session:
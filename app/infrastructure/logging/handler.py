@@ -1,55 +1,107 @@
 import logging
 import socket
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from typing import Any
 
 import orjson
 
 
 class LogstashHandler(logging.Handler):
-    """Handler для отправки логов в Logstash через TCP."""
+    """Handler для отправки логов в Logstash через TCP.
+
+    ``emit`` только сериализует запись и кладёт её в буфер, поэтому
+    недоступный Logstash не задерживает запросы. Фоновый поток отправляет
+    записи пачками до ``batch_size`` строк (JSON через перевод строки), а
+    при ошибке подключения или отправки переподключается с
+    экспоненциальной задержкой от ``backoff_initial`` до ``backoff_max``
+    секунд; задержка сбрасывается после первой отправленной пачки.
+    Отправка пачки ждёт не дольше ``send_timeout``: Logstash, переставший
+    читать, считается разорванным соединением.
+
+    Буфер ограничен ``buffer_size`` записями: при переполнении
+    выбрасываются самые старые, их число — в ``dropped``. Пачка,
+    отправленная не целиком, после переподключения уходит заново, так что
+    отдельные записи могут прийти дважды.
+
+    """
 
     def __init__(
         self,
         host: str = "logstash",
         port: int = 5000,
         project: str = "organization-catalog",
+        buffer_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        connect_timeout: float = 2,
+        send_timeout: float = 5,
+        backoff_initial: float = 0.5,
+        backoff_max: float = 30,
+        close_timeout: float = 5,
     ):
         super().__init__()
         self.host = host
         self.port = port
         self.project = project
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.connect_timeout = connect_timeout
+        self.send_timeout = send_timeout
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.close_timeout = close_timeout
         self.sock: socket.socket | None = None
-        # Пытаемся подключиться, но не падаем если не получилось
-        try:
-            self.connect()
-        except Exception:
-            self.sock = None
+
+        self.dropped = 0
+        self.sent = 0
+
+        self._buffer: deque[bytes] = deque(maxlen=buffer_size)
+        # Пачка, которую поток пытается отправить; новые записи тем
+        # временем копятся в буфере
+        self._pending: list[bytes] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._backoff = 0.0
+        self._next_connect_at = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="logstash-handler", daemon=True)
+        self._thread.start()
+
+    @property
+    def queued(self) -> int:
+        """Записи, ожидающие отправки."""
+        with self._condition:
+            return len(self._buffer) + len(self._pending)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "dropped": self.dropped,
+            "sent": self.sent,
+            "connected": self.sock is not None,
+        }
 
     def connect(self) -> None:
         """Установка соединения с Logstash."""
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.settimeout(2)  # Таймаут для подключения
-            self.sock.connect((self.host, self.port))
-            self.sock.settimeout(None)  # Убираем таймаут после подключения
-        except Exception:
+            self.sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+            # Без таймаута sendall зависнет навсегда, если Logstash
+            # перестанет читать, и до переподключения дело не дойдёт
+            self.sock.settimeout(self.send_timeout)
+        except OSError:
             self.sock = None
 
     def emit(self, record: logging.LogRecord) -> None:
-        """Отправка лога в Logstash."""
-        if not self.sock:
-            self.connect()
-            if not self.sock:
-                # Если не удалось подключиться, просто игнорируем лог
-                # чтобы не падало приложение
-                return
-
+        """Постановка лога в очередь на отправку."""
         try:
             # Формируем данные для отправки
             log_data = {
                 "level": record.levelname,
                 "title": record.getMessage(),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.fromtimestamp(record.created).isoformat(),
                 "project": self.project,
             }
 
@@ -57,22 +109,110 @@ class LogstashHandler(logging.Handler):
             if hasattr(record, "extra") and record.extra:
                 log_data.update(record.extra)
 
-            # Отправляем данные в Logstash
-            self.sock.sendall(orjson.dumps(log_data) + b"\n")
-
+            line = orjson.dumps(log_data, default=str) + b"\n"
         except Exception:
-            # При ошибке закрываем соединение и пытаемся переподключиться
-            # Не поднимаем исключение, чтобы не падало приложение
-            self.close()
-            self.connect()
+            self.handleError(record)
+            return
+
+        with self._condition:
+            if self._closed:
+                self.dropped += 1
+                return
+
+            if len(self._buffer) == self._buffer.maxlen:
+                # deque с maxlen сам вытеснит самую старую запись
+                self.dropped += 1
+            self._buffer.append(line)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+
+    def flush(self) -> None:
+        """Будит поток отправки, не дожидаясь ``flush_interval``."""
+        with self._condition:
+            self._condition.notify()
 
     def close(self) -> None:
-        """Закрытие соединения."""
+        """Отправка оставшихся записей и закрытие соединения.
+
+        Ждёт не дольше ``close_timeout``; если Logstash недоступен,
+        оставшиеся записи считаются выброшенными.
+
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._thread is not threading.current_thread():
+            self._thread.join(self.close_timeout)
+
+        super().close()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._pending:
+                    if not self._buffer and not self._closed:
+                        self._condition.wait(self.flush_interval)
+                    self._pending = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+
+                if not self._pending and self._closed:
+                    break
+
+            if not self._pending:
+                continue
+
+            if self._send(b"".join(self._pending)):
+                with self._condition:
+                    self.sent += len(self._pending)
+                    self._pending = []
+                continue
+
+            with self._condition:
+                if self._closed:
+                    # Logstash недоступен, а ждать переподключения при
+                    # остановке нельзя
+                    self.dropped += len(self._pending) + len(self._buffer)
+                    self._pending = []
+                    self._buffer.clear()
+                    break
+
+                self._condition.wait(max(self._next_connect_at - time.monotonic(), 0))
+
+        self._disconnect()
+
+    def _send(self, payload: bytes) -> bool:
+        if self.sock is None:
+            # При остановке пробуем подключиться сразу, не дожидаясь задержки
+            if time.monotonic() < self._next_connect_at and not self._closed:
+                return False
+
+            self.connect()
+            if self.sock is None:
+                self._delay_reconnect()
+                return False
+
+        try:
+            self.sock.sendall(payload)
+        except OSError:
+            # Logstash, принимающий соединения и сразу их рвущий, иначе
+            # заставил бы переподключаться без паузы
+            self._disconnect()
+            self._delay_reconnect()
+            return False
+
+        # Удачное подключение ещё не значит, что Logstash принимает записи,
+        # поэтому задержка сбрасывается только после отправки
+        self._backoff = 0.0
+        return True
+
+    def _delay_reconnect(self) -> None:
+        self._backoff = min(self._backoff * 2 or self.backoff_initial, self.backoff_max)
+        self._next_connect_at = time.monotonic() + self._backoff
+
+    def _disconnect(self) -> None:
         if self.sock:
             try:
                 self.sock.close()
-            except Exception:
+            except OSError:
                 pass
             self.sock = None
-
-        super().close()
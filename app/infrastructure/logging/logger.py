@@ -10,15 +10,18 @@ def setup_logging(config: Config) -> None:
     logger = logging.getLogger("app_logger")
     logger.setLevel(logging.INFO)
 
-    # Очищаем существующие handlers
-    if logger.handlers:
-        logger.handlers.clear()
+    # Закрываем существующие handlers: у LogstashHandler свой поток отправки
+    for handler in logger.handlers:
+        handler.close()
+    logger.handlers.clear()
 
     try:
         logstash_handler = LogstashHandler(
             host=config.logstash_host,
             port=config.logstash_port,
             project=config.logstash_project,
+            buffer_size=config.logstash_buffer_size,
+            batch_size=config.logstash_batch_size,
         )
         logstash_handler.setLevel(logging.INFO)
 
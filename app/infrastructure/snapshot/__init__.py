@@ -0,0 +1,4 @@
+from infrastructure.snapshot.arrow import encode_snapshot
+
+
+__all__ = ["encode_snapshot"]
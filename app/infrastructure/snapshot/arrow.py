@@ -0,0 +1,106 @@
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+)
+
+from domain.organization.exceptions import SnapshotFormatUnavailableException
+from domain.organization.snapshot import (
+    SNAPSHOT_COLUMNS,
+    SnapshotBatch,
+    SnapshotColumnType,
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - опциональная зависимость
+    pyarrow = None
+
+
+def _arrow_type(column_type: SnapshotColumnType) -> "pyarrow.DataType":
+    match column_type:
+        case SnapshotColumnType.FLOAT64:
+            return pyarrow.float64()
+        case SnapshotColumnType.TIMESTAMP:
+            return pyarrow.timestamp("us")
+        case _:
+            return pyarrow.string()
+
+
+def snapshot_schema(table: SnapshotTable) -> "pyarrow.Schema":
+    return pyarrow.schema([(name, _arrow_type(column_type)) for name, column_type in SNAPSHOT_COLUMNS[table]])
+
+
+class _ChunkSink:
+    """Файлоподобный приёмник для writer'ов pyarrow: копит записанные
+    байты до ``drain()``, чтобы отдавать их по мере записи пачек."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def encode_snapshot(
+    table: SnapshotTable,
+    snapshot_format: SnapshotFormat,
+    batches: AsyncIterable[SnapshotBatch],
+) -> AsyncIterator[bytes]:
+    """Кодирует пачки строк таблицы в Arrow IPC stream или Parquet.
+
+    Каждая пачка — отдельный record batch (row group для Parquet), байты
+    отдаются сразу после её записи. Отсутствие pyarrow проверяется до
+    первой итерации, чтобы ошибка не оборвала уже начатый ответ.
+
+    """
+    if pyarrow is None:
+        raise SnapshotFormatUnavailableException(snapshot_format=snapshot_format, dependency="pyarrow")
+
+    return _encode(table, snapshot_format, batches)
+
+
+async def _encode(
+    table: SnapshotTable,
+    snapshot_format: SnapshotFormat,
+    batches: AsyncIterable[SnapshotBatch],
+) -> AsyncIterator[bytes]:
+    schema = snapshot_schema(table)
+    sink = _ChunkSink()
+    if snapshot_format is SnapshotFormat.PARQUET:
+        writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    else:
+        writer = pyarrow.ipc.new_stream(sink, schema)
+
+    try:
+        async for batch in batches:
+            writer.write_batch(pyarrow.RecordBatch.from_pydict(batch, schema=schema))
+            if chunk := sink.drain():
+                yield chunk
+    finally:
+        writer.close()
+
+    # Конец потока Arrow / футер Parquet
+    if chunk := sink.drain():
+        yield chunk
@@ -0,0 +1,309 @@
+import heapq
+import math
+from bisect import bisect_right
+from collections.abc import (
+    Iterable,
+    Sequence,
+)
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from infrastructure.database.repositories.dummy.spatial import SpatialIndex
+from infrastructure.snapshot.catalog_file import (
+    CatalogFile,
+    from_microseconds,
+    to_microseconds,
+)
+
+from domain.base.entity import EntityVersion
+from domain.base.pagination import PageRequest
+from domain.organization.entities import (
+    ActivityEntity,
+    BuildingEntity,
+    OrganizationEntity,
+)
+from domain.organization.geo import (
+    distance_meters,
+    EARTH_RADIUS_METERS,
+)
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+)
+from domain.organization.value_objects import (
+    ActivityNameValueObject,
+    BuildingAddressValueObject,
+    BuildingCoordinatesValueObject,
+    OrganizationNameValueObject,
+    OrganizationPhoneValueObject,
+)
+
+
+# Номера строк таблицы снимка по возрастанию — порядок (created_at, oid)
+Rows = Sequence[int]
+
+# Первый радиус поиска ближайших; дальше он удваивается, пока в круг не
+# попадёт нужное число организаций
+NEAREST_INITIAL_RADIUS = 1_000
+# Круг такого радиуса покрывает всю сферу
+NEAREST_MAX_RADIUS = math.pi * EARTH_RADIUS_METERS
+
+
+class CatalogSnapshot:
+    """Каталог поверх файла снимка: сущности собираются из колонок по
+    номеру строки, фильтры работают по колонкам и спискам смежности без
+    загрузки таблиц в память."""
+
+    def __init__(self, catalog_file: CatalogFile) -> None:
+        self.file = catalog_file
+
+        self.activity_oids = catalog_file.uuids("activity")
+        self.activity_names = catalog_file.strings("activity.name")
+        self.activity_parents = catalog_file.array("activity.parent")
+        self.activity_created_at = catalog_file.array("activity.created_at")
+        self.activity_updated_at = catalog_file.array("activity.updated_at")
+        self.activity_children = catalog_file.adjacency("activity.children")
+        self.activity_organizations = catalog_file.adjacency("activity.organizations")
+
+        self.building_oids = catalog_file.uuids("building")
+        self.building_addresses = catalog_file.strings("building.address")
+        self.building_addresses_lower = catalog_file.strings("building.address_lower")
+        self.building_latitudes = catalog_file.array("building.latitude")
+        self.building_longitudes = catalog_file.array("building.longitude")
+        self.building_created_at = catalog_file.array("building.created_at")
+        self.building_updated_at = catalog_file.array("building.updated_at")
+        self.building_organizations = catalog_file.adjacency("building.organizations")
+
+        self.organization_oids = catalog_file.uuids("organization")
+        self.organization_names = catalog_file.strings("organization.name")
+        self.organization_names_lower = catalog_file.strings("organization.name_lower")
+        self.organization_buildings = catalog_file.array("organization.building")
+        self.organization_created_at = catalog_file.array("organization.created_at")
+        self.organization_updated_at = catalog_file.array("organization.updated_at")
+        self.organization_phones = catalog_file.array("organization.phones")
+        self.organization_activities = catalog_file.adjacency("organization.activities")
+        self.phones = catalog_file.strings("phone")
+
+        # Видов деятельности мало, а родитель нужен каждой организации —
+        # их сущности собираются один раз
+        self._activities: dict[int, ActivityEntity] = {}
+
+    @classmethod
+    def open(cls, path: str | Path) -> "CatalogSnapshot":
+        return cls(CatalogFile(path))
+
+    @property
+    def data_version(self) -> str:
+        return self.file.metadata["data_version"]
+
+    # Сущности
+
+    def activity(self, row: int) -> ActivityEntity:
+        activity = self._activities.get(row)
+        if activity is None:
+            parent = self.activity_parents[row]
+            activity = self._activities[row] = ActivityEntity(
+                oid=self.activity_oids[row],
+                name=ActivityNameValueObject(value=self.activity_names[row]),
+                parent=self.activity(parent) if parent >= 0 else None,
+                created_at=from_microseconds(self.activity_created_at[row]),
+                updated_at=from_microseconds(self.activity_updated_at[row]),
+            )
+        return activity
+
+    def building(self, row: int) -> BuildingEntity:
+        return BuildingEntity(
+            oid=self.building_oids[row],
+            address=BuildingAddressValueObject(value=self.building_addresses[row]),
+            coordinates=BuildingCoordinatesValueObject(
+                latitude=self.building_latitudes[row],
+                longitude=self.building_longitudes[row],
+            ),
+            created_at=from_microseconds(self.building_created_at[row]),
+            updated_at=from_microseconds(self.building_updated_at[row]),
+        )
+
+    def organization(self, row: int) -> OrganizationEntity:
+        return OrganizationEntity(
+            oid=self.organization_oids[row],
+            name=OrganizationNameValueObject(value=self.organization_names[row]),
+            building=self.building(self.organization_buildings[row]),
+            phones=[OrganizationPhoneValueObject(value=phone) for phone in self.organization_phone_values(row)],
+            activities=[self.activity(activity) for activity in self.organization_activities[row]],
+            created_at=from_microseconds(self.organization_created_at[row]),
+            updated_at=from_microseconds(self.organization_updated_at[row]),
+        )
+
+    def organization_phone_values(self, row: int) -> list[str]:
+        return [self.phones[phone] for phone in range(self.organization_phones[row], self.organization_phones[row + 1])]
+
+    def organization_version(self, row: int) -> EntityVersion:
+        """Как ``OrganizationEntity.version``, без сборки сущности."""
+        updated_at = max(
+            self.organization_updated_at[row],
+            self.building_updated_at[self.organization_buildings[row]],
+            *(self.activity_updated_at[activity] for activity in self.organization_activities[row]),
+        )
+        return EntityVersion(oid=self.organization_oids[row], updated_at=from_microseconds(updated_at))
+
+    # Поиск строк
+
+    def activity_row_by_name(self, name: str) -> int | None:
+        """Строка вида деятельности с точно таким названием (как ``==`` в
+        SQL)."""
+        return self.activity_names.index(name)
+
+    def activity_subtree(self, row: int) -> list[int]:
+        return [row, *self.activity_children[row]]
+
+    def organization_location(self, row: int) -> tuple[float, float]:
+        building = self.organization_buildings[row]
+        return self.building_latitudes[building], self.building_longitudes[building]
+
+    def organizations_of_buildings(self, buildings: Iterable[int]) -> set[int]:
+        return {organization for building in buildings for organization in self.building_organizations[building]}
+
+    def organizations_of_activities(self, activities: Iterable[int]) -> set[int]:
+        return {organization for activity in activities for organization in self.activity_organizations[activity]}
+
+    @cached_property
+    def _buildings_index(self) -> SpatialIndex[int]:
+        """Сетка зданий по координатам: области проверяют только точки
+        пересекающихся ячеек."""
+        return SpatialIndex.from_points(
+            range(len(self.building_oids)),
+            self.building_latitudes,
+            self.building_longitudes,
+        )
+
+    def buildings_in_box(self, bbox: SearchBoundingBox) -> list[int]:
+        return self._buildings_index.in_bounding_box(bbox.lat_min, bbox.lat_max, bbox.lon_min, bbox.lon_max)
+
+    def buildings_within(self, circle: SearchCircle) -> list[int]:
+        return self._buildings_index.within(circle.latitude, circle.longitude, circle.radius)
+
+    def nearest_organizations(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        rows: set[int] | None = None,
+    ) -> list[tuple[float, int]]:
+        """``limit`` ближайших организаций (из ``rows``, если заданы) как
+        (расстояние, строка) по возрастанию расстояния и oid.
+
+        Круг поиска растёт вдвое, пока не наберёт ``limit`` организаций:
+        всё, что вне круга, дальше его радиуса, поэтому ближайшие уже в
+        нём, и точное расстояние считается только для них.
+
+        """
+        enough = min(limit, len(self.organization_oids) if rows is None else len(rows))
+        radius = NEAREST_INITIAL_RADIUS
+        while radius < NEAREST_MAX_RADIUS:
+            candidates = self.organizations_of_buildings(
+                self.buildings_within(SearchCircle(latitude=latitude, longitude=longitude, radius=radius)),
+            )
+            if rows is not None:
+                candidates &= rows
+            if len(candidates) >= enough:
+                break
+            radius *= 2
+        else:
+            candidates = set(range(len(self.organization_oids))) if rows is None else rows
+
+        center = SearchCircle(latitude=latitude, longitude=longitude, radius=radius)
+        nearest = heapq.nsmallest(
+            limit,
+            ((self.organization_distance(center, row), self.organization_oids.key(row), row) for row in candidates),
+        )
+        return [(distance, row) for distance, _, row in nearest]
+
+    def building_distance(self, circle: SearchCircle, row: int) -> float:
+        return distance_meters(
+            circle.latitude,
+            circle.longitude,
+            self.building_latitudes[row],
+            self.building_longitudes[row],
+        )
+
+    def organization_distance(self, circle: SearchCircle, row: int) -> float:
+        return self.building_distance(circle, self.organization_buildings[row])
+
+    def select_organizations(self, filters: dict[str, Any]) -> Rows:
+        """Строки организаций, подходящих под фильтры
+        ``BaseOrganizationRepository.filter``, по возрастанию."""
+        selected: set[int] | None = None
+
+        for key, value in filters.items():
+            if key in ("name", "text"):
+                rows = self.organization_names_lower.find(value.lower())
+            elif key == "address":
+                rows = self.organizations_of_buildings(self.building_addresses_lower.find(value.lower()))
+            elif key in ("building_id", "building_ids"):
+                buildings = (self.building_oids.index(oid) for oid in ([value] if key == "building_id" else value))
+                rows = self.organizations_of_buildings(row for row in buildings if row is not None)
+            elif key == "activity_names":
+                activities = (self.activity_row_by_name(name) for name in value)
+                rows = self.organizations_of_activities(row for row in activities if row is not None)
+            elif key == "activity_subtree":
+                root = self.activity_row_by_name(value)
+                rows = set() if root is None else self.organizations_of_activities(self.activity_subtree(root))
+            elif key == "within":
+                rows = self.organizations_of_buildings(self.buildings_within(value))
+            elif key == "bounding_box":
+                rows = self.organizations_of_buildings(self.buildings_in_box(value))
+            elif key == "polygon":
+                lon_min, lat_min, lon_max, lat_max = value.bounds()
+                bbox = SearchBoundingBox(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max)
+                rows = self.organizations_of_buildings(
+                    row
+                    for row in self.buildings_in_box(bbox)
+                    if value.contains(self.building_latitudes[row], self.building_longitudes[row])
+                )
+            else:
+                raise ValueError(f"Unsupported organization filter: {key}")
+
+            selected = rows if selected is None else selected & rows
+
+        if selected is None:
+            return range(len(self.organization_oids))
+
+        return sorted(selected)
+
+    def page_organizations(self, rows: Rows, page: PageRequest | None) -> Rows:
+        """Страница в порядке (created_at, oid) — это порядок строк."""
+        return _page(rows, page, self.organization_created_at, self.organization_oids)
+
+    def page_activities(self, rows: Rows, page: PageRequest | None) -> Rows:
+        return _page(rows, page, self.activity_created_at, self.activity_oids)
+
+    @cached_property
+    def _organizations_by_update(self) -> list[int]:
+        updated_at, oids = self.organization_updated_at, self.organization_oids
+        return sorted(range(len(oids)), key=lambda row: (updated_at[row], oids.key(row)))
+
+    def organizations_changed_after(self, changed_at: datetime, oid: UUID | None) -> list[int]:
+        """Строки организаций по возрастанию (updated_at, oid), начиная со
+        следующей после ``(changed_at, oid)``; без ``oid`` — с
+        ``changed_at`` включительно."""
+        updated_at, oids = self.organization_updated_at, self.organization_oids
+        order = self._organizations_by_update
+        # Пустой oid меньше любого, поэтому строки с changed_at попадают в выборку
+        anchor = (to_microseconds(changed_at), oid.bytes if oid is not None else b"")
+        start = bisect_right(order, anchor, key=lambda row: (updated_at[row], oids.key(row)))
+        return order[start:]
+
+
+def _page(rows: Rows, page: PageRequest | None, created_at: Sequence[int], oids: Any) -> Rows:
+    if page is None:
+        return rows
+
+    if page.after is not None:
+        anchor = (to_microseconds(page.after.created_at), page.after.oid.bytes)
+        start = bisect_right(rows, anchor, key=lambda row: (created_at[row], oids.key(row)))
+        return rows[start : start + page.limit]
+
+    return rows[page.offset : page.offset + page.limit]
@@ -0,0 +1,413 @@
+"""Файл снимка каталога для read-only узлов.
+
+Файл открывается через ``mmap`` и читается без разбора: все колонки —
+выровненные массивы фиксированной ширины, к которым обращаются через
+``memoryview``. Структура::
+
+    MAGIC (8 байт) | длина заголовка (uint64) | JSON заголовок | секции
+
+Заголовок описывает секции (смещение от начала данных, длина, typecode
+``array``) и метаданные снимка. Виды секций:
+
+- колонки: ``float64`` координаты, ``int64`` время в микросекундах,
+  ``uint32``/``int32`` индексы строк;
+- uuid — 16 байт на строку плюс перестановка ``*_by_oid`` для бинарного
+  поиска;
+- таблицы строк — ``uint32`` смещения, UTF-8 данные и перестановка
+  ``*.sorted`` по байтам строк для точного поиска; для поиска по
+  подстроке хранится копия в нижнем регистре;
+- CSR списки смежности — ``uint32`` смещения и индексы соседей.
+
+Строки таблиц упорядочены по (created_at, oid) — так же, как страницы SQL
+репозиториев, поэтому keyset пагинация — бинарный поиск по номеру строки.
+
+"""
+
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Sequence,
+)
+from datetime import (
+    datetime,
+    timedelta,
+    UTC,
+)
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+from domain.organization.snapshot import (
+    SnapshotBatch,
+    SnapshotTable,
+)
+
+
+MAGIC = b"OCSNAP01"
+FORMAT_VERSION = 2
+
+UUID_SIZE = 16
+_ALIGNMENT = 8
+_PREFIX_SIZE = len(MAGIC) + 8
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_microseconds(value: datetime) -> int:
+    """Время без часового пояса в микросекундах от эпохи (aware время
+    приводится к UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_microseconds(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _padding(length: int) -> int:
+    return -length % _ALIGNMENT
+
+
+class StringTable:
+    """Строки таблицы: ``offsets[i]:offsets[i + 1]`` — байты i-й строки;
+    ``order`` — номера строк по возрастанию байтов."""
+
+    def __init__(self, source: mmap.mmap, offsets: memoryview, start: int, order: memoryview) -> None:
+        self._source = source
+        self._offsets = offsets
+        self._start = start
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.key(index).decode()
+
+    def key(self, index: int) -> bytes:
+        return self._source[self._start + self._offsets[index] : self._start + self._offsets[index + 1]]
+
+    def find(self, term: str) -> set[int]:
+        """Номера строк, содержащих ``term``: поиск ``mmap.find`` по всем
+        данным сразу, совпадения через границу строк отбрасываются."""
+        needle = term.encode()
+        if not needle:
+            return set(range(len(self)))
+
+        rows = set()
+        end = self._start + self._offsets[-1]
+        position = self._source.find(needle, self._start, end)
+        while position != -1:
+            relative = position - self._start
+            row = bisect_right(self._offsets, relative) - 1
+            row_end = self._offsets[row + 1]
+            if relative + len(needle) <= row_end:
+                rows.add(row)
+                # Следующее совпадение ищем уже в другой строке
+                position = self._source.find(needle, self._start + row_end, end)
+            else:
+                position = self._source.find(needle, position + 1, end)
+
+        return rows
+
+    def index(self, value: str) -> int | None:
+        """Первый номер строки, совпадающей с ``value`` целиком."""
+        needle = value.encode()
+        position = bisect_left(self._order, needle, key=self.key)
+        if position < len(self._order) and self.key(self._order[position]) == needle:
+            return self._order[position]
+        return None
+
+
+class UUIDColumn:
+    """uuid строк таблицы; ``order`` — номера строк по возрастанию uuid."""
+
+    def __init__(self, data: memoryview, order: memoryview) -> None:
+        self._data = data
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index: int) -> UUID:
+        return UUID(bytes=self.key(index))
+
+    def key(self, index: int) -> bytes:
+        return bytes(self._data[index * UUID_SIZE : (index + 1) * UUID_SIZE])
+
+    def index(self, oid: UUID) -> int | None:
+        position = bisect_left(self._order, oid.bytes, key=self.key)
+        if position < len(self._order) and self.key(self._order[position]) == oid.bytes:
+            return self._order[position]
+        return None
+
+
+class Adjacency:
+    """CSR список смежности: соседи i-й строки —
+    ``indices[offsets[i]:offsets[i + 1]]``."""
+
+    def __init__(self, offsets: memoryview, indices: memoryview) -> None:
+        self._offsets = offsets
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> memoryview:
+        return self._indices[self._offsets[index] : self._offsets[index + 1]]
+
+
+class CatalogFile:
+    """Открытый только на чтение файл снимка каталога."""
+
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as file:
+            self._source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._source[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a catalog snapshot file")
+
+        header_length = int.from_bytes(self._source[len(MAGIC) : _PREFIX_SIZE], "little")
+        header = orjson.loads(self._source[_PREFIX_SIZE : _PREFIX_SIZE + header_length])
+        if header["version"] != FORMAT_VERSION or header["byteorder"] != sys.byteorder:
+            raise ValueError(f"Unsupported catalog snapshot file {path}: version {header['version']}")
+
+        self.metadata: dict[str, Any] = header["metadata"]
+        self._sections: dict[str, tuple[int, int, str]] = header["sections"]
+        self._data_start = _PREFIX_SIZE + header_length + _padding(header_length)
+        self._view = memoryview(self._source)
+
+    def array(self, name: str) -> memoryview:
+        offset, length, typecode = self._sections[name]
+        start = self._data_start + offset
+        return self._view[start : start + length].cast(typecode)
+
+    def strings(self, name: str) -> StringTable:
+        offset, _, _ = self._sections[f"{name}.data"]
+        return StringTable(
+            self._source,
+            self.array(f"{name}.offsets"),
+            self._data_start + offset,
+            self.array(f"{name}.sorted"),
+        )
+
+    def uuids(self, name: str) -> UUIDColumn:
+        return UUIDColumn(self.array(f"{name}.oid"), self.array(f"{name}.by_oid"))
+
+    def adjacency(self, name: str) -> Adjacency:
+        return Adjacency(self.array(f"{name}.offsets"), self.array(f"{name}.indices"))
+
+
+class _FileBuilder:
+    def __init__(self) -> None:
+        self._sections: list[tuple[str, str, bytes]] = []
+
+    def add(self, name: str, typecode: str, data: array | bytes) -> None:
+        self._sections.append((name, typecode, data.tobytes() if isinstance(data, array) else data))
+
+    def add_uuids(self, name: str, oids: Sequence[bytes]) -> None:
+        self.add(f"{name}.oid", "B", b"".join(oids))
+        self.add(f"{name}.by_oid", "I", array("I", sorted(range(len(oids)), key=oids.__getitem__)))
+
+    def add_strings(self, name: str, values: Iterable[str]) -> None:
+        encoded = [value.encode() for value in values]
+        offsets = array("I", [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        self.add(f"{name}.offsets", "I", offsets)
+        self.add(f"{name}.data", "B", b"".join(encoded))
+        # Сортировка устойчивая: среди одинаковых строк первой идёт меньший номер
+        self.add(f"{name}.sorted", "I", array("I", sorted(range(len(encoded)), key=encoded.__getitem__)))
+
+    def add_adjacency(self, name: str, neighbours: Sequence[Iterable[int]]) -> None:
+        offsets = array("I", [0])
+        indices = array("I")
+        for row in neighbours:
+            indices.extend(row)
+            offsets.append(len(indices))
+        self.add(f"{name}.offsets", "I", offsets)
+        self.add(f"{name}.indices", "I", indices)
+
+    def write(self, path: Path, metadata: dict[str, Any]) -> None:
+        """Пишет файл атомарно: во временный файл рядом с ``path``, fsync и
+        ``os.replace``, так что узел открывает либо старый снимок, либо
+        новый целиком."""
+        sections = {}
+        offset = 0
+        for name, typecode, data in self._sections:
+            sections[name] = (offset, len(data), typecode)
+            offset += len(data) + _padding(len(data))
+
+        header = orjson.dumps(
+            {"version": FORMAT_VERSION, "byteorder": sys.byteorder, "metadata": metadata, "sections": sections},
+        )
+        descriptor, partial = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".partial")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(MAGIC)
+                file.write(len(header).to_bytes(8, "little"))
+                file.write(header + b"\0" * _padding(len(header)))
+                for _, _, data in self._sections:
+                    file.write(data + b"\0" * _padding(len(data)))
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(partial, path)
+        except BaseException:
+            Path(partial).unlink(missing_ok=True)
+            raise
+
+        # Переименование переживает сбой питания, только когда записан и
+        # сам каталог
+        directory = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+async def _collect(batches: AsyncIterator[SnapshotBatch]) -> dict[str, list[Any]]:
+    columns: dict[str, list[Any]] = {}
+    async for batch in batches:
+        for name, values in batch.items():
+            columns.setdefault(name, []).extend(values)
+    return columns
+
+
+def _uuid_bytes(value: str | UUID) -> bytes:
+    return (value if isinstance(value, UUID) else UUID(value)).bytes
+
+
+def _timed_rows(columns: dict[str, list[Any]]) -> tuple[list[int], list[bytes], array, array]:
+    """Порядок строк по (created_at, oid), их oid и время в этом порядке."""
+    oids = [_uuid_bytes(value) for value in columns.get("oid", [])]
+    created_at = [to_microseconds(value) for value in columns.get("created_at", [])]
+    order = sorted(range(len(oids)), key=lambda row: (created_at[row], oids[row]))
+    return (
+        order,
+        [oids[row] for row in order],
+        array("q", [created_at[row] for row in order]),
+        array("q", [to_microseconds(columns["updated_at"][row]) for row in order]),
+    )
+
+
+def _invert(neighbours: Sequence[Iterable[int]], size: int) -> list[list[int]]:
+    inverted: list[list[int]] = [[] for _ in range(size)]
+    for row, targets in enumerate(neighbours):
+        for target in targets:
+            inverted[target].append(row)
+    return inverted
+
+
+async def write_catalog_file(
+    path: Path,
+    batches: Callable[[SnapshotTable], AsyncIterator[SnapshotBatch]],
+) -> dict[str, int]:
+    """Собирает файл снимка из таблиц ``batches`` (как у экспорта
+    снимка) и возвращает число строк по таблицам."""
+    builder = _FileBuilder()
+
+    activities = await _collect(batches(SnapshotTable.ACTIVITIES))
+    order, activity_oids, created_at, updated_at = _timed_rows(activities)
+    activity_index = {oid: row for row, oid in enumerate(activity_oids)}
+    names = [activities["name"][row] for row in order]
+    parents = array(
+        "i",
+        [
+            activity_index[_uuid_bytes(activities["parent_id"][row])] if activities["parent_id"][row] else -1
+            for row in order
+        ],
+    )
+    builder.add_uuids("activity", activity_oids)
+    builder.add_strings("activity.name", names)
+    builder.add("activity.parent", "i", parents)
+    builder.add("activity.created_at", "q", created_at)
+    builder.add("activity.updated_at", "q", updated_at)
+    builder.add_adjacency(
+        "activity.children",
+        _invert([[parent] if parent >= 0 else [] for parent in parents], len(activity_oids)),
+    )
+    versions = [*updated_at]
+
+    buildings = await _collect(batches(SnapshotTable.BUILDINGS))
+    order, building_oids, created_at, updated_at = _timed_rows(buildings)
+    building_index = {oid: row for row, oid in enumerate(building_oids)}
+    addresses = [buildings["address"][row] for row in order]
+    builder.add_uuids("building", building_oids)
+    builder.add_strings("building.address", addresses)
+    builder.add_strings("building.address_lower", (address.lower() for address in addresses))
+    builder.add("building.latitude", "d", array("d", [buildings["latitude"][row] for row in order]))
+    builder.add("building.longitude", "d", array("d", [buildings["longitude"][row] for row in order]))
+    builder.add("building.created_at", "q", created_at)
+    builder.add("building.updated_at", "q", updated_at)
+    versions.extend(updated_at)
+
+    organizations = await _collect(batches(SnapshotTable.ORGANIZATIONS))
+    order, organization_oids, created_at, updated_at = _timed_rows(organizations)
+    organization_index = {oid: row for row, oid in enumerate(organization_oids)}
+    names = [organizations["name"][row] for row in order]
+    organization_buildings = array(
+        "I",
+        [building_index[_uuid_bytes(organizations["building_id"][row])] for row in order],
+    )
+    builder.add_uuids("organization", organization_oids)
+    builder.add_strings("organization.name", names)
+    builder.add_strings("organization.name_lower", (name.lower() for name in names))
+    builder.add("organization.building", "I", organization_buildings)
+    builder.add("organization.created_at", "q", created_at)
+    builder.add("organization.updated_at", "q", updated_at)
+    builder.add_adjacency(
+        "building.organizations",
+        _invert([[building] for building in organization_buildings], len(building_oids)),
+    )
+    versions.extend(updated_at)
+
+    phones: list[list[str]] = [[] for _ in organization_oids]
+    phone_rows = await _collect(batches(SnapshotTable.PHONES))
+    for organization_id, phone in zip(phone_rows.get("organization_id", []), phone_rows.get("phone", []), strict=True):
+        phones[organization_index[_uuid_bytes(organization_id)]].append(phone)
+    # Телефоны организации — строки phone[phones[i]:phones[i + 1]]
+    phone_offsets = array("I", [0])
+    for values in phones:
+        phone_offsets.append(phone_offsets[-1] + len(values))
+    builder.add("organization.phones", "I", phone_offsets)
+    builder.add_strings("phone", (phone for values in phones for phone in values))
+
+    links: list[list[int]] = [[] for _ in organization_oids]
+    link_rows = await _collect(batches(SnapshotTable.ORGANIZATION_ACTIVITIES))
+    for organization_id, activity_id in zip(
+        link_rows.get("organization_id", []),
+        link_rows.get("activity_id", []),
+        strict=True,
+    ):
+        links[organization_index[_uuid_bytes(organization_id)]].append(activity_index[_uuid_bytes(activity_id)])
+    links = [sorted(activity_rows) for activity_rows in links]
+    builder.add_adjacency("organization.activities", links)
+    builder.add_adjacency("activity.organizations", _invert(links, len(activity_oids)))
+
+    counts = {
+        "activities": len(activity_oids),
+        "buildings": len(building_oids),
+        "organizations": len(organization_oids),
+    }
+    builder.write(
+        path,
+        {
+            **counts,
+            "data_version": from_microseconds(max(versions)).isoformat() if versions else "",
+            "created_at": datetime.now().isoformat(),
+        },
+    )
+    return counts
@@ -0,0 +1,12 @@
+from .activity import SnapshotActivityRepository
+from .building import SnapshotBuildingRepository
+from .organization import SnapshotOrganizationRepository
+from .organization_document import SnapshotOrganizationDocumentRepository
+
+
+__all__ = [
+    "SnapshotActivityRepository",
+    "SnapshotBuildingRepository",
+    "SnapshotOrganizationDocumentRepository",
+    "SnapshotOrganizationRepository",
+]
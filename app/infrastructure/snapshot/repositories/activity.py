@@ -0,0 +1,75 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from infrastructure.snapshot.catalog import CatalogSnapshot
+from infrastructure.snapshot.catalog_file import from_microseconds
+
+from domain.base.entity import EntityVersion
+from domain.base.pagination import PageRequest
+from domain.organization.entities import ActivityEntity
+from domain.organization.exceptions import ReadOnlyCatalogException
+from domain.organization.interfaces.repositories.activity import BaseActivityRepository
+
+
+@dataclass
+class SnapshotActivityRepository(BaseActivityRepository):
+    catalog: CatalogSnapshot
+
+    async def add(self, activity: ActivityEntity) -> None:
+        raise ReadOnlyCatalogException()
+
+    async def get_by_id(self, activity_id: UUID) -> ActivityEntity | None:
+        row = self.catalog.activity_oids.index(activity_id)
+        return self.catalog.activity(row) if row is not None else None
+
+    async def get_version(self, activity_id: UUID) -> EntityVersion | None:
+        row = self.catalog.activity_oids.index(activity_id)
+        if row is None:
+            return None
+
+        return EntityVersion(oid=activity_id, updated_at=from_microseconds(self.catalog.activity_updated_at[row]))
+
+    async def get_by_ids(self, activity_ids: Iterable[UUID]) -> Iterable[ActivityEntity]:
+        rows = (self.catalog.activity_oids.index(oid) for oid in set(activity_ids))
+        return [self.catalog.activity(row) for row in sorted(row for row in rows if row is not None)]
+
+    async def get_by_name(self, name: str) -> ActivityEntity | None:
+        row = self.catalog.activity_row_by_name(name)
+        return self.catalog.activity(row) if row is not None else None
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[ActivityEntity]:
+        rows = self.catalog.page_activities(self._select(filters), page)
+        return [self.catalog.activity(row) for row in rows]
+
+    async def count(self, **filters: Any) -> int:
+        return len(self._select(filters))
+
+    async def estimate_count(self, **filters: Any) -> int:
+        return await self.count(**filters)
+
+    def _select(self, filters: dict[str, Any]) -> list[int]:
+        # Как в SQL репозитории: название и родитель сравниваются точно
+        unknown = filters.keys() - {"name", "parent_id"}
+        if unknown:
+            raise ValueError(f"Unsupported activity filter: {', '.join(sorted(unknown))}")
+
+        rows: list[int] = list(range(len(self.catalog.activity_oids)))
+
+        if "parent_id" in filters:
+            if filters["parent_id"] is None:
+                rows = [row for row in rows if self.catalog.activity_parents[row] < 0]
+            else:
+                parent = self.catalog.activity_oids.index(filters["parent_id"])
+                rows = sorted(self.catalog.activity_children[parent]) if parent is not None else []
+
+        if "name" in filters:
+            row = self.catalog.activity_row_by_name(filters["name"])
+            rows = [row] if row is not None and row in rows else []
+
+        return rows
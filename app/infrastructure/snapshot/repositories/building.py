@@ -0,0 +1,61 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from uuid import UUID
+
+from infrastructure.snapshot.catalog import CatalogSnapshot
+from infrastructure.snapshot.catalog_file import from_microseconds
+
+from domain.base.entity import EntityVersion
+from domain.organization.entities import BuildingEntity
+from domain.organization.exceptions import ReadOnlyCatalogException
+from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+)
+
+
+@dataclass
+class SnapshotBuildingRepository(BaseBuildingRepository):
+    catalog: CatalogSnapshot
+
+    async def add(self, building: BuildingEntity) -> None:
+        raise ReadOnlyCatalogException()
+
+    async def get_by_id(self, building_id: UUID) -> BuildingEntity | None:
+        row = self.catalog.building_oids.index(building_id)
+        return self.catalog.building(row) if row is not None else None
+
+    async def get_version(self, building_id: UUID) -> EntityVersion | None:
+        row = self.catalog.building_oids.index(building_id)
+        if row is None:
+            return None
+
+        return EntityVersion(oid=building_id, updated_at=from_microseconds(self.catalog.building_updated_at[row]))
+
+    async def get_by_ids(self, building_ids: Iterable[UUID]) -> Iterable[BuildingEntity]:
+        rows = (self.catalog.building_oids.index(oid) for oid in set(building_ids))
+        return [self.catalog.building(row) for row in sorted(row for row in rows if row is not None)]
+
+    async def get_by_address(self, address: str) -> BuildingEntity | None:
+        row = self.catalog.building_addresses.index(address)
+        return self.catalog.building(row) if row is not None else None
+
+    async def filter_by_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_meters: float,
+    ) -> Iterable[BuildingEntity]:
+        circle = SearchCircle(latitude=latitude, longitude=longitude, radius=radius_meters)
+        return [self.catalog.building(row) for row in self.catalog.buildings_within(circle)]
+
+    async def filter_by_bounding_box(
+        self,
+        lat_min: float,
+        lat_max: float,
+        lon_min: float,
+        lon_max: float,
+    ) -> Iterable[BuildingEntity]:
+        bbox = SearchBoundingBox(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max)
+        return [self.catalog.building(row) for row in self.catalog.buildings_in_box(bbox)]
@@ -0,0 +1,310 @@
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import (
+    Callable,
+    Iterable,
+    Sequence,
+)
+from dataclasses import dataclass
+from datetime import datetime
+from statistics import fmean
+from typing import Any
+from uuid import UUID
+
+from infrastructure.snapshot.catalog import CatalogSnapshot
+from infrastructure.snapshot.catalog_file import from_microseconds
+
+from domain.base.entity import EntityVersion
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
+from domain.organization.entities import OrganizationEntity
+from domain.organization.exceptions import ReadOnlyCatalogException
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.read_models import (
+    ActivityFacet,
+    NearbyOrganization,
+    OrganizationChange,
+    OrganizationChangesPage,
+    OrganizationCluster,
+    OrganizationProjection,
+)
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+)
+from domain.organization.text import similarity
+from domain.organization.tiles import mercator_meters
+
+
+def _projections(catalog: CatalogSnapshot) -> dict[str, Callable[[int], Any]]:
+    """Значения полей проекции прямо из колонок снимка, без сборки
+    сущностей."""
+
+    def building(row: int) -> int:
+        return catalog.organization_buildings[row]
+
+    def activity_ids(row: int) -> list[UUID]:
+        return [catalog.activity_oids[activity] for activity in catalog.organization_activities[row]]
+
+    return {
+        "oid": lambda row: catalog.organization_oids[row],
+        "name": lambda row: catalog.organization_names[row],
+        "building_id": lambda row: catalog.building_oids[building(row)],
+        "address": lambda row: catalog.building_addresses[building(row)],
+        "latitude": lambda row: catalog.building_latitudes[building(row)],
+        "longitude": lambda row: catalog.building_longitudes[building(row)],
+        "phones": catalog.organization_phone_values,
+        "activity_ids": activity_ids,
+    }
+
+
+@dataclass
+class SnapshotOrganizationRepository(BaseOrganizationRepository):
+    """Организации из файла снимка: только чтение, порядок и фильтры — как
+    у SQL репозитория."""
+
+    catalog: CatalogSnapshot
+
+    async def add(self, organization: OrganizationEntity) -> None:
+        raise ReadOnlyCatalogException()
+
+    async def delete(self, organization_id: UUID) -> bool:
+        raise ReadOnlyCatalogException()
+
+    async def get_by_id(self, organization_id: UUID) -> OrganizationEntity | None:
+        row = self.catalog.organization_oids.index(organization_id)
+        return self.catalog.organization(row) if row is not None else None
+
+    async def get_version(self, organization_id: UUID) -> EntityVersion | None:
+        row = self.catalog.organization_oids.index(organization_id)
+        return self.catalog.organization_version(row) if row is not None else None
+
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationEntity]:
+        rows = (self.catalog.organization_oids.index(oid) for oid in set(organization_ids))
+        return self._entities(sorted(row for row in rows if row is not None))
+
+    async def get_by_name(self, name: str) -> Iterable[OrganizationEntity]:
+        return self._entities(self.catalog.select_organizations({"name": name}))
+
+    async def get_by_building_id(
+        self,
+        building_id: UUID,
+    ) -> Iterable[OrganizationEntity]:
+        return self._entities(self.catalog.select_organizations({"building_id": building_id}))
+
+    async def get_by_activity_name(
+        self,
+        activity_name: str,
+    ) -> Iterable[OrganizationEntity]:
+        return self._entities(self.catalog.select_organizations({"activity_names": [activity_name]}))
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationEntity]:
+        return self._entities(self._paginate(filters, page))
+
+    async def project(
+        self,
+        fields: tuple[str, ...],
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationProjection]:
+        projections = _projections(self.catalog)
+        circle = filters.get("within")
+        results = []
+        for row in self._paginate(filters, page):
+            values = {name: projections[name](row) for name in fields}
+            if circle is not None:
+                values["distance"] = self.catalog.organization_distance(circle, row)
+            results.append(
+                OrganizationProjection(
+                    oid=self.catalog.organization_oids[row],
+                    created_at=from_microseconds(self.catalog.organization_created_at[row]),
+                    values=values,
+                ),
+            )
+
+        return results
+
+    async def count(self, **filters: Any) -> int:
+        return len(self.catalog.select_organizations(filters))
+
+    async def estimate_count(self, **filters: Any) -> int:
+        # Подсчёт идёт по спискам смежности и так дёшево
+        return await self.count(**filters)
+
+    async def count_by_activity(self, **filters: Any) -> Iterable[ActivityFacet]:
+        catalog = self.catalog
+        direct: dict[int, int] = defaultdict(int)
+        subtree: dict[int, set[int]] = defaultdict(set)
+        for row in catalog.select_organizations(filters):
+            for activity in catalog.organization_activities[row]:
+                direct[activity] += 1
+                subtree[activity].add(row)
+                parent = catalog.activity_parents[activity]
+                if parent >= 0:
+                    subtree[parent].add(row)
+
+        facets = []
+        for activity, organizations in subtree.items():
+            parent = catalog.activity_parents[activity]
+            facets.append(
+                ActivityFacet(
+                    activity_id=catalog.activity_oids[activity],
+                    name=catalog.activity_names[activity],
+                    parent_id=catalog.activity_oids[parent] if parent >= 0 else None,
+                    organizations=direct[activity],
+                    subtree_organizations=len(organizations),
+                ),
+            )
+        return sorted(facets, key=lambda facet: (-facet.subtree_organizations, facet.name))
+
+    async def get_data_version(self) -> str:
+        return self.catalog.data_version
+
+    async def get_changes(
+        self,
+        limit: int,
+        since: datetime | None = None,
+        after: PageCursor | None = None,
+    ) -> OrganizationChangesPage:
+        # Снимок неизменяем: удалений и незавершённых транзакций в нём нет
+        if after is not None:
+            rows = self.catalog.organizations_changed_after(after.created_at, after.oid)
+        elif since is not None:
+            rows = self.catalog.organizations_changed_after(since, None)
+        else:
+            rows = self.catalog.organizations_changed_after(datetime.min, None)
+
+        changes = [
+            OrganizationChange(
+                oid=organization.oid,
+                changed_at=organization.updated_at,
+                organization=organization,
+            )
+            for organization in self._entities(rows[:limit])
+        ]
+        # Новее последнего изменения в снимке ничего не появится
+        version = self.catalog.data_version
+        return OrganizationChangesPage(
+            changes=changes,
+            until=datetime.fromisoformat(version) if version else datetime.min,
+        )
+
+    async def cluster_by_bounding_box(
+        self,
+        lat_min: float,
+        lat_max: float,
+        lon_min: float,
+        lon_max: float,
+        grid_size: float | None,
+    ) -> Iterable[OrganizationCluster]:
+        catalog = self.catalog
+        bbox = SearchBoundingBox(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max)
+        cells: dict[Any, list[int]] = defaultdict(list)
+        for building in catalog.buildings_in_box(bbox):
+            organizations = len(catalog.building_organizations[building])
+            if not organizations:
+                continue
+
+            if grid_size is None:
+                cell = building
+            else:
+                # Как ST_SnapToGrid: ближайший узел сетки в метрах EPSG:3857
+                x, y = mercator_meters(catalog.building_latitudes[building], catalog.building_longitudes[building])
+                cell = (round(x / grid_size), round(y / grid_size))
+            # Здание входит в кластер столько раз, сколько в нём организаций
+            cells[cell].extend([building] * organizations)
+
+        clusters = []
+        for buildings in cells.values():
+            building_ids = set(buildings)
+            clusters.append(
+                OrganizationCluster(
+                    latitude=fmean(catalog.building_latitudes[building] for building in buildings),
+                    longitude=fmean(catalog.building_longitudes[building] for building in buildings),
+                    organizations=len(buildings),
+                    building_id=catalog.building_oids[building_ids.pop()] if len(building_ids) == 1 else None,
+                ),
+            )
+        return clusters
+
+    async def get_nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        activity_names: Iterable[str] | None = None,
+    ) -> Iterable[NearbyOrganization]:
+        catalog = self.catalog
+        rows = None if activity_names is None else set(catalog.select_organizations({"activity_names": activity_names}))
+        return [
+            NearbyOrganization(organization=catalog.organization(row), distance=distance)
+            for distance, row in catalog.nearest_organizations(latitude, longitude, limit, rows)
+        ]
+
+    async def get_near_points(
+        self,
+        points: Sequence[SearchCircle],
+        limit: int,
+        activity_name: str | None = None,
+    ) -> list[list[NearbyOrganization]]:
+        results = []
+        for point in points:
+            filters: dict[str, Any] = {"within": point}
+            if activity_name is not None:
+                filters["activity_subtree"] = activity_name
+
+            rows = sorted(self.catalog.select_organizations(filters), key=self._sort_key(filters))[:limit]
+            results.append(
+                [
+                    NearbyOrganization(
+                        organization=self.catalog.organization(row),
+                        distance=self.catalog.organization_distance(point, row),
+                    )
+                    for row in rows
+                ],
+            )
+        return results
+
+    def _entities(self, rows: Iterable[int]) -> list[OrganizationEntity]:
+        return [self.catalog.organization(row) for row in rows]
+
+    def _sort_key(self, filters: dict[str, Any]) -> Callable[[int], tuple[float, bytes]] | None:
+        """Как ``organization_sort_key`` SQL репозитория: расстояние при
+        ``within``, сходство названия при ``text``, иначе порядок строк."""
+        catalog = self.catalog
+
+        circle = filters.get("within")
+        if circle is not None:
+            return lambda row: (catalog.organization_distance(circle, row), catalog.organization_oids.key(row))
+
+        text = filters.get("text")
+        if text is not None:
+            return lambda row: (-similarity(catalog.organization_names[row], text), catalog.organization_oids.key(row))
+
+        return None
+
+    def _paginate(self, filters: dict[str, Any], page: PageRequest | None) -> Sequence[int]:
+        rows = self.catalog.select_organizations(filters)
+        key = self._sort_key(filters)
+        if key is None:
+            return self.catalog.page_organizations(rows, page)
+
+        ordered = sorted(rows, key=key)
+        if page is None:
+            return ordered
+
+        if page.after is not None:
+            anchor = self.catalog.organization_oids.index(page.after.oid)
+            if anchor is None:
+                # В SQL ключ отсутствующего якоря — NULL, сравнение ложно
+                return []
+            start = bisect_right(ordered, key(anchor), key=key)
+            return ordered[start : start + page.limit]
+
+        return ordered[page.offset : page.offset + page.limit]
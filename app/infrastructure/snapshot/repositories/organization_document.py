@@ -0,0 +1,58 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+import orjson
+from infrastructure.database.converters.organization_document import organization_entity_to_document
+
+from domain.base.pagination import PageRequest
+from domain.organization.exceptions import ReadOnlyCatalogException
+from domain.organization.geo import organization_distance
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
+from domain.organization.read_models import OrganizationDocument
+
+
+@dataclass
+class SnapshotOrganizationDocumentRepository(BaseOrganizationDocumentRepository):
+    """Документы собираются из сущностей снимка при чтении: снимок
+    неизменяем, поэтому хранить их отдельно незачем."""
+
+    organization_repository: BaseOrganizationRepository
+
+    async def get_by_ids(self, organization_ids: Iterable[UUID]) -> Iterable[OrganizationDocument]:
+        organizations = await self.organization_repository.get_by_ids(organization_ids)
+        return [organization_entity_to_document(organization) for organization in organizations]
+
+    async def filter(
+        self,
+        page: PageRequest | None = None,
+        **filters: Any,
+    ) -> Iterable[OrganizationDocument]:
+        organizations = await self.organization_repository.filter(page=page, **filters)
+
+        circle = filters.get("within")
+        if circle is None:
+            return [organization_entity_to_document(organization) for organization in organizations]
+
+        documents = []
+        for organization in organizations:
+            document = organization_entity_to_document(organization)
+            content = {**orjson.loads(document.content), "distance": organization_distance(circle, organization)}
+            documents.append(
+                OrganizationDocument(
+                    oid=document.oid,
+                    created_at=document.created_at,
+                    updated_at=document.updated_at,
+                    content=orjson.dumps(content),
+                ),
+            )
+        return documents
+
+    async def rebuild(self, organization_ids: Iterable[UUID] | None = None) -> int:
+        raise ReadOnlyCatalogException()
+
+    async def find_inconsistent(self) -> list[UUID]:
+        # Документы всегда собираются из тех же данных
+        return []
@@ -0,0 +1,66 @@
+import hashlib
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from fastapi import (
+    Header,
+    status,
+)
+from fastapi.responses import Response
+
+from domain.base.entity import EntityVersion
+
+
+def entity_etag(version: EntityVersion) -> str:
+    """Сильный ETag версии сущности: хэш ``oid`` и ``updated_at``."""
+    digest = hashlib.blake2b(f"{version.oid}:{version.updated_at.isoformat()}".encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Слабое сравнение ``If-None-Match`` (RFC 9110, 13.1.2): префикс
+    ``W/`` не учитывается, поэтому совпадает и ETag, ослабленный при
+    сжатии ответа."""
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(tag.strip().removeprefix("W/") == etag.removeprefix("W/") for tag in if_none_match.split(","))
+
+
+@dataclass(frozen=True)
+class ConditionalGet:
+    """Условный GET одного ресурса.
+
+    Обработчик сначала проверяет ``is_not_modified`` по дешевой версии
+    из репозитория и отвечает 304 без загрузки сущности; иначе строит
+    ответ и проставляет ``ETag`` и ``Cache-Control`` через ``apply``.
+
+    """
+
+    if_none_match: str | None
+    cache_control: str
+
+    def is_not_modified(self, version: EntityVersion | None) -> bool:
+        if self.if_none_match is None or version is None:
+            return False
+
+        return etag_matches(self.if_none_match, entity_etag(version))
+
+    def not_modified(self, version: EntityVersion) -> Response:
+        return self.apply(Response(status_code=status.HTTP_304_NOT_MODIFIED), version)
+
+    def apply(self, response: Response, version: EntityVersion) -> Response:
+        response.headers["ETag"] = entity_etag(version)
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+
+def conditional_get(cache_control: str) -> Callable[..., ConditionalGet]:
+    """Dependency условного GET с политикой ``Cache-Control`` маршрута."""
+
+    def dependency(
+        if_none_match: str | None = Header(None, description="ETag из предыдущего ответа"),
+    ) -> ConditionalGet:
+        return ConditionalGet(if_none_match=if_none_match, cache_control=cache_control)
+
+    return dependency
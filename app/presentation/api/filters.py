@@ -1,15 +1,66 @@
+from collections.abc import Iterable
+
 from pydantic import (
     BaseModel,
     Field,
 )
 
+from domain.base.entity import BaseEntity
+from domain.base.pagination import (
+    PageCursor,
+    TotalMode,
+)
+from domain.organization.read_models import OrganizationDocument
+
+
+MAX_PAGE_SIZE = 100
+
 
 class PaginationOut(BaseModel):
     limit: int
     offset: int
-    total: int
+    total: int | None
+    total_mode: TotalMode = TotalMode.EXACT
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_page(
+        cls,
+        pagination: "PaginationIn",
+        items: Iterable[BaseEntity | OrganizationDocument],
+        total: int | None,
+    ) -> "PaginationOut":
+        """Курсор следующей страницы строится по последнему элементу."""
+        items = list(items)
+        next_cursor = None
+
+        has_more = len(items) == pagination.limit
+        if pagination.cursor is None and pagination.total == TotalMode.EXACT and total is not None:
+            has_more = has_more and pagination.offset + len(items) < total
+
+        if items and has_more:
+            next_cursor = PageCursor.from_entity(items[-1]).encode()
+
+        return cls(
+            limit=pagination.limit,
+            offset=pagination.offset,
+            total=total,
+            total_mode=pagination.total,
+            next_cursor=next_cursor,
+        )
 
 
 class PaginationIn(BaseModel):
-    limit: int = Field(default=10)
-    offset: int = Field(default=0)
+    limit: int = Field(default=10, ge=1, le=MAX_PAGE_SIZE)
+    offset: int = Field(default=0, ge=0)
+    cursor: str | None = Field(
+        default=None,
+        description="Курсор из pagination.next_cursor предыдущей страницы (offset игнорируется)",
+    )
+    total: TotalMode = Field(
+        default=TotalMode.EXACT,
+        description=(
+            "Подсчёт total: exact — точный, estimate — приблизительный"
+            " (точный до порога, выше — оценка планировщика), none — не считать"
+        ),
+    )
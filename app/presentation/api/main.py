@@ -1,9 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from infrastructure.logging.logger import setup_logging
 from presentation.api.exceptions import setup_exception_handlers
 from presentation.api.healthcheck import healthcheck_router
-from presentation.api.middleware import setup_cors
+from presentation.api.middleware import (
+    setup_batch_loaders,
+    setup_compression,
+    setup_cors,
+)
 from presentation.api.v1 import v1_router
 
 from settings import config
@@ -15,10 +20,15 @@ def create_app() -> FastAPI:
         description="Organization Catalog DDD",
         docs_url="/api/docs",
         debug=True,
+        default_response_class=ORJSONResponse,
     )
 
     setup_cors(app)
 
+    setup_compression(app)
+
+    setup_batch_loaders(app)
+
     setup_logging(config)
 
     setup_exception_handlers(app)
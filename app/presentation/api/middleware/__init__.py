@@ -1,4 +1,6 @@
+from presentation.api.middleware.batch_loaders import setup_batch_loaders
+from presentation.api.middleware.compression import setup_compression
 from presentation.api.middleware.cors import setup_cors
 
 
-__all__ = ["setup_cors"]
+__all__ = ["setup_batch_loaders", "setup_compression", "setup_cors"]
@@ -0,0 +1,29 @@
+from fastapi import FastAPI
+from starlette.types import (
+    ASGIApp,
+    Receive,
+    Scope,
+    Send,
+)
+
+from infrastructure.database.loaders import batch_loader_scope
+
+
+class BatchLoaderScopeMiddleware:
+    """Открывает область batch loaders репозиториев на время HTTP запроса."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with batch_loader_scope():
+            await self.app(scope, receive, send)
+
+
+def setup_batch_loaders(app: FastAPI) -> None:
+    """Настройка request-scoped batch loaders для get_by_id репозиториев."""
+    app.add_middleware(BatchLoaderScopeMiddleware)
@@ -0,0 +1,261 @@
+import zlib
+from collections.abc import Callable
+
+from fastapi import FastAPI
+from starlette.datastructures import (
+    Headers,
+    MutableHeaders,
+)
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+import anyio
+
+from settings import config
+
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - опциональная зависимость
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - опциональная зависимость
+    brotli = None
+
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/geo+json",
+    "application/javascript",
+    "application/xml",
+    "application/vnd.mapbox-vector-tile",
+    "text/",
+)
+
+
+class GzipEncoder:
+    def __init__(self, level: int = 6) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Выталкивает накопленное, не закрывая поток (для streaming)."""
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int = 4) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int = 3) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+Encoder = GzipEncoder | BrotliEncoder | ZstdEncoder
+
+
+def available_encoders() -> dict[str, Callable[[], Encoder]]:
+    """Кодировки в порядке предпочтения сервера; zstd и brotli — только если
+    установлены ``zstandard`` / ``brotli``."""
+    encoders: dict[str, Callable[[], Encoder]] = {}
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    encoders["gzip"] = GzipEncoder
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, supported: tuple[str, ...]) -> str | None:
+    """Выбирает кодировку из ``Accept-Encoding`` с учетом q-значений; при
+    равных q побеждает порядок ``supported``."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding] = quality
+
+    candidates = [
+        (weights.get(coding, weights.get("*", 0.0)), -index, coding) for index, coding in enumerate(supported)
+    ]
+    quality, _, coding = max(candidates, default=(0.0, 0, None))
+    return coding if quality > 0 else None
+
+
+def _compress_all(encoder: Encoder, body: bytes) -> bytes:
+    return encoder.compress(body) + encoder.finish()
+
+
+def _compress_chunk(encoder: Encoder, chunk: bytes, more_body: bool) -> bytes:
+    compressed = encoder.compress(chunk)
+    return compressed + (encoder.flush() if more_body else encoder.finish())
+
+
+class CompressionMiddleware:
+    """Сжатие ответов zstd / brotli / gzip по ``Accept-Encoding``.
+
+    - тела меньше ``minimum_size`` отдаются как есть;
+    - streaming ответы сжимаются по мере поступления чанков (каждый
+      чанк выталкивается flush, клиент получает данные без ожидания
+      конца ответа);
+    - чанки от ``offload_size`` сжимаются в пуле потоков, чтобы не
+      блокировать event loop (zlib, zstd и brotli отпускают GIL).
+
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        offload_size: int = 256 * 1024,
+        encoders: dict[str, Callable[[], Encoder]] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.encoders = encoders if encoders is not None else available_encoders()
+        self._supported = tuple(self.encoders)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), self._supported)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    async def run_encoder(self, function: Callable[..., bytes], *args, size: int) -> bytes:
+        if size >= self.offload_size:
+            return await anyio.to_thread.run_sync(function, *args)
+
+        return function(*args)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream_send = send
+        self.start_message: Message | None = None
+        self.encoder: Encoder | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Ждем первый чанк тела: только по нему ясно, сжимать ли ответ
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.downstream_send(message)
+            return
+
+        if self.passthrough:
+            await self.downstream_send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is None:
+            if not self._should_compress(body, more_body):
+                self.passthrough = True
+                await self.downstream_send(self.start_message)
+                await self.downstream_send(message)
+                return
+
+            self.encoder = self.middleware.encoders[self.encoding]()
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            # Сжатые байты не совпадают с исходными — сильный ETag ослабляем
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+
+            if not more_body:
+                compressed = await self.middleware.run_encoder(_compress_all, self.encoder, body, size=len(body))
+                headers["Content-Length"] = str(len(compressed))
+                await self.downstream_send(self.start_message)
+                await self.downstream_send({"type": "http.response.body", "body": compressed})
+                return
+
+            del headers["Content-Length"]
+            await self.downstream_send(self.start_message)
+
+        compressed = await self.middleware.run_encoder(
+            _compress_chunk,
+            self.encoder,
+            body,
+            more_body,
+            size=len(body),
+        )
+        await self.downstream_send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        headers = Headers(raw=self.start_message["headers"])
+        if "content-encoding" in headers:
+            return False
+
+        content_type = headers.get("content-type", "")
+        if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return False
+
+        # Размер streaming ответа заранее неизвестен — сжимаем всегда
+        return more_body or len(body) >= self.middleware.minimum_size
+
+
+def setup_compression(app: FastAPI) -> None:
+    """Настройка сжатия ответов из конфига."""
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.compression_minimum_size,
+        offload_size=config.compression_offload_size,
+    )
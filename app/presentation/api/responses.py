@@ -0,0 +1,61 @@
+from typing import Any
+
+from fastapi.responses import Response
+
+import orjson
+from presentation.api.filters import PaginationOut
+
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+class RawJSONResponse(Response):
+    """Ответ из уже сериализованных orjson байт.
+
+    Возвращается напрямую из обработчика, поэтому FastAPI не
+    валидирует его повторно по ``response_model`` — схема остаётся
+    только для OpenAPI.
+
+    """
+
+    media_type = "application/json"
+
+
+def api_response(data: Any, status_code: int = 200) -> RawJSONResponse:
+    """Конверт ``ApiResponse`` из простых dict/list без pydantic моделей."""
+    return RawJSONResponse(
+        content=orjson.dumps({"data": data, "meta": {}, "errors": []}, option=ORJSON_OPTIONS),
+        status_code=status_code,
+    )
+
+
+def list_paginated_response(
+    items: list[dict[str, Any]],
+    pagination: PaginationOut,
+) -> RawJSONResponse:
+    """Конверт ``ApiResponse[ListPaginatedResponse]`` той же JSON формы."""
+    return api_response({"items": items, "pagination": pagination.model_dump()})
+
+
+def document_response(document: bytes) -> RawJSONResponse:
+    """Конверт ``ApiResponse`` вокруг готового JSON документа."""
+    return RawJSONResponse(content=b'{"data":' + document + b',"meta":{},"errors":[]}')
+
+
+def list_documents_response(
+    documents: list[bytes],
+    pagination: PaginationOut,
+) -> RawJSONResponse:
+    """Конверт ``ApiResponse[ListPaginatedResponse]`` из готовых JSON
+    документов: байты склеиваются без декодирования."""
+    return RawJSONResponse(
+        content=b"".join(
+            (
+                b'{"data":{"items":[',
+                b",".join(documents),
+                b'],"pagination":',
+                orjson.dumps(pagination.model_dump(), option=ORJSON_OPTIONS),
+                b'},"meta":{},"errors":[]}',
+            ),
+        ),
+    )
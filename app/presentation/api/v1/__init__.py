@@ -7,6 +7,8 @@ from presentation.api.dependencies import api_key_required
 from presentation.api.v1.activity.handlers import router as activity_router
 from presentation.api.v1.building.handlers import router as building_router
 from presentation.api.v1.organization.handlers import router as organization_router
+from presentation.api.v1.snapshot.handlers import router as snapshot_router
+from presentation.api.v1.tiles.handlers import router as tiles_router
 from presentation.api.v1.user.handlers import router as user_router
 
 
@@ -25,5 +27,13 @@ v1_router.include_router(
     building_router,
     dependencies=[Depends(api_key_required)],
 )
+v1_router.include_router(
+    tiles_router,
+    dependencies=[Depends(api_key_required)],
+)
+v1_router.include_router(
+    snapshot_router,
+    dependencies=[Depends(api_key_required)],
+)
 
 v1_router.include_router(user_router)
@@ -4,13 +4,22 @@ from fastapi import (
     APIRouter,
     Depends,
     Query,
+    Response,
     status,
 )
 
+from presentation.api.conditional import (
+    conditional_get,
+    ConditionalGet,
+)
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
 )
+from presentation.api.responses import (
+    list_paginated_response,
+    RawJSONResponse,
+)
 from presentation.api.schemas import (
     ApiResponse,
     ErrorSchema,
@@ -21,6 +30,7 @@ from presentation.api.v1.activity.schemas import (
     ActivityResponseSchema,
     CreateActivityRequestSchema,
 )
+from presentation.api.v1.activity.serializers import activity_response_to_dict
 
 from application.commands.activity import CreateActivityCommand
 from application.init import init_container
@@ -28,7 +38,10 @@ from application.mediator import Mediator
 from application.queries.activity import (
     GetActivitiesQuery,
     GetActivityByIdQuery,
+    GetActivityVersionQuery,
 )
+from domain.base.entity import EntityVersion
+from settings import config
 
 
 router = APIRouter(prefix="/activities", tags=["activities"])
@@ -69,6 +82,7 @@ async def create_activity(
     response_model=ApiResponse[ActivityDetailSchema],
     responses={
         status.HTTP_200_OK: {"model": ApiResponse[ActivityDetailSchema]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Вид деятельности не изменился с ETag из If-None-Match"},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
         status.HTTP_404_NOT_FOUND: {"model": ErrorSchema},
@@ -76,10 +90,18 @@ async def create_activity(
 )
 async def get_activity_by_id(
     activity_id: UUID,
+    response: Response,
+    conditional: ConditionalGet = Depends(conditional_get(config.activity_cache_control)),
     container=Depends(init_container),
-) -> ApiResponse[ActivityDetailSchema]:
-    """Получает вид деятельности по ID."""
+) -> ApiResponse[ActivityDetailSchema] | Response:
+    """Получает вид деятельности по ID (с ``If-None-Match`` — 304 без
+    загрузки, если версия не изменилась)."""
     mediator: Mediator = container.resolve(Mediator)
+    if conditional.if_none_match is not None:
+        version = await mediator.handle_query(GetActivityVersionQuery(activity_id=activity_id))
+        if conditional.is_not_modified(version):
+            return conditional.not_modified(version)
+
     query = GetActivityByIdQuery(activity_id=activity_id)
     activity = await mediator.handle_query(query)
 
@@ -89,6 +111,7 @@ async def get_activity_by_id(
             errors=[{"message": "Activity not found"}],
         )
 
+    conditional.apply(response, EntityVersion.from_entity(activity))
     return ApiResponse[ActivityDetailSchema](
         data=ActivityDetailSchema.from_entity(activity),
     )
@@ -111,7 +134,7 @@ async def get_activities(
     parent_id: UUID | None = Query(None, description="ID родительской деятельности"),
     pagination: PaginationIn = Depends(),
     container=Depends(init_container),
-) -> ApiResponse[ListPaginatedResponse[ActivityResponseSchema]]:
+) -> RawJSONResponse:
     """Получает список видов деятельности с фильтрацией."""
     mediator: Mediator = container.resolve(Mediator)
     query = GetActivitiesQuery(
@@ -119,18 +142,12 @@ async def get_activities(
         parent_id=parent_id,
         limit=pagination.limit,
         offset=pagination.offset,
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
     )
     activities, total = await mediator.handle_query(query)
 
-    items = [ActivityResponseSchema.from_entity(activity) for activity in activities]
-
-    return ApiResponse[ListPaginatedResponse[ActivityResponseSchema]](
-        data=ListPaginatedResponse[ActivityResponseSchema](
-            items=items,
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
-            ),
-        ),
+    return list_paginated_response(
+        items=[activity_response_to_dict(activity) for activity in activities],
+        pagination=PaginationOut.from_page(pagination, activities, total),
     )
@@ -0,0 +1,12 @@
+from typing import Any
+
+from domain.organization.entities import ActivityEntity
+
+
+def activity_response_to_dict(entity: ActivityEntity) -> dict[str, Any]:
+    """Форма ``ActivityResponseSchema`` без построения pydantic модели."""
+    return {
+        "oid": entity.oid,
+        "name": entity.name.as_generic_type(),
+        "parent_id": entity.parent.oid if entity.parent else None,
+    }
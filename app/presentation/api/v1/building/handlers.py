@@ -4,9 +4,14 @@ from fastapi import (
     APIRouter,
     Depends,
     Query,
+    Response,
     status,
 )
 
+from presentation.api.conditional import (
+    conditional_get,
+    ConditionalGet,
+)
 from presentation.api.schemas import (
     ApiResponse,
     ErrorSchema,
@@ -23,7 +28,10 @@ from application.mediator import Mediator
 from application.queries.building import (
     GetBuildingByAddressQuery,
     GetBuildingByIdQuery,
+    GetBuildingVersionQuery,
 )
+from domain.base.entity import EntityVersion
+from settings import config
 
 
 router = APIRouter(prefix="/buildings", tags=["buildings"])
@@ -96,6 +104,7 @@ async def get_building_by_address(
     response_model=ApiResponse[BuildingDetailSchema],
     responses={
         status.HTTP_200_OK: {"model": ApiResponse[BuildingDetailSchema]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Здание не изменилось с ETag из If-None-Match"},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
         status.HTTP_404_NOT_FOUND: {"model": ErrorSchema},
@@ -103,10 +112,22 @@ async def get_building_by_address(
 )
 async def get_building_by_id(
     building_id: UUID,
+    response: Response,
+    conditional: ConditionalGet = Depends(conditional_get(config.building_cache_control)),
     container=Depends(init_container),
-) -> ApiResponse[BuildingDetailSchema]:
-    """Получает здание по ID."""
+) -> ApiResponse[BuildingDetailSchema] | Response:
+    """Получает здание по ID.
+
+    С ``If-None-Match`` сначала сверяется версия здания и при совпадении
+    возвращается 304 без загрузки.
+
+    """
     mediator: Mediator = container.resolve(Mediator)
+    if conditional.if_none_match is not None:
+        version = await mediator.handle_query(GetBuildingVersionQuery(building_id=building_id))
+        if conditional.is_not_modified(version):
+            return conditional.not_modified(version)
+
     query = GetBuildingByIdQuery(building_id=building_id)
     building = await mediator.handle_query(query)
 
@@ -116,6 +137,7 @@ async def get_building_by_id(
             errors=[{"message": "Building not found"}],
         )
 
+    conditional.apply(response, EntityVersion.from_entity(building))
     return ApiResponse[BuildingDetailSchema](
         data=BuildingDetailSchema.from_entity(building),
     )
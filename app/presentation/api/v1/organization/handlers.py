@@ -1,41 +1,159 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import (
     APIRouter,
     Depends,
+    HTTPException,
     Query,
+    Response,
     status,
 )
 
+from presentation.api.conditional import (
+    conditional_get,
+    ConditionalGet,
+)
 from presentation.api.filters import (
     PaginationIn,
     PaginationOut,
 )
+from presentation.api.responses import (
+    api_response,
+    document_response,
+    list_documents_response,
+    list_paginated_response,
+    RawJSONResponse,
+)
 from presentation.api.schemas import (
     ApiResponse,
     ErrorSchema,
     ListPaginatedResponse,
 )
 from presentation.api.v1.organization.schemas import (
+    ActivityFacetsSchema,
     CreateOrganizationRequestSchema,
+    MAX_NEAREST,
+    NearbyOrganizationCompactSchema,
+    NearbyOrganizationSchema,
+    NearbyOrganizationsSchema,
+    NearPointsRequestSchema,
+    NearPointsSchema,
+    OrganizationChangesSchema,
+    OrganizationClustersSchema,
+    OrganizationCompactSchema,
     OrganizationDetailSchema,
+    OrganizationPolygonSearchRequestSchema,
+    OrganizationRepresentationIn,
+)
+from presentation.api.v1.organization.serializers import (
+    activity_facet_to_dict,
+    nearby_organization_to_dict,
+    organization_change_to_dict,
+    organization_cluster_to_dict,
+    organization_detail_to_dict,
 )
 
-from application.commands.organization import CreateOrganizationCommand
+from application.commands.organization import (
+    CreateOrganizationCommand,
+    DeleteOrganizationCommand,
+)
 from application.init import init_container
 from application.mediator import Mediator
 from application.queries.organization import (
-    GetOrganizationByIdQuery,
+    GetActivityFacetsQuery,
+    GetNearestOrganizationsQuery,
+    GetOrganizationChangesQuery,
+    GetOrganizationClustersByRectangleQuery,
+    GetOrganizationDocumentsByIdsQuery,
     GetOrganizationsByActivityQuery,
     GetOrganizationsByAddressQuery,
     GetOrganizationsByNameQuery,
     GetOrganizationsByRadiusQuery,
     GetOrganizationsByRectangleQuery,
+    GetOrganizationsNearPointsQuery,
+    GetOrganizationVersionQuery,
+    SearchOrganizationsQuery,
+)
+from domain.base.entity import EntityVersion
+from domain.base.pagination import PageCursor
+from domain.organization.read_models import (
+    OrganizationDocument,
+    OrganizationProjection,
+)
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+    SearchPolygon,
+)
+from domain.organization.tiles import (
+    CLUSTER_MAX_ZOOM,
+    MAX_TILE_ZOOM,
 )
+from settings import config
 
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
 
+MAX_BATCH_IDS = 100
+MAX_CHANGES = 1000
+
+OrganizationListResponse = ApiResponse[ListPaginatedResponse[OrganizationDetailSchema | OrganizationCompactSchema]]
+NearbyOrganizationListResponse = ApiResponse[
+    ListPaginatedResponse[NearbyOrganizationSchema | NearbyOrganizationCompactSchema]
+]
+
+
+def _organizations_page_response(
+    organizations: list[OrganizationDocument | OrganizationProjection],
+    pagination: PaginationOut,
+) -> RawJSONResponse:
+    """Документы отдаются готовыми байтами, проекции сериализуются
+    orjson."""
+    if organizations and isinstance(organizations[0], OrganizationProjection):
+        return list_paginated_response(
+            items=[organization.values for organization in organizations],
+            pagination=pagination,
+        )
+
+    return list_documents_response(
+        documents=[document.content for document in organizations],
+        pagination=pagination,
+    )
+
+
+def _search_area(
+    latitude: float | None,
+    longitude: float | None,
+    radius: float | None,
+    lat_min: float | None,
+    lat_max: float | None,
+    lon_min: float | None,
+    lon_max: float | None,
+) -> tuple[SearchCircle | None, SearchBoundingBox | None]:
+    """Круг и прямоугольник из query параметров; параметры каждой
+    области передаются все вместе или не передаются."""
+    circle_params = (latitude, longitude, radius)
+    box_params = (lat_min, lat_max, lon_min, lon_max)
+    if any(value is not None for value in circle_params) and None in circle_params:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'latitude', 'longitude' and 'radius' must be passed together",
+        )
+    if any(value is not None for value in box_params) and None in box_params:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'lat_min', 'lat_max', 'lon_min' and 'lon_max' must be passed together",
+        )
+
+    circle = SearchCircle(latitude=latitude, longitude=longitude, radius=radius) if radius is not None else None
+    bounding_box = (
+        SearchBoundingBox(lat_min=lat_min, lat_max=lat_max, lon_min=lon_min, lon_max=lon_max)
+        if lat_min is not None
+        else None
+    )
+    return circle, bounding_box
+
 
 @router.post(
     "",
@@ -51,7 +169,7 @@ router = APIRouter(prefix="/organizations", tags=["organizations"])
 async def create_organization(
     request: CreateOrganizationRequestSchema,
     container=Depends(init_container),
-) -> ApiResponse[OrganizationDetailSchema]:
+) -> RawJSONResponse:
     """Создает новую организацию."""
     mediator: Mediator = container.resolve(Mediator)
     command = CreateOrganizationCommand(
@@ -63,58 +181,79 @@ async def create_organization(
     results = await mediator.handle_command(command)
     organization = results[0]
 
-    return ApiResponse[OrganizationDetailSchema](
-        data=OrganizationDetailSchema.from_entity(organization),
-    )
+    return api_response(organization_detail_to_dict(organization), status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
-    response_model=ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+    response_model=OrganizationListResponse,
     responses={
         status.HTTP_200_OK: {
-            "model": ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+            "model": OrganizationListResponse,
         },
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
     },
 )
 async def get_organizations_by_name(
-    name: str = Query(..., description="Название организации"),
+    name: str | None = Query(None, description="Название организации"),
+    ids: list[UUID] | None = Query(
+        None,
+        description=f"Пакетное получение по списку ID (до {MAX_BATCH_IDS})",
+        max_length=MAX_BATCH_IDS,
+    ),
     pagination: PaginationIn = Depends(),
+    representation: OrganizationRepresentationIn = Depends(),
     container=Depends(init_container),
-) -> ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]]:
-    """Поиск организаций по названию."""
+) -> RawJSONResponse:
+    """Поиск организаций по названию или пакетное получение по списку ID."""
     mediator: Mediator = container.resolve(Mediator)
+
+    if ids:
+        documents = await mediator.handle_query(
+            GetOrganizationDocumentsByIdsQuery(organization_ids=tuple(ids)),
+        )
+
+        return list_documents_response(
+            documents=[document.content for document in documents],
+            pagination=PaginationOut(
+                limit=len(ids),
+                offset=0,
+                total=len(documents),
+            ),
+        )
+
+    if name is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either 'name' or 'ids' query parameter is required",
+        )
+
     query = GetOrganizationsByNameQuery(
         name=name,
         limit=pagination.limit,
         offset=pagination.offset,
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
+        as_documents=True,
+        fields=representation.projection_fields(),
     )
     organizations, total = await mediator.handle_query(query)
 
-    items = [OrganizationDetailSchema.from_entity(org) for org in organizations]
-
-    return ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]](
-        data=ListPaginatedResponse[OrganizationDetailSchema](
-            items=items,
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
-            ),
-        ),
+    return _organizations_page_response(
+        organizations,
+        PaginationOut.from_page(pagination, organizations, total),
     )
 
 
 @router.get(
     "/by-address",
     status_code=status.HTTP_200_OK,
-    response_model=ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+    response_model=OrganizationListResponse,
     responses={
         status.HTTP_200_OK: {
-            "model": ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+            "model": OrganizationListResponse,
         },
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
@@ -123,39 +262,35 @@ async def get_organizations_by_name(
 async def get_organizations_by_address(
     address: str = Query(..., description="Адрес здания"),
     pagination: PaginationIn = Depends(),
+    representation: OrganizationRepresentationIn = Depends(),
     container=Depends(init_container),
-) -> ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]]:
+) -> RawJSONResponse:
     """Список организаций по адресу."""
     mediator: Mediator = container.resolve(Mediator)
     query = GetOrganizationsByAddressQuery(
         address=address,
         limit=pagination.limit,
         offset=pagination.offset,
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
+        as_documents=True,
+        fields=representation.projection_fields(),
     )
     organizations, total = await mediator.handle_query(query)
-    organizations_list = list(organizations)
-
-    items = [OrganizationDetailSchema.from_entity(org) for org in organizations_list]
 
-    return ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]](
-        data=ListPaginatedResponse[OrganizationDetailSchema](
-            items=items,
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
-            ),
-        ),
+    return _organizations_page_response(
+        organizations,
+        PaginationOut.from_page(pagination, organizations, total),
     )
 
 
 @router.get(
     "/by-activity",
     status_code=status.HTTP_200_OK,
-    response_model=ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+    response_model=OrganizationListResponse,
     responses={
         status.HTTP_200_OK: {
-            "model": ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+            "model": OrganizationListResponse,
         },
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
@@ -164,38 +299,35 @@ async def get_organizations_by_address(
 async def get_organizations_by_activity(
     activity_name: str = Query(..., description="Название вида деятельности"),
     pagination: PaginationIn = Depends(),
+    representation: OrganizationRepresentationIn = Depends(),
     container=Depends(init_container),
-) -> ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]]:
+) -> RawJSONResponse:
     """Поиск организаций по виду деятельности."""
     mediator: Mediator = container.resolve(Mediator)
     query = GetOrganizationsByActivityQuery(
         activity_name=activity_name,
         limit=pagination.limit,
         offset=pagination.offset,
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
+        as_documents=True,
+        fields=representation.projection_fields(),
     )
     organizations, total = await mediator.handle_query(query)
 
-    items = [OrganizationDetailSchema.from_entity(org) for org in organizations]
-
-    return ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]](
-        data=ListPaginatedResponse[OrganizationDetailSchema](
-            items=items,
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
-            ),
-        ),
+    return _organizations_page_response(
+        organizations,
+        PaginationOut.from_page(pagination, organizations, total),
     )
 
 
 @router.get(
     "/by-radius",
     status_code=status.HTTP_200_OK,
-    response_model=ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+    response_model=NearbyOrganizationListResponse,
     responses={
         status.HTTP_200_OK: {
-            "model": ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+            "model": NearbyOrganizationListResponse,
         },
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
@@ -206,9 +338,15 @@ async def get_organizations_by_radius(
     longitude: float = Query(..., description="Долгота центральной точки"),
     radius: float = Query(..., description="Радиус поиска в метрах"),
     pagination: PaginationIn = Depends(),
+    representation: OrganizationRepresentationIn = Depends(),
     container=Depends(init_container),
-) -> ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]]:
-    """Поиск организаций в заданном радиусе."""
+) -> RawJSONResponse:
+    """Поиск организаций в заданном радиусе.
+
+    Организации упорядочены по расстоянию от центра (``distance`` в
+    метрах), при равенстве — по ``oid``, поэтому страницы стабильны.
+
+    """
     mediator: Mediator = container.resolve(Mediator)
     query = GetOrganizationsByRadiusQuery(
         latitude=latitude,
@@ -216,30 +354,26 @@ async def get_organizations_by_radius(
         radius=radius,
         limit=pagination.limit,
         offset=pagination.offset,
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
+        as_documents=True,
+        fields=representation.projection_fields(),
     )
     organizations, total = await mediator.handle_query(query)
 
-    items = [OrganizationDetailSchema.from_entity(org) for org in organizations]
-
-    return ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]](
-        data=ListPaginatedResponse[OrganizationDetailSchema](
-            items=items,
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
-            ),
-        ),
+    return _organizations_page_response(
+        organizations,
+        PaginationOut.from_page(pagination, organizations, total),
     )
 
 
 @router.get(
     "/by-rectangle",
     status_code=status.HTTP_200_OK,
-    response_model=ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+    response_model=OrganizationListResponse,
     responses={
         status.HTTP_200_OK: {
-            "model": ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]],
+            "model": OrganizationListResponse,
         },
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
@@ -251,8 +385,9 @@ async def get_organizations_by_rectangle(
     lon_min: float = Query(..., description="Минимальная долгота"),
     lon_max: float = Query(..., description="Максимальная долгота"),
     pagination: PaginationIn = Depends(),
+    representation: OrganizationRepresentationIn = Depends(),
     container=Depends(init_container),
-) -> ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]]:
+) -> RawJSONResponse:
     """Поиск организаций в прямоугольной области."""
     mediator: Mediator = container.resolve(Mediator)
     query = GetOrganizationsByRectangleQuery(
@@ -262,20 +397,326 @@ async def get_organizations_by_rectangle(
         lon_max=lon_max,
         limit=pagination.limit,
         offset=pagination.offset,
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
+        as_documents=True,
+        fields=representation.projection_fields(),
     )
     organizations, total = await mediator.handle_query(query)
 
-    items = [OrganizationDetailSchema.from_entity(org) for org in organizations]
+    return _organizations_page_response(
+        organizations,
+        PaginationOut.from_page(pagination, organizations, total),
+    )
 
-    return ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]](
-        data=ListPaginatedResponse[OrganizationDetailSchema](
-            items=items,
-            pagination=PaginationOut(
-                limit=pagination.limit,
-                offset=pagination.offset,
-                total=total,
-            ),
+
+@router.post(
+    "/by-polygon",
+    status_code=status.HTTP_200_OK,
+    response_model=OrganizationListResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "model": OrganizationListResponse,
+        },
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_organizations_by_polygon(
+    request: OrganizationPolygonSearchRequestSchema,
+    pagination: PaginationIn = Depends(),
+    representation: OrganizationRepresentationIn = Depends(),
+    container=Depends(init_container),
+) -> RawJSONResponse:
+    """Поиск организаций в области произвольной формы (GeoJSON Polygon
+    или MultiPolygon).
+
+    Многоугольник передаётся в теле запроса — в query string он не
+    помещается. Слишком детальные границы упрощаются на сервере.
+
+    """
+    mediator: Mediator = container.resolve(Mediator)
+    query = SearchOrganizationsQuery(
+        limit=pagination.limit,
+        offset=pagination.offset,
+        name=request.name,
+        activity_name=request.activity,
+        polygon=SearchPolygon.from_geojson(request.geometry.model_dump()),
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
+        as_documents=True,
+        fields=representation.projection_fields(),
+    )
+    organizations, total = await mediator.handle_query(query)
+
+    return _organizations_page_response(
+        organizations,
+        PaginationOut.from_page(pagination, organizations, total),
+    )
+
+
+@router.get(
+    "/by-rectangle/clusters",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[OrganizationClustersSchema],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[OrganizationClustersSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_organization_clusters_by_rectangle(
+    lat_min: float = Query(..., description="Минимальная широта"),
+    lat_max: float = Query(..., description="Максимальная широта"),
+    lon_min: float = Query(..., description="Минимальная долгота"),
+    lon_max: float = Query(..., description="Максимальная долгота"),
+    zoom: int = Query(..., ge=0, le=MAX_TILE_ZOOM, description="Масштаб карты"),
+    container=Depends(init_container),
+) -> RawJSONResponse:
+    """Кластеры организаций в прямоугольной области.
+
+    На мелком масштабе организации группируются по сетке, на крупном
+    (от ``CLUSTER_MAX_ZOOM``) каждая точка — отдельное здание.
+
+    """
+    mediator: Mediator = container.resolve(Mediator)
+    query = GetOrganizationClustersByRectangleQuery(
+        lat_min=lat_min,
+        lat_max=lat_max,
+        lon_min=lon_min,
+        lon_max=lon_max,
+        zoom=zoom,
+    )
+    clusters = await mediator.handle_query(query)
+
+    return api_response(
+        {
+            "items": [organization_cluster_to_dict(cluster) for cluster in clusters],
+            "clustered": zoom < CLUSTER_MAX_ZOOM,
+        },
+    )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    response_model=OrganizationListResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "model": OrganizationListResponse,
+        },
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def search_organizations(
+    name: str | None = Query(None, description="Подстрока названия; результаты ранжируются по сходству"),
+    activity: str | None = Query(None, description="Вид деятельности (включая вложенные)"),
+    address: str | None = Query(None, description="Подстрока адреса здания"),
+    latitude: float | None = Query(None, ge=-90, le=90, description="Широта центра круга"),
+    longitude: float | None = Query(None, ge=-180, le=180, description="Долгота центра круга"),
+    radius: float | None = Query(None, gt=0, description="Радиус круга в метрах"),
+    lat_min: float | None = Query(None, description="Минимальная широта области"),
+    lat_max: float | None = Query(None, description="Максимальная широта области"),
+    lon_min: float | None = Query(None, description="Минимальная долгота области"),
+    lon_max: float | None = Query(None, description="Максимальная долгота области"),
+    pagination: PaginationIn = Depends(),
+    representation: OrganizationRepresentationIn = Depends(),
+    container=Depends(init_container),
+) -> RawJSONResponse:
+    """Поиск организаций по любому сочетанию критериев (через AND).
+
+    Все критерии проверяются в одном SQL запросе вместе с пагинацией.
+    Порядок: по расстоянию (``distance`` в ответе), если задан круг,
+    иначе по сходству названия, если задан ``name``, иначе по дате
+    создания.
+
+    """
+    circle, bounding_box = _search_area(latitude, longitude, radius, lat_min, lat_max, lon_min, lon_max)
+
+    mediator: Mediator = container.resolve(Mediator)
+    query = SearchOrganizationsQuery(
+        limit=pagination.limit,
+        offset=pagination.offset,
+        name=name,
+        activity_name=activity,
+        address=address,
+        circle=circle,
+        bounding_box=bounding_box,
+        cursor=pagination.cursor,
+        total_mode=pagination.total,
+        as_documents=True,
+        fields=representation.projection_fields(),
+    )
+    organizations, total = await mediator.handle_query(query)
+
+    return _organizations_page_response(
+        organizations,
+        PaginationOut.from_page(pagination, organizations, total),
+    )
+
+
+@router.get(
+    "/facets",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[ActivityFacetsSchema],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[ActivityFacetsSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_activity_facets(
+    name: str | None = Query(None, description="Подстрока названия"),
+    address: str | None = Query(None, description="Подстрока адреса здания"),
+    building_id: UUID | None = Query(None, description="Здание"),
+    latitude: float | None = Query(None, ge=-90, le=90, description="Широта центра круга"),
+    longitude: float | None = Query(None, ge=-180, le=180, description="Долгота центра круга"),
+    radius: float | None = Query(None, gt=0, description="Радиус круга в метрах"),
+    lat_min: float | None = Query(None, description="Минимальная широта области"),
+    lat_max: float | None = Query(None, description="Максимальная широта области"),
+    lon_min: float | None = Query(None, description="Минимальная долгота области"),
+    lon_max: float | None = Query(None, description="Максимальная долгота области"),
+    container=Depends(init_container),
+) -> RawJSONResponse:
+    """Число организаций по видам деятельности среди найденных.
+
+    Критерии — как у ``/search`` (через AND). Для каждого вида
+    деятельности — число организаций с ним самим и с ним или его детьми
+    (совпадает с ``total`` запроса ``/by-activity``). Считается одним
+    GROUP BY и кешируется по критериям до изменения данных.
+
+    """
+    circle, bounding_box = _search_area(latitude, longitude, radius, lat_min, lat_max, lon_min, lon_max)
+
+    mediator: Mediator = container.resolve(Mediator)
+    query = GetActivityFacetsQuery(
+        name=name,
+        address=address,
+        building_id=building_id,
+        circle=circle,
+        bounding_box=bounding_box,
+    )
+    facets = await mediator.handle_query(query)
+
+    return api_response({"items": [activity_facet_to_dict(facet) for facet in facets]})
+
+
+@router.get(
+    "/changes",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[OrganizationChangesSchema],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[OrganizationChangesSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_organization_changes(
+    since: datetime | None = Query(None, description="Начало потока (включительно), если нет курсора"),
+    cursor: str | None = Query(None, description="next_cursor предыдущего ответа"),
+    limit: int = Query(100, ge=1, le=MAX_CHANGES, description="Максимальное количество записей"),
+    container=Depends(init_container),
+) -> RawJSONResponse:
+    """Поток изменений каталога для инкрементальной синхронизации.
+
+    Созданные и изменённые организации (с документом) и удалённые
+    (``deleted``, без документа) по возрастанию времени изменения.
+    Реплика сохраняет ``next_cursor`` и продолжает с него; без
+    ``since`` и курсора поток начинается с начала каталога.
+
+    """
+    mediator: Mediator = container.resolve(Mediator)
+    page = await mediator.handle_query(GetOrganizationChangesQuery(limit=limit, since=since, cursor=cursor))
+    next_cursor = page.next_cursor(after=PageCursor.decode(cursor) if cursor else None, since=since)
+
+    return api_response(
+        {
+            "items": [organization_change_to_dict(change) for change in page.changes],
+            "next_cursor": next_cursor.encode(),
+            "has_more": len(page.changes) == limit,
+        },
+    )
+
+
+@router.get(
+    "/nearest",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[NearbyOrganizationsSchema],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[NearbyOrganizationsSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_nearest_organizations(
+    latitude: float = Query(..., ge=-90, le=90, description="Широта точки поиска"),
+    longitude: float = Query(..., ge=-180, le=180, description="Долгота точки поиска"),
+    k: int = Query(10, ge=1, le=MAX_NEAREST, description="Сколько ближайших организаций вернуть"),
+    activity: str | None = Query(None, description="Вид деятельности (включая вложенные)"),
+    container=Depends(init_container),
+) -> RawJSONResponse:
+    """Ближайшие к точке организации по возрастанию расстояния.
+
+    В отличие от ``/by-radius`` радиус угадывать не нужно: возвращается
+    ровно ``k`` организаций (если их столько есть) с расстоянием в
+    метрах.
+
+    """
+    mediator: Mediator = container.resolve(Mediator)
+    query = GetNearestOrganizationsQuery(
+        latitude=latitude,
+        longitude=longitude,
+        limit=k,
+        activity_name=activity,
+    )
+    organizations = await mediator.handle_query(query)
+
+    return api_response({"items": [nearby_organization_to_dict(nearby) for nearby in organizations]})
+
+
+@router.post(
+    "/near-points",
+    status_code=status.HTTP_200_OK,
+    response_model=ApiResponse[NearPointsSchema],
+    responses={
+        status.HTTP_200_OK: {"model": ApiResponse[NearPointsSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_organizations_near_points(
+    request: NearPointsRequestSchema,
+    container=Depends(init_container),
+) -> RawJSONResponse:
+    """Организации рядом с каждой из точек (например, точек маршрута).
+
+    Заменяет вызов ``/by-radius`` на каждую точку: все точки
+    обрабатываются одним SQL запросом. Результаты сгруппированы по
+    точкам в порядке запроса, внутри — по возрастанию расстояния.
+
+    """
+    mediator: Mediator = container.resolve(Mediator)
+    query = GetOrganizationsNearPointsQuery(
+        points=tuple(
+            SearchCircle(latitude=point.latitude, longitude=point.longitude, radius=point.radius)
+            for point in request.points
         ),
+        limit=request.limit,
+        activity_name=request.activity,
+    )
+    results = await mediator.handle_query(query)
+
+    return api_response(
+        {
+            "results": [
+                {
+                    "point": point.model_dump(),
+                    "items": [nearby_organization_to_dict(nearby) for nearby in organizations],
+                }
+                for point, organizations in zip(request.points, results, strict=True)
+            ],
+        },
     )
 
 
@@ -285,6 +726,7 @@ async def get_organizations_by_rectangle(
     response_model=ApiResponse[OrganizationDetailSchema],
     responses={
         status.HTTP_200_OK: {"model": ApiResponse[OrganizationDetailSchema]},
+        status.HTTP_304_NOT_MODIFIED: {"description": "Организация не изменилась с ETag из If-None-Match"},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
         status.HTTP_404_NOT_FOUND: {"model": ErrorSchema},
@@ -292,19 +734,52 @@ async def get_organizations_by_rectangle(
 )
 async def get_organization_by_id(
     organization_id: UUID,
+    conditional: ConditionalGet = Depends(conditional_get(config.organization_cache_control)),
     container=Depends(init_container),
-) -> ApiResponse[OrganizationDetailSchema]:
-    """Получает организацию по ID."""
+) -> ApiResponse[OrganizationDetailSchema] | Response:
+    """Получает организацию по ID.
+
+    С ``If-None-Match`` сначала сверяется версия организации (одна
+    строка по первичному ключу) и при совпадении возвращается 304 без
+    чтения документа.
+
+    """
     mediator: Mediator = container.resolve(Mediator)
-    query = GetOrganizationByIdQuery(organization_id=organization_id)
-    organization = await mediator.handle_query(query)
+    if conditional.if_none_match is not None:
+        version = await mediator.handle_query(GetOrganizationVersionQuery(organization_id=organization_id))
+        if conditional.is_not_modified(version):
+            return conditional.not_modified(version)
+
+    query = GetOrganizationDocumentsByIdsQuery(organization_ids=(organization_id,))
+    documents = await mediator.handle_query(query)
 
-    if not organization:
+    if not documents:
         return ApiResponse[OrganizationDetailSchema](
             data={},
             errors=[{"message": "Organization not found"}],
         )
 
-    return ApiResponse[OrganizationDetailSchema](
-        data=OrganizationDetailSchema.from_entity(organization),
+    document = documents[0]
+    return conditional.apply(
+        document_response(document.content),
+        EntityVersion(oid=document.oid, updated_at=document.updated_at),
     )
+
+
+@router.delete(
+    "/{organization_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorSchema},
+    },
+)
+async def delete_organization(
+    organization_id: UUID,
+    container=Depends(init_container),
+) -> Response:
+    """Удаляет организацию; удаление попадает в ``/changes``."""
+    mediator: Mediator = container.resolve(Mediator)
+    await mediator.handle_command(DeleteOrganizationCommand(organization_id=organization_id))
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
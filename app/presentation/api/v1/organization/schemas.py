@@ -1,13 +1,29 @@
 from datetime import datetime
+from enum import StrEnum
+from typing import (
+    Any,
+    Literal,
+)
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import (
+    BaseModel,
+    Field,
+)
 
 from domain.organization.entities import (
     ActivityEntity,
     BuildingEntity,
     OrganizationEntity,
 )
+from domain.organization.read_models import (
+    ORGANIZATION_COMPACT_FIELDS,
+    ORGANIZATION_PROJECTION_FIELDS,
+)
+
+
+MAX_NEAREST = 100
+MAX_NEAR_POINTS = 100
 
 
 # Activity Schemas
@@ -137,3 +153,134 @@ class OrganizationDetailSchema(BaseModel):
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
+
+
+class OrganizationCompactSchema(BaseModel):
+    """Компактное представление для карт: ``view=compact``."""
+
+    oid: UUID
+    name: str
+    latitude: float
+    longitude: float
+
+
+class OrganizationClusterSchema(BaseModel):
+    """Точка карты: центр кластера и число организаций в нём."""
+
+    latitude: float
+    longitude: float
+    organizations: int
+    building_id: UUID | None = Field(
+        default=None,
+        description="Здание, если все организации кластера в нём",
+    )
+
+
+class OrganizationClustersSchema(BaseModel):
+    items: list[OrganizationClusterSchema]
+    clustered: bool = Field(description="false — масштаб крупный, каждая точка — отдельное здание")
+
+
+class OrganizationChangeSchema(BaseModel):
+    oid: UUID
+    changed_at: datetime
+    deleted: bool
+    organization: OrganizationDetailSchema | None = Field(description="null для удалённой организации")
+
+
+class OrganizationChangesSchema(BaseModel):
+    items: list[OrganizationChangeSchema]
+    next_cursor: str | None = Field(description="Курсор для следующего запроса; сохраняется репликой")
+    has_more: bool = Field(description="false — реплика догнала поток, следующий запрос можно сделать позже")
+
+
+class ActivityFacetSchema(BaseModel):
+    activity_id: UUID
+    name: str
+    parent_id: UUID | None
+    organizations: int = Field(description="Организации с этим видом деятельности")
+    subtree_organizations: int = Field(description="Организации с ним или его детьми")
+
+
+class ActivityFacetsSchema(BaseModel):
+    items: list[ActivityFacetSchema]
+
+
+class NearbyOrganizationSchema(OrganizationDetailSchema):
+    distance: float = Field(description="Расстояние от точки поиска до здания в метрах")
+
+
+class NearbyOrganizationCompactSchema(OrganizationCompactSchema):
+    distance: float = Field(description="Расстояние от точки поиска до здания в метрах")
+
+
+class NearbyOrganizationsSchema(BaseModel):
+    items: list[NearbyOrganizationSchema]
+
+
+class NearPointSchema(BaseModel):
+    latitude: float = Field(ge=-90, le=90)
+    longitude: float = Field(ge=-180, le=180)
+    radius: float = Field(gt=0, description="Радиус поиска в метрах")
+
+
+class NearPointsRequestSchema(BaseModel):
+    points: list[NearPointSchema] = Field(min_length=1, max_length=MAX_NEAR_POINTS)
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=MAX_NEAREST,
+        description="Сколько ближайших организаций вернуть для каждой точки",
+    )
+    activity: str | None = Field(default=None, description="Вид деятельности (включая вложенные)")
+
+
+class NearPointResultSchema(BaseModel):
+    point: NearPointSchema
+    items: list[NearbyOrganizationSchema]
+
+
+class NearPointsSchema(BaseModel):
+    results: list[NearPointResultSchema]
+
+
+class GeoJSONPolygonSchema(BaseModel):
+    type: Literal["Polygon", "MultiPolygon"]
+    coordinates: list[Any] = Field(description="Координаты GeoJSON: кольца из точек [lon, lat]")
+
+
+class OrganizationPolygonSearchRequestSchema(BaseModel):
+    geometry: GeoJSONPolygonSchema
+    name: str | None = Field(default=None, description="Подстрока названия")
+    activity: str | None = Field(default=None, description="Вид деятельности (включая вложенные)")
+
+
+class OrganizationView(StrEnum):
+    COMPACT = "compact"
+    DETAIL = "detail"
+
+
+class OrganizationRepresentationIn(BaseModel):
+    view: OrganizationView = Field(
+        default=OrganizationView.DETAIL,
+        description="compact — только oid, name и координаты (без JOIN телефонов и видов деятельности)",
+    )
+    fields: str | None = Field(
+        default=None,
+        description=(
+            f"Поля через запятую ({', '.join(ORGANIZATION_PROJECTION_FIELDS)}); "
+            "приоритетнее view, в SQL выбираются только они"
+        ),
+    )
+
+    def projection_fields(self) -> tuple[str, ...] | None:
+        """Поля проекции или ``None`` для полного документа."""
+        if self.fields:
+            fields = tuple(name.strip() for name in self.fields.split(",") if name.strip())
+            if fields:
+                return fields
+
+        if self.view == OrganizationView.COMPACT:
+            return ORGANIZATION_COMPACT_FIELDS
+
+        return None
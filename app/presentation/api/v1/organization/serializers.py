@@ -0,0 +1,82 @@
+from typing import Any
+
+from domain.organization.entities import (
+    ActivityEntity,
+    BuildingEntity,
+    OrganizationEntity,
+)
+from domain.organization.read_models import (
+    ActivityFacet,
+    NearbyOrganization,
+    OrganizationChange,
+    OrganizationCluster,
+)
+
+
+# Быстрый путь сериализации списков: entity -> dict -> orjson, минуя
+# pydantic. Форма совпадает с *DetailSchema.model_dump(mode="json").
+
+
+def activity_detail_to_dict(entity: ActivityEntity) -> dict[str, Any]:
+    return {
+        "oid": entity.oid,
+        "name": entity.name.as_generic_type(),
+        "parent_id": entity.parent.oid if entity.parent else None,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
+
+
+def building_detail_to_dict(entity: BuildingEntity) -> dict[str, Any]:
+    return {
+        "oid": entity.oid,
+        "address": entity.address.as_generic_type(),
+        "latitude": entity.coordinates.latitude,
+        "longitude": entity.coordinates.longitude,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
+
+
+def organization_detail_to_dict(entity: OrganizationEntity) -> dict[str, Any]:
+    return {
+        "oid": entity.oid,
+        "name": entity.name.as_generic_type(),
+        "building": building_detail_to_dict(entity.building),
+        "phones": [phone.as_generic_type() for phone in entity.phones],
+        "activities": [activity_detail_to_dict(activity) for activity in entity.activities],
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
+
+
+def organization_cluster_to_dict(cluster: OrganizationCluster) -> dict[str, Any]:
+    return {
+        "latitude": cluster.latitude,
+        "longitude": cluster.longitude,
+        "organizations": cluster.organizations,
+        "building_id": cluster.building_id,
+    }
+
+
+def nearby_organization_to_dict(nearby: NearbyOrganization) -> dict[str, Any]:
+    return {**organization_detail_to_dict(nearby.organization), "distance": nearby.distance}
+
+
+def activity_facet_to_dict(facet: ActivityFacet) -> dict[str, Any]:
+    return {
+        "activity_id": facet.activity_id,
+        "name": facet.name,
+        "parent_id": facet.parent_id,
+        "organizations": facet.organizations,
+        "subtree_organizations": facet.subtree_organizations,
+    }
+
+
+def organization_change_to_dict(change: OrganizationChange) -> dict[str, Any]:
+    return {
+        "oid": change.oid,
+        "changed_at": change.changed_at,
+        "deleted": change.deleted,
+        "organization": organization_detail_to_dict(change.organization) if change.organization else None,
+    }
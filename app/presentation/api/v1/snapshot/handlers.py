@@ -0,0 +1,65 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    Path,
+    Query,
+    status,
+)
+from fastapi.responses import StreamingResponse
+
+from presentation.api.schemas import ErrorSchema
+
+from application.init import init_container
+from application.mediator import Mediator
+from application.queries.catalog_snapshot import GetCatalogSnapshotQuery
+from domain.organization.snapshot import (
+    SnapshotFormat,
+    SnapshotTable,
+)
+from settings import config
+
+
+router = APIRouter(prefix="/snapshot", tags=["snapshot"])
+
+
+@router.get(
+    "/{table}",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {snapshot_format.media_type: {} for snapshot_format in SnapshotFormat},
+            "description": "Таблица каталога в Arrow IPC stream или Parquet",
+        },
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_catalog_snapshot(
+    table: SnapshotTable = Path(..., description="Таблица снимка"),
+    snapshot_format: SnapshotFormat = Query(SnapshotFormat.ARROW, alias="format", description="Формат файла"),
+    container=Depends(init_container),
+) -> StreamingResponse:
+    """Колоночный снимок таблицы каталога для аналитики.
+
+    Таблица читается курсором на стороне сервера и отдаётся по мере
+    записи record batch'ей, так что память не растёт с размером
+    каталога. Координаты зданий — колонки ``latitude``/``longitude``
+    типа float64 без потери точности.
+
+    """
+    mediator: Mediator = container.resolve(Mediator)
+    content = await mediator.handle_query(
+        GetCatalogSnapshotQuery(
+            table=table,
+            snapshot_format=snapshot_format,
+            batch_size=config.snapshot_batch_size,
+        ),
+    )
+    filename = f"{table}.{snapshot_format.extension}"
+
+    return StreamingResponse(
+        content,
+        media_type=snapshot_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
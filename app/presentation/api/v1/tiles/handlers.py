@@ -0,0 +1,54 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    Path,
+    status,
+)
+from fastapi.responses import Response
+
+from presentation.api.schemas import ErrorSchema
+
+from application.init import init_container
+from application.mediator import Mediator
+from application.queries.map_tile import GetMapTileQuery
+from domain.organization.tiles import MAX_TILE_ZOOM
+from settings import config
+
+
+router = APIRouter(prefix="/tiles", tags=["tiles"])
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+@router.get(
+    "/{z}/{x}/{y}.mvt",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+    responses={
+        status.HTTP_200_OK: {"content": {MVT_MEDIA_TYPE: {}}, "description": "Mapbox Vector Tile"},
+        status.HTTP_204_NO_CONTENT: {"description": "В тайле нет зданий с организациями"},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorSchema},
+    },
+)
+async def get_map_tile(
+    z: int = Path(..., ge=0, le=MAX_TILE_ZOOM, description="Масштаб"),
+    x: int = Path(..., ge=0, description="Колонка тайла"),
+    y: int = Path(..., ge=0, description="Строка тайла (XYZ, сверху вниз)"),
+    container=Depends(init_container),
+) -> Response:
+    """Векторный тайл зданий и организаций для карты.
+
+    Слой ``buildings`` — точки зданий с количеством организаций (с z14
+    ещё адрес), слой ``organizations`` (с z15) — организации с
+    названием. Тайлы кешируются в памяти процесса до изменения данных.
+
+    """
+    mediator: Mediator = container.resolve(Mediator)
+    content = await mediator.handle_query(GetMapTileQuery(z=z, x=x, y=y))
+    headers = {"Cache-Control": config.tile_cache_control}
+
+    if not content:
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers=headers)
+
+    return Response(content=content, media_type=MVT_MEDIA_TYPE, headers=headers)
@@ -1,3 +1,5 @@
+from enum import StrEnum
+
 from pydantic import (
     computed_field,
     Field,
@@ -8,6 +10,14 @@ from pydantic_settings import (
 )
 
 
+class CatalogBackend(StrEnum):
+    """Источник данных каталога: PostgreSQL или файл снимка (read-only
+    узел без базы)."""
+
+    POSTGRES = "postgres"
+    SNAPSHOT = "snapshot"
+
+
 class Config(BaseSettings):
     max_activity_nesting_level: int = Field(
         default=3,
@@ -59,6 +69,16 @@ class Config(BaseSettings):
         alias="LOGSTASH_PROJECT",
     )
 
+    logstash_buffer_size: int = Field(
+        default=10_000,
+        alias="LOGSTASH_BUFFER_SIZE",
+    )
+
+    logstash_batch_size: int = Field(
+        default=500,
+        alias="LOGSTASH_BATCH_SIZE",
+    )
+
     cors_origins: list[str] = Field(
         default=["*"],
         alias="CORS_ORIGINS",
@@ -79,6 +99,61 @@ class Config(BaseSettings):
         alias="CORS_ALLOW_HEADERS",
     )
 
+    compression_minimum_size: int = Field(
+        default=1024,
+        alias="COMPRESSION_MINIMUM_SIZE",
+    )
+
+    compression_offload_size: int = Field(
+        default=256 * 1024,
+        alias="COMPRESSION_OFFLOAD_SIZE",
+    )
+
+    organization_cache_control: str = Field(
+        default="private, no-cache",
+        alias="ORGANIZATION_CACHE_CONTROL",
+    )
+
+    building_cache_control: str = Field(
+        default="private, no-cache",
+        alias="BUILDING_CACHE_CONTROL",
+    )
+
+    activity_cache_control: str = Field(
+        default="private, no-cache",
+        alias="ACTIVITY_CACHE_CONTROL",
+    )
+
+    tile_cache_size: int = Field(
+        default=1024,
+        alias="TILE_CACHE_SIZE",
+    )
+
+    facet_cache_size: int = Field(
+        default=1024,
+        alias="FACET_CACHE_SIZE",
+    )
+
+    snapshot_batch_size: int = Field(
+        default=10_000,
+        alias="SNAPSHOT_BATCH_SIZE",
+    )
+
+    catalog_backend: CatalogBackend = Field(
+        default=CatalogBackend.POSTGRES,
+        alias="CATALOG_BACKEND",
+    )
+
+    catalog_snapshot_path: str = Field(
+        default="catalog.snapshot",
+        alias="CATALOG_SNAPSHOT_PATH",
+    )
+
+    tile_cache_control: str = Field(
+        default="private, max-age=60",
+        alias="TILE_CACHE_CONTROL",
+    )
+
     @computed_field
     @property
     def postgres_connection_uri(self) -> str:
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from application.commands.activity import CreateActivityCommand
+from application.commands.building import CreateBuildingCommand
+from application.commands.catalog_snapshot import ExportCatalogSnapshotCommand
+from application.commands.organization import CreateOrganizationCommand
+from application.mediator import Mediator
+from domain.organization.snapshot import (
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+@pytest.mark.asyncio()
+async def test_export_catalog_snapshot_writes_every_table(mediator: Mediator, tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await mediator.handle_command(
+        CreateBuildingCommand(address="г. Москва, ул. Ленина 1", latitude=55.7558, longitude=37.6173),
+    )
+    await mediator.handle_command(
+        CreateOrganizationCommand(
+            name="ООО Рога и Копыта",
+            address="г. Москва, ул. Ленина 1",
+            phones=["+7-495-123-4567", "+7-495-765-4321"],
+            activities=["Еда"],
+        ),
+    )
+
+    paths, *_ = await mediator.handle_command(
+        ExportCatalogSnapshotCommand(directory=tmp_path / "snapshot", snapshot_format=SnapshotFormat.PARQUET),
+    )
+
+    assert set(paths) == set(SnapshotTable)
+    assert sorted(path.name for path in (tmp_path / "snapshot").iterdir()) == sorted(
+        f"{table}.parquet" for table in SnapshotTable
+    )
+    assert parquet.read_table(paths[SnapshotTable.PHONES]).column("phone").to_pylist() == [
+        "+7-495-123-4567",
+        "+7-495-765-4321",
+    ]
@@ -2,9 +2,13 @@ import pytest
 
 from application.commands.activity import CreateActivityCommand
 from application.commands.building import CreateBuildingCommand
-from application.commands.organization import CreateOrganizationCommand
+from application.commands.organization import (
+    CreateOrganizationCommand,
+    RebuildOrganizationDocumentsCommand,
+)
 from application.exceptions.organization import OrganizationWithThatNameAlreadyExistsException
 from application.mediator import Mediator
+from application.queries.organization import FindInconsistentOrganizationDocumentsQuery
 from domain.organization.exceptions import (
     ActivityNotFoundException,
     BuildingNotFoundException,
@@ -12,6 +16,8 @@ from domain.organization.exceptions import (
     EmptyOrganizationPhoneException,
 )
 from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
+from domain.organization.value_objects import OrganizationNameValueObject
 
 
 @pytest.mark.asyncio()
@@ -259,3 +265,46 @@ async def test_create_organization_command_duplicate_name(
                 activities=["Еда"],
             ),
         )
+
+
+@pytest.mark.asyncio()
+async def test_organization_document_rebuild_fixes_inconsistency(
+    organization_repository: BaseOrganizationRepository,
+    organization_document_repository: BaseOrganizationDocumentRepository,
+    mediator: Mediator,
+):
+    """Документ создаётся вместе с организацией, расхождение находит
+    checker, rebuild его устраняет."""
+    await mediator.handle_command(
+        CreateBuildingCommand(
+            address="г. Москва, ул. Ленина 1",
+            latitude=55.7558,
+            longitude=37.6173,
+        ),
+    )
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    organization, *_ = await mediator.handle_command(
+        CreateOrganizationCommand(
+            name="ООО Рога и Копыта",
+            address="г. Москва, ул. Ленина 1",
+            phones=["+7-495-123-4567"],
+            activities=["Еда"],
+        ),
+    )
+
+    [document] = await organization_document_repository.get_by_ids([organization.oid])
+    assert "ООО Рога и Копыта" in document.content.decode()
+    assert await mediator.handle_query(FindInconsistentOrganizationDocumentsQuery()) == []
+
+    # Исходные данные изменились в обход read model
+    saved_organization = await organization_repository.get_by_id(organization.oid)
+    saved_organization.name = OrganizationNameValueObject("ООО Копыта и Рога")
+
+    assert await mediator.handle_query(FindInconsistentOrganizationDocumentsQuery()) == [organization.oid]
+
+    rebuilt, *_ = await mediator.handle_command(RebuildOrganizationDocumentsCommand())
+
+    assert rebuilt == 1
+    assert await mediator.handle_query(FindInconsistentOrganizationDocumentsQuery()) == []
+    [document] = await organization_document_repository.get_by_ids([organization.oid])
+    assert "ООО Копыта и Рога" in document.content.decode()
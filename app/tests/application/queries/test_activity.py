@@ -46,17 +46,15 @@ async def test_get_activities_query_with_name_filter(mediator: Mediator):
         CreateActivityCommand(name="Еда на вынос", parent_id=None),
     )
 
-    # Ищем по названию "Еда"
+    # Ищем по названию "Еда": как и в SQL, название сравнивается точно
     results, total = await mediator.handle_query(
         GetActivitiesQuery(name="Еда", limit=10, offset=0),
     )
 
     results_list = list(results)
-    assert len(results_list) == 2
-    assert total == 2
-    names = [activity.name.as_generic_type() for activity in results_list]
-    assert "Еда" in names
-    assert "Еда на вынос" in names
+    assert len(results_list) == 1
+    assert total == 1
+    assert results_list[0].name.as_generic_type() == "Еда"
 
 
 @pytest.mark.asyncio()
@@ -0,0 +1,92 @@
+import io
+
+import pytest
+
+from application.commands.activity import CreateActivityCommand
+from application.commands.building import CreateBuildingCommand
+from application.commands.organization import CreateOrganizationCommand
+from application.mediator import Mediator
+from application.queries.catalog_snapshot import GetCatalogSnapshotQuery
+from domain.organization.exceptions import SnapshotFormatUnavailableException
+from domain.organization.snapshot import (
+    SnapshotFormat,
+    SnapshotTable,
+)
+
+
+# Координаты, которые не переживают округление до 6 знаков
+LATITUDE = 55.75581234567891
+LONGITUDE = 37.61731234567891
+
+
+async def _create_catalog(mediator: Mediator, organizations: int) -> None:
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await mediator.handle_command(
+        CreateBuildingCommand(address="г. Москва, ул. Ленина 1", latitude=LATITUDE, longitude=LONGITUDE),
+    )
+    for number in range(organizations):
+        await mediator.handle_command(
+            CreateOrganizationCommand(
+                name=f"ООО Снимок {number}",
+                address="г. Москва, ул. Ленина 1",
+                phones=["+7-495-123-4567"],
+                activities=["Еда"],
+            ),
+        )
+
+
+async def _read(mediator: Mediator, query: GetCatalogSnapshotQuery) -> list[bytes]:
+    return [chunk async for chunk in await mediator.handle_query(query)]
+
+
+@pytest.mark.asyncio()
+async def test_get_catalog_snapshot_arrow(mediator: Mediator):
+    pyarrow = pytest.importorskip("pyarrow")
+    await _create_catalog(mediator, organizations=5)
+
+    query = GetCatalogSnapshotQuery(
+        table=SnapshotTable.ORGANIZATIONS,
+        snapshot_format=SnapshotFormat.ARROW,
+        batch_size=2,
+    )
+    batches = list(pyarrow.ipc.open_stream(b"".join(await _read(mediator, query))))
+
+    # По record batch на каждые batch_size строк
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert sorted(pyarrow.Table.from_batches(batches).column("name").to_pylist()) == [
+        f"ООО Снимок {number}" for number in range(5)
+    ]
+
+    query = GetCatalogSnapshotQuery(table=SnapshotTable.BUILDINGS, snapshot_format=SnapshotFormat.ARROW)
+    buildings = pyarrow.ipc.open_stream(b"".join(await _read(mediator, query))).read_all()
+
+    assert buildings.schema.field("latitude").type == pyarrow.float64()
+    assert buildings.column("latitude").to_pylist() == [LATITUDE]
+    assert buildings.column("longitude").to_pylist() == [LONGITUDE]
+
+
+@pytest.mark.asyncio()
+async def test_get_catalog_snapshot_parquet(mediator: Mediator):
+    pytest.importorskip("pyarrow")
+    parquet = pytest.importorskip("pyarrow.parquet")
+    await _create_catalog(mediator, organizations=3)
+
+    for table, rows in (
+        (SnapshotTable.PHONES, 3),
+        (SnapshotTable.ACTIVITIES, 1),
+        (SnapshotTable.ORGANIZATION_ACTIVITIES, 3),
+    ):
+        query = GetCatalogSnapshotQuery(table=table, snapshot_format=SnapshotFormat.PARQUET, batch_size=2)
+        snapshot = parquet.read_table(io.BytesIO(b"".join(await _read(mediator, query))))
+
+        assert snapshot.num_rows == rows
+
+
+@pytest.mark.asyncio()
+async def test_get_catalog_snapshot_without_pyarrow(mediator: Mediator, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("infrastructure.snapshot.arrow.pyarrow", None)
+
+    with pytest.raises(SnapshotFormatUnavailableException):
+        await mediator.handle_query(
+            GetCatalogSnapshotQuery(table=SnapshotTable.ORGANIZATIONS, snapshot_format=SnapshotFormat.PARQUET),
+        )
@@ -0,0 +1,85 @@
+import pytest
+from punq import Container
+
+from application.commands.activity import CreateActivityCommand
+from application.commands.building import CreateBuildingCommand
+from application.commands.organization import (
+    CreateOrganizationCommand,
+    DeleteOrganizationCommand,
+)
+from application.mediator import Mediator
+from application.queries.map_tile import GetMapTileQuery
+from domain.organization.entities import OrganizationEntity
+from domain.organization.exceptions import InvalidTileCoordinatesException
+from domain.organization.services.map_tile import TileCache
+from domain.organization.tiles import TileCoordinates
+
+
+LATITUDE = 55.7558
+LONGITUDE = 37.6173
+
+
+async def _create_organization(mediator: Mediator, name: str, address: str) -> OrganizationEntity:
+    await mediator.handle_command(CreateBuildingCommand(address=address, latitude=LATITUDE, longitude=LONGITUDE))
+    organization, *_ = await mediator.handle_command(
+        CreateOrganizationCommand(name=name, address=address, phones=["+7-495-123-4567"], activities=["Еда"]),
+    )
+    return organization
+
+
+def _query(z: int) -> GetMapTileQuery:
+    tile = TileCoordinates.containing(latitude=LATITUDE, longitude=LONGITUDE, z=z)
+    return GetMapTileQuery(z=tile.z, x=tile.x, y=tile.y)
+
+
+@pytest.mark.asyncio()
+async def test_get_map_tile_attributes_depend_on_zoom(mediator: Mediator):
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await _create_organization(mediator, "ООО Рога и Копыта", "г. Москва, ул. Ленина 1")
+
+    detailed = await mediator.handle_query(_query(z=16))
+    overview = await mediator.handle_query(_query(z=10))
+
+    assert b"organizations" in detailed
+    assert "ООО Рога и Копыта".encode() in detailed
+    assert b"buildings" in overview
+    assert "ООО Рога и Копыта".encode() not in overview
+    assert await mediator.handle_query(GetMapTileQuery(z=16, x=0, y=0)) == b""
+
+
+@pytest.mark.asyncio()
+async def test_get_map_tile_is_cached_until_data_changes(mediator: Mediator, container: Container):
+    cache: TileCache = container.resolve(TileCache)
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await _create_organization(mediator, "ООО Рога и Копыта", "г. Москва, ул. Ленина 1")
+
+    first = await mediator.handle_query(_query(z=16))
+    assert await mediator.handle_query(_query(z=16)) is first
+    assert len(cache) == 1
+
+    # Новая организация меняет версию данных — тайл пересобирается
+    await _create_organization(mediator, "ООО Копыта и Рога", "г. Москва, ул. Ленина 2")
+
+    assert "ООО Копыта и Рога".encode() in await mediator.handle_query(_query(z=16))
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio()
+async def test_get_map_tile_cache_notices_deletion_of_older_organization(mediator: Mediator):
+    """Версия — счётчик записей, а не max(updated_at): удаление не самой
+    новой организации тоже сбрасывает тайл."""
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    older = await _create_organization(mediator, "ООО Рога и Копыта", "г. Москва, ул. Ленина 1")
+    await _create_organization(mediator, "ООО Копыта и Рога", "г. Москва, ул. Ленина 2")
+
+    assert "ООО Рога и Копыта".encode() in await mediator.handle_query(_query(z=16))
+
+    await mediator.handle_command(DeleteOrganizationCommand(organization_id=older.oid))
+
+    assert "ООО Рога и Копыта".encode() not in await mediator.handle_query(_query(z=16))
+
+
+@pytest.mark.asyncio()
+async def test_get_map_tile_invalid_coordinates(mediator: Mediator):
+    with pytest.raises(InvalidTileCoordinatesException):
+        await mediator.handle_query(GetMapTileQuery(z=2, x=4, y=0))
@@ -1,17 +1,42 @@
+from uuid import uuid4
+
+import orjson
 import pytest
+from punq import Container
 
 from application.commands.activity import CreateActivityCommand
 from application.commands.building import CreateBuildingCommand
-from application.commands.organization import CreateOrganizationCommand
+from application.commands.organization import (
+    CreateOrganizationCommand,
+    DeleteOrganizationCommand,
+)
+from application.exceptions.organization import OrganizationNotFoundException
 from application.mediator import Mediator
 from application.queries.organization import (
+    GetActivityFacetsQuery,
+    GetNearestOrganizationsQuery,
     GetOrganizationByIdQuery,
+    GetOrganizationChangesQuery,
+    GetOrganizationClustersByRectangleQuery,
     GetOrganizationsByActivityQuery,
     GetOrganizationsByAddressQuery,
+    GetOrganizationsByIdsQuery,
     GetOrganizationsByNameQuery,
     GetOrganizationsByRadiusQuery,
     GetOrganizationsByRectangleQuery,
+    GetOrganizationsNearPointsQuery,
+    SearchOrganizationsQuery,
+)
+from domain.base.pagination import (
+    PageCursor,
+    TotalMode,
+)
+from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
 )
+from domain.organization.services.facets import FacetCache
 
 
 @pytest.mark.asyncio()
@@ -385,6 +410,57 @@ async def test_get_organizations_by_rectangle_query(mediator: Mediator):
     assert "ООО Точка 2" in names
 
 
+@pytest.mark.asyncio()
+async def test_get_organizations_by_rectangle_pages_by_cursor(
+    mediator: Mediator,
+    container: Container,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    for index in range(5):
+        await mediator.handle_command(
+            CreateBuildingCommand(address=f"Точка {index}", latitude=55.75 + index * 0.001, longitude=37.6),
+        )
+        await mediator.handle_command(
+            CreateOrganizationCommand(name=f"ООО Точка {index}", address=f"Точка {index}", phones=[], activities=[]),
+        )
+    await mediator.handle_command(CreateBuildingCommand(address="Вне области", latitude=56.0, longitude=37.6))
+    await mediator.handle_command(
+        CreateOrganizationCommand(name="ООО Вне области", address="Вне области", phones=[], activities=[]),
+    )
+
+    # Здания области не загружаются: фильтр — часть запроса страницы
+    async def fail(*args, **kwargs):
+        raise AssertionError("buildings must not be prefetched")
+
+    monkeypatch.setattr(container.resolve(BaseBuildingRepository), "filter_by_bounding_box", fail)
+
+    seen = []
+    cursor = None
+    while True:
+        results, total = await mediator.handle_query(
+            GetOrganizationsByRectangleQuery(
+                lat_min=55.74,
+                lat_max=55.76,
+                lon_min=37.59,
+                lon_max=37.61,
+                limit=2,
+                offset=0,
+                cursor=cursor,
+            ),
+        )
+        results = list(results)
+        if not results:
+            break
+
+        assert len(results) <= 2
+        assert total == 5
+        seen.extend(org.name.as_generic_type() for org in results)
+        cursor = PageCursor.from_entity(results[-1]).encode()
+
+    assert seen == [f"ООО Точка {index}" for index in range(5)]
+
+
 @pytest.mark.asyncio()
 async def test_search_organizations_pagination(mediator: Mediator):
     """Тест пагинации при поиске организаций."""
@@ -431,3 +507,471 @@ async def test_search_organizations_pagination(mediator: Mediator):
     )
     assert len(list(results_page3)) == 1
     assert total3 == 5
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_by_ids_query(mediator: Mediator):
+    """Тест пакетного получения организаций по списку ID."""
+    await mediator.handle_command(
+        CreateBuildingCommand(
+            address="г. Москва, ул. Ленина 1",
+            latitude=55.7558,
+            longitude=37.6173,
+        ),
+    )
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+
+    organizations = []
+    for name in ("ООО Первая", "ООО Вторая", "ООО Третья"):
+        organization, *_ = await mediator.handle_command(
+            CreateOrganizationCommand(
+                name=name,
+                address="г. Москва, ул. Ленина 1",
+                phones=["+7-495-123-4567"],
+                activities=["Еда"],
+            ),
+        )
+        organizations.append(organization)
+
+    third, first = organizations[2], organizations[0]
+    results = await mediator.handle_query(
+        GetOrganizationsByIdsQuery(organization_ids=(third.oid, uuid4(), first.oid, third.oid)),
+    )
+
+    # Порядок как в запросе, несуществующие и дубликаты пропускаются
+    assert [org.oid for org in results] == [third.oid, first.oid]
+
+
+@pytest.mark.asyncio()
+async def test_search_organizations_by_name_keyset_pagination(mediator: Mediator):
+    """Тест keyset пагинации: страницы по курсору не пересекаются."""
+    await mediator.handle_command(
+        CreateBuildingCommand(
+            address="г. Москва, ул. Ленина 1",
+            latitude=55.7558,
+            longitude=37.6173,
+        ),
+    )
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+
+    for index in range(5):
+        await mediator.handle_command(
+            CreateOrganizationCommand(
+                name=f"ООО Рога {index}",
+                address="г. Москва, ул. Ленина 1",
+                phones=["+7-495-123-4567"],
+                activities=["Еда"],
+            ),
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        results, total = await mediator.handle_query(
+            GetOrganizationsByNameQuery(name="Рога", limit=2, offset=0, cursor=cursor),
+        )
+        results = list(results)
+        if not results:
+            break
+
+        assert total == 5
+        seen.extend(org.name.as_generic_type() for org in results)
+        cursor = PageCursor.from_entity(results[-1]).encode()
+
+    assert seen == [f"ООО Рога {index}" for index in range(5)]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("total_mode", "expected_total"),
+    [
+        (TotalMode.EXACT, 3),
+        (TotalMode.ESTIMATE, 3),
+        (TotalMode.NONE, None),
+    ],
+)
+async def test_search_organizations_by_name_total_modes(
+    mediator: Mediator,
+    total_mode: TotalMode,
+    expected_total: int | None,
+):
+    """Тест режимов подсчёта total."""
+    await mediator.handle_command(
+        CreateBuildingCommand(
+            address="г. Москва, ул. Ленина 1",
+            latitude=55.7558,
+            longitude=37.6173,
+        ),
+    )
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+
+    for index in range(3):
+        await mediator.handle_command(
+            CreateOrganizationCommand(
+                name=f"ООО Рога {index}",
+                address="г. Москва, ул. Ленина 1",
+                phones=["+7-495-123-4567"],
+                activities=["Еда"],
+            ),
+        )
+
+    results, total = await mediator.handle_query(
+        GetOrganizationsByNameQuery(name="Рога", limit=2, offset=0, total_mode=total_mode),
+    )
+
+    assert len(list(results)) == 2
+    assert total == expected_total
+
+    # Неизвестные адрес и вид деятельности: total в той же форме, что и
+    # для пустой выборки по существующим
+    empty_total = None if total_mode is TotalMode.NONE else 0
+    for query in (
+        GetOrganizationsByAddressQuery(address="Нет такого адреса", limit=2, offset=0, total_mode=total_mode),
+        GetOrganizationsByActivityQuery(activity_name="Нет такого вида", limit=2, offset=0, total_mode=total_mode),
+    ):
+        results, total = await mediator.handle_query(query)
+        assert list(results) == []
+        assert total == empty_total
+
+
+@pytest.mark.asyncio()
+async def test_get_organization_clusters_by_rectangle_query(mediator: Mediator):
+    """На мелком масштабе соседние здания объединяются, на крупном — нет."""
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    # Два здания в ~100 м друг от друга и одно в другом конце города
+    for index, (latitude, longitude) in enumerate([(55.7558, 37.6173), (55.7565, 37.6180), (55.6000, 37.4000)]):
+        address = f"г. Москва, ул. Кластерная {index}"
+        await mediator.handle_command(CreateBuildingCommand(address=address, latitude=latitude, longitude=longitude))
+        await mediator.handle_command(
+            CreateOrganizationCommand(
+                name=f"ООО Кластер {index}",
+                address=address,
+                phones=["+7-495-123-4567"],
+                activities=["Еда"],
+            ),
+        )
+
+    bounds = {"lat_min": 55.5, "lat_max": 56.0, "lon_min": 37.0, "lon_max": 38.0}
+
+    clusters = await mediator.handle_query(GetOrganizationClustersByRectangleQuery(**bounds, zoom=10))
+
+    assert sorted(cluster.organizations for cluster in clusters) == [1, 2]
+    merged = next(cluster for cluster in clusters if cluster.organizations == 2)
+    assert merged.building_id is None
+    assert 55.7558 < merged.latitude < 55.7565
+
+    points = await mediator.handle_query(GetOrganizationClustersByRectangleQuery(**bounds, zoom=17))
+
+    assert len(points) == 3
+    assert all(point.organizations == 1 and point.building_id is not None for point in points)
+
+
+@pytest.mark.asyncio()
+async def test_get_nearest_organizations_query(mediator: Mediator):
+    """Ближайшие организации упорядочены по расстоянию, фильтр по виду
+    деятельности учитывает вложенные."""
+    food, *_ = await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await mediator.handle_command(CreateActivityCommand(name="Мясная продукция", parent_id=food.oid))
+    await mediator.handle_command(CreateActivityCommand(name="Автомобили", parent_id=None))
+
+    places = [
+        ("ООО Далеко", (55.8000, 37.7000), "Еда"),
+        ("ООО Рядом", (55.7560, 37.6175), "Автомобили"),
+        ("ООО Средне", (55.7600, 37.6300), "Мясная продукция"),
+    ]
+    for index, (name, (latitude, longitude), activity) in enumerate(places):
+        address = f"г. Москва, ул. Соседняя {index}"
+        await mediator.handle_command(CreateBuildingCommand(address=address, latitude=latitude, longitude=longitude))
+        await mediator.handle_command(
+            CreateOrganizationCommand(name=name, address=address, phones=["+7-495-123-4567"], activities=[activity]),
+        )
+
+    nearest = await mediator.handle_query(GetNearestOrganizationsQuery(latitude=55.7558, longitude=37.6173, limit=2))
+
+    assert [nearby.organization.name.as_generic_type() for nearby in nearest] == ["ООО Рядом", "ООО Средне"]
+    assert nearest[0].distance < 50 < nearest[1].distance
+
+    food_nearest = await mediator.handle_query(
+        GetNearestOrganizationsQuery(latitude=55.7558, longitude=37.6173, limit=5, activity_name="Еда"),
+    )
+
+    assert [nearby.organization.name.as_generic_type() for nearby in food_nearest] == ["ООО Средне", "ООО Далеко"]
+
+    unknown = await mediator.handle_query(
+        GetNearestOrganizationsQuery(latitude=55.7558, longitude=37.6173, limit=5, activity_name="Нет такого"),
+    )
+
+    assert unknown == []
+
+
+@pytest.mark.asyncio()
+async def test_organizations_by_radius_are_ordered_by_distance_across_pages(mediator: Mediator):
+    """Страницы по курсору идут по расстоянию, одинаковое расстояние
+    упорядочено по oid, документы содержат distance."""
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    buildings = [
+        ("г. Москва, ул. Дальняя 1", 55.7600, 37.6300),
+        ("г. Москва, ул. Ближняя 1", 55.7560, 37.6175),
+        ("г. Москва, ул. Средняя 1", 55.7580, 37.6200),
+        ("г. Санкт-Петербург, Невский 1", 59.9343, 30.3351),
+    ]
+    for address, latitude, longitude in buildings:
+        await mediator.handle_command(CreateBuildingCommand(address=address, latitude=latitude, longitude=longitude))
+
+    placements = [
+        ("ООО Дальняя", "г. Москва, ул. Дальняя 1"),
+        ("ООО Средняя А", "г. Москва, ул. Средняя 1"),
+        ("ООО Ближняя", "г. Москва, ул. Ближняя 1"),
+        ("ООО Средняя Б", "г. Москва, ул. Средняя 1"),
+        ("ООО Питер", "г. Санкт-Петербург, Невский 1"),
+    ]
+    organization_ids = {}
+    for name, address in placements:
+        organization, *_ = await mediator.handle_command(
+            CreateOrganizationCommand(name=name, address=address, phones=["+7-495-123-4567"], activities=["Еда"]),
+        )
+        organization_ids[name] = organization.oid
+
+    seen = []
+    cursor = None
+    while True:
+        documents, total = await mediator.handle_query(
+            GetOrganizationsByRadiusQuery(
+                latitude=55.7558,
+                longitude=37.6173,
+                radius=5000,
+                limit=2,
+                offset=0,
+                cursor=cursor,
+                as_documents=True,
+            ),
+        )
+        documents = list(documents)
+        if not documents:
+            break
+
+        assert total == 4
+        seen.extend(orjson.loads(document.content) for document in documents)
+        cursor = PageCursor.from_entity(documents[-1]).encode()
+
+    middle = sorted([organization_ids["ООО Средняя А"], organization_ids["ООО Средняя Б"]])
+    expected = [organization_ids["ООО Ближняя"], *middle, organization_ids["ООО Дальняя"]]
+    assert [document["oid"] for document in seen] == [str(oid) for oid in expected]
+    distances = [document["distance"] for document in seen]
+    assert distances == sorted(distances)
+    assert distances[1] == distances[2]
+
+
+@pytest.mark.asyncio()
+async def test_search_organizations_query_combines_criteria(mediator: Mediator):
+    """Название, поддерево видов деятельности и область сочетаются через
+    AND."""
+    food, *_ = await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await mediator.handle_command(CreateActivityCommand(name="Кофейни", parent_id=food.oid))
+    await mediator.handle_command(CreateActivityCommand(name="Автомобили", parent_id=None))
+
+    buildings = [
+        ("г. Москва, ул. Мясницкая 1", 55.7600, 37.6350),
+        ("г. Москва, ул. Тверская 7", 55.7580, 37.6120),
+        ("г. Санкт-Петербург, Невский 1", 59.9343, 30.3351),
+    ]
+    for address, latitude, longitude in buildings:
+        await mediator.handle_command(CreateBuildingCommand(address=address, latitude=latitude, longitude=longitude))
+
+    placements = [
+        ("Кофе Хауз", "г. Москва, ул. Мясницкая 1", "Кофейни"),
+        ("Кофе и Шины", "г. Москва, ул. Тверская 7", "Автомобили"),
+        ("Кофе Питер", "г. Санкт-Петербург, Невский 1", "Кофейни"),
+        ("Кофе", "г. Москва, ул. Тверская 7", "Еда"),
+    ]
+    for name, address, activity in placements:
+        await mediator.handle_command(
+            CreateOrganizationCommand(name=name, address=address, phones=["+7-495-123-4567"], activities=[activity]),
+        )
+
+    results, total = await mediator.handle_query(
+        SearchOrganizationsQuery(
+            limit=10,
+            offset=0,
+            name="кофе",
+            activity_name="Еда",
+            circle=SearchCircle(latitude=55.7558, longitude=37.6173, radius=2000),
+        ),
+    )
+
+    # По расстоянию: Тверская ближе Мясницкой
+    assert [org.name.as_generic_type() for org in results] == ["Кофе", "Кофе Хауз"]
+    assert total == 2
+
+    ranked, _ = await mediator.handle_query(SearchOrganizationsQuery(limit=10, offset=0, name="кофе"))
+
+    # Без круга — по сходству названия: точное совпадение первым
+    assert next(org.name.as_generic_type() for org in ranked) == "Кофе"
+
+    in_box, total = await mediator.handle_query(
+        SearchOrganizationsQuery(
+            limit=10,
+            offset=0,
+            address="тверская",
+            bounding_box=SearchBoundingBox(lat_min=55.0, lat_max=56.0, lon_min=37.0, lon_max=38.0),
+        ),
+    )
+
+    assert sorted(org.name.as_generic_type() for org in in_box) == ["Кофе", "Кофе и Шины"]
+    assert total == 2
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_near_points_query(mediator: Mediator):
+    """Результаты сгруппированы по точкам в порядке запроса, внутри —
+    по расстоянию, не больше ``limit`` на точку."""
+    food, *_ = await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await mediator.handle_command(CreateActivityCommand(name="Кофейни", parent_id=food.oid))
+    await mediator.handle_command(CreateActivityCommand(name="Автомобили", parent_id=None))
+
+    places = [
+        ("ООО Центр", (55.7560, 37.6175), "Кофейни"),
+        ("ООО Около центра", (55.7580, 37.6200), "Автомобили"),
+        ("ООО Чуть дальше", (55.7600, 37.6300), "Еда"),
+        ("ООО Питер", (59.9343, 30.3351), "Еда"),
+    ]
+    for index, (name, (latitude, longitude), activity) in enumerate(places):
+        address = f"г. Маршрутная {index}"
+        await mediator.handle_command(CreateBuildingCommand(address=address, latitude=latitude, longitude=longitude))
+        await mediator.handle_command(
+            CreateOrganizationCommand(name=name, address=address, phones=["+7-495-123-4567"], activities=[activity]),
+        )
+
+    points = (
+        SearchCircle(latitude=59.9340, longitude=30.3350, radius=1000),
+        SearchCircle(latitude=55.7558, longitude=37.6173, radius=5000),
+        SearchCircle(latitude=0.0, longitude=0.0, radius=1000),
+    )
+
+    results = await mediator.handle_query(GetOrganizationsNearPointsQuery(points=points, limit=2))
+
+    names = [[nearby.organization.name.as_generic_type() for nearby in group] for group in results]
+    assert names == [["ООО Питер"], ["ООО Центр", "ООО Около центра"], []]
+    assert results[1][0].distance < results[1][1].distance
+
+    food_results = await mediator.handle_query(
+        GetOrganizationsNearPointsQuery(points=points, limit=5, activity_name="Еда"),
+    )
+
+    names = [[nearby.organization.name.as_generic_type() for nearby in group] for group in food_results]
+    assert names == [["ООО Питер"], ["ООО Центр", "ООО Чуть дальше"], []]
+
+
+@pytest.mark.asyncio()
+async def test_get_activity_facets_query(mediator: Mediator, container: Container):
+    """Прямые и поддеревом счётчики по видам деятельности в пределах
+    выборки; организация в поддереве считается один раз."""
+    food, *_ = await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await mediator.handle_command(CreateActivityCommand(name="Мясная продукция", parent_id=food.oid))
+    await mediator.handle_command(CreateActivityCommand(name="Молочная продукция", parent_id=food.oid))
+    await mediator.handle_command(CreateActivityCommand(name="Автомобили", parent_id=None))
+
+    places = [
+        ("Ферма", (55.7560, 37.6175), ["Мясная продукция", "Молочная продукция"]),
+        ("Мясная лавка", (55.7580, 37.6200), ["Мясная продукция"]),
+        ("Гастроном", (55.7600, 37.6300), ["Еда"]),
+        ("Автосалон", (59.9343, 30.3351), ["Автомобили"]),
+    ]
+    for index, (name, (latitude, longitude), activities) in enumerate(places):
+        address = f"г. Фасетная {index}"
+        await mediator.handle_command(CreateBuildingCommand(address=address, latitude=latitude, longitude=longitude))
+        await mediator.handle_command(
+            CreateOrganizationCommand(name=name, address=address, phones=["+7-495-123-4567"], activities=activities),
+        )
+
+    facets = await mediator.handle_query(GetActivityFacetsQuery())
+
+    counts = {facet.name: (facet.organizations, facet.subtree_organizations) for facet in facets}
+    assert counts == {
+        "Еда": (1, 3),
+        "Мясная продукция": (2, 2),
+        "Молочная продукция": (1, 1),
+        "Автомобили": (1, 1),
+    }
+    assert facets[0].name == "Еда"
+
+    moscow = await mediator.handle_query(
+        GetActivityFacetsQuery(circle=SearchCircle(latitude=55.7558, longitude=37.6173, radius=5000), name="лавка"),
+    )
+
+    counts = {facet.name: (facet.organizations, facet.subtree_organizations) for facet in moscow}
+    assert counts == {"Еда": (0, 1), "Мясная продукция": (1, 1)}
+
+    facet_cache = container.resolve(FacetCache)
+    assert len(facet_cache) == 2
+    await mediator.handle_query(GetActivityFacetsQuery())
+    assert len(facet_cache) == 2
+
+    await mediator.handle_command(CreateBuildingCommand(address="г. Фасетная 9", latitude=55.75, longitude=37.61))
+    await mediator.handle_command(
+        CreateOrganizationCommand(
+            name="Молочный",
+            address="г. Фасетная 9",
+            phones=["+7-495-123-4567"],
+            activities=["Молочная продукция"],
+        ),
+    )
+
+    facets = await mediator.handle_query(GetActivityFacetsQuery())
+
+    assert {facet.name: facet.subtree_organizations for facet in facets}["Еда"] == 4
+    assert len(facet_cache) == 3
+
+
+@pytest.mark.asyncio()
+async def test_get_organization_changes_query(mediator: Mediator):
+    """Поток изменений идёт страницами по курсору, удаление приходит
+    записью без организации после всех предыдущих изменений; пустая первая
+    страница всё равно даёт позицию для продолжения."""
+    empty = await mediator.handle_query(GetOrganizationChangesQuery(limit=2))
+
+    assert empty.changes == []
+    resume = empty.next_cursor().encode()
+
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    await mediator.handle_command(
+        CreateBuildingCommand(address="г. Москва, ул. Изменений 1", latitude=55.7558, longitude=37.6173),
+    )
+    created = []
+    for name in ("ООО Первая", "ООО Вторая", "ООО Третья"):
+        organization, *_ = await mediator.handle_command(
+            CreateOrganizationCommand(
+                name=name,
+                address="г. Москва, ул. Изменений 1",
+                phones=["+7-495-123-4567"],
+                activities=["Еда"],
+            ),
+        )
+        created.append(organization)
+
+    first = await mediator.handle_query(GetOrganizationChangesQuery(limit=2))
+
+    assert [change.oid for change in first.changes] == [org.oid for org in created[:2]]
+    assert not any(change.deleted for change in first.changes)
+    cursor = first.next_cursor().encode()
+
+    resumed = await mediator.handle_query(GetOrganizationChangesQuery(limit=10, cursor=resume))
+
+    assert [change.oid for change in resumed.changes] == [org.oid for org in created]
+
+    await mediator.handle_command(DeleteOrganizationCommand(organization_id=created[0].oid))
+
+    rest = await mediator.handle_query(GetOrganizationChangesQuery(limit=10, cursor=cursor))
+
+    assert [(change.oid, change.deleted) for change in rest.changes] == [
+        (created[2].oid, False),
+        (created[0].oid, True),
+    ]
+    assert rest.changes[1].organization is None
+
+    since = await mediator.handle_query(GetOrganizationChangesQuery(limit=10, since=created[2].updated_at))
+
+    assert [change.oid for change in since.changes] == [created[2].oid, created[0].oid]
+
+    with pytest.raises(OrganizationNotFoundException):
+        await mediator.handle_command(DeleteOrganizationCommand(organization_id=created[0].oid))
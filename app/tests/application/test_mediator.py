@@ -0,0 +1,228 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Any
+
+import pytest
+
+from application.behaviors import (
+    BaseBehavior,
+    LatencyHistogram,
+    TimingBehavior,
+)
+from application.commands.base import (
+    BaseCommand,
+    BaseCommandHandler,
+)
+from application.commands.building import CreateBuildingCommand
+from application.exceptions.mediator import CommandHandlersFailedException
+from application.mediator import (
+    CommandExecutionPolicy,
+    Mediator,
+)
+from application.queries.building import GetBuildingByAddressQuery
+
+
+@dataclass
+class RecordingBehavior(BaseBehavior):
+    name: str
+    calls: list[str] = field(default_factory=list)
+
+    async def handle(self, request, handler, call_next) -> Any:
+        self.calls.append(f"{self.name}:before")
+        result = await call_next(request)
+        self.calls.append(f"{self.name}:after")
+        return result
+
+
+@dataclass(frozen=True)
+class PingCommand(BaseCommand): ...
+
+
+@dataclass(frozen=True)
+class SleepingCommandHandler(BaseCommandHandler[PingCommand, str]):
+    name: str
+    delay: float
+    events: list[str]
+    error: Exception | None = None
+
+    async def handle(self, command: PingCommand) -> str:
+        self.events.append(f"{self.name}:start")
+        await asyncio.sleep(self.delay)
+        self.events.append(f"{self.name}:end")
+        if self.error:
+            raise self.error
+        return self.name
+
+
+@pytest.mark.asyncio()
+async def test_query_behaviors_run_in_registration_order(mediator: Mediator):
+    """Первый зарегистрированный behavior оборачивает остальные."""
+    calls: list[str] = []
+    mediator.register_query_behavior(RecordingBehavior(name="outer", calls=calls))
+    mediator.register_query_behavior(RecordingBehavior(name="inner", calls=calls))
+
+    result = await mediator.handle_query(GetBuildingByAddressQuery(address="нет такого"))
+
+    assert result is None
+    assert calls == ["outer:before", "inner:before", "inner:after", "outer:after"]
+
+
+@pytest.mark.asyncio()
+async def test_command_behaviors_wrap_each_handler(mediator: Mediator):
+    """Command behaviors вызываются для каждого обработчика команды."""
+    calls: list[str] = []
+    mediator.register_command_behavior(RecordingBehavior(name="cmd", calls=calls))
+
+    building, *_ = await mediator.handle_command(
+        CreateBuildingCommand(
+            address="г. Москва, ул. Ленина 1",
+            latitude=55.7558,
+            longitude=37.6173,
+        ),
+    )
+
+    assert building.address.as_generic_type() == "г. Москва, ул. Ленина 1"
+    assert calls == ["cmd:before", "cmd:after"]
+
+
+@pytest.mark.asyncio()
+async def test_behavior_can_short_circuit_query(mediator: Mediator):
+    """Behavior может вернуть результат, не вызывая обработчик."""
+
+    @dataclass
+    class CachedBehavior(BaseBehavior):
+        async def handle(self, request, handler, call_next) -> Any:
+            return "cached"
+
+    mediator.register_query_behavior(CachedBehavior())
+
+    assert await mediator.handle_query(GetBuildingByAddressQuery(address="адрес")) == "cached"
+
+
+@pytest.mark.asyncio()
+async def test_timing_behavior_collects_histograms_per_handler(mediator: Mediator):
+    """Timing behavior зарегистрирован по умолчанию и пишет гистограммы."""
+    timing = next(b for b in mediator.query_behaviors if isinstance(b, TimingBehavior))
+
+    await mediator.handle_query(GetBuildingByAddressQuery(address="адрес"))
+    await mediator.handle_query(GetBuildingByAddressQuery(address="адрес"))
+
+    snapshot = timing.snapshot()
+    assert snapshot["GetBuildingByAddressQueryHandler"]["count"] == 2
+
+
+def test_latency_histogram_percentiles():
+    histogram = LatencyHistogram(buckets=(0.01, 0.1, 1.0))
+
+    for seconds in (0.005, 0.005, 0.05, 0.5, 3.0):
+        histogram.observe(seconds)
+
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.percentile(0.4) == 0.01
+    assert histogram.percentile(0.6) == 0.1
+    assert histogram.percentile(1.0) == 3.0
+    assert histogram.as_dict()["buckets"]["+Inf"] == 1
+
+
+@pytest.mark.asyncio()
+async def test_command_handlers_run_sequentially_by_default():
+    events: list[str] = []
+    mediator = Mediator()
+    mediator.register_command(
+        PingCommand,
+        [
+            SleepingCommandHandler(name="first", delay=0.01, events=events),
+            SleepingCommandHandler(name="second", delay=0, events=events),
+        ],
+    )
+
+    results = await mediator.handle_command(PingCommand())
+
+    assert results == ["first", "second"]
+    assert events == ["first:start", "first:end", "second:start", "second:end"]
+
+
+@pytest.mark.asyncio()
+async def test_command_handlers_run_concurrently():
+    events: list[str] = []
+    mediator = Mediator()
+    mediator.register_command(
+        PingCommand,
+        [
+            SleepingCommandHandler(name="first", delay=0.01, events=events),
+            SleepingCommandHandler(name="second", delay=0, events=events),
+        ],
+        policy=CommandExecutionPolicy.CONCURRENT,
+    )
+
+    results = await mediator.handle_command(PingCommand())
+
+    # Результаты в порядке регистрации, выполнение — перемешано
+    assert results == ["first", "second"]
+    assert events == ["first:start", "second:start", "second:end", "first:end"]
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_command_handlers_errors_are_aggregated():
+    events: list[str] = []
+    mediator = Mediator()
+    mediator.register_command(
+        PingCommand,
+        [
+            SleepingCommandHandler(name="first", delay=0, events=events, error=ValueError("first")),
+            SleepingCommandHandler(name="second", delay=0.01, events=events),
+            SleepingCommandHandler(name="third", delay=0, events=events, error=ValueError("third")),
+        ],
+        policy=CommandExecutionPolicy.CONCURRENT,
+    )
+
+    with pytest.raises(CommandHandlersFailedException) as exc_info:
+        await mediator.handle_command(PingCommand())
+
+    assert len(exc_info.value.errors) == 2
+    # Упавшие обработчики не отменяют соседние
+    assert "second:end" in events
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_command_single_error_is_reraised_as_is():
+    mediator = Mediator()
+    mediator.register_command(
+        PingCommand,
+        [
+            SleepingCommandHandler(name="first", delay=0, events=[], error=ValueError("boom")),
+            SleepingCommandHandler(name="second", delay=0, events=[]),
+        ],
+        policy=CommandExecutionPolicy.CONCURRENT,
+    )
+
+    with pytest.raises(ValueError, match="boom"):
+        await mediator.handle_command(PingCommand())
+
+
+@pytest.mark.asyncio()
+async def test_secondary_command_handlers_run_in_background():
+    events: list[str] = []
+    mediator = Mediator()
+    mediator.register_command(
+        PingCommand,
+        [
+            SleepingCommandHandler(name="primary", delay=0, events=events),
+            SleepingCommandHandler(name="secondary", delay=0.01, events=events),
+            SleepingCommandHandler(name="failing", delay=0, events=events, error=ValueError("ignored")),
+        ],
+        policy=CommandExecutionPolicy.PRIMARY_THEN_BACKGROUND,
+    )
+
+    results = await mediator.handle_command(PingCommand())
+
+    assert results == ["primary"]
+    assert "secondary:end" not in events
+
+    await mediator.wait_background_tasks()
+
+    assert "secondary:end" in events
+    assert "failing:end" in events
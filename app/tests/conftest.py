@@ -5,6 +5,7 @@ from application.mediator import Mediator
 from domain.organization.interfaces.repositories.activity import BaseActivityRepository
 from domain.organization.interfaces.repositories.building import BaseBuildingRepository
 from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
 from domain.user.interfaces.repositories.api_key import BaseAPIKeyRepository
 from domain.user.interfaces.repositories.user import BaseUserRepository
 from settings.config import Config
@@ -26,6 +27,11 @@ def organization_repository(container: Container) -> BaseOrganizationRepository:
     return container.resolve(BaseOrganizationRepository)
 
 
+@fixture()
+def organization_document_repository(container: Container) -> BaseOrganizationDocumentRepository:
+    return container.resolve(BaseOrganizationDocumentRepository)
+
+
 @fixture()
 def building_repository(container: Container) -> BaseBuildingRepository:
     return container.resolve(BaseBuildingRepository)
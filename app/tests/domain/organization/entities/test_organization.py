@@ -1,3 +1,6 @@
+from datetime import datetime
+
+from domain.base.entity import EntityVersion
 from domain.organization.entities import (
     ActivityEntity,
     BuildingEntity,
@@ -61,3 +64,28 @@ def test_organization_entity_with_empty_lists():
     assert organization.phones == []
     assert organization.activities == []
     assert organization.building == building
+
+
+def test_organization_version_follows_building_and_activities():
+    """ETag организации меняется при изменении здания или вида
+    деятельности: они входят в ответ."""
+    building = BuildingEntity(
+        address=BuildingAddressValueObject(value="г. Москва, ул. Блюхера, 32/1"),
+        coordinates=BuildingCoordinatesValueObject(latitude=55.7558, longitude=37.6173),
+        updated_at=datetime(2026, 1, 1),
+    )
+    activity = ActivityEntity(name=ActivityNameValueObject(value="Еда"), updated_at=datetime(2026, 1, 1))
+    organization = OrganizationEntity(
+        name=OrganizationNameValueObject(value="ООО Рога и Копыта"),
+        building=building,
+        activities=[activity],
+        updated_at=datetime(2026, 1, 2),
+    )
+
+    assert organization.version() == EntityVersion(oid=organization.oid, updated_at=datetime(2026, 1, 2))
+
+    building.updated_at = datetime(2026, 1, 3)
+    assert organization.version().updated_at == datetime(2026, 1, 3)
+
+    activity.updated_at = datetime(2026, 1, 4)
+    assert organization.version().updated_at == datetime(2026, 1, 4)
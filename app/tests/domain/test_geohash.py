@@ -0,0 +1,59 @@
+import pytest
+
+from domain.organization.geohash import (
+    cover,
+    encode,
+    GEOHASH_PRECISION,
+    MAX_COVER_CELLS,
+)
+from domain.organization.search import SearchBoundingBox
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude", "precision", "expected"),
+    [
+        (57.64911, 10.40744, 11, "u4pruydqqvj"),
+        (42.6, -5.6, 5, "ezs42"),
+        (-25.382708, -49.265506, 5, "6gkzw"),
+    ],
+)
+def test_encode_matches_reference_geohash(latitude: float, longitude: float, precision: int, expected: str):
+    assert encode(latitude, longitude, precision) == expected
+
+
+def test_cover_contains_geohash_of_every_point_inside():
+    bbox = SearchBoundingBox(lat_min=55.70, lat_max=55.80, lon_min=37.55, lon_max=37.70)
+
+    cells = cover(bbox)
+
+    assert 0 < len(cells) <= MAX_COVER_CELLS
+    for latitude in (55.70, 55.73, 55.80):
+        for longitude in (37.55, 37.61, 37.70):
+            assert any(encode(latitude, longitude).startswith(cell) for cell in cells)
+
+
+def test_cover_is_stable_for_nearby_boxes():
+    """Небольшой сдвиг области не меняет покрытие — ключ кеша."""
+    bbox = SearchBoundingBox(lat_min=55.751, lat_max=55.759, lon_min=37.611, lon_max=37.619)
+    shifted = SearchBoundingBox(lat_min=55.752, lat_max=55.760, lon_min=37.612, lon_max=37.620)
+
+    assert cover(bbox) == cover(shifted)
+
+
+def test_cover_of_tiny_box_uses_full_precision():
+    bbox = SearchBoundingBox(lat_min=55.75580, lat_max=55.75580, lon_min=37.61730, lon_max=37.61730)
+
+    assert cover(bbox) == (encode(55.7558, 37.6173),)
+    assert len(cover(bbox)[0]) == GEOHASH_PRECISION
+
+
+def test_cover_of_whole_world_is_first_level():
+    bbox = SearchBoundingBox(lat_min=-90, lat_max=90, lon_min=-180, lon_max=180)
+
+    assert len(cover(bbox)) == 32
+
+
+def test_cover_of_inverted_box_is_empty():
+    bbox = SearchBoundingBox(lat_min=55.76, lat_max=55.75, lon_min=37.61, lon_max=37.62)
+
+    assert cover(bbox) == ()
@@ -0,0 +1,29 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from domain.base.exceptions import InvalidPageCursorException
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
+
+
+def test_page_cursor_roundtrip():
+    cursor = PageCursor(created_at=datetime(2025, 11, 16, 4, 17, 58, 436158), oid=uuid4())
+
+    assert PageCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "W10", "WyJ4IiwgInkiXQ"])
+def test_page_cursor_decode_invalid(token: str):
+    with pytest.raises(InvalidPageCursorException):
+        PageCursor.decode(token)
+
+
+def test_page_request_build_prefers_cursor():
+    cursor = PageCursor(created_at=datetime.now(), oid=uuid4())
+
+    assert PageRequest.build(limit=10, offset=5) == PageRequest(limit=10, offset=5)
+    assert PageRequest.build(limit=10, offset=5, cursor=cursor.encode()) == PageRequest(limit=10, after=cursor)
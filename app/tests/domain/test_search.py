@@ -0,0 +1,80 @@
+import math
+
+import pytest
+
+from domain.organization.exceptions import (
+    InvalidSearchPolygonException,
+    SearchPolygonTooLargeException,
+)
+from domain.organization.search import (
+    MAX_POLYGON_VERTICES,
+    SearchPolygon,
+)
+
+
+SQUARE = [[37.0, 55.0], [38.0, 55.0], [38.0, 56.0], [37.0, 56.0], [37.0, 55.0]]
+HOLE = [[37.4, 55.4], [37.6, 55.4], [37.6, 55.6], [37.4, 55.6], [37.4, 55.4]]
+
+
+def _circle(vertices: int) -> list[list[float]]:
+    ring = [
+        [37.6 + 0.1 * math.cos(2 * math.pi * index / vertices), 55.75 + 0.05 * math.sin(2 * math.pi * index / vertices)]
+        for index in range(vertices)
+    ]
+    return [*ring, ring[0]]
+
+
+def test_polygon_contains_respects_holes_and_parts():
+    polygon = SearchPolygon.from_geojson(
+        {
+            "type": "MultiPolygon",
+            "coordinates": [[SQUARE, HOLE], [[[30.0, 59.0], [31.0, 59.0], [31.0, 60.0], [30.0, 59.0]]]],
+        },
+    )
+
+    assert polygon.contains(latitude=55.2, longitude=37.2)
+    assert not polygon.contains(latitude=55.5, longitude=37.5)
+    assert polygon.contains(latitude=59.2, longitude=30.8)
+    assert not polygon.contains(latitude=54.0, longitude=37.5)
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Point", "coordinates": [37.0, 55.0]},
+        {"type": "Polygon", "coordinates": []},
+        {"type": "Polygon", "coordinates": [SQUARE[:3]]},
+        {"type": "Polygon", "coordinates": [SQUARE[:4]]},
+        {"type": "Polygon", "coordinates": [[[200.0, 55.0], *SQUARE[1:4], [200.0, 55.0]]]},
+        # Вырожденные кольца: одна точка и отрезок
+        {"type": "Polygon", "coordinates": [[[37.0, 55.0]] * 600]},
+        {"type": "Polygon", "coordinates": [[[37.0, 55.0], [37.5, 55.5], [38.0, 56.0], [37.0, 55.0]]]},
+    ],
+)
+def test_invalid_polygon(geometry: dict):
+    with pytest.raises(InvalidSearchPolygonException):
+        SearchPolygon.from_geojson(geometry)
+
+
+def test_polygon_vertex_limit():
+    with pytest.raises(SearchPolygonTooLargeException):
+        SearchPolygon.from_geojson({"type": "Polygon", "coordinates": [_circle(MAX_POLYGON_VERTICES)]})
+
+
+def test_large_polygon_is_simplified_keeping_its_shape():
+    polygon = SearchPolygon.from_geojson({"type": "Polygon", "coordinates": [_circle(5000)]})
+
+    simplified = polygon.simplified(max_vertices=500)
+
+    assert simplified.vertex_count <= 500
+    assert simplified.contains(latitude=55.75, longitude=37.6)
+    assert simplified.contains(latitude=55.75, longitude=37.69)
+    assert not simplified.contains(latitude=55.75, longitude=37.71)
+
+
+def test_polygon_simplification_keeps_at_least_a_triangle():
+    square = SearchPolygon.from_geojson({"type": "Polygon", "coordinates": [SQUARE]})
+
+    assert square.simplified(max_vertices=4).vertex_count == 4
+    with pytest.raises(SearchPolygonTooLargeException):
+        square.simplified(max_vertices=3)
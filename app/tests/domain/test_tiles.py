@@ -0,0 +1,57 @@
+import pytest
+
+from domain.organization.exceptions import InvalidTileCoordinatesException
+from domain.organization.services.map_tile import TileCache
+from domain.organization.tiles import (
+    cluster_grid_size,
+    CLUSTER_MAX_ZOOM,
+    TILE_EXTENT,
+    TileAttributes,
+    TileCoordinates,
+)
+
+
+@pytest.mark.parametrize(("z", "x", "y"), [(-1, 0, 0), (0, 1, 0), (3, 0, 8), (23, 0, 0)])
+def test_tile_coordinates_out_of_range(z: int, x: int, y: int):
+    with pytest.raises(InvalidTileCoordinatesException):
+        TileCoordinates(z=z, x=x, y=y)
+
+
+def test_tile_containing_point_projects_inside_extent():
+    tile = TileCoordinates.containing(latitude=55.7558, longitude=37.6173, z=16)
+    lon_min, lat_min, lon_max, lat_max = tile.bounds()
+
+    assert (tile.x, tile.y) == (39616, 20486)
+    assert lat_min <= 55.7558 <= lat_max
+    assert lon_min <= 37.6173 <= lon_max
+    assert all(0 <= value <= TILE_EXTENT for value in tile.project(55.7558, 37.6173))
+
+
+def test_tile_attributes_are_thinned_by_zoom():
+    assert TileAttributes.for_zoom(5) == TileAttributes(
+        building_fields=("oid", "organizations"),
+        organization_fields=(),
+    )
+    assert "address" in TileAttributes.for_zoom(14).building_fields
+    assert TileAttributes.for_zoom(16).organization_fields == ("oid", "name", "building_id")
+
+
+def test_tile_cache_evicts_least_recently_used():
+    cache = TileCache(max_entries=2)
+    first, second, third = (TileCoordinates(z=1, x=x, y=0) for x in (0, 1, 1))
+
+    cache.put((first, "v1"), b"first")
+    cache.put((second, "v1"), b"second")
+    assert cache.get((first, "v1")) == b"first"
+
+    cache.put((third, "v2"), b"third")
+
+    assert cache.get((second, "v1")) is None
+    assert cache.get((first, "v1")) == b"first"
+    assert len(cache) == 2
+
+
+def test_cluster_grid_size_halves_per_zoom_and_stops_at_max_zoom():
+    assert cluster_grid_size(10) == pytest.approx(cluster_grid_size(9) / 2)
+    assert cluster_grid_size(CLUSTER_MAX_ZOOM - 1) is not None
+    assert cluster_grid_size(CLUSTER_MAX_ZOOM) is None
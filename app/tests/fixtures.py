@@ -2,6 +2,9 @@ from infrastructure.database.repositories.dummy import (
     DummyInMemoryActivityRepository,
     DummyInMemoryAPIKeyRepository,
     DummyInMemoryBuildingRepository,
+    DummyInMemoryCatalogSnapshotRepository,
+    DummyInMemoryMapTileRepository,
+    DummyInMemoryOrganizationDocumentRepository,
     DummyInMemoryOrganizationRepository,
     DummyInMemoryUserRepository,
 )
@@ -13,7 +16,10 @@ from punq import (
 from application.init import _init_container
 from domain.organization.interfaces.repositories.activity import BaseActivityRepository
 from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.interfaces.repositories.catalog_snapshot import BaseCatalogSnapshotRepository
+from domain.organization.interfaces.repositories.map_tile import BaseMapTileRepository
 from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
 from domain.user.interfaces.repositories.api_key import BaseAPIKeyRepository
 from domain.user.interfaces.repositories.user import BaseUserRepository
 
@@ -28,6 +34,18 @@ def init_dummy_container() -> Container:
         scope=Scope.singleton,
     )
 
+    container.register(
+        BaseOrganizationDocumentRepository,
+        DummyInMemoryOrganizationDocumentRepository,
+        scope=Scope.singleton,
+    )
+
+    container.register(
+        BaseMapTileRepository,
+        DummyInMemoryMapTileRepository,
+        scope=Scope.singleton,
+    )
+
     container.register(
         BaseBuildingRepository,
         DummyInMemoryBuildingRepository,
@@ -40,6 +58,12 @@ def init_dummy_container() -> Container:
         scope=Scope.singleton,
     )
 
+    container.register(
+        BaseCatalogSnapshotRepository,
+        DummyInMemoryCatalogSnapshotRepository,
+        scope=Scope.singleton,
+    )
+
     container.register(
         BaseUserRepository,
         DummyInMemoryUserRepository,
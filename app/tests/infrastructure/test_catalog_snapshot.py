@@ -0,0 +1,254 @@
+from pathlib import Path
+
+import pytest
+from infrastructure.snapshot.catalog import CatalogSnapshot
+from infrastructure.snapshot.catalog_file import CatalogFile
+from infrastructure.snapshot.repositories import (
+    SnapshotActivityRepository,
+    SnapshotBuildingRepository,
+    SnapshotOrganizationDocumentRepository,
+    SnapshotOrganizationRepository,
+)
+from punq import Container
+
+from application.commands.activity import CreateActivityCommand
+from application.commands.building import CreateBuildingCommand
+from application.commands.catalog_snapshot import BuildCatalogFileCommand
+from application.commands.organization import CreateOrganizationCommand
+from application.init import _init_container
+from application.mediator import Mediator
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
+from domain.organization.entities import OrganizationEntity
+from domain.organization.exceptions import ReadOnlyCatalogException
+from domain.organization.interfaces.repositories.activity import BaseActivityRepository
+from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.search import (
+    SearchBoundingBox,
+    SearchCircle,
+)
+
+
+BUILDINGS = (
+    ("г. Москва, ул. Ленина 1", 55.7558, 37.6173),
+    ("г. Москва, ул. Тверская 7", 55.7601, 37.6094),
+    ("г. Санкт-Петербург, Невский пр. 28", 59.9356, 30.3259),
+)
+ORGANIZATIONS = (
+    ("ООО Рога и Копыта", BUILDINGS[0][0], ["+7-495-123-4567", "+7-495-765-4321"], ["Мясная продукция"]),
+    ("Молочный двор", BUILDINGS[0][0], ["+7-495-000-0001"], ["Молочная продукция"]),
+    ("Копыта и Сыр", BUILDINGS[1][0], [], ["Молочная продукция", "Автомобили"]),
+    ("Дом книги", BUILDINGS[2][0], ["+7-812-448-2355"], ["Еда"]),
+)
+
+
+async def _build_catalog(container: Container, path: Path) -> CatalogSnapshot:
+    mediator: Mediator = container.resolve(Mediator)
+    await mediator.handle_command(CreateActivityCommand(name="Еда", parent_id=None))
+    food = await container.resolve(BaseActivityRepository).get_by_name("Еда")
+    for name in ("Мясная продукция", "Молочная продукция"):
+        await mediator.handle_command(CreateActivityCommand(name=name, parent_id=food.oid))
+    await mediator.handle_command(CreateActivityCommand(name="Автомобили", parent_id=None))
+
+    for address, latitude, longitude in BUILDINGS:
+        await mediator.handle_command(CreateBuildingCommand(address=address, latitude=latitude, longitude=longitude))
+    for name, address, phones, activities in ORGANIZATIONS:
+        await mediator.handle_command(
+            CreateOrganizationCommand(name=name, address=address, phones=phones, activities=activities),
+        )
+
+    counts, *_ = await mediator.handle_command(BuildCatalogFileCommand(path=path, batch_size=2))
+
+    assert counts == {"activities": 4, "buildings": 3, "organizations": 4}
+    # Временный файл переименован в ``path``
+    assert [file.name for file in path.parent.iterdir()] == [path.name]
+    return CatalogSnapshot.open(path)
+
+
+def _oids(organizations: list[OrganizationEntity]) -> list:
+    return [organization.oid for organization in organizations]
+
+
+@pytest.mark.asyncio()
+async def test_snapshot_organizations_match_source(container: Container, tmp_path: Path):
+    catalog = await _build_catalog(container, tmp_path / "catalog.snapshot")
+    source = container.resolve(BaseOrganizationRepository)
+    snapshot = SnapshotOrganizationRepository(catalog=catalog)
+
+    for expected in await source.filter():
+        organization = await snapshot.get_by_id(expected.oid)
+
+        assert organization.name == expected.name
+        assert organization.building.oid == expected.building.oid
+        assert organization.building.coordinates == expected.building.coordinates
+        assert organization.phones == expected.phones
+        assert [activity.oid for activity in organization.activities] == [
+            activity.oid for activity in expected.activities
+        ]
+        assert [activity.parent and activity.parent.oid for activity in organization.activities] == [
+            activity.parent and activity.parent.oid for activity in expected.activities
+        ]
+        assert organization.created_at == expected.created_at
+        assert await snapshot.get_version(expected.oid) == await source.get_version(expected.oid)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"name": "копыта"},
+        {"text": "копыта"},
+        {"address": "ленина"},
+        {"activity_names": ["Молочная продукция"]},
+        {"activity_subtree": "Еда"},
+        {"within": SearchCircle(latitude=55.7558, longitude=37.6173, radius=1_000)},
+        {"bounding_box": SearchBoundingBox(lat_min=55, lat_max=56, lon_min=37, lon_max=38)},
+        {"name": "копыта", "address": "тверская"},
+    ],
+)
+@pytest.mark.asyncio()
+async def test_snapshot_filters_match_source(container: Container, tmp_path: Path, filters: dict):
+    catalog = await _build_catalog(container, tmp_path / "catalog.snapshot")
+    source = container.resolve(BaseOrganizationRepository)
+    snapshot = SnapshotOrganizationRepository(catalog=catalog)
+
+    page = PageRequest(limit=2)
+    expected = list(await source.filter(page=page, **filters))
+
+    assert _oids(await snapshot.filter(page=page, **filters)) == _oids(expected)
+    assert await snapshot.count(**filters) == await source.count(**filters)
+
+    if expected:
+        after = PageRequest(limit=2, after=PageCursor.from_entity(expected[-1]))
+        assert _oids(await snapshot.filter(page=after, **filters)) == _oids(await source.filter(page=after, **filters))
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude", "limit", "activity_names"),
+    [
+        (55.7558, 37.6173, 2, None),
+        # Круг растёт до Санкт-Петербурга
+        (55.7558, 37.6173, 4, None),
+        # Подходящих меньше ``limit`` — поиск доходит до всей сферы
+        (0, 0, 10, ["Молочная продукция"]),
+        (59.9356, 30.3259, 1, ["Мясная продукция", "Автомобили"]),
+    ],
+)
+@pytest.mark.asyncio()
+async def test_snapshot_nearest_match_source(
+    container: Container,
+    tmp_path: Path,
+    latitude: float,
+    longitude: float,
+    limit: int,
+    activity_names: list[str] | None,
+):
+    catalog = await _build_catalog(container, tmp_path / "catalog.snapshot")
+    source = container.resolve(BaseOrganizationRepository)
+    snapshot = SnapshotOrganizationRepository(catalog=catalog)
+
+    def pairs(nearby) -> list:
+        return [(item.organization.oid, round(item.distance, 3)) for item in nearby]
+
+    assert pairs(await snapshot.get_nearest(latitude, longitude, limit, activity_names)) == pairs(
+        await source.get_nearest(latitude, longitude, limit, activity_names),
+    )
+
+    points = [SearchCircle(latitude=latitude, longitude=longitude, radius=radius) for radius in (1_000, 1_000_000)]
+    activity_name = activity_names[0] if activity_names else None
+    assert [pairs(nearby) for nearby in await snapshot.get_near_points(points, limit, activity_name)] == [
+        pairs(nearby) for nearby in await source.get_near_points(points, limit, activity_name)
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_snapshot_projection_and_facets(container: Container, tmp_path: Path):
+    catalog = await _build_catalog(container, tmp_path / "catalog.snapshot")
+    source = container.resolve(BaseOrganizationRepository)
+    snapshot = SnapshotOrganizationRepository(catalog=catalog)
+    fields = ("oid", "name", "address", "latitude", "phones", "activity_ids")
+    circle = SearchCircle(latitude=55.7558, longitude=37.6173, radius=5_000)
+
+    page = PageRequest(limit=10)
+
+    assert await snapshot.project(fields, page, within=circle) == await source.project(fields, page, within=circle)
+    assert await snapshot.count_by_activity() == await source.count_by_activity()
+
+
+@pytest.mark.asyncio()
+async def test_snapshot_buildings_and_activities(container: Container, tmp_path: Path):
+    catalog = await _build_catalog(container, tmp_path / "catalog.snapshot")
+    buildings = SnapshotBuildingRepository(catalog=catalog)
+    activities = SnapshotActivityRepository(catalog=catalog)
+
+    building = await buildings.get_by_address(BUILDINGS[1][0])
+    assert building == await container.resolve(BaseBuildingRepository).get_by_address(BUILDINGS[1][0])
+    assert await buildings.get_by_address("г. Москва") is None
+    # Точный поиск — бинарный по перестановке строк, префикс и продолжение не совпадают
+    assert [catalog.building_addresses.index(address) for address, *_ in BUILDINGS] == [0, 1, 2]
+    assert catalog.building_addresses.index(BUILDINGS[0][0] + "0") is None
+    assert catalog.building_addresses.index("") is None
+    assert [item.address.as_generic_type() for item in await buildings.filter_by_radius(55.7558, 37.6173, 1_000)] == [
+        BUILDINGS[0][0],
+        BUILDINGS[1][0],
+    ]
+
+    food = await activities.get_by_name("Еда")
+    assert [item.name.as_generic_type() for item in await activities.filter(parent_id=food.oid)] == [
+        "Мясная продукция",
+        "Молочная продукция",
+    ]
+    assert await activities.count(name="Мясная продукция", parent_id=food.oid) == 1
+    assert await activities.count(name="продукция") == 0
+
+
+@pytest.mark.asyncio()
+async def test_snapshot_documents_and_read_only(container: Container, tmp_path: Path):
+    catalog = await _build_catalog(container, tmp_path / "catalog.snapshot")
+    organizations = SnapshotOrganizationRepository(catalog=catalog)
+    documents = SnapshotOrganizationDocumentRepository(organization_repository=organizations)
+    organization = next(iter(await organizations.get_by_name("Рога")))
+
+    document, *_ = await documents.get_by_ids([organization.oid])
+    assert document.oid == organization.oid
+    # Версия для ETag учитывает здание и виды деятельности, как у сущности
+    assert await organizations.get_version(organization.oid) == organization.version()
+    assert document.updated_at == organization.version().updated_at
+    assert await documents.find_inconsistent() == []
+
+    with pytest.raises(ReadOnlyCatalogException):
+        await organizations.add(organization)
+    with pytest.raises(ReadOnlyCatalogException):
+        await organizations.delete(organization.oid)
+    with pytest.raises(ReadOnlyCatalogException):
+        await documents.rebuild()
+
+
+@pytest.mark.asyncio()
+async def test_snapshot_backend_is_selected_by_config(
+    container: Container,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    path = tmp_path / "catalog.snapshot"
+    await _build_catalog(container, path)
+    monkeypatch.setenv("CATALOG_BACKEND", "snapshot")
+    monkeypatch.setenv("CATALOG_SNAPSHOT_PATH", str(path))
+
+    snapshot_container = _init_container()
+
+    organizations = snapshot_container.resolve(BaseOrganizationRepository)
+    assert isinstance(organizations, SnapshotOrganizationRepository)
+    assert organizations.catalog is snapshot_container.resolve(BaseBuildingRepository).catalog
+    assert await organizations.count(activity_subtree="Еда") == len(ORGANIZATIONS)
+
+
+def test_catalog_file_rejects_foreign_files(tmp_path: Path):
+    path = tmp_path / "catalog.snapshot"
+    path.write_bytes(b"PAR1" + bytes(64))
+
+    with pytest.raises(ValueError):
+        CatalogFile(path)
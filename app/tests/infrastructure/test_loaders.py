@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+from infrastructure.database.loaders import (
+    batch_loader_scope,
+    BatchLoader,
+    get_batch_loader,
+)
+
+
+class RecordingBatchLoad:
+    def __init__(self, values: dict[int, str]):
+        self.values = values
+        self.calls: list[list[int]] = []
+
+    async def __call__(self, keys: list[int]) -> dict[int, str]:
+        self.calls.append(keys)
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+@pytest.mark.asyncio()
+async def test_loads_in_same_tick_are_batched():
+    batch_load = RecordingBatchLoad({1: "one", 2: "two", 3: "three"})
+    loader = BatchLoader(batch_load)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(3), loader.load(42))
+
+    assert results == ["one", "two", "three", None]
+    assert batch_load.calls == [[1, 2, 3, 42]]
+
+
+@pytest.mark.asyncio()
+async def test_loader_caches_and_deduplicates_keys():
+    batch_load = RecordingBatchLoad({1: "one"})
+    loader = BatchLoader(batch_load)
+
+    assert await loader.load_many([1, 1]) == ["one", "one"]
+    assert await loader.load(1) == "one"
+    assert batch_load.calls == [[1]]
+
+    loader.clear(1)
+    assert await loader.load(1) == "one"
+    assert batch_load.calls == [[1], [1]]
+
+
+@pytest.mark.asyncio()
+async def test_loader_splits_batches_by_max_size():
+    batch_load = RecordingBatchLoad({key: str(key) for key in range(5)})
+    loader = BatchLoader(batch_load, max_batch_size=2)
+
+    assert await loader.load_many(range(5)) == ["0", "1", "2", "3", "4"]
+    assert batch_load.calls == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio()
+async def test_loader_errors_are_not_cached():
+    calls = 0
+
+    async def failing_batch_load(keys: list[int]) -> dict[int, str]:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("database is down")
+        return {key: "ok" for key in keys}
+
+    loader = BatchLoader(failing_batch_load)
+
+    with pytest.raises(RuntimeError):
+        await loader.load(1)
+
+    assert await loader.load(1) == "ok"
+
+
+@pytest.mark.asyncio()
+async def test_get_batch_loader_is_shared_within_scope():
+    batch_load = RecordingBatchLoad({1: "one", 2: "two"})
+
+    with batch_loader_scope():
+        first = get_batch_loader("key", batch_load)
+        second = get_batch_loader("key", batch_load)
+        assert first is second
+
+        await asyncio.gather(first.load(1), second.load(2))
+
+    assert batch_load.calls == [[1, 2]]
+    # Вне области каждый вызов получает новый loader
+    assert get_batch_loader("key", batch_load) is not get_batch_loader("key", batch_load)
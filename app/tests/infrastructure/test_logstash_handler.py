@@ -0,0 +1,187 @@
+import logging
+import socket
+import threading
+import time
+
+import orjson
+import pytest
+from infrastructure.logging.handler import LogstashHandler
+
+
+class LogstashServer:
+    """TCP сервер, собирающий строки, как input tcp с codec json_lines."""
+
+    def __init__(self, port: int = 0) -> None:
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("127.0.0.1", port))
+        self.sock.listen()
+        self.port = self.sock.getsockname()[1]
+        self.lines: list[dict] = []
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self) -> None:
+        connection, _ = self.sock.accept()
+        buffer = b""
+        while data := connection.recv(65536):
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            self.lines.extend(orjson.loads(line) for line in lines)
+
+    def wait_for(self, count: int, timeout: float = 5) -> list[dict]:
+        deadline = time.monotonic() + timeout
+        while len(self.lines) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.lines
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+def _unused_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _record(message: str, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app_logger", logging.INFO, __file__, 1, message, None, None)
+    if extra:
+        record.extra = extra
+    return record
+
+
+def test_records_are_shipped_as_json_lines():
+    server = LogstashServer()
+    handler = LogstashHandler(host="127.0.0.1", port=server.port, project="test", flush_interval=0.05)
+
+    for index in range(100):
+        handler.handle(_record(f"запрос {index}", request_id=index))
+    lines = server.wait_for(100)
+    handler.close()
+    server.close()
+
+    assert [line["title"] for line in lines] == [f"запрос {index}" for index in range(100)]
+    assert lines[0]["project"] == "test"
+    assert lines[0]["request_id"] == 0
+    assert handler.stats() == {"queued": 0, "dropped": 0, "sent": 100, "connected": False}
+
+
+def test_emit_does_not_wait_for_unreachable_logstash():
+    handler = LogstashHandler(host="127.0.0.1", port=_unused_port(), buffer_size=5, batch_size=1)
+
+    started_at = time.perf_counter()
+    for index in range(1_000):
+        handler.handle(_record(f"запрос {index}"))
+    elapsed = time.perf_counter() - started_at
+
+    assert elapsed < 0.5
+    assert handler.queued <= 6
+    assert handler.dropped + handler.queued == 1_000
+
+    handler.close()
+    assert handler.dropped == 1_000
+
+
+def test_reconnects_and_keeps_newest_records():
+    port = _unused_port()
+    handler = LogstashHandler(
+        host="127.0.0.1",
+        port=port,
+        buffer_size=3,
+        batch_size=1,
+        flush_interval=0.01,
+        backoff_initial=0.01,
+        backoff_max=0.05,
+    )
+    for index in range(10):
+        handler.handle(_record(f"запрос {index}"))
+
+    server = LogstashServer(port=port)
+    lines = server.wait_for(10 - handler.dropped)
+    handler.close()
+    server.close()
+
+    titles = [line["title"] for line in lines]
+    # Старые записи вытеснены из буфера, последние дошли
+    assert titles[-3:] == ["запрос 7", "запрос 8", "запрос 9"]
+    assert handler.sent + handler.dropped == 10
+
+
+def test_send_times_out_when_logstash_stops_reading():
+    # Соединения принимаются ядром в backlog, но никто их не читает
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    handler = LogstashHandler(
+        host="127.0.0.1",
+        port=server.getsockname()[1],
+        batch_size=1,
+        flush_interval=0.01,
+        connect_timeout=0.2,
+        send_timeout=0.2,
+        close_timeout=2,
+    )
+    for _ in range(20):
+        handler.handle(_record("x" * 1_000_000))
+
+    started_at = time.perf_counter()
+    handler.close()
+    server.close()
+
+    assert time.perf_counter() - started_at < 2
+    assert handler.queued == 0
+    assert handler.sent + handler.dropped == 20
+
+
+class ResettingSocket:
+    """Соединение, которое Logstash рвёт сразу после подключения."""
+
+    def sendall(self, payload: bytes) -> None:
+        raise ConnectionResetError
+
+    def close(self) -> None:
+        pass
+
+
+def test_send_failures_back_off_reconnects():
+    handler = LogstashHandler(
+        host="127.0.0.1",
+        port=_unused_port(),
+        batch_size=1,
+        flush_interval=0.01,
+        backoff_initial=0.05,
+        backoff_max=1,
+        close_timeout=1,
+    )
+    connects = 0
+
+    def connect() -> None:
+        nonlocal connects
+        connects += 1
+        handler.sock = ResettingSocket()
+
+    handler.connect = connect
+    handler.handle(_record("запрос"))
+    time.sleep(0.5)
+    handler.close()
+
+    # Задержки 0,05 + 0,1 + 0,2 с: за полсекунды — несколько попыток, а не
+    # переподключение в цикле; последняя — при закрытии
+    assert connects <= 6
+    assert handler.dropped == 1
+
+
+@pytest.mark.parametrize("buffer_size", [1, 3])
+def test_close_drops_records_when_logstash_is_down(buffer_size: int):
+    handler = LogstashHandler(host="127.0.0.1", port=_unused_port(), buffer_size=buffer_size, close_timeout=1)
+    handler.handle(_record("запрос"))
+
+    started_at = time.perf_counter()
+    handler.close()
+
+    assert time.perf_counter() - started_at < 1
+    assert handler.stats()["queued"] == 0
+    assert handler.dropped == 1
+    handler.handle(_record("после закрытия"))
+    assert handler.dropped == 2
@@ -0,0 +1,241 @@
+"""Контракт репозиториев каталога: одни и те же проверки для in-memory и
+SQLAlchemy реализаций.
+
+SQLAlchemy вариант работает с PostgreSQL из ``Config`` (с применёнными
+миграциями) и пропускается, если база недоступна. Данные не удаляются:
+названия и адреса каждого теста содержат уникальный токен.
+
+"""
+
+import asyncio
+from dataclasses import dataclass
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+import pytest
+from infrastructure.database.gateways.postgres import Database
+from infrastructure.database.repositories import (
+    SQLAlchemyActivityRepository,
+    SQLAlchemyBuildingRepository,
+    SQLAlchemyOrganizationDocumentRepository,
+    SQLAlchemyOrganizationRepository,
+)
+from infrastructure.database.repositories.dummy import (
+    DummyInMemoryActivityRepository,
+    DummyInMemoryBuildingRepository,
+    DummyInMemoryOrganizationDocumentRepository,
+    DummyInMemoryOrganizationRepository,
+)
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from domain.base.pagination import (
+    PageCursor,
+    PageRequest,
+)
+from domain.organization.entities import (
+    ActivityEntity,
+    BuildingEntity,
+    OrganizationEntity,
+)
+from domain.organization.interfaces.repositories.activity import BaseActivityRepository
+from domain.organization.interfaces.repositories.building import BaseBuildingRepository
+from domain.organization.interfaces.repositories.organization import BaseOrganizationRepository
+from domain.organization.interfaces.repositories.organization_document import BaseOrganizationDocumentRepository
+from domain.organization.value_objects import (
+    ActivityNameValueObject,
+    BuildingAddressValueObject,
+    BuildingCoordinatesValueObject,
+    OrganizationNameValueObject,
+    OrganizationPhoneValueObject,
+)
+from settings.config import Config
+
+
+@dataclass
+class Repositories:
+    activity: BaseActivityRepository
+    building: BaseBuildingRepository
+    organization: BaseOrganizationRepository
+    organization_document: BaseOrganizationDocumentRepository
+
+
+def _postgres_database() -> Database:
+    config = Config()
+
+    async def probe() -> None:
+        engine = create_async_engine(config.postgres_connection_uri)
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1 FROM organization LIMIT 1"))
+        finally:
+            await engine.dispose()
+
+    try:
+        asyncio.run(asyncio.wait_for(probe(), timeout=2))
+    except (ImportError, OSError, SQLAlchemyError, TimeoutError):
+        pytest.skip("PostgreSQL недоступен")
+
+    return Database(url=config.postgres_connection_uri, ro_url=config.postgres_connection_uri)
+
+
+@pytest.fixture(params=["in_memory", "sqlalchemy"])
+def repositories(request: pytest.FixtureRequest) -> Repositories:
+    if request.param == "in_memory":
+        organization_repository = DummyInMemoryOrganizationRepository()
+        return Repositories(
+            activity=DummyInMemoryActivityRepository(),
+            building=DummyInMemoryBuildingRepository(),
+            organization=organization_repository,
+            organization_document=DummyInMemoryOrganizationDocumentRepository(
+                organization_repository=organization_repository,
+            ),
+        )
+
+    database = _postgres_database()
+    return Repositories(
+        activity=SQLAlchemyActivityRepository(database=database),
+        building=SQLAlchemyBuildingRepository(database=database),
+        organization=SQLAlchemyOrganizationRepository(database=database),
+        organization_document=SQLAlchemyOrganizationDocumentRepository(database=database),
+    )
+
+
+@pytest.fixture()
+def token() -> str:
+    return uuid4().hex[:8]
+
+
+def _oids(entities) -> set[UUID]:
+    return {entity.oid for entity in entities}
+
+
+async def _activity(repositories: Repositories, name: str, parent: ActivityEntity | None = None) -> ActivityEntity:
+    activity = ActivityEntity(name=ActivityNameValueObject(name), parent=parent)
+    await repositories.activity.add(activity)
+    return activity
+
+
+async def _building(repositories: Repositories, address: str, latitude: float, longitude: float) -> BuildingEntity:
+    building = BuildingEntity(
+        address=BuildingAddressValueObject(address),
+        coordinates=BuildingCoordinatesValueObject(latitude=latitude, longitude=longitude),
+    )
+    await repositories.building.add(building)
+    return building
+
+
+async def _organization(
+    repositories: Repositories,
+    name: str,
+    building: BuildingEntity,
+    activities: list[ActivityEntity],
+) -> OrganizationEntity:
+    organization = OrganizationEntity(
+        name=OrganizationNameValueObject(name),
+        building=building,
+        phones=[OrganizationPhoneValueObject("+7-495-123-4567")],
+        activities=activities,
+    )
+    await repositories.organization.add(organization)
+    return organization
+
+
+@pytest.mark.asyncio()
+async def test_activity_lookups_compare_names_exactly(repositories: Repositories, token: str):
+    food = await _activity(repositories, f"Еда {token}")
+    meat = await _activity(repositories, f"Мясо {token}", parent=food)
+
+    assert (await repositories.activity.get_by_id(meat.oid)).parent.oid == food.oid
+    assert (await repositories.activity.get_by_name(f"Еда {token}")).oid == food.oid
+    assert await repositories.activity.get_by_name(f"еда {token}") is None
+    assert _oids(await repositories.activity.get_by_ids([food.oid, meat.oid, uuid4()])) == {food.oid, meat.oid}
+    assert (await repositories.activity.get_version(food.oid)).oid == food.oid
+
+    assert _oids(await repositories.activity.filter(parent_id=food.oid)) == {meat.oid}
+    assert await repositories.activity.count(name=f"Мясо {token}") == 1
+    assert await repositories.activity.count(name=f"мясо {token}") == 0
+
+
+@pytest.mark.asyncio()
+async def test_building_lookup_by_address_is_exact(repositories: Repositories, token: str):
+    building = await _building(repositories, f"г. Москва, ул. Ленина {token}", 55.7558, 37.6173)
+
+    assert (await repositories.building.get_by_id(building.oid)).address == building.address
+    assert (await repositories.building.get_by_address(f"г. Москва, ул. Ленина {token}")).oid == building.oid
+    assert await repositories.building.get_by_address(f"Г. МОСКВА, УЛ. ЛЕНИНА {token}") is None
+    assert _oids(await repositories.building.get_by_ids([building.oid, uuid4()])) == {building.oid}
+
+
+@pytest.mark.asyncio()
+async def test_organization_lookups(repositories: Repositories, token: str):
+    food = await _activity(repositories, f"Еда {token}")
+    meat = await _activity(repositories, f"Мясо {token}", parent=food)
+    first = await _building(repositories, f"г. Москва, ул. Ленина {token}", 55.7558, 37.6173)
+    second = await _building(repositories, f"г. Москва, ул. Тверская {token}", 55.7601, 37.6094)
+    horns = await _organization(repositories, f"Рога и Копыта {token}", first, [meat])
+    hooves = await _organization(repositories, f"Копыта {token}", first, [food])
+    milk = await _organization(repositories, f"Молоко {token}", second, [])
+
+    assert [activity.oid for activity in (await repositories.organization.get_by_id(horns.oid)).activities] == [
+        meat.oid,
+    ]
+    # Название — подстрока без учёта регистра (ILIKE)
+    assert _oids(await repositories.organization.get_by_name(f"КОПЫТА {token}")) == {horns.oid, hooves.oid}
+    assert _oids(await repositories.organization.get_by_building_id(first.oid)) == {horns.oid, hooves.oid}
+    # Вид деятельности — точное название, без вложенных
+    assert _oids(await repositories.organization.get_by_activity_name(f"Мясо {token}")) == {horns.oid}
+    assert _oids(await repositories.organization.get_by_activity_name(f"Еда {token}")) == {hooves.oid}
+    assert list(await repositories.organization.get_by_activity_name(f"мясо {token}")) == []
+
+    assert await repositories.organization.count(activity_subtree=f"Еда {token}") == 2
+    assert _oids(await repositories.organization.filter(name=token, building_id=second.oid)) == {milk.oid}
+
+
+@pytest.mark.asyncio()
+async def test_organization_pages_follow_created_at_and_oid(repositories: Repositories, token: str):
+    building = await _building(repositories, f"г. Москва, ул. Ленина {token}", 55.7558, 37.6173)
+    organizations = [
+        await _organization(repositories, f"Организация {index} {token}", building, []) for index in range(5)
+    ]
+    expected = [organization.oid for organization in sorted(organizations, key=lambda org: (org.created_at, org.oid))]
+
+    first_page = list(await repositories.organization.filter(page=PageRequest(limit=2), name=token))
+    after = PageCursor.from_entity(first_page[-1])
+    second_page = list(await repositories.organization.filter(page=PageRequest(limit=2, after=after), name=token))
+    offset_page = list(await repositories.organization.filter(page=PageRequest(limit=2, offset=4), name=token))
+
+    assert [organization.oid for organization in first_page + second_page + offset_page] == expected
+
+
+@pytest.mark.asyncio()
+async def test_deleted_organization_leaves_indexes(repositories: Repositories, token: str):
+    food = await _activity(repositories, f"Еда {token}")
+    building = await _building(repositories, f"г. Москва, ул. Ленина {token}", 55.7558, 37.6173)
+    organization = await _organization(repositories, f"Рога и Копыта {token}", building, [food])
+
+    assert await repositories.organization.delete(organization.oid)
+    assert not await repositories.organization.delete(organization.oid)
+
+    assert await repositories.organization.get_by_id(organization.oid) is None
+    assert list(await repositories.organization.get_by_building_id(building.oid)) == []
+    assert list(await repositories.organization.get_by_activity_name(f"Еда {token}")) == []
+    assert list(await repositories.organization.get_by_name(token)) == []
+
+
+@pytest.mark.asyncio()
+async def test_organization_document_follows_organization(repositories: Repositories, token: str):
+    """Документ пишется вместе с организацией, без отдельного rebuild, и
+    удаляется вместе с ней."""
+    building = await _building(repositories, f"г. Москва, ул. Ленина {token}", 55.7558, 37.6173)
+    organization = await _organization(repositories, f"Рога и Копыта {token}", building, [])
+
+    [document] = await repositories.organization_document.get_by_ids([organization.oid])
+    assert f"Рога и Копыта {token}" in document.content.decode()
+
+    await repositories.organization.delete(organization.oid)
+
+    assert list(await repositories.organization_document.get_by_ids([organization.oid])) == []
@@ -0,0 +1,104 @@
+import random
+
+import pytest
+from infrastructure.database.repositories.dummy import spatial
+from infrastructure.database.repositories.dummy.spatial import SpatialIndex
+
+from domain.organization.geo import distance_meters
+
+
+POINTS = 5_000
+
+
+@pytest.fixture()
+def points() -> list[tuple[float, float]]:
+    rng = random.Random(42)
+    return [(rng.uniform(-89.9, 89.9), rng.uniform(-180, 180)) for _ in range(POINTS)]
+
+
+def _index(points: list[tuple[float, float]]) -> SpatialIndex[int]:
+    index = SpatialIndex()
+    for item, (latitude, longitude) in enumerate(points):
+        index.add(item, latitude, longitude)
+    return index
+
+
+@pytest.mark.parametrize(
+    ("latitude", "longitude", "radius"),
+    [
+        (55.7558, 37.6173, 300_000),
+        # Через антимеридиан
+        (0, 179.9, 500_000),
+        (-10, -179.95, 1_000_000),
+        # У полюса
+        (89.5, 0, 200_000),
+        (10, 20, 20_000_000),
+        (10, 20, 0),
+    ],
+)
+def test_within_matches_scan(
+    points: list[tuple[float, float]],
+    monkeypatch: pytest.MonkeyPatch,
+    latitude: float,
+    longitude: float,
+    radius: float,
+):
+    index = _index(points)
+    expected = [item for item, point in enumerate(points) if distance_meters(latitude, longitude, *point) <= radius]
+
+    monkeypatch.setattr(spatial, "numpy", None)
+    assert index.within(latitude, longitude, radius) == expected
+
+    monkeypatch.undo()
+    pytest.importorskip("numpy")
+    assert index.within(latitude, longitude, radius) == expected
+
+
+@pytest.mark.parametrize(
+    "bbox",
+    [
+        (55, 56, 37, 38),
+        (-90, 90, -180, 180),
+        (10, 20, -30, 40),
+        (20, 10, -30, 40),
+    ],
+)
+def test_bounding_box_matches_scan(points: list[tuple[float, float]], bbox: tuple[float, float, float, float]):
+    pytest.importorskip("numpy")
+    lat_min, lat_max, lon_min, lon_max = bbox
+    expected = [
+        item
+        for item, (latitude, longitude) in enumerate(points)
+        if lat_min <= latitude <= lat_max and lon_min <= longitude <= lon_max
+    ]
+
+    assert _index(points).in_bounding_box(*bbox) == expected
+
+
+def test_added_points_are_visible_after_query():
+    pytest.importorskip("numpy")
+    index = SpatialIndex()
+    index.add("Ленина 1", 55.7558, 37.6173)
+    assert index.within(55.7558, 37.6173, 1_000) == ["Ленина 1"]
+
+    index.add("Тверская 7", 55.7601, 37.6094)
+
+    assert index.within(55.7558, 37.6173, 1_000) == ["Ленина 1", "Тверская 7"]
+    assert index.in_bounding_box(55.76, 55.77, 37.6, 37.61) == ["Тверская 7"]
+
+
+@pytest.mark.parametrize(
+    ("latitude", "expected"),
+    [
+        # Длина градуса меридиана на эллипсоиде WGS84 — то, что считает
+        # ST_Distance по geography
+        (0.0, 110_574.4),
+        (55.0, 111_332.7),
+    ],
+)
+def test_distance_is_within_tolerance_of_spheroid(latitude: float, expected: float):
+    numpy = pytest.importorskip("numpy")
+
+    (distance,) = spatial.haversine_meters(latitude, 0.0, numpy.array([latitude + 1]), numpy.zeros(1))
+
+    assert abs(distance - expected) / expected < 0.006
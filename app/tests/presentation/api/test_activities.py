@@ -217,3 +217,88 @@ async def test_create_activity_fail_duplicate_name(
 
     assert json_data["errors"]
     assert any("already exists" in error["message"].lower() for error in json_data["errors"])
+
+
+@pytest.mark.asyncio()
+async def test_get_activities_cursor_pagination(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+    api_key_headers: dict[str, str],
+):
+    create_url = app.url_path_for("create_activity")
+    created_names = []
+    for index in range(5):
+        name = f"TestActivity_{faker.uuid4()}_{index}"
+        response: Response = client.post(url=create_url, json={"name": name}, headers=api_key_headers)
+        assert response.is_success
+        created_names.append(name)
+
+    url = app.url_path_for("get_activities")
+    names = []
+    params = {"limit": 2}
+    while True:
+        response = client.get(url=url, params=params, headers=api_key_headers)
+        assert response.is_success, response.json()
+        data = response.json()["data"]
+
+        names.extend(item["name"] for item in data["items"])
+        assert data["pagination"]["total"] == 5
+        if data["pagination"]["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": data["pagination"]["next_cursor"]}
+
+    assert names == created_names
+
+
+@pytest.mark.asyncio()
+async def test_get_activities_invalid_cursor(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    url = app.url_path_for("get_activities")
+    response: Response = client.get(url=url, params={"cursor": "not-a-cursor"}, headers=api_key_headers)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["errors"]
+
+
+@pytest.mark.asyncio()
+async def test_get_activities_limit_too_large(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    url = app.url_path_for("get_activities")
+    response: Response = client.get(url=url, params={"limit": 101}, headers=api_key_headers)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT, response.json()
+
+
+@pytest.mark.asyncio()
+async def test_get_activities_without_total(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+    api_key_headers: dict[str, str],
+):
+    create_url = app.url_path_for("create_activity")
+    for _ in range(3):
+        response: Response = client.post(
+            url=create_url,
+            json={"name": f"TestActivity_{faker.uuid4()}"},
+            headers=api_key_headers,
+        )
+        assert response.is_success
+
+    url = app.url_path_for("get_activities")
+    response = client.get(url=url, params={"limit": 2, "total": "none"}, headers=api_key_headers)
+
+    assert response.is_success, response.json()
+    pagination = response.json()["data"]["pagination"]
+
+    assert pagination["total"] is None
+    assert pagination["total_mode"] == "none"
+    # Без total следующая страница определяется только по размеру текущей
+    assert pagination["next_cursor"] is not None
@@ -131,6 +131,44 @@ async def test_get_building_by_id_success(
     assert "updated_at" in json_data["data"]
 
 
+@pytest.mark.asyncio()
+async def test_get_building_by_id_not_modified(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+    api_key_headers: dict[str, str],
+):
+    create_response: Response = client.post(
+        url=app.url_path_for("create_building"),
+        json={
+            "address": faker.address()[:100],
+            "latitude": 55.7558,
+            "longitude": 37.6173,
+        },
+        headers=api_key_headers,
+    )
+    assert create_response.is_success
+    url = app.url_path_for("get_building_by_id", building_id=create_response.json()["data"]["oid"])
+
+    response: Response = client.get(url=url, headers=api_key_headers)
+    etag = response.headers["etag"]
+
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    # Версия не изменилась — 304 без тела
+    not_modified: Response = client.get(url=url, headers={**api_key_headers, "If-None-Match": etag})
+
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    # Чужой ETag — полный ответ
+    modified: Response = client.get(url=url, headers={**api_key_headers, "If-None-Match": '"stale"'})
+
+    assert modified.status_code == status.HTTP_200_OK
+    assert modified.json()["data"]["oid"] == response.json()["data"]["oid"]
+
+
 @pytest.mark.asyncio()
 async def test_get_building_by_id_not_found(
     app: FastAPI,
@@ -0,0 +1,113 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import (
+    PlainTextResponse,
+    StreamingResponse,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from presentation.api.middleware.compression import (
+    CompressionMiddleware,
+    GzipEncoder,
+    negotiate_encoding,
+)
+
+
+PAYLOAD = "organization " * 1000
+
+
+def _create_client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/large")
+    async def large() -> PlainTextResponse:
+        return PlainTextResponse(PAYLOAD)
+
+    @app.get("/tagged")
+    async def tagged() -> PlainTextResponse:
+        return PlainTextResponse(PAYLOAD, headers={"ETag": '"v1"'})
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks():
+            for _ in range(3):
+                yield PAYLOAD
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/binary")
+    async def binary() -> PlainTextResponse:
+        return PlainTextResponse(PAYLOAD, media_type="application/octet-stream")
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip;q=1.0, zstd;q=0.5", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "zstd"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding: str, expected: str | None):
+    assert negotiate_encoding(accept_encoding, ("zstd", "br", "gzip")) == expected
+
+
+@pytest.mark.parametrize("offload_size", [1, 1024 * 1024])
+def test_large_response_is_compressed(offload_size: int):
+    client = _create_client(offload_size=offload_size, encoders={"gzip": GzipEncoder})
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(PAYLOAD)
+    assert response.text == PAYLOAD
+
+
+def test_compressed_response_etag_is_weakened():
+    client = _create_client(encoders={"gzip": GzipEncoder})
+
+    assert client.get("/tagged", headers={"Accept-Encoding": "gzip"}).headers["etag"] == 'W/"v1"'
+    assert client.get("/tagged", headers={"Accept-Encoding": "identity"}).headers["etag"] == '"v1"'
+
+
+def test_small_and_binary_responses_are_not_compressed():
+    client = _create_client()
+
+    for url in ("/small", "/binary"):
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+
+def test_streaming_response_is_compressed_incrementally():
+    client = _create_client(encoders={"gzip": GzipEncoder})
+
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode() == PAYLOAD * 3
+
+
+@pytest.mark.parametrize(("encoding", "module"), [("zstd", "zstandard"), ("br", "brotli")])
+def test_optional_encodings(encoding: str, module: str):
+    pytest.importorskip(module)
+    client = _create_client()
+
+    response = client.get("/large", headers={"Accept-Encoding": encoding})
+
+    assert response.headers["content-encoding"] == encoding
+    assert response.text == PAYLOAD
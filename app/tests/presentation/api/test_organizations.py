@@ -286,6 +286,54 @@ async def test_get_organization_by_id_success(
     assert "activities" in json_data["data"]
 
 
+@pytest.mark.asyncio()
+async def test_get_organization_by_id_not_modified(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+    api_key_headers: dict[str, str],
+):
+    address = faker.address()[:100]
+    building_response: Response = client.post(
+        url=app.url_path_for("create_building"),
+        json={"address": address, "latitude": 55.7558, "longitude": 37.6173},
+        headers=api_key_headers,
+    )
+    assert building_response.is_success
+
+    activity_name = f"TestActivity_{faker.uuid4()}"
+    activity_response: Response = client.post(
+        url=app.url_path_for("create_activity"),
+        json={"name": activity_name},
+        headers=api_key_headers,
+    )
+    assert activity_response.is_success
+
+    create_response: Response = client.post(
+        url=app.url_path_for("create_organization"),
+        json={
+            "name": faker.company()[:100],
+            "address": address,
+            "phones": ["+7-495-123-4567"],
+            "activities": [activity_name],
+        },
+        headers=api_key_headers,
+    )
+    assert create_response.is_success
+    url = app.url_path_for("get_organization_by_id", organization_id=create_response.json()["data"]["oid"])
+
+    response: Response = client.get(url=url, headers=api_key_headers)
+    assert response.is_success
+    etag = response.headers["etag"]
+
+    # Тот же ETag, в том числе ослабленный при сжатии ответа — 304
+    for if_none_match in (etag, f"W/{etag.removeprefix('W/')}", f'"other", {etag}'):
+        not_modified: Response = client.get(url=url, headers={**api_key_headers, "If-None-Match": if_none_match})
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+
+
 @pytest.mark.asyncio()
 async def test_get_organization_by_id_not_found(
     app: FastAPI,
@@ -503,3 +551,524 @@ async def test_create_organization_fail_duplicate_name(
 
     assert json_data["errors"]
     assert any("already exists" in error["message"].lower() for error in json_data["errors"])
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_by_ids_success(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+    api_key_headers: dict[str, str],
+):
+    # Создаем здание
+    building_url = app.url_path_for("create_building")
+    address = faker.address()[:100]
+    building_response: Response = client.post(
+        url=building_url,
+        json={
+            "address": address,
+            "latitude": 55.7558,
+            "longitude": 37.6173,
+        },
+        headers=api_key_headers,
+    )
+    assert building_response.is_success
+
+    # Создаем деятельность
+    activity_url = app.url_path_for("create_activity")
+    activity_name = f"TestActivity_{faker.uuid4()}"
+    activity_response: Response = client.post(
+        url=activity_url,
+        json={"name": activity_name},
+        headers=api_key_headers,
+    )
+    assert activity_response.is_success
+
+    # Создаем организации
+    create_url = app.url_path_for("create_organization")
+    created_ids = []
+    for index in range(3):
+        create_response: Response = client.post(
+            url=create_url,
+            json={
+                "name": f"TestOrg_{faker.uuid4()}_{index}",
+                "address": address,
+                "phones": ["+7-495-123-4567"],
+                "activities": [activity_name],
+            },
+            headers=api_key_headers,
+        )
+        assert create_response.is_success
+        created_ids.append(create_response.json()["data"]["oid"])
+
+    # Получаем организации одним запросом
+    requested_ids = [created_ids[2], str(uuid4()), created_ids[0]]
+    url = app.url_path_for("get_organizations_by_name")
+    response: Response = client.get(
+        url=url,
+        params={"ids": requested_ids},
+        headers=api_key_headers,
+    )
+
+    assert response.is_success, response.json()
+    json_data = response.json()
+
+    assert [item["oid"] for item in json_data["data"]["items"]] == [created_ids[2], created_ids[0]]
+    assert json_data["data"]["pagination"]["total"] == 2
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_without_name_and_ids_fails(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    url = app.url_path_for("get_organizations_by_name")
+    response: Response = client.get(url=url, headers=api_key_headers)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["errors"]
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_by_ids_too_many_ids(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    url = app.url_path_for("get_organizations_by_name")
+    response: Response = client.get(
+        url=url,
+        params={"ids": [str(uuid4()) for _ in range(101)]},
+        headers=api_key_headers,
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT, response.json()
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_sparse_fieldsets(
+    app: FastAPI,
+    client: TestClient,
+    faker: Faker,
+    api_key_headers: dict[str, str],
+):
+    building_url = app.url_path_for("create_building")
+    address = faker.address()[:100]
+    building_response: Response = client.post(
+        url=building_url,
+        json={"address": address, "latitude": 55.7558, "longitude": 37.6173},
+        headers=api_key_headers,
+    )
+    assert building_response.is_success
+
+    activity_url = app.url_path_for("create_activity")
+    activity_name = f"TestActivity_{faker.uuid4()}"
+    activity_response: Response = client.post(
+        url=activity_url,
+        json={"name": activity_name},
+        headers=api_key_headers,
+    )
+    assert activity_response.is_success
+
+    name = f"TestOrg_{faker.uuid4()}"
+    create_response: Response = client.post(
+        url=app.url_path_for("create_organization"),
+        json={
+            "name": name,
+            "address": address,
+            "phones": ["+7-495-123-4567"],
+            "activities": [activity_name],
+        },
+        headers=api_key_headers,
+    )
+    assert create_response.is_success
+    oid = create_response.json()["data"]["oid"]
+
+    url = app.url_path_for("get_organizations_by_address")
+
+    response: Response = client.get(url=url, params={"address": address, "view": "compact"}, headers=api_key_headers)
+    assert response.is_success, response.json()
+    assert response.json()["data"]["items"] == [
+        {"oid": oid, "name": name, "latitude": 55.7558, "longitude": 37.6173},
+    ]
+
+    response = client.get(url=url, params={"address": address, "fields": "name, phones"}, headers=api_key_headers)
+    assert response.is_success, response.json()
+    assert response.json()["data"]["items"] == [{"name": name, "phones": ["+7-495-123-4567"]}]
+
+    response = client.get(url=url, params={"address": address, "fields": "name,secret"}, headers=api_key_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["errors"]
+
+
+@pytest.mark.asyncio()
+async def test_get_organization_clusters_by_rectangle(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    address = "г. Москва, ул. Кластерная 1"
+    client.post(
+        url=app.url_path_for("create_building"),
+        json={"address": address, "latitude": 55.7558, "longitude": 37.6173},
+        headers=api_key_headers,
+    )
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    for name in ("ООО Первая", "ООО Вторая"):
+        client.post(
+            url=app.url_path_for("create_organization"),
+            json={"name": name, "address": address, "phones": ["+7-495-123-4567"], "activities": ["Еда"]},
+            headers=api_key_headers,
+        )
+
+    url = app.url_path_for("get_organization_clusters_by_rectangle")
+    bounds = {"lat_min": 55.0, "lat_max": 56.0, "lon_min": 37.0, "lon_max": 38.0}
+    response: Response = client.get(url=url, params={**bounds, "zoom": 8}, headers=api_key_headers)
+
+    assert response.is_success
+    data = response.json()["data"]
+    assert data["clustered"] is True
+    assert len(data["items"]) == 1
+    assert data["items"][0]["organizations"] == 2
+    assert data["items"][0]["building_id"] is not None
+
+    invalid: Response = client.get(url=url, params={**bounds, "zoom": 30}, headers=api_key_headers)
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+@pytest.mark.asyncio()
+async def test_get_nearest_organizations(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    for index, (latitude, longitude) in enumerate([(55.7600, 37.6300), (55.7560, 37.6175)]):
+        address = f"г. Москва, ул. Соседняя {index}"
+        client.post(
+            url=app.url_path_for("create_building"),
+            json={"address": address, "latitude": latitude, "longitude": longitude},
+            headers=api_key_headers,
+        )
+        client.post(
+            url=app.url_path_for("create_organization"),
+            json={
+                "name": f"ООО Сосед {index}",
+                "address": address,
+                "phones": ["+7-495-123-4567"],
+                "activities": ["Еда"],
+            },
+            headers=api_key_headers,
+        )
+
+    url = app.url_path_for("get_nearest_organizations")
+    response: Response = client.get(
+        url=url,
+        params={"latitude": 55.7558, "longitude": 37.6173, "k": 1, "activity": "Еда"},
+        headers=api_key_headers,
+    )
+
+    assert response.is_success
+    items = response.json()["data"]["items"]
+    assert len(items) == 1
+    assert items[0]["name"] == "ООО Сосед 1"
+    assert items[0]["building"]["address"] == "г. Москва, ул. Соседняя 1"
+    assert 0 < items[0]["distance"] < 50
+
+    invalid: Response = client.get(url=url, params={"latitude": 95, "longitude": 37.6173}, headers=api_key_headers)
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_by_radius_ordered_by_distance(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    # Создаются от дальнего к ближнему — порядок по created_at обратный
+    for index, (latitude, longitude) in enumerate([(55.7600, 37.6300), (55.7580, 37.6200), (55.7560, 37.6175)]):
+        address = f"г. Москва, ул. Радиальная {index}"
+        client.post(
+            url=app.url_path_for("create_building"),
+            json={"address": address, "latitude": latitude, "longitude": longitude},
+            headers=api_key_headers,
+        )
+        client.post(
+            url=app.url_path_for("create_organization"),
+            json={
+                "name": f"ООО Радиус {index}",
+                "address": address,
+                "phones": ["+7-495-123-4567"],
+                "activities": ["Еда"],
+            },
+            headers=api_key_headers,
+        )
+
+    url = app.url_path_for("get_organizations_by_radius")
+    params = {"latitude": 55.7558, "longitude": 37.6173, "radius": 5000, "limit": 2}
+    first: Response = client.get(url=url, params=params, headers=api_key_headers)
+
+    assert first.is_success
+    first_page = first.json()["data"]
+    assert [item["name"] for item in first_page["items"]] == ["ООО Радиус 2", "ООО Радиус 1"]
+    assert first_page["items"][0]["distance"] < first_page["items"][1]["distance"]
+
+    second: Response = client.get(
+        url=url,
+        params={**params, "cursor": first_page["pagination"]["next_cursor"], "view": "compact"},
+        headers=api_key_headers,
+    )
+
+    assert second.is_success
+    items = second.json()["data"]["items"]
+    assert [item["name"] for item in items] == ["ООО Радиус 0"]
+    assert items[0]["distance"] > first_page["items"][1]["distance"]
+
+
+@pytest.mark.asyncio()
+async def test_search_organizations(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Кофейни"}, headers=api_key_headers)
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Автомобили"}, headers=api_key_headers)
+    address = "г. Москва, ул. Мясницкая 1"
+    client.post(
+        url=app.url_path_for("create_building"),
+        json={"address": address, "latitude": 55.7600, "longitude": 37.6350},
+        headers=api_key_headers,
+    )
+    for name, activity in [("Кофе Хауз", "Кофейни"), ("Кофе и Шины", "Автомобили"), ("Чайная", "Кофейни")]:
+        client.post(
+            url=app.url_path_for("create_organization"),
+            json={"name": name, "address": address, "phones": ["+7-495-123-4567"], "activities": [activity]},
+            headers=api_key_headers,
+        )
+
+    url = app.url_path_for("search_organizations")
+    response: Response = client.get(
+        url=url,
+        params={"name": "кофе", "activity": "Кофейни", "latitude": 55.7558, "longitude": 37.6173, "radius": 2000},
+        headers=api_key_headers,
+    )
+
+    assert response.is_success
+    data = response.json()["data"]
+    assert [item["name"] for item in data["items"]] == ["Кофе Хауз"]
+    assert data["items"][0]["distance"] > 0
+    assert data["pagination"]["total"] == 1
+
+    partial: Response = client.get(url=url, params={"latitude": 55.7558}, headers=api_key_headers)
+    assert partial.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_by_polygon(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    # Треугольник: вторая точка внутри его bounding box, но вне самого треугольника
+    for index, (latitude, longitude) in enumerate([(55.2, 37.5), (55.8, 37.2)]):
+        address = f"г. Москва, ул. Районная {index}"
+        client.post(
+            url=app.url_path_for("create_building"),
+            json={"address": address, "latitude": latitude, "longitude": longitude},
+            headers=api_key_headers,
+        )
+        client.post(
+            url=app.url_path_for("create_organization"),
+            json={
+                "name": f"ООО Район {index}",
+                "address": address,
+                "phones": ["+7-495-123-4567"],
+                "activities": ["Еда"],
+            },
+            headers=api_key_headers,
+        )
+
+    url = app.url_path_for("get_organizations_by_polygon")
+    triangle = [[37.0, 55.0], [38.0, 55.0], [38.0, 56.0], [37.0, 55.0]]
+    response: Response = client.post(
+        url=url,
+        json={"geometry": {"type": "Polygon", "coordinates": [triangle]}},
+        headers=api_key_headers,
+    )
+
+    assert response.is_success
+    assert [item["name"] for item in response.json()["data"]["items"]] == ["ООО Район 0"]
+
+    unclosed: Response = client.post(
+        url=url,
+        json={"geometry": {"type": "Polygon", "coordinates": [triangle[:3]]}},
+        headers=api_key_headers,
+    )
+    assert unclosed.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio()
+async def test_get_organizations_near_points(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    for index, (latitude, longitude) in enumerate([(55.7600, 37.6300), (59.9343, 30.3351), (55.7560, 37.6175)]):
+        address = f"г. Маршрутная {index}"
+        client.post(
+            url=app.url_path_for("create_building"),
+            json={"address": address, "latitude": latitude, "longitude": longitude},
+            headers=api_key_headers,
+        )
+        client.post(
+            url=app.url_path_for("create_organization"),
+            json={
+                "name": f"ООО Маршрут {index}",
+                "address": address,
+                "phones": ["+7-495-123-4567"],
+                "activities": ["Еда"],
+            },
+            headers=api_key_headers,
+        )
+
+    url = app.url_path_for("get_organizations_near_points")
+    points = [
+        {"latitude": 55.7558, "longitude": 37.6173, "radius": 5000},
+        {"latitude": 59.9340, "longitude": 30.3350, "radius": 1000},
+    ]
+    response: Response = client.post(url=url, json={"points": points, "limit": 1}, headers=api_key_headers)
+
+    assert response.is_success
+    results = response.json()["data"]["results"]
+    assert [result["point"] for result in results] == points
+    assert [[item["name"] for item in result["items"]] for result in results] == [
+        ["ООО Маршрут 2"],
+        ["ООО Маршрут 1"],
+    ]
+    assert 0 < results[0]["items"][0]["distance"] < 50
+
+    too_many: Response = client.post(url=url, json={"points": points * 51}, headers=api_key_headers)
+    assert too_many.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    too_large_limit: Response = client.post(url=url, json={"points": points, "limit": 101}, headers=api_key_headers)
+    assert too_large_limit.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    invalid: Response = client.post(url=url, json={"points": []}, headers=api_key_headers)
+    assert invalid.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+@pytest.mark.asyncio()
+async def test_get_activity_facets(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    food = client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    client.post(
+        url=app.url_path_for("create_activity"),
+        json={"name": "Кофейни", "parent_id": food.json()["data"]["oid"]},
+        headers=api_key_headers,
+    )
+    for index, activities in enumerate([["Кофейни"], ["Еда"]]):
+        address = f"г. Москва, ул. Фасетная {index}"
+        client.post(
+            url=app.url_path_for("create_building"),
+            json={"address": address, "latitude": 55.7558, "longitude": 37.6173 + index / 100},
+            headers=api_key_headers,
+        )
+        client.post(
+            url=app.url_path_for("create_organization"),
+            json={
+                "name": f"ООО Фасет {index}",
+                "address": address,
+                "phones": ["+7-495-123-4567"],
+                "activities": activities,
+            },
+            headers=api_key_headers,
+        )
+
+    url = app.url_path_for("get_activity_facets")
+    response: Response = client.get(
+        url=url,
+        params={"lat_min": 55.7, "lat_max": 55.8, "lon_min": 37.6, "lon_max": 37.62},
+        headers=api_key_headers,
+    )
+
+    assert response.is_success
+    items = response.json()["data"]["items"]
+    assert [(item["name"], item["organizations"], item["subtree_organizations"]) for item in items] == [
+        ("Еда", 0, 1),
+        ("Кофейни", 1, 1),
+    ]
+    assert items[1]["parent_id"] == items[0]["activity_id"]
+
+    partial: Response = client.get(url=url, params={"latitude": 55.7558}, headers=api_key_headers)
+    assert partial.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio()
+async def test_get_organization_changes_and_delete(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    url = app.url_path_for("get_organization_changes")
+    # Пустой поток всё равно отдаёт курсор, с которого можно продолжить
+    empty = client.get(url=url, params={"limit": 2}, headers=api_key_headers).json()["data"]
+    assert empty["items"] == []
+    assert empty["next_cursor"] is not None
+
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    client.post(
+        url=app.url_path_for("create_building"),
+        json={"address": "г. Москва, ул. Синхронная 1", "latitude": 55.7558, "longitude": 37.6173},
+        headers=api_key_headers,
+    )
+    oids = []
+    for index in range(2):
+        created = client.post(
+            url=app.url_path_for("create_organization"),
+            json={
+                "name": f"ООО Реплика {index}",
+                "address": "г. Москва, ул. Синхронная 1",
+                "phones": ["+7-495-123-4567"],
+                "activities": ["Еда"],
+            },
+            headers=api_key_headers,
+        )
+        oids.append(created.json()["data"]["oid"])
+
+    resumed = client.get(url=url, params={"cursor": empty["next_cursor"]}, headers=api_key_headers)
+    assert [item["oid"] for item in resumed.json()["data"]["items"]] == oids
+
+    response: Response = client.get(url=url, params={"limit": 2}, headers=api_key_headers)
+
+    assert response.is_success
+    data = response.json()["data"]
+    assert [item["oid"] for item in data["items"]] == oids
+    assert data["items"][0]["organization"]["name"] == "ООО Реплика 0"
+    assert data["has_more"] is True
+
+    delete_url = app.url_path_for("delete_organization", organization_id=oids[0])
+    deleted = client.delete(url=delete_url, headers=api_key_headers)
+    assert deleted.status_code == status.HTTP_204_NO_CONTENT
+
+    response = client.get(url=url, params={"cursor": data["next_cursor"]}, headers=api_key_headers)
+
+    data = response.json()["data"]
+    assert [(item["oid"], item["deleted"], item["organization"]) for item in data["items"]] == [(oids[0], True, None)]
+    assert data["has_more"] is False
+
+    # Клиент, догнавший поток, получает свой курсор обратно
+    caught_up = client.get(url=url, params={"cursor": data["next_cursor"]}, headers=api_key_headers)
+    assert caught_up.json()["data"] == {"items": [], "next_cursor": data["next_cursor"], "has_more": False}
+
+    missing = client.delete(url=delete_url, headers=api_key_headers)
+    assert missing.status_code == status.HTTP_404_NOT_FOUND
+
+    invalid = client.get(url=url, params={"cursor": "not-a-cursor"}, headers=api_key_headers)
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,81 @@
+from datetime import (
+    datetime,
+    UTC,
+)
+
+import orjson
+from presentation.api.filters import PaginationOut
+from presentation.api.responses import list_paginated_response
+from presentation.api.schemas import (
+    ApiResponse,
+    ListPaginatedResponse,
+)
+from presentation.api.v1.activity.schemas import ActivityResponseSchema
+from presentation.api.v1.activity.serializers import activity_response_to_dict
+from presentation.api.v1.organization.schemas import OrganizationDetailSchema
+from presentation.api.v1.organization.serializers import organization_detail_to_dict
+
+from domain.organization.entities import (
+    ActivityEntity,
+    BuildingEntity,
+    OrganizationEntity,
+)
+from domain.organization.value_objects import (
+    ActivityNameValueObject,
+    BuildingAddressValueObject,
+    BuildingCoordinatesValueObject,
+    OrganizationNameValueObject,
+    OrganizationPhoneValueObject,
+)
+
+
+def _organization(created_at: datetime) -> OrganizationEntity:
+    parent = ActivityEntity(name=ActivityNameValueObject("Еда"), created_at=created_at, updated_at=created_at)
+    return OrganizationEntity(
+        name=OrganizationNameValueObject("ООО Рога и Копыта"),
+        building=BuildingEntity(
+            address=BuildingAddressValueObject("г. Москва, ул. Ленина 1"),
+            coordinates=BuildingCoordinatesValueObject(latitude=55.7558, longitude=37.6173),
+            created_at=created_at,
+            updated_at=created_at,
+        ),
+        phones=[OrganizationPhoneValueObject("+7-495-123-4567")],
+        activities=[
+            parent,
+            ActivityEntity(name=ActivityNameValueObject("Мясо"), parent=parent),
+        ],
+        created_at=created_at,
+        updated_at=created_at,
+    )
+
+
+def test_fast_list_response_matches_pydantic_json():
+    """Быстрый путь отдаёт тот же JSON, что и цепочка pydantic схем."""
+    organizations = [
+        _organization(datetime(2025, 11, 16, 4, 17, 58, 436158)),
+        _organization(datetime(2025, 11, 16, 4, 17, 58, tzinfo=UTC)),
+    ]
+    pagination = PaginationOut(limit=10, offset=0, total=2)
+
+    expected = ApiResponse[ListPaginatedResponse[OrganizationDetailSchema]](
+        data=ListPaginatedResponse[OrganizationDetailSchema](
+            items=[OrganizationDetailSchema.from_entity(org) for org in organizations],
+            pagination=pagination,
+        ),
+    ).model_dump(mode="json")
+
+    response = list_paginated_response(
+        items=[organization_detail_to_dict(org) for org in organizations],
+        pagination=pagination,
+    )
+
+    assert response.media_type == "application/json"
+    assert orjson.loads(response.body) == expected
+
+
+def test_activity_response_to_dict_matches_schema():
+    activity = _organization(datetime.now()).activities[1]
+
+    assert orjson.loads(orjson.dumps(activity_response_to_dict(activity))) == (
+        ActivityResponseSchema.from_entity(activity).model_dump(mode="json")
+    )
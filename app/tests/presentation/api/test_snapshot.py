@@ -0,0 +1,38 @@
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from httpx import Response
+
+
+@pytest.mark.asyncio()
+async def test_get_catalog_snapshot(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    pyarrow = pytest.importorskip("pyarrow")
+    client.post(
+        url=app.url_path_for("create_building"),
+        json={"address": "г. Москва, ул. Тверская 7", "latitude": 55.7558, "longitude": 37.6173},
+        headers=api_key_headers,
+    )
+
+    response: Response = client.get(
+        app.url_path_for("get_catalog_snapshot", table="buildings"),
+        params={"format": "arrow"},
+        headers=api_key_headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    assert response.headers["content-disposition"] == 'attachment; filename="buildings.arrows"'
+    assert pyarrow.ipc.open_stream(response.content).read_all().column("address").to_pylist() == [
+        "г. Москва, ул. Тверская 7",
+    ]
+
+    unknown: Response = client.get("/api/v1/snapshot/users", headers=api_key_headers)
+    assert unknown.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
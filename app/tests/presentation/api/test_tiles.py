@@ -0,0 +1,45 @@
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+from httpx import Response
+
+from domain.organization.tiles import TileCoordinates
+
+
+@pytest.mark.asyncio()
+async def test_get_map_tile(
+    app: FastAPI,
+    client: TestClient,
+    api_key_headers: dict[str, str],
+):
+    address = "г. Москва, ул. Тверская 7"
+    client.post(
+        url=app.url_path_for("create_building"),
+        json={"address": address, "latitude": 55.7558, "longitude": 37.6173},
+        headers=api_key_headers,
+    )
+    client.post(url=app.url_path_for("create_activity"), json={"name": "Еда"}, headers=api_key_headers)
+    create_response: Response = client.post(
+        url=app.url_path_for("create_organization"),
+        json={"name": "ООО Тайл", "address": address, "phones": ["+7-495-123-4567"], "activities": ["Еда"]},
+        headers=api_key_headers,
+    )
+    assert create_response.is_success
+
+    tile = TileCoordinates.containing(latitude=55.7558, longitude=37.6173, z=16)
+    response: Response = client.get(f"/api/v1/tiles/{tile.z}/{tile.x}/{tile.y}.mvt", headers=api_key_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/vnd.mapbox-vector-tile"
+    assert response.headers["cache-control"] == "private, max-age=60"
+    assert "ООО Тайл".encode() in response.content
+
+    empty: Response = client.get("/api/v1/tiles/16/0/0.mvt", headers=api_key_headers)
+    assert empty.status_code == status.HTTP_204_NO_CONTENT
+
+    invalid: Response = client.get("/api/v1/tiles/2/4/0.mvt", headers=api_key_headers)
+    assert invalid.status_code == status.HTTP_400_BAD_REQUEST